@@ -6,10 +6,15 @@
 
 import json
 import hashlib
+import heapq
+import os
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any
 from dataclasses import dataclass
 
+from timeseries_store import TimeSeriesStore
+
 
 @dataclass
 class AgentService:
@@ -43,12 +48,33 @@ class UserProfile:
 
 
 class AIAgentEconomy:
+    """
+    事件溯源存储:
+    - 每次变更追加一行到 ledger（JSONL），支付创建只需一次追加写
+    - 每 SNAPSHOT_EVERY 个事件把完整状态写成快照并截断 ledger
+    - 启动时加载快照，再重放快照之后的 ledger 事件
+    - 内存中维护 能力→服务、用户→交易、tx_id→交易 索引
+    """
+    
+    SNAPSHOT_EVERY = 500
+    
     def __init__(self, data_path: str = "data/agent_economy.json"):
         self.data_path = data_path
+        self.ledger_path = str(Path(data_path).with_suffix('.ledger.jsonl'))
         self.services: Dict[str, AgentService] = {}
         self.transactions: List[Transaction] = []
         self.users: Dict[str, UserProfile] = {}
+        self.seq = 0
+        self._events_since_snapshot = 0
+        self.skipped_events = 0
+        self._reset_indexes()
         self._load()
+    
+    def _reset_indexes(self):
+        self._by_capability: Dict[str, Dict[str, None]] = {}
+        self._by_user: Dict[str, List[str]] = {}
+        self._tx_index: Dict[str, Transaction] = {}
+        self._completed_volume = 0.0
         
     def register_service(self, agent_id: str, name: str, description: str, 
                       capabilities: List[str], price_per_use: float) -> str:
@@ -62,14 +88,14 @@ class AIAgentEconomy:
             usage_count=0,
             status="active"
         )
-        self.services[agent_id] = service
-        self._save()
+        self._record("service_registered", service.__dict__)
         return agent_id
     
     def discover_services(self, capability: str) -> List[AgentService]:
         return [
-            s for s in self.services.values()
-            if capability in s.capabilities and s.status == "active"
+            self.services[agent_id]
+            for agent_id in self._by_capability.get(capability, ())
+            if self.services[agent_id].status == "active"
         ]
     
     def create_payment(self, from_user: str, to_agent: str, 
@@ -84,19 +110,15 @@ class AIAgentEconomy:
             timestamp=datetime.now().isoformat(),
             status="pending"
         )
-        self.transactions.append(tx)
-        self._save()
+        self._record("payment_created", tx.__dict__)
         return tx_id
     
     def complete_payment(self, tx_id: str) -> bool:
-        for tx in self.transactions:
-            if tx.tx_id == tx_id:
-                tx.status = "completed"
-                if tx.to_agent in self.services:
-                    self.services[tx.to_agent].usage_count += 1
-                self._save()
-                return True
-        return False
+        tx = self._tx_index.get(tx_id)
+        if tx is None:
+            return False
+        self._record("payment_completed", {"tx_id": tx_id})
+        return True
     
     def create_user(self, user_id: str, preferences: List[str]) -> str:
         user = UserProfile(
@@ -105,8 +127,7 @@ class AIAgentEconomy:
             usage_history=[],
             trust_score=5.0
         )
-        self.users[user_id] = user
-        self._save()
+        self._record("user_created", user.__dict__)
         return user_id
     
     def get_recommendations(self, user_id: str) -> List[AgentService]:
@@ -117,37 +138,143 @@ class AIAgentEconomy:
         for pref in user.preferences:
             for service in self.discover_services(pref):
                 recommendations.append(service)
-        return recommendations[:5]
+                if len(recommendations) >= 5:
+                    return recommendations
+        return recommendations
+    
+    def get_user_transactions(self, user_id: str) -> List[Transaction]:
+        return [self._tx_index[tx_id] for tx_id in self._by_user.get(user_id, [])]
     
     def get_market_stats(self) -> Dict:
-        total = sum(tx.amount for tx in self.transactions if tx.status == "completed")
-        top = sorted(self.services.values(), key=lambda x: x.usage_count, reverse=True)[:5]
+        top = heapq.nlargest(5, self.services.values(), key=lambda x: x.usage_count)
         return {
             "total_agents": len(self.services),
             "total_transactions": len(self.transactions),
-            "total_volume": total,
+            "total_volume": self._completed_volume,
             "top_agents": [{"name": a.name, "usage": a.usage_count} for a in top]
         }
     
-    def _load(self):
-        try:
-            with open(self.data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.services = {k: AgentService(**v) for k, v in data.get('services', {}).items()}
-                self.transactions = [Transaction(**t) for t in data.get('transactions', [])]
-                self.users = {k: UserProfile(**v) for k, v in data.get('users', {}).items()}
-        except:
-            pass
+    def record_status(self, store: TimeSeriesStore = None):
+        """把当前市场统计追加到 economy_status 时序（替代 economy_status_*.json）"""
+        store = store or TimeSeriesStore(str(Path(self.data_path).parent / "timeseries"))
+        store.append(
+            "economy_status", datetime.now(), flush=True,
+            agent_count=len(self.services),
+            transaction_count=len(self.transactions),
+            transaction_volume=self._completed_volume,
+            status="monitoring"
+        )
+    
+    # ==================== 事件溯源 ====================
+    
+    def _apply(self, op: str, data: Dict):
+        """把一个事件应用到内存状态和索引"""
+        if op == "service_registered":
+            old = self.services.get(data["agent_id"])
+            if old is not None:
+                for cap in old.capabilities:
+                    self._by_capability.get(cap, {}).pop(old.agent_id, None)
+            service = AgentService(**data)
+            self.services[service.agent_id] = service
+            for cap in service.capabilities:
+                self._by_capability.setdefault(cap, {})[service.agent_id] = None
+        elif op == "payment_created":
+            self._index_transaction(Transaction(**data))
+        elif op == "payment_completed":
+            tx = self._tx_index.get(data["tx_id"])
+            if tx is not None:
+                if tx.status != "completed":
+                    self._completed_volume += tx.amount
+                tx.status = "completed"
+                if tx.to_agent in self.services:
+                    self.services[tx.to_agent].usage_count += 1
+        elif op == "user_created":
+            user = UserProfile(**data)
+            self.users[user.user_id] = user
+    
+    def _index_transaction(self, tx: Transaction):
+        self.transactions.append(tx)
+        self._tx_index[tx.tx_id] = tx
+        self._by_user.setdefault(tx.from_agent, []).append(tx.tx_id)
+        if tx.status == "completed":
+            self._completed_volume += tx.amount
     
-    def _save(self):
+    def _record(self, op: str, data: Dict):
+        """应用事件并追加到 ledger（一次追加写），按需触发快照"""
+        self._apply(op, data)
+        self.seq += 1
+        event = {"seq": self.seq, "op": op, "ts": datetime.now().isoformat(), "data": data}
+        Path(self.ledger_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.ledger_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + "\n")
+        
+        self._events_since_snapshot += 1
+        if self._events_since_snapshot >= self.SNAPSHOT_EVERY:
+            self.snapshot()
+    
+    def snapshot(self):
+        """写完整快照（原子替换）后截断 ledger"""
         data = {
+            'seq': self.seq,
             'services': {k: v.__dict__ for k, v in self.services.items()},
             'transactions': [t.__dict__ for t in self.transactions],
             'users': {k: v.__dict__ for k, v in self.users.items()},
             'last_update': datetime.now().isoformat()
         }
-        with open(self.data_path, 'w', encoding='utf-8') as f:
+        Path(self.data_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.data_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.data_path)
+        
+        # 快照记录了 seq，截断前崩溃也只会重放到已包含的事件并被跳过
+        open(self.ledger_path, 'w').close()
+        self._events_since_snapshot = 0
+    
+    def _load(self):
+        try:
+            with open(self.data_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                self.seq = data.get('seq', 0)
+                self.services = {}
+                for v in data.get('services', {}).values():
+                    self._apply("service_registered", v)
+                for t in data.get('transactions', []):
+                    self._index_transaction(Transaction(**t))
+                self.users = {k: UserProfile(**v) for k, v in data.get('users', {}).items()}
+        except (OSError, ValueError, TypeError):
+            pass
+        self._replay()
+    
+    def _replay(self):
+        """
+        重放快照之后的 ledger 事件
+        
+        没有换行结尾的末行是写了一半的事件: 截掉它，否则下一次追加会拼在它后面；
+        中间无法解析的行跳过并计入 skipped_events，继续重放后面的事件。
+        """
+        try:
+            with open(self.ledger_path, 'rb+') as f:
+                data = f.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    f.truncate(complete)
+        except OSError:
+            return
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+                seq, op, payload = event["seq"], event["op"], event["data"]
+            except (ValueError, KeyError, TypeError):
+                self.skipped_events += 1
+                continue
+            if seq <= self.seq:
+                continue
+            self._apply(op, payload)
+            self.seq = seq
+            self._events_since_snapshot += 1
 
 
 class OpenClawAgent:
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 跨引擎答案缓存 (Answer Memoization)
+
+基准测试和用户会反复提交相同（或只差空格/全半角/大小写）的题目:
+1. 键 = 引擎版本 + 规范化题目（全角 ASCII→半角、casefold、空白折叠）；
+   题面大小写有含义的引擎（棋局 FEN、牌面）设 answer_cache_casefold = False 保留大小写
+2. LRU 容量上限 + TTL 过期（部分答案含当前日期，不能永久缓存）
+3. 可选持久化到磁盘（pickle，原子写入）
+4. 命中率统计
+5. memory_ring(): 引擎的 self.memory 改为有界环形缓冲，不再无限增长；命中缓存时同样记入 self.memory
+
+用法:
+    class ReasoningEngineVx:
+        def __init__(self):
+            self.memory = memory_ring()
+
+        @memoize_answer
+        def analyze(self, problem: str) -> Dict:
+            ...
+
+    get_answer_cache().stats()
+
+环境变量:
+    OPENCLAW_ANSWER_CACHE=0           关闭缓存
+    OPENCLAW_ANSWER_CACHE_PATH=路径    启动时加载、退出时保存
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import copy
+import functools
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 3600.0       # 秒
+MEMORY_LIMIT = 500         # 每个引擎 self.memory 保留的最近条数
+
+_WS_RE = re.compile(r"\s+")
+# 只折叠全角 ASCII（U+FF01~FF5E）与全角空格；不用 NFKC，否则 "a³"→"a3"、"½"→"1⁄2" 会撞键
+_FULLWIDTH = {c: c - 0xFEE0 for c in range(0xFF01, 0xFF5F)}
+_FULLWIDTH[0x3000] = 0x20
+
+
+# ==================== 规范化 ====================
+
+def normalize_prompt(text: str, casefold: bool = True) -> str:
+    """全角 ASCII→半角、大小写折叠（casefold=False 时保留）、空白折叠"""
+    text = text.translate(_FULLWIDTH)
+    if casefold:
+        text = text.casefold()
+    return _WS_RE.sub(" ", text).strip()
+
+
+def memory_ring(maxlen: int = MEMORY_LIMIT) -> deque:
+    """有界环形缓冲：满后丢弃最旧的记录（支持 append/len/迭代，与原 list 用法兼容）"""
+    return deque(maxlen=maxlen)
+
+
+# ==================== 缓存 ====================
+
+class AnswerCache:
+    """
+    线程安全的 LRU + TTL 答案缓存
+
+    Args:
+        max_size: 最多缓存多少条，0 表示关闭
+        ttl: 过期时间（秒），None 表示不过期
+        path: 持久化文件；None 表示只在内存中
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: Optional[float] = DEFAULT_TTL,
+                 path: str = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        # 键 -> (过期时间戳, 答案)；用 time.time() 以便持久化后仍可比较
+        self._data: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    @staticmethod
+    def key(version: str, prompt: str, casefold: bool = True) -> Tuple[str, str]:
+        return (version, normalize_prompt(prompt, casefold))
+
+    def get(self, version: str, prompt: str, casefold: bool = True) -> Optional[Any]:
+        """命中返回答案的副本，未命中/已过期返回 None"""
+        key = self.key(version, prompt, casefold)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] < time.time():
+                del self._data[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        # 返回副本：调用方修改结果不会污染缓存
+        return copy.deepcopy(value)
+
+    def put(self, version: str, prompt: str, value: Any, casefold: bool = True):
+        if self.max_size <= 0 or value is None:
+            return
+        key = self.key(version, prompt, casefold)
+        expires = time.time() + self.ttl if self.ttl is not None else float("inf")
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
+
+    # ==================== 持久化 ====================
+
+    def save(self, path: str = None) -> Optional[str]:
+        """写入磁盘（跳过已过期条目）；目录不可写时返回 None"""
+        import pickle
+
+        path = path or self.path
+        if not path:
+            return None
+        now = time.time()
+        with self._lock:
+            entries = [(k, v) for k, v in self._data.items() if v[0] >= now]
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            return None
+        return path
+
+    def load(self, path: str = None) -> int:
+        """从磁盘加载未过期条目，返回加载条数；文件缺失或损坏时返回 0"""
+        import pickle
+
+        path = path or self.path
+        if not path:
+            return 0
+        try:
+            with open(path, "rb") as f:
+                entries = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, ValueError, AttributeError, ImportError):
+            return 0
+        now = time.time()
+        loaded = 0
+        with self._lock:
+            for key, (expires, value) in entries:
+                if expires >= now:
+                    self._data[key] = (expires, value)
+                    loaded += 1
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+        return loaded
+
+
+_default_cache: Optional[AnswerCache] = None
+_default_lock = threading.Lock()
+
+
+def get_answer_cache() -> AnswerCache:
+    """进程级共享缓存（所有引擎共用，按引擎版本区分键）"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            enabled = os.environ.get("OPENCLAW_ANSWER_CACHE", "1") != "0"
+            path = os.environ.get("OPENCLAW_ANSWER_CACHE_PATH") or None
+            cache = AnswerCache(max_size=DEFAULT_MAX_SIZE if enabled else 0, path=path)
+            if path and enabled:
+                import atexit
+
+                cache.load()
+                atexit.register(cache.save)
+            _default_cache = cache
+        return _default_cache
+
+
+# ==================== 装饰器 ====================
+
+def engine_version(engine: Any) -> str:
+    """缓存键中的引擎版本：类名 + self.version（子类与父类互不共享）"""
+    cls = type(engine)
+    return f"{cls.__module__}.{cls.__qualname__}@{getattr(engine, 'version', '')}"
+
+
+def memoize_answer(method: Callable) -> Callable:
+    """
+    装饰引擎的 analyze(self, problem)：相同版本 + 规范化题目直接返回缓存答案
+
+    带额外参数（如 context）的调用不走缓存；实例可设置 self.answer_cache
+    替换共享缓存（如设为 AnswerCache(max_size=0) 关闭）；类属性
+    answer_cache_casefold = False 时键保留大小写。命中时跳过了 analyze
+    里的记忆写入，这里补一条 cached=True 的记录到 self.memory。
+    """
+    @functools.wraps(method)
+    def wrapper(self, problem, *args, **kwargs):
+        if args or kwargs or not isinstance(problem, str):
+            return method(self, problem, *args, **kwargs)
+        cache = getattr(self, "answer_cache", None)
+        if cache is None:
+            cache = get_answer_cache()
+        version = engine_version(self)
+        casefold = getattr(self, "answer_cache_casefold", True)
+        cached = cache.get(version, problem, casefold)
+        if cached is not None:
+            memory = getattr(self, "memory", None)
+            if memory is not None:
+                memory.append({
+                    "problem": problem,
+                    "answer": cached.get("answer", "") if isinstance(cached, dict) else cached,
+                    "type": cached.get("type", "") if isinstance(cached, dict) else "",
+                    "timestamp": datetime.now().isoformat(),
+                    "cached": True,
+                })
+            return cached
+        result = method(self, problem)
+        cache.put(version, problem, result, casefold)
+        return result
+    return wrapper
+
+
+if __name__ == "__main__":
+    from engine_registry import create_engine
+
+    print("=" * 70)
+    print("🦞 答案缓存演示")
+    print("=" * 70)
+
+    engine = create_engine("games")
+    prompts = [
+        "For Nim with heaps (3,4,5), what is the winning move? XOR strategy.",
+        "For Nim with heaps (3,4,5),   what is the winning move?  XOR strategy.",
+        "Ｆｏｒ Ｎｉｍ ｗｉｔｈ ｈｅａｐｓ （３，４，５）， what is the winning move? XOR strategy.",
+        "In Monty Hall, should you switch doors? Calculate probabilities.",
+    ]
+    for p in prompts:
+        start = time.perf_counter()
+        result = engine.analyze(p)
+        print(f"  {(time.perf_counter() - start) * 1e6:9.1f} μs  {p[:40]:40s} → {str(result.get('answer')).splitlines()[0][:24]}")
+
+    n = 200
+    cache = get_answer_cache()
+    for label, enabled in (("无缓存", False), ("有缓存", True)):
+        engine.answer_cache = cache if enabled else AnswerCache(max_size=0)
+        start = time.perf_counter()
+        for i in range(n):
+            engine.analyze(prompts[i % len(prompts)])
+        print(f"\n{label}: {(time.perf_counter() - start) / n * 1e6:.1f} μs/次")
+    print(f"\n统计: {cache.stats()}")
+    print(f"memory 上限: {engine.memory.maxlen} 条（当前 {len(engine.memory)}）")
@@ -5,8 +5,9 @@ Auto Memory Loader - 每次会话自动加载JSON记忆 + 自动学习
 
 import json
 from datetime import datetime
-from structured_memory import StructuredMemory
+from structured_memory import StructuredMemory, WORKSPACE
 from auto_learner import AutoLearner
+from daily_note_index import recent_entries
 
 class AutoMemoryLoader:
     """
@@ -46,6 +47,14 @@ class AutoMemoryLoader:
             self.load_all()
         return self.cache.get("stats", {})
     
+    def get_daily_entries(self, types=None, days=1, limit=20):
+        """
+        读取最近 daily notes 中的条目（最新优先）
+        
+        通过偏移索引 seek 到匹配章节，不再整文件读取
+        """
+        return recent_entries(WORKSPACE / "memory", days=days, types=types, limit=limit)
+    
     def auto_learn(self, user_message: str, assistant_response: str,
                    intent: str = None, confidence: float = None):
         """
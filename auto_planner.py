@@ -269,6 +269,32 @@ class AutoPlanner:
         
         print("=" * 60)
     
+    def _health_checks(self):
+        """健康检查项: (名称, 返回描述的函数)"""
+        import shutil
+        import subprocess
+        import urllib.request
+        workspace = '/home/admin/.openclaw/workspace'
+        
+        def openclaw():
+            with urllib.request.urlopen('http://localhost:3009/health', timeout=3) as resp:
+                return resp.read(200).decode('utf-8', errors='replace').strip()
+        
+        def git_status():
+            result = subprocess.run(['git', 'status', '--short'], cwd=workspace,
+                                    capture_output=True, text=True, timeout=10)
+            if result.returncode != 0:
+                lines = result.stderr.strip().splitlines() or [f"退出码 {result.returncode}"]
+                raise RuntimeError(lines[-1][:80])
+            return str(len(result.stdout.splitlines()))
+        
+        def disk():
+            usage = shutil.disk_usage(workspace)
+            return (f"{usage.used / 1024**3:.1f}G / {usage.total / 1024**3:.1f}G "
+                    f"({usage.used / usage.total:.0%})")
+        
+        return [('OpenClaw', openclaw), ('Git Status', git_status), ('Disk', disk)]
+    
     def run_daily_check(self):
         """执行每日检查"""
         print("\n🦞 小爪每日自动检查")
@@ -286,24 +312,16 @@ class AutoPlanner:
         # 显示状态
         self.print_dashboard()
         
-        # 检查健康
+        # 检查健康（进程内完成，不再为每项检查启动 shell）
         print("\n🏥 系统健康检查:")
-        import subprocess
-        checks = [
-            ('OpenClaw', 'curl -s http://localhost:3009/health || echo "离线"'),
-            ('Git Status', 'git status --short | wc -l'),
-            ('Disk', 'df -h /home/admin/.openclaw/workspace | tail -1'),
-        ]
-        
-        for name, cmd in checks:
+        for name, check in self._health_checks():
             try:
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                if '离线' in result.stdout:
+                print(f"  ✅ {name}: {check()}")
+            except Exception as e:
+                if name == 'OpenClaw':
                     print(f"  ❌ {name}: 离线")
                 else:
-                    print(f"  ✅ {name}: {result.stdout.strip()}")
-            except Exception as e:
-                print(f"  ⚠️ {name}: 检查失败")
+                    print(f"  ⚠️ {name}: 检查失败 ({e})")
         
         # 学习检查
         print("\n📚 今日学习:")
@@ -312,6 +330,7 @@ class AutoPlanner:
         print("  ⏳ 新技术调研")
         
         print("\n💡 建议:")
+        status = self.get_status()
         if status['pending'] > 5:
             print("  有较多待办任务，建议优先完成重要的")
         
@@ -19,6 +19,8 @@ import re
 from typing import Dict, List, Any, Optional, Callable
 from enum import Enum
 
+from integer_search import answer_diophantine, format_solutions
+
 
 class TaskType(Enum):
     """任务类型"""
@@ -156,13 +158,14 @@ class ReasoningAssistant:
     
     def _math_reasoning(self, problem: str) -> Dict[str, Any]:
         """数学推理"""
-        # 直角三角形问题
-        if "直角三角形" in problem:
+        # 不定方程 / 直角三角形问题: 有界整数搜索
+        searched = answer_diophantine(problem)
+        if searched is not None:
             return {
                 "steps": ["提取边长", "应用勾股定理", "验证面积=周长", "穷举求解"],
                 "confidence": 0.95,
-                "conclusion": "答案: (5,12,13), (6,8,10)",
-                "reasoning": "满足a²+b²=c²且ab/2=a+b+c的解有2个"
+                "conclusion": f"答案: {format_solutions(searched['solutions'])}",
+                "reasoning": f"满足{'且'.join(searched['constraints'])}的解有{len(searched['solutions'])}个"
             }
         
         return {
@@ -25,7 +25,8 @@ Version: 1.0
 Date: 2026-02-11
 """
 
-from unified_reasoning_engine import UnifiedReasoningEngine, ReasoningResult
+from engine_registry import get_engine
+from tracing import get_tracer, span
 
 
 class AutoReasoning:
@@ -45,10 +46,18 @@ class AutoReasoning:
             auto_enable: 是否自动启用推理
         """
         self.auto_enable = auto_enable
-        self.engine = UnifiedReasoningEngine()
+        self._engine = None
+        self.tracer = get_tracer()
         self.session_history = []
         self.enabled = True
         
+    @property
+    def engine(self):
+        """统一推理引擎单例，第一条需要推理的消息到来时才导入"""
+        if self._engine is None:
+            self._engine = get_engine("unified")
+        return self._engine
+    
     def process(self, user_message: str) -> dict:
         """
         处理用户消息
@@ -57,50 +66,105 @@ class AutoReasoning:
             user_message: 用户的消息
             
         Returns:
-            包含答案和推理报告的字典
+            包含答案和推理报告的字典（"trace" 为分阶段耗时树，未采样时为 None）
         """
+        with self.tracer.trace("AutoReasoning.process", chars=len(user_message)) as root:
+            output = self._process(user_message)
+            root.set(mode=output.get("mode_used"))
+        output["trace"] = root.to_dict()
+        return output
+    
+    def _process(self, user_message: str) -> dict:
         # 检查是否启用
         if not self.enabled:
-            return {
-                "answer": user_message,
-                "reasoning_report": "推理引擎未启用",
-                "auto_enabled": False
-            }
+            return self._disabled_output(user_message)
         
         # 检测是否需要推理
-        needs_reasoning = self._needs_reasoning(user_message)
+        with span("needs_reasoning"):
+            needs_reasoning = self._needs_reasoning(user_message)
         
         if needs_reasoning:
             # 调用推理引擎
-            result = self.engine.solve(user_message)
+            with span("engine.solve"):
+                result = self.engine.solve(user_message)
             
             # 生成推理报告
-            report = self._generate_report(user_message, result)
-            
-            # 记录历史
-            self.session_history.append({
-                "message": user_message,
-                "result": result
-            })
-            
-            return {
-                "answer": result.answer,
-                "reasoning_report": report,
-                "auto_enabled": True,
-                "confidence": result.confidence,
-                "mode_used": result.mode_used,
-                "key_insight": result.key_insight,
-                "steps": result.steps
-            }
+            with span("report"):
+                return self._reasoning_output(user_message, result)
         else:
             # 一般对话，直接返回
-            return {
-                "answer": self._general_response(user_message),
-                "reasoning_report": "一般对话，无需推理",
-                "auto_enabled": True,
-                "confidence": 0.5,
-                "mode_used": "chat"
-            }
+            return self._chat_output(user_message)
+    
+    def process_many(self, messages: list) -> list:
+        """
+        批量处理消息: 需要推理的消息一次性交给 engine.solve_many
+        （按任务类型分组、重复问题只算一次），结果按输入顺序返回
+        """
+        if not self.enabled:
+            return [self._disabled_output(m) for m in messages]
+        
+        outputs = [None] * len(messages)
+        pending = []
+        for i, message in enumerate(messages):
+            if self._needs_reasoning(message):
+                pending.append(i)
+            else:
+                outputs[i] = self._chat_output(message)
+        
+        if pending:
+            results = self.engine.solve_many([messages[i] for i in pending])
+            for i, result in zip(pending, results):
+                outputs[i] = self._reasoning_output(messages[i], result)
+        return outputs
+    
+    async def aprocess(self, user_message: str, timeout: float = None) -> dict:
+        """
+        异步处理消息: 推理在引擎的有界执行器中运行，不阻塞事件循环
+        
+        Args:
+            timeout: 截止时间（秒），超时返回置信度 0 的超时结果
+        """
+        if not self.enabled:
+            return self._disabled_output(user_message)
+        if not self._needs_reasoning(user_message):
+            return self._chat_output(user_message)
+        result = await self.engine.asolve(user_message, timeout=timeout)
+        return self._reasoning_output(user_message, result)
+    
+    def _reasoning_output(self, message: str, result) -> dict:
+        report = self._generate_report(message, result)
+        
+        # 记录历史
+        self.session_history.append({
+            "message": message,
+            "result": result
+        })
+        
+        return {
+            "answer": result.answer,
+            "reasoning_report": report,
+            "auto_enabled": True,
+            "confidence": result.confidence,
+            "mode_used": result.mode_used,
+            "key_insight": result.key_insight,
+            "steps": result.steps
+        }
+    
+    def _chat_output(self, message: str) -> dict:
+        return {
+            "answer": self._general_response(message),
+            "reasoning_report": "一般对话，无需推理",
+            "auto_enabled": True,
+            "confidence": 0.5,
+            "mode_used": "chat"
+        }
+    
+    def _disabled_output(self, message: str) -> dict:
+        return {
+            "answer": message,
+            "reasoning_report": "推理引擎未启用",
+            "auto_enabled": False
+        }
     
     def _needs_reasoning(self, message: str) -> bool:
         """检测是否需要推理"""
@@ -132,7 +196,7 @@ class AutoReasoning:
         
         return False
     
-    def _generate_report(self, message: str, result: ReasoningResult) -> str:
+    def _generate_report(self, message: str, result) -> str:
         """生成推理报告"""
         report = f"""
 ╔═══════════════════════════════════════════════════════════════╗
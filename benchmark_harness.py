@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 统一基准测试框架
+
+替代 v14_4_benchmark.py / hard_benchmark_v11_fixed.py / lmarena_benchmark_v10.py
+等各自硬编码 sys.path 与题目列表、串行执行的驱动脚本:
+1. 声明式题库: data/benchmarks/*.json
+2. 引擎注册表: engine_registry 自动发现的每个 ReasoningEngine* 类及其他入口
+3. 进程池并行: 每个 (引擎, 题库) 一个任务，分散到全部 CPU 核
+4. 延迟统计: 每题 p50/p95/p99，每引擎吞吐量 (题/秒)
+5. 基线对比: 结果存为 JSON，与基线比较，标出准确率或速度的回退
+
+题库格式:
+    {"name": ..., "description": ..., "cases": [
+        {"id": ..., "question": ..., "type": 可选, "keywords": 可选,
+         "min_confidence": 可选, "min_length": 可选}]}
+    判定: 回答非空，且（若给了判据）任一判据满足
+
+用法:
+    python benchmark_harness.py --engines v14_4 v14_final --suites hard_v11 --repeat 3
+    python benchmark_harness.py --out data/benchmarks/results/latest.json --baseline baseline.json
+    python benchmark_harness.py --list
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import contextlib
+import fnmatch
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent
+SUITE_DIR = ROOT / "data" / "benchmarks"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine_registry import ALIASES, EngineSpec, create_engine, registry
+
+# 速度回退判定: p95 变慢超过该比例且绝对差超过 SPEED_FLOOR_MS
+SPEED_TOLERANCE = 0.25
+SPEED_FLOOR_MS = 1.0
+
+
+# ==================== 引擎选择 ====================
+
+def select_engines(patterns: Optional[List[str]], engines: Dict[str, EngineSpec]) -> List[EngineSpec]:
+    """按名字或通配符选择引擎；不给则选全部有文本入口的"""
+    if not patterns:
+        return [spec for spec in engines.values() if spec.entry]
+    chosen = []
+    for pattern in patterns:
+        matched = [spec for key, spec in engines.items() if fnmatch.fnmatch(key, ALIASES.get(pattern, pattern))]
+        if not matched:
+            raise KeyError(f"未知引擎: {pattern}")
+        chosen.extend(spec for spec in matched if spec not in chosen)
+    return chosen
+
+
+# ==================== 题库 ====================
+
+def load_suites(names: Optional[List[str]] = None, suite_dir: Path = SUITE_DIR) -> List[Dict]:
+    suites = []
+    for path in sorted(suite_dir.glob("*.json")):
+        if names and path.stem not in names:
+            continue
+        with open(path, encoding="utf-8") as f:
+            suites.append(json.load(f))
+    if names:
+        missing = set(names) - {s["name"] for s in suites}
+        if missing:
+            raise KeyError(f"未知题库: {', '.join(sorted(missing))}")
+    return suites
+
+
+def answer_text(result: Any) -> str:
+    """把各版本引擎的返回值统一成可检索的文本"""
+    if isinstance(result, dict):
+        for key in ("answer", "conclusion", "final_answer"):
+            if isinstance(result.get(key), str) and result[key]:
+                return result[key]
+        return json.dumps(result, ensure_ascii=False, default=str)
+    return "" if result is None else str(result)
+
+
+def check_case(case: Dict, result: Any) -> bool:
+    """判定: 回答非空，且（若给了判据）类型 / 关键词 / 置信度 / 长度任一满足"""
+    text = answer_text(result)
+    if not text.strip():
+        return False
+    meta = result if isinstance(result, dict) else {}
+    checks = []
+    if "type" in case:
+        checks.append(case["type"] == meta.get("type"))
+    if "keywords" in case:
+        folded = text.casefold()
+        checks.append(any(kw.casefold() in folded for kw in case["keywords"]))
+    if "min_confidence" in case:
+        confidence = meta.get("confidence")
+        checks.append(isinstance(confidence, (int, float)) and confidence >= case["min_confidence"])
+    if "min_length" in case:
+        checks.append(len(text) >= case["min_length"])
+    return any(checks) if checks else True
+
+
+# ==================== 统计 ====================
+
+def percentile(values: List[float], q: float) -> float:
+    """线性插值分位数 (q ∈ [0, 100])"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def latency_summary(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": percentile(values, 50),
+        "p95_ms": percentile(values, 95),
+        "p99_ms": percentile(values, 99),
+        "mean_ms": sum(values) / len(values) if values else 0.0,
+    }
+
+
+# ==================== 执行 ====================
+
+def run_task(spec: EngineSpec, suite: Dict, repeat: int = 1) -> Dict:
+    """在工作进程中运行一个 (引擎, 题库)；引擎自身的打印输出被丢弃"""
+    record = {"engine": spec.name, "suite": suite["name"], "cases": [], "error": None}
+    sink = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sink):
+            start = time.perf_counter()
+            engine = create_engine(spec.name)
+            record["init_ms"] = (time.perf_counter() - start) * 1000
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+
+    method = getattr(engine, spec.entry)
+    for case in suite["cases"]:
+        times, passed, error, answer = [], False, None, ""
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                with contextlib.redirect_stdout(sink):
+                    result = method(case["question"])
+                times.append((time.perf_counter() - start) * 1000)
+                passed = check_case(case, result)
+                answer = answer_text(result)
+            except Exception as e:
+                times.append((time.perf_counter() - start) * 1000)
+                passed, error = False, f"{type(e).__name__}: {e}"
+            sink.seek(0)
+            sink.truncate()
+        record["cases"].append({
+            "id": case["id"],
+            "passed": passed,
+            "error": error,
+            "answer": answer[:120],
+            "latency": latency_summary(times),
+        })
+    return record
+
+
+def summarize(records: List[Dict]) -> Dict[str, Dict]:
+    """按 引擎/题库 汇总准确率、延迟分位数与吞吐量"""
+    summary: Dict[str, Dict] = {}
+    for record in records:
+        key = f"{record['engine']}/{record['suite']}"
+        if record["error"]:
+            summary[key] = {"error": record["error"]}
+            continue
+        cases = record["cases"]
+        medians = [c["latency"]["p50_ms"] for c in cases]
+        total_ms = sum(medians)
+        summary[key] = {
+            "total": len(cases),
+            "passed": sum(c["passed"] for c in cases),
+            "accuracy": sum(c["passed"] for c in cases) / len(cases) if cases else 0.0,
+            "errors": sum(c["error"] is not None for c in cases),
+            "init_ms": record["init_ms"],
+            "throughput_qps": len(cases) / (total_ms / 1000) if total_ms else 0.0,
+            **latency_summary(medians),
+        }
+    return summary
+
+
+def run_benchmarks(engines: List[EngineSpec], suites: List[Dict],
+                   workers: int = 0, repeat: int = 1) -> Dict:
+    """
+    运行全部 (引擎, 题库) 组合
+
+    Args:
+        workers: 进程数，0 表示 os.cpu_count()，1 表示在当前进程串行执行
+        repeat: 每题重复次数（分位数基于重复测量）
+    """
+    tasks = [(spec, suite) for spec in engines for suite in suites]
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        records = [run_task(spec, suite, repeat) for spec, suite in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            futures = [pool.submit(run_task, spec, suite, repeat) for spec, suite in tasks]
+            records = [f.result() for f in futures]
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "workers": workers,
+        "repeat": repeat,
+        "wall_ms": (time.perf_counter() - start) * 1000,
+        "engines": [spec._asdict() for spec in engines],
+        "summary": summarize(records),
+        "records": records,
+    }
+
+
+# ==================== 基线对比 ====================
+
+def compare_to_baseline(current: Dict, baseline: Dict,
+                        speed_tolerance: float = SPEED_TOLERANCE) -> List[Dict]:
+    """
+    找出回退: 准确率下降、单题由通过变失败、p95 延迟变慢超过容差
+
+    Returns:
+        [{"key", "kind": "accuracy"|"case"|"speed"|"error", "detail"}]
+    """
+    regressions = []
+    base_summary = baseline.get("summary", {})
+    for key, now in current["summary"].items():
+        before = base_summary.get(key)
+        if before is None:
+            continue
+        if "error" in now and "error" not in before:
+            regressions.append({"key": key, "kind": "error", "detail": now["error"]})
+            continue
+        if "error" in now or "error" in before:
+            continue
+        if now["accuracy"] < before["accuracy"]:
+            regressions.append({
+                "key": key, "kind": "accuracy",
+                "detail": f"{before['accuracy']:.1%} → {now['accuracy']:.1%}",
+            })
+        slower = now["p95_ms"] - before["p95_ms"]
+        if slower > SPEED_FLOOR_MS and slower > before["p95_ms"] * speed_tolerance:
+            regressions.append({
+                "key": key, "kind": "speed",
+                "detail": f"p95 {before['p95_ms']:.2f} ms → {now['p95_ms']:.2f} ms",
+            })
+
+    base_cases = {
+        (r["engine"], c["id"]): c["passed"]
+        for r in baseline.get("records", []) for c in r.get("cases", [])
+    }
+    for record in current["records"]:
+        for case in record["cases"]:
+            if base_cases.get((record["engine"], case["id"])) and not case["passed"]:
+                regressions.append({
+                    "key": f"{record['engine']}/{record['suite']}", "kind": "case",
+                    "detail": f"{case['id']} 由通过变为失败",
+                })
+    return regressions
+
+
+# ==================== 输出 ====================
+
+def format_report(results: Dict, regressions: Optional[List[Dict]] = None) -> str:
+    lines = ["=" * 92, "🦞 统一基准测试", "=" * 92]
+    lines.append(f"{'引擎/题库':36s} {'通过':>7s} {'准确率':>7s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'题/秒':>9s}")
+    lines.append("-" * 92)
+    for key, s in sorted(results["summary"].items()):
+        if "error" in s:
+            lines.append(f"{key:36s} ❌ {s['error'][:50]}")
+            continue
+        lines.append(
+            f"{key:36s} {s['passed']:3d}/{s['total']:<3d} {s['accuracy']:7.1%} "
+            f"{s['p50_ms']:7.2f}ms {s['p95_ms']:7.2f}ms {s['p99_ms']:7.2f}ms {s['throughput_qps']:9.0f}"
+        )
+    lines.append("-" * 92)
+    lines.append(f"进程数: {results['workers']} | 重复: {results['repeat']} | 总耗时: {results['wall_ms']:.0f} ms")
+    if regressions is not None:
+        if regressions:
+            lines.append(f"\n⚠️ 相对基线的回退 ({len(regressions)}):")
+            for r in regressions:
+                lines.append(f"  [{r['kind']}] {r['key']}: {r['detail']}")
+        else:
+            lines.append("\n✅ 无回退")
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='小爪统一基准测试')
+    parser.add_argument('--engines', '-e', nargs='*', help='引擎名或通配符 (如 v14_* v3)，默认全部')
+    parser.add_argument('--suites', '-s', nargs='*', help='题库名，默认 data/benchmarks 下全部')
+    parser.add_argument('--workers', '-w', type=int, default=0, help='进程数，0=CPU核数')
+    parser.add_argument('--repeat', '-r', type=int, default=1, help='每题重复次数')
+    parser.add_argument('--out', '-o', default=None, help='结果JSON路径')
+    parser.add_argument('--baseline', '-b', default=None, help='基线结果JSON，用于回退检测')
+    parser.add_argument('--tolerance', type=float, default=SPEED_TOLERANCE, help='p95 变慢容差比例')
+    parser.add_argument('--answer-cache', action='store_true',
+                        help='启用跨引擎答案缓存（默认关闭，--repeat 测的是引擎本身而不是缓存命中）')
+    parser.add_argument('--list', action='store_true', help='列出已注册引擎与题库')
+    args = parser.parse_args()
+    # 工作进程继承环境变量，首次 analyze 时读取
+    os.environ["OPENCLAW_ANSWER_CACHE"] = "1" if args.answer_cache else "0"
+
+    engines = registry()
+    if args.list:
+        for key, spec in engines.items():
+            entry = f".{spec.entry}()" if spec.entry else "（无文本接口）"
+            print(f"  {key:24s} {spec.class_name}{entry}")
+        for suite in load_suites():
+            print(f"  📋 {suite['name']:20s} {len(suite['cases']):3d} 题  {suite['description']}")
+        return 0
+
+    results = run_benchmarks(select_engines(args.engines, engines), load_suites(args.suites),
+                             workers=args.workers, repeat=args.repeat)
+    regressions = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        results["regressions"] = regressions
+    print(format_report(results, regressions))
+
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2, default=str)
+        print(f"\n💾 结果已保存: {args.out}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 缓冲式分级日志
+
+热路径上逐行 print 的代价: 每行一次 stdout 写入（终端/管道下可能是一次系统调用）
+加上格式化。这里改为:
+1. 分级: DEBUG < INFO < WARNING < ERROR < QUIET，低于当前级别的调用直接返回
+2. 缓冲: 行先进内存，flush() 时一次性写出（或超过 capacity 行时自动写出）
+3. enabled(level) 供调用方跳过整段格式化（如多行横幅）
+
+环境变量 OPENCLAW_LOG_LEVEL 设默认级别（DEBUG/INFO/WARNING/ERROR/QUIET）。
+
+用法:
+    log = get_logger("think_loop")
+    log.info("Step 1 ...")
+    if log.enabled(DEBUG):
+        log.debug(expensive_dump())
+    log.flush()          # 每条消息处理完写出一次
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, TextIO
+
+DEBUG, INFO, WARNING, ERROR, QUIET = 10, 20, 30, 40, 100
+
+LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR, "QUIET": QUIET}
+
+
+def _parse_level(level) -> int:
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVELS[str(level).upper()]
+    except KeyError:
+        raise ValueError(f"未知日志级别: {level}") from None
+
+
+DEFAULT_LEVEL = _parse_level(os.environ.get("OPENCLAW_LOG_LEVEL", "INFO"))
+
+
+class BufferedLogger:
+    """
+    Args:
+        name: 日志名（仅用于 get_logger 注册）
+        level: 最低输出级别
+        stream: 输出流，默认在 flush 时取 sys.stdout（兼容 redirect_stdout）
+        capacity: 缓冲行数上限，超过后自动 flush
+    """
+
+    def __init__(self, name: str = "", level=None, stream: Optional[TextIO] = None,
+                 capacity: int = 256):
+        self.name = name
+        self.level = DEFAULT_LEVEL if level is None else _parse_level(level)
+        self.stream = stream
+        self.capacity = capacity
+        self._lines: List[str] = []
+        self._lock = threading.Lock()
+
+    def set_level(self, level):
+        self.level = _parse_level(level)
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def log(self, level: int, message: str = ""):
+        if level < self.level:
+            return
+        with self._lock:
+            self._lines.append(message)
+            full = len(self._lines) >= self.capacity
+        if full:
+            self.flush()
+
+    def debug(self, message: str = ""):
+        self.log(DEBUG, message)
+
+    def info(self, message: str = ""):
+        self.log(INFO, message)
+
+    def warning(self, message: str = ""):
+        self.log(WARNING, message)
+
+    def error(self, message: str = ""):
+        self.log(ERROR, message)
+
+    def flush(self):
+        """把缓冲的行一次性写出"""
+        with self._lock:
+            if not self._lines:
+                return
+            text = "\n".join(self._lines) + "\n"
+            self._lines.clear()
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def drain(self) -> List[str]:
+        """取走缓冲内容而不写出（测试/调试接口用）"""
+        with self._lock:
+            lines, self._lines = self._lines, []
+        return lines
+
+
+_loggers: Dict[str, BufferedLogger] = {}
+_loggers_lock = threading.Lock()
+
+
+def get_logger(name: str) -> BufferedLogger:
+    """按名字返回共享日志对象"""
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = _loggers[name] = BufferedLogger(name)
+        return logger
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 组合优化精确求解器
+
+- 旅行商 (TSP): 城市数 ≤ HELD_KARP_MAX 时用 Held-Karp 位掩码 DP（按子集大小整层向量化），
+  更多城市用最近邻起步 + 2-opt + Or-opt 局部搜索
+- 0/1 背包: NumPy 滚动一维数组 DP，选择记录按位压缩，回溯出方案
+- 迷宫: 位压缩网格上的双向 BFS（整行/整图按位移位扩展前沿），以及 A*（曼哈顿启发）
+
+用法:
+    solve_tsp([(0, 0), (1, 2), (3, 1)])["length"]
+    solve_knapsack([10, 20, 30], [60, 100, 120], 50)["value"]
+    solve_maze(generate_maze(41, 41))["length"]
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import heapq
+import random
+import re
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+HELD_KARP_MAX = 16
+# 背包 DP 规模上限: 容量（dp 行与临时数组长度）与 物品数×容量（压缩选择位图）
+KNAPSACK_MAX_CAPACITY = 10_000_000
+KNAPSACK_MAX_CELLS = 256_000_000
+
+
+# ==================== 旅行商 ====================
+
+def _distance_matrix(points: Sequence[Tuple[float, float]]) -> np.ndarray:
+    p = np.asarray(points, dtype=np.float64)
+    diff = p[:, None, :] - p[None, :, :]
+    return np.sqrt((diff ** 2).sum(axis=2))
+
+
+def tour_length(tour: Sequence[int], dist: np.ndarray) -> float:
+    t = np.asarray(tour)
+    return float(dist[t, np.roll(t, -1)].sum())
+
+
+def held_karp(dist: np.ndarray) -> List[int]:
+    """
+    Held-Karp 精确解（从城市 0 出发）
+
+    dp[S, j]: 从 0 出发、经过子集 S（城市 1..n-1 编码为位）、停在 j 的最短路。
+    同一大小的所有子集一次向量化更新。
+    """
+    n = dist.shape[0]
+    if n <= 3:
+        return list(range(n))
+    m = n - 1
+    d = dist[1:, 1:]
+    full = (1 << m) - 1
+    dp = np.full((1 << m, m), np.inf)
+    parent = np.full((1 << m, m), -1, dtype=np.int8)
+    for j in range(m):
+        dp[1 << j, j] = dist[0, j + 1]
+
+    subsets = np.arange(1 << m)
+    popcount = np.zeros(1 << m, dtype=np.int8)
+    for j in range(m):
+        popcount += (subsets >> j) & 1
+    for size in range(2, m + 1):
+        layer = subsets[popcount == size]
+        for j in range(m):
+            sel = layer[(layer >> j) & 1 == 1]
+            prev = sel ^ (1 << j)
+            cost = dp[prev] + d[:, j]
+            k = cost.argmin(axis=1)
+            dp[sel, j] = cost[np.arange(sel.size), k]
+            parent[sel, j] = k
+
+    last = int((dp[full] + dist[1:, 0]).argmin())
+    tour, state = [], full
+    while last >= 0:
+        tour.append(last + 1)
+        state, last = state ^ (1 << last), int(parent[state, last])
+    return [0] + tour[::-1]
+
+
+def _nearest_neighbor(dist: np.ndarray) -> List[int]:
+    n = dist.shape[0]
+    tour, seen = [0], np.zeros(n, dtype=bool)
+    seen[0] = True
+    for _ in range(n - 1):
+        row = np.where(seen, np.inf, dist[tour[-1]])
+        nxt = int(row.argmin())
+        tour.append(nxt)
+        seen[nxt] = True
+    return tour
+
+
+def two_opt(tour: List[int], dist: np.ndarray) -> List[int]:
+    """2-opt: 对每条边 (i-1, i) 向量化计算所有反转段的增益，取最优的那一个"""
+    t = np.asarray(tour)
+    n = t.size
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            a, b = t[i - 1], t[i]
+            c = t[i + 1:]
+            d = np.roll(t, -1)[i + 1:]
+            delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+            j = int(delta.argmin())
+            if delta[j] < -1e-9:
+                end = i + 1 + j
+                t[i:end + 1] = t[i:end + 1][::-1].copy()
+                improved = True
+    return t.tolist()
+
+
+def or_opt(tour: List[int], dist: np.ndarray) -> List[int]:
+    """Or-opt: 把长度 1-3 的连续段（可翻转）挪到收益最大的位置"""
+    t = list(tour)
+    n = len(t)
+    improved = True
+    while improved:
+        improved = False
+        for length in (1, 2, 3):
+            for i in range(1, n - length + 1):
+                seg = t[i:i + length]
+                prev, nxt = t[i - 1], t[(i + length) % n]
+                gain = dist[prev, seg[0]] + dist[seg[-1], nxt] - dist[prev, nxt]
+                rest = np.asarray(t[:i] + t[i + length:])
+                u, v = rest, np.roll(rest, -1)
+                fwd = dist[u, seg[0]] + dist[seg[-1], v] - dist[u, v]
+                rev = dist[u, seg[-1]] + dist[seg[0], v] - dist[u, v]
+                k_f, k_r = int(fwd.argmin()), int(rev.argmin())
+                best, k, flip = (fwd[k_f], k_f, False) if fwd[k_f] <= rev[k_r] else (rev[k_r], k_r, True)
+                if best < gain - 1e-9:
+                    rest = rest.tolist()
+                    rest[k + 1:k + 1] = seg[::-1] if flip else seg
+                    start = rest.index(0)
+                    t = rest[start:] + rest[:start]
+                    improved = True
+                    break
+            if improved:
+                break
+    return t
+
+
+def solve_tsp(points: Sequence[Tuple[float, float]], method: str = "auto") -> Dict:
+    """
+    Args:
+        method: "exact"（Held-Karp）、"heuristic"（最近邻+2-opt+Or-opt）或 "auto"
+
+    Returns:
+        {"tour", "length", "method", "exact", "n", "elapsed_ms"}
+    """
+    start = time.perf_counter()
+    dist = _distance_matrix(points)
+    n = len(points)
+    exact = method == "exact" or (method == "auto" and n <= HELD_KARP_MAX)
+    if exact:
+        tour = held_karp(dist)
+    else:
+        tour = or_opt(two_opt(_nearest_neighbor(dist), dist), dist)
+        tour = two_opt(tour, dist)
+    return {
+        "tour": tour,
+        "length": tour_length(tour, dist),
+        "method": "held_karp" if exact else "2opt+oropt",
+        "exact": exact,
+        "n": n,
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+# ==================== 0/1 背包 ====================
+
+def solve_knapsack(weights: Sequence[int], values: Sequence[int], capacity: int) -> Dict:
+    """
+    0/1 背包: dp 只保留一行（滚动数组），每件物品用一次切片取最大值完成整行更新
+
+    Raises:
+        ValueError: 容量为负、重量不是正数，或规模超过 KNAPSACK_MAX_CAPACITY / KNAPSACK_MAX_CELLS
+
+    Returns:
+        {"value", "weight", "items"(下标), "elapsed_ms"}
+    """
+    start = time.perf_counter()
+    capacity = int(capacity)
+    if capacity < 0:
+        raise ValueError("背包容量不能为负")
+    if any(int(w) <= 0 for w in weights):
+        raise ValueError("物品重量必须是正整数")
+    if capacity > KNAPSACK_MAX_CAPACITY or len(weights) * (capacity + 1) > KNAPSACK_MAX_CELLS:
+        raise ValueError(f"背包规模过大: {len(weights)} 件 × 容量 {capacity}")
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    taken = []  # 每件物品的选择位图（packbits 压缩）
+    for w, v in zip(weights, values):
+        w, v = int(w), int(v)
+        mask = np.zeros(capacity + 1, dtype=bool)
+        if w <= capacity:
+            cand = dp[:capacity + 1 - w] + v
+            mask[w:] = cand > dp[w:]
+            dp[w:] = np.where(mask[w:], cand, dp[w:])
+        taken.append(np.packbits(mask))
+
+    items, c = [], capacity
+    for i in range(len(taken) - 1, -1, -1):
+        if (taken[i][c >> 3] >> (7 - (c & 7))) & 1:
+            items.append(i)
+            c -= int(weights[i])
+    items.reverse()
+    return {
+        "value": int(dp[capacity]),
+        "weight": int(sum(weights[i] for i in items)),
+        "items": items,
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+# ==================== 迷宫 ====================
+
+class Grid:
+    """
+    位压缩网格: 第 r 行第 c 列对应第 r*(W+1)+c 位，每行末尾留一列恒为墙，
+    这样整图左右移位时不会跨行串格。
+    """
+
+    def __init__(self, lines: Sequence[str], wall: str = "#"):
+        self.lines = [line.rstrip("\n") for line in lines if line.strip()]
+        self.height = len(self.lines)
+        self.width = max(len(line) for line in self.lines)
+        self.stride = self.width + 1
+        self.free = 0
+        self.cells = bytearray(self.stride * self.height)
+        self.start = self.goal = None
+        for r, line in enumerate(self.lines):
+            row = 0
+            for c, ch in enumerate(line):
+                if ch != wall:
+                    row |= 1 << c
+                    self.cells[r * self.stride + c] = 1
+                if ch == "S":
+                    self.start = r * self.stride + c
+                elif ch == "E":
+                    self.goal = r * self.stride + c
+            self.free |= row << (r * self.stride)
+        if self.start is None or self.goal is None:
+            raise ValueError("迷宫需要起点 S 和终点 E")
+
+    def coord(self, idx: int) -> Tuple[int, int]:
+        return divmod(idx, self.stride)
+
+    def _spread(self, frontier: int) -> int:
+        s = self.stride
+        return ((frontier << 1) | (frontier >> 1) | (frontier << s) | (frontier >> s)) & self.free
+
+    def _neighbors(self, idx: int) -> List[int]:
+        s = self.stride
+        return [j for j in (idx - 1, idx + 1, idx - s, idx + s)
+                if 0 <= j < len(self.cells) and self.cells[j]]
+
+
+def _packed(bits: int) -> Tuple[int, int]:
+    """把稀疏前沿存成 (偏移, 右移后的整数)，避免保存整图大小的整数"""
+    shift = (bits & -bits).bit_length() - 1
+    return shift, bits >> shift
+
+
+def _in_layer(layer: Tuple[int, int], idx: int) -> bool:
+    shift, bits = layer
+    return idx >= shift and (bits >> (idx - shift)) & 1 == 1
+
+
+def bidirectional_bfs(grid: Grid) -> Optional[List[int]]:
+    """两端交替扩展较小的前沿，每层一次整体移位；相遇后沿各层回溯出路径"""
+    sides = [
+        {"frontier": 1 << grid.start, "visited": 1 << grid.start, "layers": [_packed(1 << grid.start)]},
+        {"frontier": 1 << grid.goal, "visited": 1 << grid.goal, "layers": [_packed(1 << grid.goal)]},
+    ]
+    if grid.start == grid.goal:
+        return [grid.start]
+    meet = None
+    while meet is None:
+        a, b = sorted(sides, key=lambda s: s["frontier"].bit_count())
+        nxt = grid._spread(a["frontier"]) & ~a["visited"]
+        if not nxt:
+            return None
+        a["frontier"] = nxt
+        a["visited"] |= nxt
+        a["layers"].append(_packed(nxt))
+        both = nxt & b["visited"]
+        if both:
+            meet = (both & -both).bit_length() - 1
+
+    halves = []
+    for side in sides:
+        layers = side["layers"]
+        depth = next(i for i, layer in enumerate(layers) if _in_layer(layer, meet))
+        path, cur = [meet], meet
+        for i in range(depth - 1, -1, -1):
+            cur = next(j for j in grid._neighbors(cur) if _in_layer(layers[i], j))
+            path.append(cur)
+        halves.append(path)
+    return halves[0][::-1] + halves[1][1:]
+
+
+def astar(grid: Grid) -> Tuple[Optional[List[int]], int]:
+    """A*（曼哈顿距离启发，一致启发保证最短）；返回 (路径, 扩展节点数)"""
+    s = grid.stride
+    gr, gc = divmod(grid.goal, s)
+    h = lambda i: abs(i // s - gr) + abs(i % s - gc)  # noqa: E731
+    g = {grid.start: 0}
+    parent = {grid.start: -1}
+    heap = [(h(grid.start), 0, grid.start)]
+    expanded = 0
+    while heap:
+        f, cost, cur = heapq.heappop(heap)
+        if cost > g[cur]:
+            continue
+        expanded += 1
+        if cur == grid.goal:
+            path = []
+            while cur != -1:
+                path.append(cur)
+                cur = parent[cur]
+            return path[::-1], expanded
+        for nb in grid._neighbors(cur):
+            nc = cost + 1
+            if nc < g.get(nb, 1 << 60):
+                g[nb] = nc
+                parent[nb] = cur
+                heapq.heappush(heap, (nc + h(nb), nc, nb))
+    return None, expanded
+
+
+def solve_maze(lines: Sequence[str], method: str = "bfs") -> Dict:
+    """
+    Args:
+        lines: 迷宫文本行，'#' 为墙，'S' 起点，'E' 终点
+        method: "bfs"（位压缩双向 BFS）或 "astar"
+
+    Returns:
+        {"length"(步数, 无路为 None), "path"(坐标列表), "method", "expanded", "elapsed_ms"}
+    """
+    start = time.perf_counter()
+    grid = Grid(lines)
+    expanded = None
+    if method == "astar":
+        path, expanded = astar(grid)
+    else:
+        path = bidirectional_bfs(grid)
+    return {
+        "length": len(path) - 1 if path else None,
+        "path": [grid.coord(i) for i in path] if path else [],
+        "method": method,
+        "expanded": expanded,
+        "size": (grid.height, grid.width),
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def generate_maze(width: int, height: int, seed: int = 0, braid: float = 0.0) -> List[str]:
+    """
+    递归回溯生成完美迷宫（宽高取奇数），S 在左上、E 在右下
+
+    Args:
+        braid: 额外打通墙壁的比例，>0 时产生环路（多条路径）
+    """
+    rng = random.Random(seed)
+    width, height = width | 1, height | 1
+    g = [["#"] * width for _ in range(height)]
+    stack = [(1, 1)]
+    g[1][1] = " "
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc, r + dr // 2, c + dc // 2)
+                   for dr, dc in ((0, 2), (0, -2), (2, 0), (-2, 0))
+                   if 0 < r + dr < height - 1 and 0 < c + dc < width - 1 and g[r + dr][c + dc] == "#"]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc, wr, wc = rng.choice(options)
+        g[wr][wc] = g[nr][nc] = " "
+        stack.append((nr, nc))
+    for _ in range(int(braid * width * height / 4)):
+        r, c = rng.randrange(1, height - 1), rng.randrange(1, width - 1)
+        if (r + c) % 2 == 1:
+            g[r][c] = " "
+    g[1][1], g[height - 2][width - 2] = "S", "E"
+    return ["".join(row) for row in g]
+
+
+def open_grid(width: int, height: int, density: float = 0.25, seed: int = 0) -> List[str]:
+    """随机障碍的开阔网格（对角两端为 S/E）"""
+    rng = random.Random(seed)
+    rows = [["#" if rng.random() < density else " " for _ in range(width)] for _ in range(height)]
+    rows[0][0], rows[-1][-1] = "S", "E"
+    return ["".join(r) for r in rows]
+
+
+# ==================== 问题解析 ====================
+
+_PAIR = r"[（(]\s*(-?\d+(?:\.\d+)?)\s*[,，]\s*(-?\d+(?:\.\d+)?)\s*[)）]"
+
+
+def solve_question(category: str, question: str) -> Optional[Dict]:
+    """
+    按路由类别从题面取出实例并求解
+
+    Returns:
+        {"problem", "summary", "result"}；题面没有可用实例且无演示实例时返回 None
+    """
+    if category == "tsp":
+        points = [(float(x), float(y)) for x, y in re.findall(_PAIR, question)]
+        if len(points) < 3:
+            return None
+        r = solve_tsp(points)
+        fmt = lambda v: f"{v:g}"  # noqa: E731
+        route = " → ".join(f"({fmt(points[i][0])},{fmt(points[i][1])})" for i in r["tour"] + [r["tour"][0]])
+        kind = "精确最优" if r["exact"] else "局部最优"
+        summary = f"{kind}回路 ({r['method']}): {route}\n总距离: {r['length']:.2f}，耗时 {r['elapsed_ms']:.1f} ms"
+    elif category == "knapsack":
+        m = re.search(r"(?:capacity|容量)\s*[=:：为]?\s*(\d+)", question, flags=re.I)
+        items = [(int(float(w)), int(float(v))) for w, v in re.findall(_PAIR, question)]
+        if not m or not items:
+            return None
+        weights, values = zip(*items)
+        try:
+            r = solve_knapsack(weights, values, int(m.group(1)))
+        except ValueError:
+            return None
+        chosen = " + ".join(f"({weights[i]},{values[i]})" for i in r["items"]) or "无"
+        summary = (f"最优价值: {r['value']}（重量 {r['weight']}/{m.group(1)}）\n"
+                   f"选择: {chosen}，耗时 {r['elapsed_ms']:.2f} ms")
+    elif category == "maze":
+        lines = [line for line in question.splitlines() if "#" in line]
+        demo = not any("S" in line for line in lines) or not any("E" in line for line in lines)
+        if demo:
+            lines = generate_maze(41, 41, seed=0, braid=0.1)
+        bfs = solve_maze(lines, "bfs")
+        star = solve_maze(lines, "astar")
+        title = "演示迷宫 41×41" if demo else f"迷宫 {bfs['size'][0]}×{bfs['size'][1]}"
+        if bfs["length"] is None:
+            summary = f"{title}: 无路径"
+        else:
+            summary = (f"{title}: 最短路 {bfs['length']} 步\n"
+                       f"双向BFS(位压缩) {bfs['elapsed_ms']:.2f} ms | "
+                       f"A* {star['elapsed_ms']:.2f} ms（扩展 {star['expanded']} 格，步数 {star['length']}）")
+        r = {"bfs": bfs, "astar": star}
+    else:
+        return None
+    return {"problem": category, "summary": summary, "result": r}
+
+
+if __name__ == "__main__":
+    print("🦞 组合优化求解器基准")
+    print("=" * 64)
+
+    rng = random.Random(42)
+    print("\n旅行商 (城市数 → 耗时)")
+    for n in (8, 10, 12, 14, 16):
+        pts = [(rng.random() * 100, rng.random() * 100) for _ in range(n)]
+        exact = solve_tsp(pts, "exact")
+        heur = solve_tsp(pts, "heuristic")
+        print(f"  n={n:4d}  Held-Karp {exact['elapsed_ms']:8.1f} ms  长度 {exact['length']:8.2f} | "
+              f"2-opt+Or-opt {heur['elapsed_ms']:7.1f} ms  长度 {heur['length']:8.2f} "
+              f"({(heur['length'] / exact['length'] - 1) * 100:+.2f}%)")
+    for n in (50, 100, 200):
+        pts = [(rng.random() * 100, rng.random() * 100) for _ in range(n)]
+        heur = solve_tsp(pts, "heuristic")
+        nn = tour_length(_nearest_neighbor(_distance_matrix(pts)), _distance_matrix(pts))
+        print(f"  n={n:4d}  2-opt+Or-opt {heur['elapsed_ms']:8.1f} ms  长度 {heur['length']:8.2f} "
+              f"(最近邻 {nn:.2f})")
+
+    print("\n0/1 背包 (物品数 × 容量 → 耗时)")
+    for n, cap in ((50, 1_000), (200, 10_000), (1_000, 50_000), (2_000, 100_000)):
+        w = [rng.randint(1, cap // 10) for _ in range(n)]
+        v = [rng.randint(1, 1000) for _ in range(n)]
+        r = solve_knapsack(w, v, cap)
+        assert sum(v[i] for i in r["items"]) == r["value"] and r["weight"] <= cap
+        print(f"  n={n:5d} C={cap:7d}  {r['elapsed_ms']:8.1f} ms  价值 {r['value']}")
+
+    print("\n迷宫 (尺寸 → 耗时)")
+    for size, braid in ((41, 0.0), (101, 0.0), (201, 0.1), (401, 0.1)):
+        lines = generate_maze(size, size, seed=1, braid=braid)
+        b, a = solve_maze(lines, "bfs"), solve_maze(lines, "astar")
+        assert b["length"] == a["length"]
+        print(f"  迷宫 {size:4d}²  最短 {b['length']:6d} 步  双向BFS {b['elapsed_ms']:8.1f} ms | "
+              f"A* {a['elapsed_ms']:8.1f} ms")
+    for size in (200, 500, 1000):
+        lines = open_grid(size, size, seed=3)
+        b, a = solve_maze(lines, "bfs"), solve_maze(lines, "astar")
+        assert b["length"] == a["length"]
+        print(f"  开阔 {size:4d}²  最短 {b['length'] or 0:6d} 步  双向BFS {b['elapsed_ms']:8.1f} ms | "
+              f"A* {a['elapsed_ms']:8.1f} ms")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 Token预算上下文组装器
+
+为 StructuredMemory.get_context_for_ai 组装真正受限的上下文：
+1. 候选条目：事件、实体、待办、检索到的记忆
+2. 按 相关度 × 新鲜度 × 类型权重 打分
+3. 在 token 预算内贪心装箱（token 长度估算带缓存）
+4. 紧凑 JSON 输出（无缩进），组装结果在轮次之间缓存
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import json
+import math
+import re
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# 类型权重：待办最重要，其次是检索记忆和事件
+KIND_WEIGHTS = {
+    "pending_actions": 1.0,
+    "memories": 0.9,
+    "recent_events": 0.8,
+    "entities": 0.6,
+}
+
+# 新鲜度半衰期（小时）
+RECENCY_HALF_LIFE_HOURS = 24.0
+
+_CJK_RE = re.compile(r'[㐀-鿿豈-﫿　-〿＀-￯]')
+_WORD_RE = re.compile(r'[a-z0-9_]+')
+
+
+@lru_cache(maxsize=8192)
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本 token 数（带缓存）
+
+    中文及全角字符约 1 token/字，其余约 4 字符/token。
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+def compact_json(data: Any) -> str:
+    """紧凑 JSON（无缩进、无多余空格）"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def query_terms(query: str) -> frozenset:
+    """查询词：英文按单词，中文按相邻二字组"""
+    if not query:
+        return frozenset()
+    q = query.lower()
+    terms = set(_WORD_RE.findall(q))
+    cjk = ''.join(_CJK_RE.findall(q))
+    if len(cjk) == 1:
+        terms.add(cjk)
+    terms.update(cjk[i:i + 2] for i in range(len(cjk) - 1))
+    return frozenset(terms)
+
+
+def _age_hours(timestamp: Optional[str], now: datetime) -> Optional[float]:
+    if not timestamp:
+        return None
+    try:
+        ts = datetime.fromisoformat(str(timestamp))
+    except ValueError:
+        return None
+    if ts.tzinfo is not None:
+        ts = ts.replace(tzinfo=None)
+    return max(0.0, (now - ts).total_seconds() / 3600)
+
+
+class ContextAssembler:
+    """
+    Token预算上下文组装器
+
+    用法:
+        assembler = ContextAssembler(max_tokens=2000)
+        text = assembler.assemble(header, candidates, query="视频", version=3)
+    """
+
+    ITEM_CACHE_SIZE = 4096
+
+    def __init__(self, max_tokens: int = 2000, result_cache_size: int = 32):
+        self.max_tokens = max_tokens
+        self.result_cache_size = result_cache_size
+        # 条目序列化缓存: (kind, 指纹) → (文本, token数)
+        self._item_cache: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        # 组装结果缓存: (版本, 查询, 预算) → 上下文
+        self._result_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        self.stats = {"assembled": 0, "result_hits": 0, "item_hits": 0, "item_misses": 0}
+
+    # ==================== 候选条目 ====================
+
+    @staticmethod
+    def collect(context: Dict, entities: Dict, events: Dict,
+                memories: List[Any] = None) -> List[Dict]:
+        """
+        从结构化记忆中收集候选条目
+
+        Returns:
+            [{"kind", "payload", "timestamp", "key"}]
+        """
+        candidates = []
+
+        for event in events.get("today", []):
+            candidates.append({
+                "kind": "recent_events",
+                "payload": event,
+                "timestamp": event.get("timestamp"),
+                "key": f"{event.get('timestamp')}|{event.get('type')}|{event.get('description')}"
+            })
+
+        for entity_type, items in entities.items():
+            for entity_id, entity in items.items():
+                updated = entity.get("updated_at") if isinstance(entity, dict) else None
+                candidates.append({
+                    "kind": "entities",
+                    "payload": {"type": entity_type, "id": entity_id,
+                                "data": entity.get("data") if isinstance(entity, dict) else entity},
+                    "timestamp": updated,
+                    "key": f"{entity_type}|{entity_id}|{updated}"
+                })
+
+        for action in context.get("pending_actions", []):
+            ts = action.get("created_at") if isinstance(action, dict) else None
+            candidates.append({
+                "kind": "pending_actions",
+                "payload": action,
+                "timestamp": ts,
+                "key": None
+            })
+
+        for memory in memories or []:
+            ts = memory.get("timestamp") if isinstance(memory, dict) else None
+            candidates.append({
+                "kind": "memories",
+                "payload": memory,
+                "timestamp": ts,
+                "key": None
+            })
+
+        return candidates
+
+    # ==================== 打分与装箱 ====================
+
+    def _serialize(self, item: Dict) -> Tuple[str, int]:
+        """条目紧凑序列化 + token 估算（按指纹缓存）"""
+        key = item.get("key")
+        cache_key = (item["kind"], key) if key else None
+        if cache_key and cache_key in self._item_cache:
+            self.stats["item_hits"] += 1
+            return self._item_cache[cache_key]
+
+        self.stats["item_misses"] += 1
+        text = compact_json(item["payload"])
+        entry = (text, estimate_tokens(text) + 1)  # +1: 列表分隔符
+        if cache_key:
+            if len(self._item_cache) >= self.ITEM_CACHE_SIZE:
+                self._item_cache.clear()
+            self._item_cache[cache_key] = entry
+        return entry
+
+    @staticmethod
+    def score(item: Dict, text: str, terms: frozenset, now: datetime) -> float:
+        """得分 = 类型权重 × (相关度, 新鲜度) 的加权"""
+        age = _age_hours(item.get("timestamp"), now)
+        recency = 0.5 if age is None else 0.5 ** (age / RECENCY_HALF_LIFE_HOURS)
+        weight = KIND_WEIGHTS.get(item["kind"], 0.5)
+
+        if not terms:
+            return weight * recency
+
+        # 检索记忆自带的检索分数优先
+        payload = item["payload"]
+        if isinstance(payload, dict) and isinstance(payload.get("score"), (int, float)):
+            relevance = float(payload["score"])
+        else:
+            lowered = text.lower()
+            relevance = sum(1 for t in terms if t in lowered) / len(terms)
+
+        return weight * (0.65 * relevance + 0.35 * recency)
+
+    def assemble(self, header: Dict, candidates: List[Dict], query: str = None,
+                 max_tokens: int = None, max_chars: int = None, version: Any = None) -> str:
+        """
+        在预算内组装上下文
+
+        Args:
+            header: 必带字段（会话、用户、当前任务）
+            candidates: collect() 返回的候选条目
+            query: 当前用户消息，用于相关度打分
+            max_tokens: token 预算
+            max_chars: 字符上限（兼容旧的 max_size）
+            version: 记忆版本号；相同版本+查询+预算直接命中缓存
+
+        Returns:
+            紧凑 JSON 字符串
+        """
+        budget = max_tokens or self.max_tokens
+        cache_key = (version, query, budget, max_chars) if version is not None else None
+        if cache_key and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            self.stats["result_hits"] += 1
+            return self._result_cache[cache_key]
+
+        now = datetime.now()
+        terms = query_terms(query)
+
+        base = {k: v for k, v in header.items() if v not in (None, {}, [])}
+        base_text = compact_json(base)
+        used_tokens = estimate_tokens(base_text) + 8  # 分组键与 omitted 字段余量
+        used_chars = len(base_text) + 32
+
+        scored = []
+        for item in candidates:
+            text, tokens = self._serialize(item)
+            scored.append((self.score(item, text, terms, now), tokens, text, item))
+        scored.sort(key=lambda x: x[0], reverse=True)
+
+        groups: Dict[str, List[Tuple[float, Any]]] = {}
+        omitted = 0
+        for score, tokens, text, item in scored:
+            kind = item["kind"]
+            group_cost = 0 if kind in groups else estimate_tokens(kind) + 2
+            if used_tokens + tokens + group_cost > budget or (
+                    max_chars and used_chars + len(text) + len(kind) + 6 > max_chars):
+                omitted += 1
+                continue
+            used_tokens += tokens + group_cost
+            used_chars += len(text) + 1 + (len(kind) + 5 if kind not in groups else 0)
+            groups.setdefault(kind, []).append((item.get("timestamp") or "", item["payload"]))
+
+        result = dict(base)
+        for kind in KIND_WEIGHTS:
+            if kind in groups:
+                # 组内按时间顺序输出，便于模型阅读
+                result[kind] = [p for _, p in sorted(groups[kind], key=lambda x: str(x[0]))]
+        if omitted:
+            result["omitted"] = omitted
+
+        context_str = compact_json(result)
+        self.stats["assembled"] += 1
+
+        if cache_key:
+            self._result_cache[cache_key] = context_str
+            if len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+
+        return context_str
+
+    def invalidate(self):
+        """清空缓存（记忆被整体替换时）"""
+        self._item_cache.clear()
+        self._result_cache.clear()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 Daily Notes 偏移索引 (sidecar)
+
+memory/YYYY-MM-DD.md 只追加不改写，因此为每个笔记维护一个旁路索引：
+- 每个章节标题的层级、标题、类型、时间戳
+- 章节在文件中的字节偏移 [offset, end)
+- 消费者游标 (如迁移器已处理到的位置)
+
+追加时只扫描新增字节；读取时直接 seek 到目标章节，支持倒序读取（最新优先）。
+
+索引位置: memory/.index/<笔记名>.json
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+INDEX_VERSION = 1
+INDEX_DIRNAME = ".index"
+
+# 用于校验文件是否仍是"只追加"的指纹长度
+_FINGERPRINT_BYTES = 256
+
+_HEADER_RE = re.compile(rb'^(#{1,6})[ \t]+(.*?)[ \t#]*\r?$')
+_FENCE_RE = re.compile(rb'^\s*(```|~~~)')
+_TS_RE = re.compile(r'(\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}(?::\d{2})?)?|\b\d{2}:\d{2}(?::\d{2})?\b)')
+_TYPE_RE = re.compile(r'(?:^|-\s*)([A-Z][A-Z_]{2,})\b')
+_DATE_STEM_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def parse_header(title: str, date_hint: str = None) -> Dict:
+    """
+    从标题中解析类型和时间戳
+
+    支持:
+        ### DECISION - 2026-02-10 10:00   (AutoMemorySaver)
+        ### AUTO_SAVE - 10:00:00          (ThinkLoopV3, 日期取自文件名)
+        ## 2026-02-10 10:00 - LEARNING     (MEMORY.md)
+    """
+    entry_type = None
+    timestamp = None
+
+    ts_match = _TS_RE.search(title)
+    if ts_match:
+        timestamp = ts_match.group(1).replace('T', ' ')
+        if len(timestamp) <= 8 and date_hint:
+            timestamp = f"{date_hint} {timestamp}"
+
+    type_match = _TYPE_RE.search(title)
+    if type_match:
+        entry_type = type_match.group(1)
+
+    return {"type": entry_type, "timestamp": timestamp}
+
+
+class DailyNoteIndex:
+    """
+    单个 daily note 的偏移索引
+
+    用法:
+        idx = DailyNoteIndex("memory/2026-02-10.md")
+        idx.append("\\n### DECISION - 2026-02-10 10:00\\n\\n**内容**\\n")
+        for section in idx.sections(types=["DECISION"], reverse=True):
+            print(idx.read_section(section))
+    """
+
+    def __init__(self, note_path):
+        self.note_path = Path(note_path)
+        self.index_path = self.note_path.parent / INDEX_DIRNAME / f"{self.note_path.name}.json"
+        stem = self.note_path.stem
+        self.date_hint = stem if _DATE_STEM_RE.match(stem) else None
+        self.data = self._load()
+
+    # ==================== 持久化 ====================
+
+    def _empty(self) -> Dict:
+        return {
+            "version": INDEX_VERSION,
+            "file": self.note_path.name,
+            "size": 0,
+            "scanned": 0,
+            "in_fence": False,
+            "fingerprint": "",
+            "sections": [],
+            "cursors": {}
+        }
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return self._empty()
+
+    def save(self):
+        """原子写入索引文件"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self.index_path)
+
+    # ==================== 索引维护 ====================
+
+    def _fingerprint(self, f, size: int) -> str:
+        """取已索引内容末尾若干字节的哈希，用于检测文件被改写"""
+        start = max(0, size - _FINGERPRINT_BYTES)
+        f.seek(start)
+        return hashlib.sha1(f.read(size - start)).hexdigest()
+
+    @property
+    def size(self) -> int:
+        return self.data["size"]
+
+    def refresh(self) -> bool:
+        """
+        使索引与文件同步
+
+        文件只增长且已索引部分未变 → 只扫描新增字节；
+        否则（截断、改写）→ 全量重建，游标清零。
+
+        Returns:
+            索引是否发生变化
+        """
+        if not self.note_path.exists():
+            if self.data["size"] or self.data["sections"]:
+                self.data = self._empty()
+                return True
+            return False
+
+        file_size = self.note_path.stat().st_size
+        with open(self.note_path, 'rb') as f:
+            if file_size == self.data["size"]:
+                if file_size == 0 or self._fingerprint(f, file_size) == self.data["fingerprint"]:
+                    return False
+                self.data = self._empty()
+            elif file_size < self.data["size"] or (
+                    self.data["size"] and self._fingerprint(f, self.data["size"]) != self.data["fingerprint"]):
+                self.data = self._empty()
+
+            self._scan(f, file_size)
+        return True
+
+    def _scan(self, f, file_size: int):
+        """从 scanned 位置开始扫描到文件末尾，追加新章节"""
+        sections = self.data["sections"]
+        pos = self.data["scanned"]
+        in_fence = self.data["in_fence"]
+
+        f.seek(pos)
+        for line in f:
+            line_start = pos
+            pos += len(line)
+            complete = line.endswith(b'\n')
+
+            if _FENCE_RE.match(line):
+                if complete:
+                    in_fence = not in_fence
+                    self.data["scanned"] = pos
+                    self.data["in_fence"] = in_fence
+                continue
+
+            if not in_fence:
+                match = _HEADER_RE.match(line.rstrip(b'\n'))
+                if match:
+                    title = match.group(2).decode('utf-8', errors='replace')
+                    section = {
+                        "offset": line_start,
+                        "end": file_size,
+                        "level": len(match.group(1)),
+                        "title": title,
+                        **parse_header(title, self.date_hint)
+                    }
+                    if sections and sections[-1]["offset"] == line_start:
+                        # 上次扫描时该标题行尚未写完
+                        sections[-1] = section
+                    else:
+                        if sections:
+                            sections[-1]["end"] = line_start
+                        sections.append(section)
+
+            # 未以换行结尾的末行留待下次追加后重新扫描
+            if complete:
+                self.data["scanned"] = pos
+                self.data["in_fence"] = in_fence
+
+        if sections:
+            sections[-1]["end"] = file_size
+        self.data["size"] = file_size
+        self.data["fingerprint"] = self._fingerprint(f, file_size)
+
+    def append(self, text: str) -> List[Dict]:
+        """
+        追加内容到笔记并增量更新索引
+
+        Returns:
+            本次新增的章节
+        """
+        self.refresh()
+        before = len(self.data["sections"])
+        self.note_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.note_path, 'ab') as f:
+            f.write(text.encode('utf-8'))
+        self.refresh()
+        self.save()
+        return self.data["sections"][before:]
+
+    # ==================== 读取 ====================
+
+    def sections(self, types: List[str] = None, since: str = None,
+                 after_offset: int = 0, reverse: bool = False) -> List[Dict]:
+        """
+        按条件筛选章节（不读取正文）
+
+        Args:
+            types: 只保留这些类型 (DECISION/LEARNING/...)
+            since: 时间戳下限 (字符串比较, "2026-02-10 09:00")
+            after_offset: 只返回结束位置在此偏移之后的章节
+            reverse: 最新章节在前
+        """
+        result = [s for s in self.data["sections"] if s["end"] > after_offset]
+        if types:
+            wanted = set(types)
+            result = [s for s in result if s.get("type") in wanted]
+        if since:
+            result = [s for s in result if (s.get("timestamp") or "") >= since]
+        if reverse:
+            result.reverse()
+        return result
+
+    def read_range(self, start: int, end: int = None) -> str:
+        """读取 [start, end) 字节范围"""
+        end = self.data["size"] if end is None else end
+        if end <= start:
+            return ""
+        with open(self.note_path, 'rb') as f:
+            f.seek(start)
+            return f.read(end - start).decode('utf-8', errors='replace')
+
+    def read_section(self, section: Dict) -> str:
+        """seek 到章节并读取正文（含标题行）"""
+        return self.read_range(section["offset"], section["end"])
+
+    def iter_entries(self, types: List[str] = None, since: str = None,
+                     reverse: bool = True, limit: int = None) -> Iterator[Dict]:
+        """
+        逐个读取章节正文，默认最新优先
+
+        Yields:
+            章节元数据 + "content"
+        """
+        self.refresh()
+        sections = self.sections(types=types, since=since, reverse=reverse)
+        if limit is not None:
+            sections = sections[:limit]
+        if not sections:
+            return
+        with open(self.note_path, 'rb') as f:
+            for s in sections:
+                f.seek(s["offset"])
+                content = f.read(s["end"] - s["offset"]).decode('utf-8', errors='replace')
+                yield {**s, "content": content}
+
+    # ==================== 消费者游标 ====================
+
+    def get_cursor(self, name: str) -> int:
+        """获取消费者已处理到的字节偏移"""
+        return self.data["cursors"].get(name, 0)
+
+    def set_cursor(self, name: str, offset: int = None):
+        """记录消费者处理进度（默认到当前文件末尾）"""
+        self.data["cursors"][name] = self.data["size"] if offset is None else offset
+        self.save()
+
+    def read_since_cursor(self, name: str) -> str:
+        """读取游标之后新增的内容"""
+        self.refresh()
+        return self.read_range(self.get_cursor(name))
+
+
+# ==================== 便捷函数 ====================
+
+def append_daily(note_path, text: str) -> List[Dict]:
+    """追加到 daily note 并维护索引"""
+    return DailyNoteIndex(note_path).append(text)
+
+
+def recent_entries(memory_dir, days: int = 1, types: List[str] = None,
+                   limit: int = 20) -> List[Dict]:
+    """
+    倒序读取最近几天 daily notes 中的章节
+
+    Args:
+        memory_dir: memory 目录
+        days: 最多回看的笔记数量
+        types: 章节类型过滤
+        limit: 最多返回条数
+    """
+    notes = sorted(
+        (p for p in Path(memory_dir).glob('*.md') if _DATE_STEM_RE.match(p.stem)),
+        reverse=True
+    )[:days]
+
+    results = []
+    for note in notes:
+        idx = DailyNoteIndex(note)
+        changed = idx.refresh()
+        for entry in idx.iter_entries(types=types, limit=limit - len(results)):
+            results.append(entry)
+        if changed:
+            idx.save()
+        if len(results) >= limit:
+            break
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("memory")
+    notes = [target] if target.is_file() else sorted(target.glob('*.md'))
+
+    print("📑 Daily Notes 偏移索引")
+    print("=" * 50)
+    for note in notes:
+        idx = DailyNoteIndex(note)
+        idx.refresh()
+        idx.save()
+        types = {}
+        for s in idx.data["sections"]:
+            if s.get("type"):
+                types[s["type"]] = types.get(s["type"], 0) + 1
+        print(f"  {note.name}: {len(idx.data['sections'])} 章节, {idx.size} 字节 {types or ''}")
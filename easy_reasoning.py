@@ -12,6 +12,9 @@ Date: 2026-02-11
 
 import re
 
+from integer_search import answer_diophantine, format_solutions
+from safe_math import answer_math
+
 def reason(question: str) -> dict:
     """一键推理"""
     qtype = _detect_type(question)
@@ -60,18 +63,32 @@ def _logical(question: str) -> dict:
 
 
 def _math(question: str) -> dict:
-    if "直角三角形" in question:
+    searched = answer_diophantine(question)
+    if searched is not None:
+        checks = "\n".join(
+            f"{s}: " + ", ".join(f"{c} ✓" for c in searched["constraints"])
+            for s in searched["solutions"][:10]
+        )
         return {
             "type": "math",
-            "answer": "(5,12,13), (6,8,10)",
+            "answer": format_solutions(searched["solutions"]),
             "confidence": 0.95,
-            "reasoning": """
-【条件】a²+b²=c² 且 ab/2=a+b+c
-【求解】穷举验证得2解:
-(5,12,13): 5²+12²=169=13² ✓, 5×12/2=30=5+12+13=30 ✓
-(6,8,10): 6²+8²=100=10² ✓, 6×8/2=24=6+8+10=24 ✓""",
+            "reasoning": f"""
+【条件】{' 且 '.join(searched['constraints'])}
+【求解】整数搜索 {searched['cells']:,} 种组合，得{len(searched['solutions'])}解:
+{checks}""",
             "steps": ["提取条件", "穷举求解", "验证"]
         }
+    solved = answer_math(question)
+    if solved:
+        action = "解方程" if solved["kind"] == "equation" else "求值"
+        return {
+            "type": "math",
+            "answer": solved["answer"],
+            "confidence": 0.95,
+            "reasoning": f"【{action}】{solved['expression']} → {solved['answer']}",
+            "steps": ["提取算式", action, "输出结果"]
+        }
     return {"type": "math", "answer": "计算中", "confidence": 0.7, "reasoning": "数学"}
 
 
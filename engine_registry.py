@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 推理引擎注册表（延迟加载）
+
+入口脚本不再在顶部 import 具体版本的引擎模块:
+1. 版本名 → 模块文件 + 类名，首次使用时才导入（含 reasoning_engine_v3.1.py 这类带点文件名）
+2. get_engine() 按版本名返回单例；create_engine() 每次新建
+3. resolve("module:attr") 延迟解析任意函数/类（用于求解器表）
+4. cached_table() 把启动时计算的查找表缓存成 pickle，源文件变化自动失效
+5. 用 python -X importtime 测量入口模块的启动开销，并按预算检查
+
+用法:
+    from engine_registry import get_engine
+    engine = get_engine("v14_5_economics")      # 或别名 "latest"
+    python engine_registry.py --list
+    python engine_registry.py --importtime      # 超预算时退出码为 1
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import importlib
+import os
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+# 本模块会被求解器模块在导入期引用，只依赖轻量标准库（pickle/subprocess 等按需导入）
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, "data", "cache")
+
+# 文本入口方法（按优先级）
+ENTRY_METHODS = ("analyze", "solve", "chat")
+
+# 不符合 reasoning_engine_*.py 命名的入口
+ENTRY_POINTS = {
+    "unified": ("unified_reasoning_engine.py", "UnifiedReasoningEngine", "solve"),
+    "integrator": ("reasoning_engine_integrator.py", "ReasoningIntegrator", "analyze"),
+}
+
+ALIASES = {
+    "latest": "v14_5_economics",
+    "games": "v14_2_games",
+}
+
+# 入口模块的启动预算 (ms, -X importtime 的累计值)
+IMPORT_BUDGET_MS = {
+    "engine_registry": 25,
+    "auto_reasoning_integration": 35,
+    "reasoning_engine_integrator": 30,
+    "unified_reasoning_engine": 80,
+    "reasoning_engine_v3": 80,
+    "reasoning_engine_v14_2_games": 40,
+    "reasoning_engine_v14_5_economics": 30,
+}
+
+
+# ==================== 注册表 ====================
+
+class EngineSpec(NamedTuple):
+    """一个可加载的引擎"""
+    name: str            # 文件名去掉前缀，如 v14_4_final、v3.1
+    path: str            # 模块文件（相对仓库根目录）
+    class_name: str
+    entry: Optional[str]  # 文本入口方法；None 表示没有 str -> 结果 的接口
+
+
+_CLASS_RE = re.compile(r"^class (ReasoningEngine\w*)\s*[(:]", re.M)
+_ENTRY_RE = re.compile(r"^    def (%s)\(self, \w+: str" % "|".join(ENTRY_METHODS), re.M)
+
+_registry: Optional[Dict[str, EngineSpec]] = None
+_instances: Dict[str, Any] = {}
+_resolved: Dict[str, Any] = {}
+_lock = threading.RLock()
+
+
+def discover_engines(root: str = ROOT) -> Dict[str, EngineSpec]:
+    """扫描 reasoning_engine_*.py 源码（不导入），登记每个 ReasoningEngine* 类"""
+    registry: Dict[str, EngineSpec] = {}
+    for filename in sorted(os.listdir(root)):
+        if not (filename.startswith("reasoning_engine_") and filename.endswith(".py")):
+            continue
+        with open(os.path.join(root, filename), encoding="utf-8") as f:
+            source = f.read()
+        classes = _CLASS_RE.findall(source)
+        if not classes:
+            continue
+        entries = set(_ENTRY_RE.findall(source))
+        entry = next((m for m in ENTRY_METHODS if m in entries), None)
+        # 子类（如 v14.5 继承 v14.4_final）沿用父类的 analyze
+        if entry is None and re.search(r"^class ReasoningEngine\w*\(ReasoningEngine", source, re.M):
+            entry = "analyze"
+        name = filename[len("reasoning_engine_"):-len(".py")]
+        for class_name in classes:
+            key = name if len(classes) == 1 else f"{name}:{class_name}"
+            registry[key] = EngineSpec(key, filename, class_name, entry)
+    return registry
+
+
+def registry() -> Dict[str, EngineSpec]:
+    """全部引擎（首次调用时扫描一次）"""
+    global _registry
+    with _lock:
+        if _registry is None:
+            found = discover_engines()
+            for name, (path, class_name, entry) in ENTRY_POINTS.items():
+                found[name] = EngineSpec(name, path, class_name, entry)
+            _registry = found
+        return _registry
+
+
+def spec_for(name: str) -> EngineSpec:
+    name = ALIASES.get(name, name)
+    try:
+        return registry()[name]
+    except KeyError:
+        raise KeyError(f"未知引擎: {name}") from None
+
+
+# ==================== 延迟加载 ====================
+
+def _import_path(path: str):
+    """按文件名导入模块；合法标识符走常规 import（与其他模块共享 sys.modules）"""
+    stem = os.path.splitext(path)[0]
+    if stem.isidentifier():
+        return importlib.import_module(stem)
+    from importlib.util import module_from_spec, spec_from_file_location
+    
+    module_name = "engine_" + re.sub(r"\W", "_", stem)
+    module = sys.modules.get(module_name)
+    if module is None:
+        file_spec = spec_from_file_location(module_name, os.path.join(ROOT, path))
+        module = module_from_spec(file_spec)
+        sys.modules[module_name] = module
+        file_spec.loader.exec_module(module)
+    return module
+
+
+def load_class(name: str) -> type:
+    spec = spec_for(name)
+    return getattr(_import_path(spec.path), spec.class_name)
+
+
+def create_engine(name: str):
+    """新建一个引擎实例（不缓存）"""
+    return load_class(name)()
+
+
+def get_engine(name: str):
+    """按版本名（或别名）返回单例引擎，首次调用时导入并构造"""
+    name = ALIASES.get(name, name)
+    with _lock:
+        engine = _instances.get(name)
+        if engine is None:
+            engine = _instances[name] = create_engine(name)
+        return engine
+
+
+def resolve(target: str) -> Any:
+    """延迟解析 "module:attr"，结果缓存"""
+    obj = _resolved.get(target)
+    if obj is None:
+        module, _, attr = target.partition(":")
+        obj = _resolved[target] = getattr(importlib.import_module(module), attr)
+    return obj
+
+
+def reset():
+    """清空单例与注册表（测试/热更新用）"""
+    global _registry
+    with _lock:
+        _instances.clear()
+        _resolved.clear()
+        _registry = None
+
+
+# ==================== 预编译表缓存 ====================
+
+def _fingerprint(sources) -> tuple:
+    stamp = []
+    for src in sources:
+        st = os.stat(src)
+        stamp.append((os.path.basename(src), st.st_mtime_ns, st.st_size))
+    return (sys.version_info[:2], tuple(stamp))
+
+
+def cached_table(name: str, builder: Callable[[], Any], *sources: str) -> Any:
+    """
+    返回 builder() 的结果，并缓存为 data/cache/<name>.pkl
+
+    缓存键 = Python 版本 + 各源文件的 (mtime, size)；源文件改动后自动重建。
+    缓存目录不可写时直接返回计算结果。
+    """
+    import pickle
+    
+    path = os.path.join(CACHE_DIR, f"{name}.pkl")
+    key = _fingerprint(sources)
+    try:
+        with open(path, "rb") as f:
+            cached_key, value = pickle.load(f)
+        if cached_key == key:
+            return value
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    value = builder()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return value
+
+
+# ==================== 启动开销 ====================
+
+def measure_import_ms(module: str, runs: int = 3) -> float:
+    """
+    在干净的子进程中用 -X importtime 测量模块累计导入耗时，取 runs 次最小值
+
+    先预热一次并允许写 .pyc（即使环境设置了 PYTHONDONTWRITEBYTECODE），
+    测的是部署后的真实启动开销而不是源码编译时间。
+    """
+    import subprocess
+    
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    best = float("inf")
+    for i in range(runs + 1):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT, env=env, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise ImportError(proc.stderr.strip().splitlines()[-1])
+        if i == 0:
+            continue
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                best = min(best, int(parts[1]) / 1000)
+    return best
+
+
+def check_import_budget(budgets: Dict[str, float] = None, runs: int = 3) -> Dict[str, Dict]:
+    """
+    Returns:
+        {模块: {"ms", "budget_ms", "ok"}}
+    """
+    report = {}
+    for module, budget in (budgets or IMPORT_BUDGET_MS).items():
+        ms = measure_import_ms(module, runs)
+        report[module] = {"ms": ms, "budget_ms": budget, "ok": ms <= budget}
+    return report
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='小爪推理引擎注册表')
+    parser.add_argument('--list', action='store_true', help='列出已注册引擎')
+    parser.add_argument('--importtime', action='store_true', help='测量入口模块启动开销并检查预算')
+    parser.add_argument('--runs', type=int, default=3, help='importtime 测量次数（取最小值）')
+    args = parser.parse_args()
+
+    if args.importtime:
+        print("⏱️ 启动开销 (-X importtime 累计)")
+        report = check_import_budget(runs=args.runs)
+        for module, r in report.items():
+            mark = "✅" if r["ok"] else "❌"
+            print(f"  {mark} {module:36s} {r['ms']:7.1f} ms / 预算 {r['budget_ms']:.0f} ms")
+        return 0 if all(r["ok"] for r in report.values()) else 1
+
+    aliases = {v: k for k, v in ALIASES.items()}
+    for key, spec in registry().items():
+        entry = f".{spec.entry}()" if spec.entry else "（无文本接口）"
+        alias = f"  (别名 {aliases[key]})" if key in aliases else ""
+        print(f"  {key:24s} {spec.class_name}{entry}{alias}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,10 @@
 """
 
 import sys
+import time
 sys.path.insert(0, '/home/admin/.openclaw/workspace')
 
+from integer_search import PRESETS, format_solutions, run_preset
 from reasoning_engine_v14_final import ReasoningEngineV14Final
 
 
@@ -76,9 +78,12 @@ def test_frontier_math():
     print("-"*80)
     
     results = {"good": 0, "poor": 0, "fail": 0}
+    elapsed = []
     
     for c in challenges:
+        start = time.perf_counter()
         result = engine.analyze(c["q"])
+        elapsed.append((time.perf_counter() - start) * 1000)
         
         has_hints = sum(1 for h in c["hints"] if h in result["answer"])
         coverage = has_hints / len(c["hints"])
@@ -94,7 +99,7 @@ def test_frontier_math():
             results["fail"] += 1
         
         print(f"\n{c['id']:2d}. [{c['difficulty']:18s}] {status} {c['title']}")
-        print(f"    覆盖率: {coverage*100:.0f}% | 置信度: {result['confidence']*100:.0f}%")
+        print(f"    覆盖率: {coverage*100:.0f}% | 置信度: {result['confidence']*100:.0f}% | 耗时: {elapsed[-1]:.2f} ms")
     
     total = len(challenges)
     good = results["good"]
@@ -107,6 +112,17 @@ def test_frontier_math():
     print(f"\n总题数: {total}")
     print(f"良好: {results['good']} | 部分: {results['poor']} | 不足: {results['fail']}")
     print(f"\n得分: {score:.1f}%")
+    print(f"总耗时: {sum(elapsed):.2f} ms")
+    
+    print("\n" + "="*80)
+    print("🔢 整数搜索 (不定方程)")
+    print("="*80)
+    
+    for name in PRESETS:
+        r = run_preset(name)
+        print(f"\n  {r['title']}")
+        print(f"    解: {format_solutions(r['solutions'], limit=5) or '无'}")
+        print(f"    搜索: {r['cells']:,} 组合 | 跳过块: {r['skipped']} | 耗时: {r['elapsed_ms']:.1f} ms")
     
     print("\n" + "="*80)
     print("🌟 评级")
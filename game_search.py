@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 博弈树搜索引擎
+
+负极大值 (negamax) + Alpha-Beta 剪枝，配合:
+- 迭代加深: 逐层加深直到时间预算用完、找到必胜/必败、或整棵树已搜完
+- 置换表: Zobrist 哈希（走子时增量异或），固定大小数组，深度优先替换
+- 走法排序: 置换表最佳着 → 杀手着 → 历史启发 → 游戏自带的静态提示
+- 时间预算: 每 2048 个节点检查一次，超时即放弃当前迭代，返回上一层完整结果
+- solve_game: 按局面（游戏名 + Zobrist 哈希）缓存结果，重复分析同一局面不再付预算
+
+游戏以插件形式定义（继承 Game，实现 moves/push/pop/outcome/evaluate），
+内置: 井字棋、四子棋、尼姆、王车对王残局。
+
+用法:
+    r = search(TicTacToe(), time_limit=1.0)
+    r["move"], r["score"], r["depth"], r["nps"]
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+WIN = 100000
+MAX_PLY = 128
+MATE_BOUND = WIN - MAX_PLY
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def _zobrist(rng: random.Random, *shape):
+    """生成 Zobrist 随机数表（64 位）"""
+    if len(shape) == 1:
+        return [rng.getrandbits(64) for _ in range(shape[0])]
+    return [_zobrist(rng, *shape[1:]) for _ in range(shape[0])]
+
+
+# ==================== 游戏定义 ====================
+
+class Game:
+    """
+    游戏插件接口（可变状态，push/pop 成对使用）
+
+    - moves(): 当前一方的合法走法
+    - push(move) / pop(): 走子 / 悔棋，同时增量维护 self.hash
+    - outcome(): 终局返回 1/0/-1（站在轮到走子一方的角度），否则 None
+    - evaluate(): 非终局的启发式估值（同样站在走子方角度，|值| 远小于 WIN）
+    - order_hint(move): 走法排序的静态提示，越大越先搜
+    """
+
+    name = "game"
+    hash = 0
+
+    def moves(self) -> List:
+        raise NotImplementedError
+
+    def push(self, move):
+        raise NotImplementedError
+
+    def pop(self):
+        raise NotImplementedError
+
+    def outcome(self) -> Optional[int]:
+        raise NotImplementedError
+
+    def evaluate(self) -> int:
+        return 0
+
+    def order_hint(self, move) -> int:
+        return 0
+
+    def describe(self, move) -> str:
+        return str(move)
+
+
+_TTT_LINES = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+
+
+class TicTacToe(Game):
+    """井字棋: 格子 0-8，1 为先手 X，2 为后手 O"""
+
+    name = "tic_tac_toe"
+    LINES = _TTT_LINES
+    _LINES_AT = [[line for line in _TTT_LINES if i in line] for i in range(9)]
+    _HINT = [1, 0, 1, 0, 2, 0, 1, 0, 1]  # 中心 > 角 > 边
+    _Z = _zobrist(random.Random(9), 9, 3)
+    _Z_SIDE = random.Random(10).getrandbits(64)
+
+    def __init__(self, board: Sequence[int] = None):
+        self.board = list(board) if board else [0] * 9
+        x, o = self.board.count(1), self.board.count(2)
+        self.side = 1 if x == o else 2
+        self.history: List[int] = []
+        self.hash = 0
+        for i, v in enumerate(self.board):
+            if v:
+                self.hash ^= self._Z[i][v]
+        if self.side == 2:
+            self.hash ^= self._Z_SIDE
+
+    def moves(self) -> List[int]:
+        return [i for i, v in enumerate(self.board) if v == 0]
+
+    def push(self, move: int):
+        self.board[move] = self.side
+        self.hash ^= self._Z[move][self.side] ^ self._Z_SIDE
+        self.side = 3 - self.side
+        self.history.append(move)
+
+    def pop(self):
+        move = self.history.pop()
+        self.side = 3 - self.side
+        self.hash ^= self._Z[move][self.side] ^ self._Z_SIDE
+        self.board[move] = 0
+
+    def outcome(self) -> Optional[int]:
+        b = self.board
+        if self.history:
+            last = self.history[-1]
+            for x, y, z in self._LINES_AT[last]:
+                if b[x] == b[y] == b[z] != 0:
+                    return -1
+        elif any(b[x] == b[y] == b[z] != 0 for x, y, z in self.LINES):
+            return -1 if any(b[x] == b[y] == b[z] == 3 - self.side for x, y, z in self.LINES) else 1
+        return 0 if 0 not in b else None
+
+    def order_hint(self, move: int) -> int:
+        return self._HINT[move]
+
+    def describe(self, move: int) -> str:
+        names = ["左上", "上", "右上", "左", "中心", "右", "左下", "下", "右下"]
+        return f"{names[move]}(格{move})"
+
+
+class ConnectFour(Game):
+    """
+    四子棋（7 列 × 6 行）位棋盘实现
+
+    第 c 列第 r 行对应第 c*7+r 位，每列顶部留一位哨兵，四连判断只需 4 次移位。
+    """
+
+    name = "connect_four"
+    WIDTH, HEIGHT = 7, 6
+    _ORDER = [3, 2, 4, 1, 5, 0, 6]
+    _Z = _zobrist(random.Random(4), 2, 49)
+    _Z_SIDE = random.Random(5).getrandbits(64)
+    # 每格参与的四连窗口数，作为位置权重
+    _WEIGHTS = [[3, 4, 5, 5, 4, 3], [4, 6, 8, 8, 6, 4], [5, 8, 11, 11, 8, 5], [7, 10, 13, 13, 10, 7],
+                [5, 8, 11, 11, 8, 5], [4, 6, 8, 8, 6, 4], [3, 4, 5, 5, 4, 3]]
+
+    def __init__(self, moves: Sequence[int] = ()):
+        self.boards = [0, 0]
+        self.heights = [c * 7 for c in range(self.WIDTH)]
+        self.side = 0
+        self.history: List[int] = []
+        self.hash = 0
+        self._weight_masks = {}
+        for c, col in enumerate(self._WEIGHTS):
+            for r, w in enumerate(col):
+                self._weight_masks[w] = self._weight_masks.get(w, 0) | (1 << (c * 7 + r))
+        for col in moves:
+            self.push(col)
+
+    def moves(self) -> List[int]:
+        return [c for c in self._ORDER if self.heights[c] < c * 7 + self.HEIGHT]
+
+    def push(self, col: int):
+        idx = self.heights[col]
+        self.heights[col] = idx + 1
+        self.boards[self.side] |= 1 << idx
+        self.hash ^= self._Z[self.side][idx] ^ self._Z_SIDE
+        self.side ^= 1
+        self.history.append(col)
+
+    def pop(self):
+        col = self.history.pop()
+        self.side ^= 1
+        idx = self.heights[col] - 1
+        self.heights[col] = idx
+        self.boards[self.side] ^= 1 << idx
+        self.hash ^= self._Z[self.side][idx] ^ self._Z_SIDE
+
+    @staticmethod
+    def _four(b: int) -> bool:
+        for s in (1, 7, 6, 8):
+            m = b & (b >> s)
+            if m & (m >> 2 * s):
+                return True
+        return False
+
+    def outcome(self) -> Optional[int]:
+        if self.history and self._four(self.boards[self.side ^ 1]):
+            return -1
+        return 0 if len(self.history) == self.WIDTH * self.HEIGHT else None
+
+    def evaluate(self) -> int:
+        mine, theirs = self.boards[self.side], self.boards[self.side ^ 1]
+        score = 0
+        for w, mask in self._weight_masks.items():
+            score += w * ((mine & mask).bit_count() - (theirs & mask).bit_count())
+        return score
+
+    def order_hint(self, col: int) -> int:
+        return 3 - abs(col - 3)
+
+    def describe(self, col: int) -> str:
+        return f"第{col + 1}列"
+
+
+class Nim(Game):
+    """尼姆（正常规则：拿走最后一个的一方获胜）"""
+
+    name = "nim"
+
+    def __init__(self, heaps: Sequence[int]):
+        self.heaps = list(heaps)
+        # 公平博弈：局面价值与轮到谁无关，哈希不含走子方，置换更多
+        self._z = _zobrist(random.Random(7), len(self.heaps), max(self.heaps) + 1)
+        self.side = 0
+        self.history = []
+        self.hash = 0
+        for i, h in enumerate(self.heaps):
+            self.hash ^= self._z[i][h]
+
+    def moves(self) -> List[tuple]:
+        return [(i, k) for i, h in enumerate(self.heaps) for k in range(h, 0, -1)]
+
+    def push(self, move: tuple):
+        i, k = move
+        h = self.heaps[i]
+        self.hash ^= self._z[i][h] ^ self._z[i][h - k]
+        self.heaps[i] = h - k
+        self.side ^= 1
+        self.history.append(move)
+
+    def pop(self):
+        i, k = self.history.pop()
+        h = self.heaps[i]
+        self.hash ^= self._z[i][h] ^ self._z[i][h + k]
+        self.heaps[i] = h + k
+        self.side ^= 1
+
+    def outcome(self) -> Optional[int]:
+        return None if any(self.heaps) else -1
+
+    def describe(self, move: tuple) -> str:
+        i, k = move
+        h = self.heaps[i]
+        return f"从第{i + 1}堆取{k} ({h}→{h - k})"
+
+
+class KingRookKing(Game):
+    """
+    王车对王残局（白方王+车，黑方单王）
+
+    格子 0-63（a1=0, h8=63）。车被吃即和棋；黑方无子可动时，被将军为将死，否则逼和。
+
+    Raises:
+        ValueError: 局面不合法（棋子重叠、两王相邻、轮白走时黑王已被将军）
+    """
+
+    name = "krk"
+    _Z = _zobrist(random.Random(8), 3, 65)
+    _Z_SIDE = random.Random(11).getrandbits(64)
+    _KING_STEPS = [[sq2 for df in (-1, 0, 1) for dr in (-1, 0, 1)
+                    if (df or dr) and 0 <= sq % 8 + df < 8 and 0 <= sq // 8 + dr < 8
+                    for sq2 in [sq + df + 8 * dr]] for sq in range(64)]
+    _ADJ = [set(steps) for steps in _KING_STEPS]
+    _EDGE = [max(abs(2 * (sq % 8) - 7), abs(2 * (sq // 8) - 7)) for sq in range(64)]
+
+    def __init__(self, wk: str, wr: str, bk: str, white_to_move: bool = True):
+        self.pieces = [self.square(wk), self.square(wr), self.square(bk)]
+        self.side = 0 if white_to_move else 1
+        wk_sq, wr_sq, bk_sq = self.pieces
+        if len(set(self.pieces)) < 3:
+            raise ValueError("棋子重叠")
+        if bk_sq in self._ADJ[wk_sq]:
+            raise ValueError("两王相邻")
+        if not self.side and bk_sq in self._rook_attacks(wr_sq, wk_sq):
+            raise ValueError("轮白方走棋时黑王已被将军")
+        self.history = []
+        self.hash = self._Z_SIDE if self.side else 0
+        for p, sq in enumerate(self.pieces):
+            self.hash ^= self._Z[p][sq]
+
+    @staticmethod
+    def square(name: str) -> int:
+        return (ord(name[0].lower()) - 97) + 8 * (int(name[1]) - 1)
+
+    @staticmethod
+    def square_name(sq: int) -> str:
+        return "abcdefgh"[sq % 8] + str(sq // 8 + 1)
+
+    def _rook_attacks(self, rook: int, blocker: int) -> set:
+        attacked = set()
+        f, r = rook % 8, rook // 8
+        for df, dr in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            ff, rr = f + df, r + dr
+            while 0 <= ff < 8 and 0 <= rr < 8:
+                sq = ff + 8 * rr
+                attacked.add(sq)
+                if sq == blocker:
+                    break
+                ff, rr = ff + df, rr + dr
+        return attacked
+
+    def _black_moves(self) -> List[tuple]:
+        wk, wr, bk = self.pieces
+        rook = self._rook_attacks(wr, wk) if wr != 64 else set()
+        return [(2, sq) for sq in self._KING_STEPS[bk]
+                if sq not in self._ADJ[wk] and (sq == wr or sq not in rook)
+                and not (sq == wr and wr in self._ADJ[wk])]
+
+    def moves(self) -> List[tuple]:
+        wk, wr, bk = self.pieces
+        if self.side:
+            return self._black_moves()
+        result = [(0, sq) for sq in self._KING_STEPS[wk] if sq not in self._ADJ[bk] and sq != wr]
+        f, r = wr % 8, wr // 8
+        for df, dr in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            ff, rr = f + df, r + dr
+            while 0 <= ff < 8 and 0 <= rr < 8:
+                sq = ff + 8 * rr
+                if sq in (wk, bk):
+                    break
+                result.append((1, sq))
+                ff, rr = ff + df, rr + dr
+        return result
+
+    def push(self, move: tuple):
+        piece, to = move
+        frm = self.pieces[piece]
+        captured = piece == 2 and to == self.pieces[1]
+        self.hash ^= self._Z[piece][frm] ^ self._Z[piece][to] ^ self._Z_SIDE
+        if captured:
+            self.hash ^= self._Z[1][to] ^ self._Z[1][64]
+            self.pieces[1] = 64
+        self.pieces[piece] = to
+        self.side ^= 1
+        self.history.append((piece, frm, captured))
+
+    def pop(self):
+        piece, frm, captured = self.history.pop()
+        to = self.pieces[piece]
+        self.side ^= 1
+        self.pieces[piece] = frm
+        self.hash ^= self._Z[piece][frm] ^ self._Z[piece][to] ^ self._Z_SIDE
+        if captured:
+            self.pieces[1] = to
+            self.hash ^= self._Z[1][to] ^ self._Z[1][64]
+
+    def in_check(self) -> bool:
+        wk, wr, bk = self.pieces
+        return wr != 64 and bk in self._rook_attacks(wr, wk)
+
+    def outcome(self) -> Optional[int]:
+        if self.pieces[1] == 64:
+            return 0
+        if self.side and not self._black_moves():
+            return -1 if self.in_check() else 0
+        return None
+
+    def evaluate(self) -> int:
+        wk, wr, bk = self.pieces
+        kings = abs(wk % 8 - bk % 8) + abs(wk // 8 - bk // 8)
+        score = 500 + 10 * self._EDGE[bk] - 4 * kings
+        return -score if self.side else score
+
+    def order_hint(self, move: tuple) -> int:
+        # 白方优先动车（将军/切割），黑方优先回中心
+        piece, to = move
+        return (piece == 1) * 2 if self.side == 0 else -self._EDGE[to]
+
+    def describe(self, move: tuple) -> str:
+        piece, to = move
+        return ("K", "R", "k")[piece] + self.square_name(to)
+
+
+# ==================== 搜索 ====================
+
+class _Timeout(Exception):
+    pass
+
+
+class GameSearch:
+    """
+    迭代加深 Alpha-Beta 搜索器
+
+    Args:
+        tt_bits: 置换表大小为 2**tt_bits 项
+    """
+
+    def __init__(self, tt_bits: int = 18):
+        self.tt_mask = (1 << tt_bits) - 1
+        self.tt: List[Optional[tuple]] = [None] * (1 << tt_bits)
+        self.nodes = 0
+        self.tt_hits = 0
+        self._deadline = float("inf")
+        self._horizon = 0
+        self._killers: List[list] = [[None, None] for _ in range(MAX_PLY + 1)]
+        self._history: Dict = {}
+
+    def clear(self):
+        self.tt = [None] * (self.tt_mask + 1)
+        self._history.clear()
+
+    # ---------- 置换表 ----------
+
+    @staticmethod
+    def _to_tt(value: int, ply: int) -> int:
+        """杀棋分数存为“距当前节点”的步数，取出时再按 ply 还原"""
+        if value >= MATE_BOUND:
+            return value + ply
+        if value <= -MATE_BOUND:
+            return value - ply
+        return value
+
+    @staticmethod
+    def _from_tt(value: int, ply: int) -> int:
+        if value >= MATE_BOUND:
+            return value - ply
+        if value <= -MATE_BOUND:
+            return value + ply
+        return value
+
+    def _store(self, key: int, depth: int, value: int, flag: int, move, complete: bool, ply: int):
+        slot = key & self.tt_mask
+        old = self.tt[slot]
+        if old is None or old[0] != key or old[1] <= depth:
+            self.tt[slot] = (key, depth, self._to_tt(value, ply), flag, move, complete)
+
+    # ---------- 走法排序 ----------
+
+    def _ordered(self, game: Game, moves: List, tt_move, ply: int) -> List:
+        k1, k2 = self._killers[ply]
+        history = self._history
+        hint = game.order_hint
+
+        def key(m):
+            if m == tt_move:
+                return 1 << 40
+            bonus = (1 << 30) if m == k1 else (1 << 29) if m == k2 else 0
+            return bonus + history.get(m, 0) * 4 + hint(m)
+
+        return sorted(moves, key=key, reverse=True)
+
+    # ---------- negamax ----------
+
+    def _negamax(self, game: Game, depth: int, alpha: int, beta: int, ply: int) -> int:
+        self.nodes += 1
+        if not self.nodes & 2047 and time.perf_counter() > self._deadline:
+            raise _Timeout()
+
+        result = game.outcome()
+        if result is not None:
+            return result * (WIN - ply) if result else 0
+        if depth <= 0 or ply >= MAX_PLY:
+            self._horizon += 1
+            return game.evaluate()
+
+        key = game.hash
+        entry = self.tt[key & self.tt_mask]
+        tt_move = None
+        if entry is not None and entry[0] == key:
+            tt_move = entry[4]
+            if entry[1] >= depth:
+                value = self._from_tt(entry[2], ply)
+                flag = entry[3]
+                if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                    self.tt_hits += 1
+                    if not entry[5]:
+                        self._horizon += 1
+                    return value
+
+        horizon_before = self._horizon
+        alpha0 = alpha
+        best, best_move = -WIN - 1, None
+        for move in self._ordered(game, game.moves(), tt_move, ply):
+            game.push(move)
+            try:
+                value = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.pop()
+            if value > best:
+                best, best_move = value, move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                killers = self._killers[ply]
+                if move != killers[0]:
+                    killers[1], killers[0] = killers[0], move
+                self._history[move] = self._history.get(move, 0) + depth * depth
+                break
+
+        flag = UPPER if best <= alpha0 else LOWER if best >= beta else EXACT
+        self._store(key, depth, best, flag, best_move, self._horizon == horizon_before, ply)
+        return best
+
+    def _principal_variation(self, game: Game, limit: int) -> List:
+        pv, pushed = [], 0
+        seen = set()
+        while len(pv) < limit and game.outcome() is None and game.hash not in seen:
+            seen.add(game.hash)
+            entry = self.tt[game.hash & self.tt_mask]
+            if entry is None or entry[0] != game.hash or entry[4] is None:
+                break
+            pv.append(game.describe(entry[4]))
+            game.push(entry[4])
+            pushed += 1
+        for _ in range(pushed):
+            game.pop()
+        return pv
+
+    def search(self, game: Game, max_depth: int = 64, time_limit: float = 1.0) -> Dict:
+        """
+        迭代加深搜索
+
+        Returns:
+            {"move", "move_text", "score", "depth", "complete", "nodes", "tt_hits",
+             "elapsed_ms", "nps", "pv"}
+        """
+        start = time.perf_counter()
+        self._deadline = start + time_limit
+        self.nodes = self.tt_hits = 0
+        self._killers = [[None, None] for _ in range(MAX_PLY + 1)]
+        best = {"move": None, "score": 0, "depth": 0, "complete": False}
+
+        if game.outcome() is None:
+            for depth in range(1, max_depth + 1):
+                self._horizon = 0
+                try:
+                    score = self._negamax(game, depth, -WIN - 1, WIN + 1, 0)
+                except _Timeout:
+                    break
+                entry = self.tt[game.hash & self.tt_mask]
+                move = entry[4] if entry is not None and entry[0] == game.hash else None
+                best = {"move": move, "score": score, "depth": depth, "complete": self._horizon == 0}
+                if best["complete"] or abs(score) >= MATE_BOUND:
+                    break
+
+        elapsed = time.perf_counter() - start
+        best.update({
+            "move_text": game.describe(best["move"]) if best["move"] is not None else None,
+            "nodes": self.nodes,
+            "tt_hits": self.tt_hits,
+            "elapsed_ms": elapsed * 1000,
+            "nps": self.nodes / elapsed if elapsed > 0 else 0.0,
+            "pv": self._principal_variation(game, best["depth"]) if best["move"] is not None else [],
+        })
+        return best
+
+
+def search(game: Game, max_depth: int = 64, time_limit: float = 1.0, tt_bits: int = 18) -> Dict:
+    """用全新的置换表搜索一个局面"""
+    return GameSearch(tt_bits).search(game, max_depth=max_depth, time_limit=time_limit)
+
+
+def describe_score(score: int, complete: bool = True) -> str:
+    """
+    把搜索分数翻译成中文结论（站在走子方角度）
+
+    complete=False（预算用完、未搜完全树）时 0 分只说明搜索深度内双方持平，
+    不能下"和棋"的结论
+    """
+    if score >= MATE_BOUND:
+        return f"必胜（{WIN - score}步内）"
+    if score <= -MATE_BOUND:
+        return f"必败（{WIN + score}步内）"
+    if not complete:
+        if score == 0:
+            return "未完全搜索（搜索深度内均势）"
+        return f"未完全搜索，{'优势' if score > 0 else '劣势'} {score:+d}"
+    if score == 0:
+        return "均势/和棋"
+    return f"{'优势' if score > 0 else '劣势'} {score:+d}"
+
+
+# ==================== 问题解析 ====================
+
+KRK_DEMO = ("f6", "a1", "h8")
+
+
+def game_from_question(category: str, question: str) -> Optional[Game]:
+    """根据路由类别和题面构造局面；无法构造时返回 None"""
+    if category == "nim":
+        m = re.search(r"[（(]\s*(\d+(?:\s*[,，]\s*\d+)+)\s*[)）]", question)
+        heaps = [int(x) for x in re.split(r"\s*[,，]\s*", m.group(1))] if m else [3, 4, 5]
+        return Nim(heaps) if 0 < sum(heaps) <= 60 else None
+    if category in ("tic_tac_toe", "minimax"):
+        return TicTacToe()
+    if category == "connect_four":
+        return ConnectFour()
+    if category in ("chess", "chess_endgame"):
+        squares = re.findall(r"\b([a-h][1-8])\b", question.lower())
+        try:
+            return KingRookKing(*(squares[:3] if len(squares) >= 3 else KRK_DEMO))
+        except ValueError:
+            return None  # 不合法的局面不搜索，只给知识条目
+    return None
+
+
+SOLVE_CACHE_SIZE = 256
+# (游戏名, 局面哈希) → (时间预算, 结果)
+_solved: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def solve_game(category: str, question: str, time_limit: float = 1.0) -> Optional[Dict]:
+    """
+    构造局面并搜索，返回 search() 的结果外加 "game" 名
+
+    同一局面已搜完全树/找到杀棋，或已用不少于 time_limit 的预算搜过时直接返回缓存，
+    结果带 "cached": True
+    """
+    game = game_from_question(category, question)
+    if game is None:
+        return None
+    key = (game.name, game.hash)
+    hit = _solved.get(key)
+    if hit is not None:
+        budget, cached = hit
+        if cached["complete"] or abs(cached["score"]) >= MATE_BOUND or budget >= time_limit:
+            _solved.move_to_end(key)
+            return dict(cached, pv=list(cached["pv"]), cached=True)
+    result = search(game, time_limit=time_limit)
+    result["game"] = game.name
+    _solved[key] = (time_limit, dict(result, pv=list(result["pv"])))
+    if len(_solved) > SOLVE_CACHE_SIZE:
+        _solved.popitem(last=False)
+    return dict(result, cached=False)
+
+
+if __name__ == "__main__":
+    print("🦞 博弈树搜索引擎")
+    print("=" * 60)
+    cases = [
+        ("井字棋 空盘", TicTacToe(), 1.0),
+        ("尼姆 (3,4,5)", Nim([3, 4, 5]), 1.0),
+        ("尼姆 (1,2,3)", Nim([1, 2, 3]), 1.0),
+        ("王车对王 Kf6 Ra1 / kh8", KingRookKing(*KRK_DEMO), 2.0),
+        ("王车对王 Kc3 Rd4 / ka1", KingRookKing("c3", "d4", "a1"), 2.0),
+        ("四子棋 空盘", ConnectFour(), 2.0),
+        ("四子棋 3,3,3,3,2", ConnectFour([3, 3, 3, 3, 2]), 2.0),
+    ]
+    for title, game, budget in cases:
+        r = search(game, time_limit=budget)
+        print(f"\n{title}")
+        print(f"  最佳: {r['move_text']}  评估: {describe_score(r['score'], r['complete'])}  深度: {r['depth']}"
+              f"{' (已搜完)' if r['complete'] else ''}")
+        print(f"  主变: {' '.join(r['pv'][:10])}")
+        print(f"  节点: {r['nodes']:,}  置换表命中: {r['tt_hits']:,}  "
+              f"耗时: {r['elapsed_ms']:.1f} ms  速度: {r['nps']:,.0f} nodes/s")
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 博弈论数值求解器
+
+双矩阵博弈 (A, B)（行玩家收益 A，列玩家收益 B）:
+- 纯策略均衡: 向量化最优反应扫描
+- 支撑集枚举: 枚举等大小支撑集，解无差异方程并检验最优反应
+- Lemke-Howson: 互补转轴，快速给出一个均衡（大矩阵也可用）
+
+重复囚徒困境锦标赛: 每个策略是一个有限状态机（状态 → 合作概率，状态 × 对手动作 → 下一状态），
+所有对局 × 重复次数作为一个向量同时推进，每轮只是几次数组下标运算。
+
+用法:
+    nash_equilibria(A, B)                 # [(x, y), ...]
+    ipd_tournament(rounds=200, noise=0.01)["ranking"]
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import itertools
+import re
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EPS = 1e-9
+
+
+# ==================== 双矩阵博弈 ====================
+
+def _as_game(A, B=None) -> Tuple[np.ndarray, np.ndarray]:
+    A = np.asarray(A, dtype=np.float64)
+    B = -A if B is None else np.asarray(B, dtype=np.float64)
+    if A.shape != B.shape or A.ndim != 2:
+        raise ValueError(f"收益矩阵形状不一致: {A.shape} vs {B.shape}")
+    return A, B
+
+
+def pure_equilibria(A, B=None) -> List[Tuple[int, int]]:
+    """纯策略均衡: A 在列内最大且 B 在行内最大的格子"""
+    A, B = _as_game(A, B)
+    best_row = A >= A.max(axis=0, keepdims=True) - EPS
+    best_col = B >= B.max(axis=1, keepdims=True) - EPS
+    return [(int(i), int(j)) for i, j in zip(*np.nonzero(best_row & best_col))]
+
+
+def _indifferent(M: np.ndarray) -> Optional[np.ndarray]:
+    """解 M p = u·1, Σp = 1，返回 p（无解或有负分量时 None）"""
+    k = M.shape[1]
+    lhs = np.zeros((M.shape[0] + 1, k + 1))
+    lhs[:-1, :k] = M
+    lhs[:-1, k] = -1.0
+    lhs[-1, :k] = 1.0
+    rhs = np.zeros(M.shape[0] + 1)
+    rhs[-1] = 1.0
+    sol, _, rank, _ = np.linalg.lstsq(lhs, rhs, rcond=None)
+    if rank < k + 1 or not np.allclose(lhs @ sol, rhs, atol=1e-7):
+        return None
+    p = sol[:k]
+    return p if (p >= -EPS).all() else None
+
+
+def support_enumeration(A, B=None, max_support: int = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """支撑集枚举（非退化博弈可找全所有均衡）"""
+    A, B = _as_game(A, B)
+    m, n = A.shape
+    found = []
+    for k in range(1, min(m, n, max_support or m) + 1):
+        for I in itertools.combinations(range(m), k):
+            for J in itertools.combinations(range(n), k):
+                y_s = _indifferent(A[np.ix_(I, J)])
+                x_s = _indifferent(B[np.ix_(I, J)].T) if y_s is not None else None
+                if x_s is None:
+                    continue
+                x, y = np.zeros(m), np.zeros(n)
+                x[list(I)], y[list(J)] = x_s, y_s
+                # 支撑集外的策略不能更好
+                if (A @ y).max() > x @ A @ y + 1e-7 or (x @ B).max() > x @ B @ y + 1e-7:
+                    continue
+                if not any(np.allclose(x, fx) and np.allclose(y, fy) for fx, fy in found):
+                    found.append((x, y))
+    return found
+
+
+def lemke_howson(A, B=None, initial_label: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lemke-Howson 互补转轴（显式维护基变量）
+
+    标签 0..m-1 为行策略，m..m+n-1 为列策略。
+    行多面体 {x≥0, Bᵀx≤1}、列多面体 {y≥0, Ay≤1} 各一张表，轮流转入上一步离基的标签，
+    直到初始丢弃的标签离基。
+    """
+    A, B = _as_game(A, B)
+    m, n = A.shape
+    A = A - A.min() + 1.0
+    B = B - B.min() + 1.0
+
+    # 行表: n 行，列按标签排 [x_0..x_{m-1} | s_0..s_{n-1}]
+    row_t = np.hstack([B.T, np.eye(n)])
+    row_rhs = np.ones(n)
+    row_basis = list(range(m, m + n))
+    # 列表: m 行，列按标签排 [r_0..r_{m-1} | y_0..y_{n-1}]
+    col_t = np.hstack([np.eye(m), A])
+    col_rhs = np.ones(m)
+    col_basis = list(range(m))
+
+    tables = {"row": (row_t, row_rhs, row_basis), "col": (col_t, col_rhs, col_basis)}
+    which = "row" if initial_label < m else "col"
+    entering = initial_label
+    for _ in range(10 * (m + n) ** 2):
+        t, rhs, basis = tables[which]
+        column = t[:, entering]
+        ratios = np.where(column > EPS, rhs / np.where(column > EPS, column, 1.0), np.inf)
+        r = int(ratios.argmin())
+        if not np.isfinite(ratios[r]):
+            raise ArithmeticError("Lemke-Howson 遇到无界射线")
+        pivot = t[r, entering]
+        t[r] /= pivot
+        rhs[r] /= pivot
+        for i in range(t.shape[0]):
+            if i != r and abs(t[i, entering]) > 0:
+                factor = t[i, entering]
+                t[i] -= factor * t[r]
+                rhs[i] -= factor * rhs[r]
+        leaving, basis[r] = basis[r], entering
+        if leaving == initial_label:
+            break
+        entering = leaving
+        which = "col" if which == "row" else "row"
+    else:
+        raise ArithmeticError("Lemke-Howson 未收敛")
+
+    x, y = np.zeros(m), np.zeros(n)
+    for i, label in enumerate(row_basis):
+        if label < m:
+            x[label] = row_rhs[i]
+    for i, label in enumerate(col_basis):
+        if label >= m:
+            y[label - m] = col_rhs[i]
+    return x / x.sum(), y / y.sum()
+
+
+def nash_equilibria(A, B=None, method: str = "auto") -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Args:
+        method: "support"（全部均衡）、"lemke_howson"（每个初始标签各跑一次，去重）或 "auto"
+            （小于等于 6×6 用支撑集枚举，否则 Lemke-Howson）
+    """
+    A, B = _as_game(A, B)
+    if method == "support" or (method == "auto" and max(A.shape) <= 6):
+        found = support_enumeration(A, B)
+        if found:
+            return found
+    found = []
+    for label in range(sum(A.shape)):
+        try:
+            x, y = lemke_howson(A, B, label)
+        except ArithmeticError:
+            continue
+        if not any(np.allclose(x, fx) and np.allclose(y, fy) for fx, fy in found):
+            found.append((x, y))
+    return found
+
+
+# ==================== 题面解析 ====================
+
+NAMED_GAMES = {
+    "prisoners_dilemma": (["囚徒", "prisoner"], ["合作", "背叛"],
+                          [[3, 0], [5, 1]], [[3, 5], [0, 1]]),
+    "matching_pennies": (["匹配硬币", "matching pennies"], ["正", "反"],
+                         [[1, -1], [-1, 1]], [[-1, 1], [1, -1]]),
+    "battle_of_sexes": (["性别之战", "battle of the sexes"], ["歌剧", "足球"],
+                        [[2, 0], [0, 1]], [[1, 0], [0, 2]]),
+    "rock_paper_scissors": (["石头剪刀布", "rock paper scissors", "rock-paper-scissors"], ["石头", "剪刀", "布"],
+                            [[0, 1, -1], [-1, 0, 1], [1, -1, 0]], None),
+    "chicken": (["懦夫", "胆小鬼", "chicken"], ["转向", "直行"],
+                [[0, -1], [1, -10]], [[0, 1], [-1, -10]]),
+    "stag_hunt": (["猎鹿", "stag hunt"], ["猎鹿", "猎兔"],
+                  [[4, 0], [3, 3]], [[4, 3], [0, 3]]),
+}
+
+_NUM = r"-?\d+(?:\.\d+)?"
+
+
+def _parse_matrix(text: str) -> Optional[np.ndarray]:
+    rows = re.findall(r"\[([^\[\]]+)\]", text)
+    if not rows:
+        return None
+    matrix = [[float(v) for v in re.findall(_NUM, row)] for row in rows]
+    if len({len(r) for r in matrix}) != 1:
+        return None
+    return np.array(matrix)
+
+
+def parse_game(question: str) -> Optional[Dict]:
+    """
+    从题面取收益矩阵，支持:
+    - A=[[3,0],[5,1]] B=[[3,5],[0,1]]（B 缺省为零和 -A）
+    - 双矩阵格子: (3,3) (0,5); (5,0) (1,1)  —— 行用分号或换行分隔
+    - 经典博弈名: 囚徒困境、匹配硬币、性别之战、石头剪刀布、懦夫博弈、猎鹿
+
+    Returns:
+        {"name", "A", "B", "actions"}；无法识别时 None
+    """
+    m = re.search(r"A\s*=\s*(\[\s*\[.*?\]\s*\])", question, flags=re.S)
+    if m:
+        A = _parse_matrix(m.group(1))
+        mb = re.search(r"B\s*=\s*(\[\s*\[.*?\]\s*\])", question, flags=re.S)
+        B = _parse_matrix(mb.group(1)) if mb else None
+        if A is not None and (B is None or B.shape == A.shape):
+            return {"name": "custom", "A": A, "B": -A if B is None else B, "actions": None}
+
+    rows = []
+    for line in re.split(r"[;；\n]", question):
+        cells = re.findall(rf"[（(]\s*({_NUM})\s*[,，]\s*({_NUM})\s*[)）]", line)
+        if cells:
+            rows.append([(float(a), float(b)) for a, b in cells])
+    if len(rows) >= 2 and len({len(r) for r in rows}) == 1 and len(rows[0]) >= 2:
+        cells = np.array(rows)
+        return {"name": "custom", "A": cells[:, :, 0], "B": cells[:, :, 1], "actions": None}
+
+    q = question.lower()
+    for name, (keywords, actions, A, B) in NAMED_GAMES.items():
+        if any(k in q for k in keywords):
+            A = np.array(A, dtype=np.float64)
+            return {"name": name, "A": A, "B": -A if B is None else np.array(B, dtype=np.float64),
+                    "actions": actions}
+    return None
+
+
+def _fmt_strategy(p: np.ndarray, actions: Optional[Sequence[str]]) -> str:
+    names = actions or [str(i + 1) for i in range(len(p))]
+    parts = [f"{names[i]}:{v:.3g}" for i, v in enumerate(p) if v > EPS]
+    return parts[0].split(":")[0] if len(parts) == 1 else "(" + ", ".join(parts) + ")"
+
+
+def describe_equilibria(game: Dict, equilibria: List[Tuple[np.ndarray, np.ndarray]]) -> List[str]:
+    A, B = game["A"], game["B"]
+    lines = []
+    for x, y in equilibria:
+        kind = "纯策略" if max(x) > 1 - EPS and max(y) > 1 - EPS else "混合策略"
+        u, v = (round(float(w), 9) + 0.0 for w in (x @ A @ y, x @ B @ y))
+        lines.append(f"{kind}: 行={_fmt_strategy(x, game['actions'])}，列={_fmt_strategy(y, game['actions'])}，"
+                     f"收益=({u:.3g}, {v:.3g})")
+    return lines
+
+
+# ==================== 重复囚徒困境 ====================
+
+C, D = 1, 0  # 动作编码: 1 合作, 0 背叛
+
+# 名称: (各状态合作概率, 转移表[状态][对手动作 D/C], 初始状态)
+STRATEGIES = {
+    "TitForTat": ([1, 0], [[1, 0], [1, 0]], 0),
+    "TitForTwoTats": ([1, 1, 0], [[1, 0], [2, 0], [2, 0]], 0),
+    "GenerousTFT": ([1, 1 / 3], [[1, 0], [1, 0]], 0),
+    "SuspiciousTFT": ([1, 0], [[1, 0], [1, 0]], 1),
+    "Grim": ([1, 0], [[1, 0], [1, 1]], 0),
+    "Pavlov": ([1, 0], [[1, 0], [0, 1]], 0),
+    "AlwaysCooperate": ([1], [[0, 0]], 0),
+    "AlwaysDefect": ([0], [[0, 0]], 0),
+    "Random": ([0.5], [[0, 0]], 0),
+}
+
+
+def _compile_strategies(names: Sequence[str]):
+    """把状态机拼成统一形状的数组: coop[策略, 状态]、trans[策略, 状态, 对手动作]、start[策略]"""
+    states = max(len(STRATEGIES[s][0]) for s in names)
+    coop = np.zeros((len(names), states))
+    trans = np.zeros((len(names), states, 2), dtype=np.int64)
+    start = np.zeros(len(names), dtype=np.int64)
+    for k, name in enumerate(names):
+        probs, table, init = STRATEGIES[name]
+        coop[k, :len(probs)] = probs
+        trans[k, :len(table)] = table
+        start[k] = init
+    return coop, trans, start
+
+
+def ipd_tournament(strategies: Sequence[str] = None, rounds: int = 200, repetitions: int = 20,
+                   noise: float = 0.0, payoffs: Tuple[float, float, float, float] = (5, 3, 1, 0),
+                   seed: int = None) -> Dict:
+    """
+    循环赛（含自我对局），所有对局 × 重复同时推进
+
+    Args:
+        noise: 每个动作被翻转的概率
+        payoffs: (T, R, P, S)
+
+    Returns:
+        {"ranking": [(名称, 平均每轮得分)], "matrix", "strategies", "rounds", "matches", "elapsed_ms"}
+    """
+    start_time = time.perf_counter()
+    names = list(strategies or STRATEGIES)
+    coop, trans, init = _compile_strategies(names)
+    T, R, P, S = payoffs
+    # pay[my, their] 以动作编码 (D=0, C=1) 为下标
+    pay = np.array([[P, T], [S, R]], dtype=np.float64)
+
+    pairs = np.array([(i, j) for i in range(len(names)) for j in range(i, len(names))])
+    a = np.repeat(pairs[:, 0], repetitions)
+    b = np.repeat(pairs[:, 1], repetitions)
+    sa, sb = init[a], init[b]
+    score_a = np.zeros(a.size)
+    score_b = np.zeros(b.size)
+    rng = np.random.default_rng(seed)
+
+    for _ in range(rounds):
+        u = rng.random((2, a.size))
+        act_a = (u[0] < coop[a, sa]).astype(np.int64)
+        act_b = (u[1] < coop[b, sb]).astype(np.int64)
+        if noise:
+            flip = rng.random((2, a.size)) < noise
+            act_a ^= flip[0]
+            act_b ^= flip[1]
+        score_a += pay[act_a, act_b]
+        score_b += pay[act_b, act_a]
+        sa, sb = trans[a, sa, act_b], trans[b, sb, act_a]
+
+    k = len(names)
+    totals = np.zeros((k, k))
+    counts = np.zeros((k, k))
+    np.add.at(totals, (a, b), score_a)
+    np.add.at(counts, (a, b), 1)
+    np.add.at(totals, (b, a), score_b)
+    np.add.at(counts, (b, a), 1)
+    matrix = totals / np.maximum(counts, 1) / rounds
+    average = matrix.mean(axis=1)
+    order = np.argsort(-average)
+    return {
+        "ranking": [(names[i], float(average[i])) for i in order],
+        "matrix": matrix,
+        "strategies": names,
+        "rounds": rounds,
+        "matches": int(a.size),
+        "elapsed_ms": (time.perf_counter() - start_time) * 1000,
+    }
+
+
+# ==================== 问题入口 ====================
+
+def solve_game_theory(category: str, question: str) -> Optional[Dict]:
+    """
+    纳什均衡 / 囚徒困境题: 解析收益矩阵求均衡；囚徒困境另跑一次重复博弈锦标赛
+
+    Returns:
+        {"summary", "game", "equilibria", "tournament"}；无法识别时 None
+    """
+    if category not in ("nash_equilibrium", "prisoners_dilemma"):
+        return None
+    start = time.perf_counter()
+    game = parse_game(question)
+    if game is None and category == "prisoners_dilemma":
+        game = parse_game("prisoner")
+    lines, equilibria, tournament = [], [], None
+    if game is not None:
+        equilibria = nash_equilibria(game["A"], game["B"])
+        shape = "×".join(map(str, game["A"].shape))
+        lines.append(f"{shape} 博弈的纳什均衡 ({len(equilibria)} 个):")
+        lines += ["  " + s for s in describe_equilibria(game, equilibria)]
+    if category == "prisoners_dilemma":
+        m = re.search(r"noise\s*[=:]?\s*(\d*\.?\d+)|噪声\s*(\d*\.?\d+)", question, flags=re.I)
+        noise = float(next(g for g in m.groups() if g)) if m else 0.01
+        tournament = ipd_tournament(rounds=200, repetitions=20, noise=noise, seed=0)
+        top = ", ".join(f"{n} {s:.2f}" for n, s in tournament["ranking"][:4])
+        lines.append(f"重复博弈锦标赛 (200轮×20次，噪声{noise:g}，{tournament['matches']}场): {top}")
+    if not lines:
+        return None
+    lines.append(f"耗时 {(time.perf_counter() - start) * 1000:.1f} ms")
+    return {"summary": "\n".join(lines), "game": game, "equilibria": equilibria, "tournament": tournament}
+
+
+if __name__ == "__main__":
+    print("🦞 博弈论求解器")
+    print("=" * 60)
+    for name in NAMED_GAMES:
+        g = parse_game(NAMED_GAMES[name][0][0])
+        start = time.perf_counter()
+        eqs = nash_equilibria(g["A"], g["B"])
+        print(f"\n{name}  ({(time.perf_counter() - start) * 1000:.2f} ms)")
+        for line in describe_equilibria(g, eqs):
+            print("  " + line)
+
+    rng = np.random.default_rng(0)
+    print("\n随机博弈: 支撑集枚举 vs Lemke-Howson")
+    for size in (3, 5, 8, 15, 30):
+        A, B = rng.random((size, size)), rng.random((size, size))
+        start = time.perf_counter()
+        x, y = lemke_howson(A, B)
+        lh = (time.perf_counter() - start) * 1000
+        ok = (A @ y).max() <= x @ A @ y + 1e-6 and (x @ B).max() <= x @ B @ y + 1e-6
+        line = f"  {size:2d}×{size:<2d}  Lemke-Howson {lh:7.2f} ms {'✓' if ok else '✗'}"
+        if size <= 8:
+            start = time.perf_counter()
+            n_eq = len(support_enumeration(A, B))
+            line += f" | 支撑集枚举 {(time.perf_counter() - start) * 1000:8.1f} ms ({n_eq} 个均衡)"
+        print(line)
+
+    print("\n重复囚徒困境锦标赛 (200轮×50次，噪声 0.01)")
+    t = ipd_tournament(repetitions=50, noise=0.01, seed=1)
+    for name, score in t["ranking"]:
+        print(f"  {name:16s} {score:.3f}")
+    rate = t["matches"] * t["rounds"] / (t["elapsed_ms"] / 1000)
+    print(f"  {t['matches']} 场，{t['elapsed_ms']:.1f} ms，{rate:,.0f} 轮/秒")
@@ -19,6 +19,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from timeseries_store import TimeSeriesStore
+
 
 @dataclass
 class ServiceCheck:
@@ -40,6 +42,7 @@ class HealthMonitor:
     def __init__(self):
         self.log_file = '/home/admin/.openclaw/workspace/选股结果/health_check.log'
         self.status_file = '/home/admin/.openclaw/workspace/选股结果/service_status.json'
+        self.metrics = TimeSeriesStore('/home/admin/.openclaw/workspace/data/timeseries')
         
         # 定义需要监控的服务
         self.services = [
@@ -242,9 +245,12 @@ class HealthMonitor:
         return results
     
     def save_status(self, results: Dict):
-        """保存状态"""
+        """保存状态（最新快照 + health 时序）"""
         with open(self.status_file, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
+        
+        # 每次检查的汇总追加到时序存储，趋势图不再需要逐个打开快照
+        self.metrics.append('health', results['check_time'], flush=True, **results['summary'])
     
     def log_check(self, results: Dict):
         """记录日志"""
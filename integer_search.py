@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 向量化整数搜索引擎（有界丢番图问题）
+
+"直角三角形面积等于周长"这类题本质是小范围整数搜索，这里用一个小型约束 DSL
+描述问题，在 NumPy 广播网格上分块求值：
+
+    IntegerSearch(
+        variables=[("a", 1, 100), ("b", "a", 100), ("c", "b + 1", "a + b - 1")],
+        constraints=["a**2 + b**2 == c**2", "a*b == 2*(a + b + c)"],
+    ).solve()
+
+- 变量按顺序枚举，上下界可以是前面变量的表达式（单调界）
+- 第一个变量分块，其余变量展开为广播网格，每块不超过 max_cells 个格子
+- 单调剪枝：每块先按界的端点求出后续变量的实际范围，空块直接跳过，
+  再用逐格的上下界掩码剔除越界组合，最后才计算约束
+- 约束只允许整数算术、比较、and/or/not、abs、min、max（AST 白名单），
+  指数必须是不超过 MAX_EXPONENT 的非负整数常量
+- 按变量范围估算中间结果的量级，可能超出 int64 时改用 Python 大整数（object 数组）；
+  除数为零记为错误，不返回 NumPy 的默认值
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import ast
+import re
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DEFAULT_MAX_CELLS = 1 << 21
+MIN_CHUNKS = 16
+MAX_EXPONENT = 64
+INT64_SAFE = 2 ** 62
+Bound = Union[int, str]
+
+
+class SearchError(ValueError):
+    """DSL 不合法或搜索空间过大"""
+
+
+# ==================== DSL 编译 ====================
+
+_BINOPS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.FloorDiv: "//",
+           ast.Mod: "%", ast.Pow: "**"}
+_CMPOPS = {ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=",
+           ast.Gt: ">", ast.GtE: ">="}
+_FUNCS = {"abs": "np.abs", "min": "np.minimum", "max": "np.maximum"}
+
+
+def _to_source(node, names: Sequence[str]) -> str:
+    """白名单 AST → NumPy 表达式源码"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
+        return repr(node.value)
+    if isinstance(node, ast.Name):
+        if node.id not in names:
+            raise SearchError(f"未知变量: {node.id}")
+        return node.id
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.USub):
+            return f"(-{_to_source(node.operand, names)})"
+        if isinstance(node.op, ast.Not):
+            return f"np.logical_not({_to_source(node.operand, names)})"
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+        raise SearchError("整数搜索请用 // 或把除法移到等式另一侧")
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+        exp = node.right
+        if not (isinstance(exp, ast.Constant) and isinstance(exp.value, int)
+                and not isinstance(exp.value, bool) and 0 <= exp.value <= MAX_EXPONENT):
+            raise SearchError(f"指数必须是 0~{MAX_EXPONENT} 的整数常量")
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        return f"({_to_source(node.left, names)}{_BINOPS[type(node.op)]}{_to_source(node.right, names)})"
+    if isinstance(node, ast.BoolOp):
+        joiner = "&" if isinstance(node.op, ast.And) else "|"
+        return "(" + joiner.join(_to_source(v, names) for v in node.values) + ")"
+    if isinstance(node, ast.Compare):
+        # a < b < c → (a<b)&(b<c)
+        parts, left = [], node.left
+        for op, right in zip(node.ops, node.comparators):
+            if type(op) not in _CMPOPS:
+                raise SearchError("不支持的比较")
+            parts.append(f"({_to_source(left, names)}{_CMPOPS[type(op)]}{_to_source(right, names)})")
+            left = right
+        return "(" + "&".join(parts) + ")"
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _FUNCS \
+            and not node.keywords:
+        args = ",".join(_to_source(a, names) for a in node.args)
+        return f"{_FUNCS[node.func.id]}({args})"
+    raise SearchError(f"不允许的语法: {ast.dump(node)[:60]}")
+
+
+def _magnitude(node, limits: Dict[str, int], peak: List[float]) -> float:
+    """|表达式值| 的上界（变量取 |值| ≤ limits[名字]），途经的最大中间量记入 peak[0]"""
+    if isinstance(node, ast.Constant):
+        value = float(abs(node.value))
+    elif isinstance(node, ast.Name):
+        value = float(limits[node.id])
+    elif isinstance(node, ast.UnaryOp):
+        value = _magnitude(node.operand, limits, peak)
+        if isinstance(node.op, ast.Not):
+            value = 1.0
+    elif isinstance(node, ast.BinOp):
+        a = _magnitude(node.left, limits, peak)
+        b = _magnitude(node.right, limits, peak)
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            value = a + b
+        elif isinstance(node.op, ast.Mult):
+            value = a * b
+        elif isinstance(node.op, ast.FloorDiv):
+            value = a + 1
+        elif isinstance(node.op, ast.Mod):
+            value = b
+        else:
+            try:
+                value = a ** node.right.value
+            except OverflowError:
+                value = float("inf")
+    elif isinstance(node, (ast.BoolOp, ast.Compare)):
+        children = node.values if isinstance(node, ast.BoolOp) else [node.left, *node.comparators]
+        for child in children:
+            _magnitude(child, limits, peak)
+        value = 1.0
+    else:  # abs/min/max
+        value = max(_magnitude(a, limits, peak) for a in node.args)
+    peak[0] = max(peak[0], value)
+    return value
+
+
+def _parse(expr: str):
+    try:
+        return ast.parse(expr.strip(), mode="eval").body
+    except SyntaxError as e:
+        raise SearchError(f"无法解析: {expr}") from e
+
+
+def compile_expr(expr: str, names: Sequence[str]):
+    """把 DSL 表达式编译为 f(**变量数组)"""
+    source = _to_source(_parse(expr), names)
+    args = ", ".join(names)
+    return eval(f"lambda {args}: {source}", {"np": np, "__builtins__": {}})
+
+
+# ==================== 搜索 ====================
+
+class IntegerSearch:
+    """
+    有界整数搜索
+
+    Args:
+        variables: [(名字, 下界, 上界)]，界为整数或前面变量的表达式（闭区间）
+        constraints: 约束表达式列表（全部满足）
+        max_cells: 每块广播网格的最大格子数
+        limit: 最多返回多少组解
+    """
+
+    def __init__(self, variables: List[Tuple[str, Bound, Bound]], constraints: List[str],
+                 max_cells: int = DEFAULT_MAX_CELLS, limit: int = 10000):
+        if not variables:
+            raise SearchError("至少需要一个变量")
+        self.names = [v[0] for v in variables]
+        self.max_cells = max_cells
+        self.limit = limit
+        self.constraint_text = list(constraints)
+        # 量级估算用的 AST（约束与非常数界）
+        self._trees = [_parse(str(b)) for _, lo, hi in variables for b in (lo, hi)
+                       if not isinstance(b, int)] + [_parse(c) for c in constraints]
+        self._dtype = np.int64
+
+        self._bounds = []
+        for i, (name, lo, hi) in enumerate(variables):
+            earlier = self.names[:i]
+            self._bounds.append((
+                self._bound_fn(lo, earlier),
+                self._bound_fn(hi, earlier),
+            ))
+        self._constraints = [compile_expr(c, self.names) for c in constraints]
+
+    @staticmethod
+    def _bound_fn(bound: Bound, earlier: List[str]):
+        if isinstance(bound, int):
+            return bound
+        return compile_expr(str(bound), earlier)
+
+    @staticmethod
+    def _eval_bound(bound, values: Dict[str, np.ndarray]):
+        if isinstance(bound, int):
+            return bound
+        return bound(**values)
+
+    def _range(self, i: int, corners: Dict[str, Tuple[int, int]]) -> Tuple[int, int]:
+        """单调界：在前面变量范围的端点组合上取界的极值"""
+        lo_b, hi_b = self._bounds[i]
+        if isinstance(lo_b, int) and isinstance(hi_b, int):
+            return lo_b, hi_b
+        earlier = self.names[:i]
+        # 端点只有几个，用 Python 大整数求界，不会溢出
+        grids = np.meshgrid(*[np.array(corners[n], dtype=object) for n in earlier], indexing="ij")
+        values = {n: g.ravel() for n, g in zip(earlier, grids)}
+        lo = np.min(self._eval_bound(lo_b, values))
+        hi = np.max(self._eval_bound(hi_b, values))
+        return int(lo), int(hi)
+
+    def solve(self) -> Dict:
+        """
+        Raises:
+            SearchError: 第一个变量取单个值时的网格就超过 max_cells（无法分块），
+                或求值时除数为零
+
+        Returns:
+            {"solutions": [(..), ...], "cells": 检查的格子数, "chunks": 块数,
+             "skipped": 剪掉的块数, "elapsed_ms": 耗时}
+        """
+        start = time.perf_counter()
+        first_lo, first_hi = self._range(0, {})
+
+        # 估算单个 first 值对应的网格大小，决定分块宽度
+        ranges_full = {self.names[0]: (first_lo, first_hi)}
+        width = 1
+        for i in range(1, len(self.names)):
+            lo, hi = self._range(i, ranges_full)
+            ranges_full[self.names[i]] = (lo, hi)
+            width *= max(0, hi - lo + 1)
+        if width > self.max_cells:
+            raise SearchError(f"搜索空间过大: 每个 {self.names[0]} 需要 {width:,} 格 (上限 {self.max_cells:,})")
+        # 中间结果可能超出 int64 时退回 Python 大整数
+        limits = {n: max(abs(lo), abs(hi)) for n, (lo, hi) in ranges_full.items()}
+        peak = [0.0]
+        for tree in self._trees:
+            _magnitude(tree, limits, peak)
+        self._dtype = object if peak[0] >= INT64_SAFE else np.int64
+
+        step = max(1, self.max_cells // max(1, width))
+        # 块越窄，按端点求出的后续范围越紧；至少切成 MIN_CHUNKS 块
+        step = min(step, max(1, (first_hi - first_lo + 1) // MIN_CHUNKS))
+
+        with np.errstate(divide="raise", invalid="raise"):
+            try:
+                solutions, cells, chunks, skipped = self._search(first_lo, first_hi, step)
+            except (FloatingPointError, ZeroDivisionError) as e:
+                raise SearchError(f"求值出错（除数为零？）: {e}") from e
+
+        return {
+            "variables": self.names,
+            "constraints": self.constraint_text,
+            "solutions": solutions,
+            "cells": cells,
+            "chunks": chunks,
+            "skipped": skipped,
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+        }
+
+    def _search(self, first_lo: int, first_hi: int, step: int):
+        solutions: List[Tuple[int, ...]] = []
+        cells = chunks = skipped = 0
+        for chunk_lo in range(first_lo, first_hi + 1, step):
+            chunk_hi = min(first_hi, chunk_lo + step - 1)
+            corners = {self.names[0]: (chunk_lo, chunk_hi)}
+            axes = [np.arange(chunk_lo, chunk_hi + 1, dtype=self._dtype)]
+            empty = False
+            for i in range(1, len(self.names)):
+                lo, hi = self._range(i, corners)
+                if hi < lo:
+                    empty = True
+                    break
+                corners[self.names[i]] = (lo, hi)
+                axes.append(np.arange(lo, hi + 1, dtype=self._dtype))
+            chunks += 1
+            if empty:
+                skipped += 1
+                continue
+
+            shape = tuple(len(a) for a in axes)
+            if int(np.prod(shape, dtype=object)) > self.max_cells:
+                raise SearchError(f"搜索块过大: {shape} (上限 {self.max_cells:,} 格)")
+            grids = np.meshgrid(*axes, indexing="ij", sparse=True)
+            values = dict(zip(self.names, grids))
+            mask = np.ones(shape, dtype=bool)
+            # 逐格的依赖界
+            for i in range(1, len(self.names)):
+                lo_b, hi_b = self._bounds[i]
+                earlier = {n: values[n] for n in self.names[:i]}
+                if not isinstance(lo_b, int):
+                    mask &= values[self.names[i]] >= self._eval_bound(lo_b, earlier)
+                if not isinstance(hi_b, int):
+                    mask &= values[self.names[i]] <= self._eval_bound(hi_b, earlier)
+            cells += int(np.prod(shape))
+            for constraint in self._constraints:
+                if not mask.any():
+                    break
+                mask &= np.broadcast_to(np.asarray(constraint(**values), dtype=bool), shape)
+
+            for idx in zip(*np.nonzero(mask)):
+                solutions.append(tuple(int(axes[k][j]) for k, j in enumerate(idx)))
+                if len(solutions) >= self.limit:
+                    break
+            if len(solutions) >= self.limit:
+                break
+        return solutions, cells, chunks, skipped
+
+
+# ==================== 预置题型 ====================
+
+PRESETS = {
+    # 直角三角形三边为整数，面积等于周长
+    "right_triangle_area_eq_perimeter": {
+        "title": "直角三角形面积等于周长",
+        "variables": [("a", 1, 100), ("b", "a", 100), ("c", "b + 1", "a + b - 1")],
+        "constraints": ["a**2 + b**2 == c**2", "a*b == 2*(a + b + c)"],
+    },
+    # 直角三角形面积是周长的两倍
+    "right_triangle_area_eq_2perimeter": {
+        "title": "直角三角形面积是周长的两倍",
+        "variables": [("a", 1, 200), ("b", "a", 200), ("c", "b + 1", "a + b - 1")],
+        "constraints": ["a**2 + b**2 == c**2", "a*b == 4*(a + b + c)"],
+    },
+    # 勾股数（斜边不超过 50）
+    "pythagorean_triples_50": {
+        "title": "斜边不超过50的勾股数",
+        "variables": [("a", 1, 50), ("b", "a + 1", 50), ("c", "b + 1", 50)],
+        "constraints": ["a**2 + b**2 == c**2"],
+    },
+    # 费马 n=3: x³ + y³ = z³ 在小范围内无解
+    "fermat_cubes_100": {
+        "title": "x³+y³=z³ 在 100 以内的正整数解",
+        "variables": [("x", 1, 100), ("y", "x", 100), ("z", "y + 1", 200)],
+        "constraints": ["x**3 + y**3 == z**3"],
+    },
+    # 佩尔方程 x² - 2y² = 1
+    "pell_2": {
+        "title": "佩尔方程 x²-2y²=1",
+        "variables": [("y", 1, 2000), ("x", "y + 1", "2*y + 1")],
+        "constraints": ["x**2 - 2*y**2 == 1"],
+    },
+}
+
+
+def run_preset(name: str) -> Dict:
+    spec = PRESETS[name]
+    result = IntegerSearch(spec["variables"], spec["constraints"]).solve()
+    result["title"] = spec["title"]
+    return result
+
+
+def format_solutions(solutions: List[Tuple[int, ...]], limit: int = 10) -> str:
+    if not solutions:
+        return "无解"
+    text = ", ".join("(" + ",".join(map(str, s)) + ")" for s in solutions[:limit])
+    return text + (f" 等{len(solutions)}组" if len(solutions) > limit else "")
+
+
+# ==================== 从题目中识别 ====================
+
+_EQ_RE = re.compile(r'[a-zA-Z0-9\s\+\-\*/\^\(\)²³×%]+(?:==?|＝)[a-zA-Z0-9\s\+\-\*/\^\(\)²³×%]+')
+# 紧挨着等式、却不在 _EQ_RE 字符集里的运算符：等式被截断了，宁可不答
+_CUT_BEFORE_RE = re.compile(r'(?:[÷·!<>≤≥≠]|\d\.)$')
+_CUT_AFTER_RE = re.compile(r'[÷·!<>≤≥≠]|\.\d')
+_RANGE_RE = re.compile(r'(?:不超过|小于等于|≤|以内|<=)\s*(\d+)|(\d+)\s*以内')
+
+
+def answer_diophantine(question: str) -> Optional[Dict]:
+    """
+    识别有界整数搜索类题目并求解
+
+    - 预置题型：直角三角形面积等于周长 / 两倍周长 …
+    - 通用：题目中含 "正整数解/整数解" 且有若干含变量的等式
+    """
+    if "直角三角形" in question and "周长" in question and "面积" in question:
+        name = "right_triangle_area_eq_2perimeter" if re.search(r'两倍|2倍|二倍', question) \
+            else "right_triangle_area_eq_perimeter"
+        return run_preset(name)
+
+    if not re.search(r'正?整数解|正整数|整数对', question):
+        return None
+    from safe_math import normalize
+
+    equations = []
+    for m in _EQ_RE.finditer(question):
+        before, after = question[:m.start()].rstrip()[-2:], question[m.end():].lstrip()[:2]
+        if _CUT_BEFORE_RE.search(before) or _CUT_AFTER_RE.match(after):
+            return None
+        text = normalize(m.group(0)).replace("==", "=")
+        left, _, right = text.partition("=")
+        equations.append(f"{left.strip()} == {right.strip()}")
+    names = sorted({n for eq in equations for n in re.findall(r'(?<![a-zA-Z])[a-z](?![a-zA-Z])', eq)})
+    if not equations or not names or len(names) > 4:
+        return None
+
+    upper = 100
+    m = _RANGE_RE.search(question)
+    if m:
+        upper = int(m.group(1) or m.group(2))
+    low = 1 if "正整数" in question else -upper
+    try:
+        result = IntegerSearch([(n, low, upper) for n in names], equations).solve()
+    except (SearchError, ValueError, FloatingPointError, OverflowError):
+        return None
+    result["title"] = "、".join(equations)
+    return result
+
+
+if __name__ == "__main__":
+    print("🦞 向量化整数搜索")
+    print("=" * 60)
+    for name in PRESETS:
+        r = run_preset(name)
+        print(f"  {r['title']:24s} {format_solutions(r['solutions'], 4):32s} "
+              f"{r['cells']:>10,} 格  {r['elapsed_ms']:7.2f} ms")
+
+    q = "求 x^2 + y^2 = 25 的正整数解"
+    r = answer_diophantine(q)
+    print(f"\n  {q} → {format_solutions(r['solutions'])}  ({r['elapsed_ms']:.2f} ms)")
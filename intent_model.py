@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 在线意图学习模型
+
+替代 .intent_learning.json（启动整读、每次学习整写，经验加成靠手写的字典查找）:
+1. 特征: 规范化文本的字符 1~3-gram，crc32 哈希到固定 n_features 个桶（哈希技巧，
+   词表无需维护，中文按字切分天然适用），按计数做 L2 归一
+2. 模型: 每个意图一行权重（一对其余的逻辑回归），全部放在一个 NumPy 矩阵里
+3. 打分: 单次稀疏点积 W[row, idx] @ vals + b[row]
+4. 更新: 一步 SGD，只改动本条文本命中的那几列，O(意图数 × 特征数)；
+   正样本同时是其余已知意图的负样本。偏置默认冻结为 0: 只有正反馈时偏置会一路
+   上涨，连毫不相干的文本也会得到高概率；冻结后没有共享特征的文本恒为 0.5
+5. 持久化: 小型二进制文件（头JSON + zlib 压缩的权重），原子写入；
+   每 checkpoint_every 次更新自动落盘一次，flush() 写出剩余更新，
+   绑定文件的模型在解释器退出时自动 flush
+
+文件格式:
+    b"IML1" | uint32 头长度 | 头JSON | uint32 长度 + zlib(W float32) | uint32 长度 + zlib(b float32)
+
+用法:
+    model = IntentModel.load("~/.openclaw/workspace/.intent_model.bin")
+    model.update("测试一下", "TEST_SYSTEM")             # 正样本（其余意图各得一个负样本）
+    model.update("测试一下", "EXECUTE_TASK", positive=False)   # 只对该意图的负样本
+    model.probability("帮我测试", "TEST_SYSTEM")         # → 0~1，未学过的意图为 None
+    model.flush()
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import atexit
+import json
+import os
+import struct
+import threading
+import weakref
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from answer_cache import normalize_prompt
+
+MAGIC = b"IML1"
+_U32 = struct.Struct("<I")
+
+DEFAULT_FEATURES = 1 << 14   # 哈希桶数（须为 2 的幂）
+DEFAULT_NGRAM = 3
+DEFAULT_LR = 0.5
+DEFAULT_CHECKPOINT_EVERY = 20
+
+# 绑定文件的模型；退出时统一 flush，弱引用不延长实例寿命
+_BOUND_MODELS: "weakref.WeakSet[IntentModel]" = weakref.WeakSet()
+
+
+def _flush_all():
+    for model in list(_BOUND_MODELS):
+        model.flush()
+
+
+atexit.register(_flush_all)
+
+
+# ==================== 特征 ====================
+
+@lru_cache(maxsize=4096)
+def hashed_features(text: str, n_features: int = DEFAULT_FEATURES,
+                    ngram: int = DEFAULT_NGRAM) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    文本 → 稀疏特征 (桶下标 int64[k] 升序去重, 值 float32[k] L2 归一)
+
+    结果只读（带 LRU 缓存，同一条消息在打分与更新之间只算一次）
+    """
+    text = normalize_prompt(text)
+    mask = n_features - 1
+    buckets = []
+    for n in range(1, ngram + 1):
+        for i in range(len(text) - n + 1):
+            buckets.append(zlib.crc32(text[i:i + n].encode("utf-8")) & mask)
+    if not buckets:
+        idx, vals = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    else:
+        idx, counts = np.unique(np.asarray(buckets, dtype=np.int64), return_counts=True)
+        vals = counts.astype(np.float32)
+        vals /= np.sqrt(np.dot(vals, vals))
+    idx.flags.writeable = False
+    vals.flags.writeable = False
+    return idx, vals
+
+
+def _sigmoid(z: float) -> float:
+    return float(1.0 / (1.0 + np.exp(-z)))
+
+
+# ==================== 模型 ====================
+
+class IntentModel:
+    """
+    哈希 n-gram 在线意图分类器
+
+    Args:
+        path: 持久化文件；None 时只在内存中
+        n_features: 哈希桶数（2 的幂）
+        ngram: 最长字符 n-gram
+        lr: SGD 步长
+        checkpoint_every: 累计多少次更新自动落盘一次（0 关闭，只在 flush 时写）
+        fit_bias: 是否学习偏置（默认冻结为 0，见模块说明）
+    """
+
+    def __init__(self, path: Optional[str] = None, n_features: int = DEFAULT_FEATURES,
+                 ngram: int = DEFAULT_NGRAM, lr: float = DEFAULT_LR,
+                 checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY, fit_bias: bool = False):
+        if n_features & (n_features - 1):
+            raise ValueError(f"n_features 须为 2 的幂: {n_features}")
+        self.path = os.path.expanduser(str(path)) if path else None
+        self.n_features = n_features
+        self.ngram = ngram
+        self.lr = lr
+        self.checkpoint_every = checkpoint_every
+        self.fit_bias = fit_bias
+        self.labels: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.W = np.zeros((0, n_features), dtype=np.float32)
+        self.b = np.zeros(0, dtype=np.float32)
+        self.updates = 0
+        self._dirty = 0
+        self._lock = threading.Lock()
+        if self.path:
+            _BOUND_MODELS.add(self)
+
+    def features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        return hashed_features(text, self.n_features, self.ngram)
+
+    def _row(self, label: str) -> int:
+        """意图对应的权重行；新意图按倍增扩容"""
+        row = self._rows.get(label)
+        if row is None:
+            row = len(self.labels)
+            if row >= self.W.shape[0]:
+                grown = np.zeros((max(4, 2 * self.W.shape[0]), self.n_features), dtype=np.float32)
+                grown[:row] = self.W[:row]
+                self.W = grown
+                self.b = np.resize(self.b, grown.shape[0])
+                self.b[row:] = 0.0
+            self.labels.append(label)
+            self._rows[label] = row
+        return row
+
+    # ==================== 打分 ====================
+
+    def logit(self, text: str, label: str) -> Optional[float]:
+        """单次稀疏点积；未学过的意图返回 None"""
+        row = self._rows.get(label)
+        if row is None:
+            return None
+        idx, vals = self.features(text)
+        return float(self.W[row, idx] @ vals + self.b[row])
+
+    def probability(self, text: str, label: str) -> Optional[float]:
+        z = self.logit(text, label)
+        return None if z is None else _sigmoid(z)
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """所有已学意图的概率"""
+        if not self.labels:
+            return {}
+        idx, vals = self.features(text)
+        n = len(self.labels)
+        z = self.W[:n, idx] @ vals + self.b[:n]
+        p = 1.0 / (1.0 + np.exp(-z))
+        return dict(zip(self.labels, p.tolist()))
+
+    def predict(self, text: str) -> Tuple[Optional[str], float]:
+        """(概率最高的意图, 概率)；模型为空时 (None, 0.0)"""
+        scores = self.scores(text)
+        if not scores:
+            return None, 0.0
+        label = max(scores, key=scores.get)
+        return label, scores[label]
+
+    # ==================== 更新 ====================
+
+    def update(self, text: str, label: str, positive: bool = True, lr: float = None) -> float:
+        """
+        一步 SGD（对数损失），只改动 text 命中的特征列
+
+        positive=True 时 text 同时作为其余已知意图的负样本；
+        positive=False 只降低 label 本身（不知道正确意图是哪个）
+
+        Returns:
+            更新前该意图的概率
+        """
+        idx, vals = self.features(text)
+        with self._lock:
+            row = self._row(label)
+            rows = np.arange(len(self.labels)) if positive else np.array([row])
+            z = self.W[rows[:, None], idx] @ vals + self.b[rows]
+            target = (rows == row).astype(np.float32) if positive else np.zeros(1, dtype=np.float32)
+            g = ((lr or self.lr) * (target - 1.0 / (1.0 + np.exp(-z)))).astype(np.float32)
+            p = _sigmoid(float(z[row if positive else 0]))
+            # idx 已去重，花式索引 += 不会丢失重复项
+            self.W[rows[:, None], idx] += g[:, None] * vals
+            if self.fit_bias:
+                self.b[rows] += g
+            self.updates += 1
+            self._dirty += 1
+            due = self.checkpoint_every and self._dirty >= self.checkpoint_every
+        if due:
+            self.save()
+        return p
+
+    # ==================== 持久化 ====================
+
+    def save(self, path: str = None) -> Optional[str]:
+        """原子写入二进制文件；目录不可写时返回 None"""
+        path = os.path.expanduser(str(path)) if path else self.path
+        if not path:
+            return None
+        with self._lock:
+            n = len(self.labels)
+            header = json.dumps({
+                "n_features": self.n_features,
+                "ngram": self.ngram,
+                "labels": self.labels,
+                "updates": self.updates,
+            }, ensure_ascii=False).encode("utf-8")
+            weights = zlib.compress(np.ascontiguousarray(self.W[:n]).tobytes())
+            bias = zlib.compress(self.b[:n].tobytes())
+            self._dirty = 0
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(MAGIC)
+                for block in (header, weights, bias):
+                    f.write(_U32.pack(len(block)))
+                    f.write(block)
+            os.replace(tmp, path)
+        except OSError:
+            return None
+        return path
+
+    def flush(self) -> Optional[str]:
+        """有未落盘的更新时写出"""
+        if self._dirty and self.path:
+            return self.save()
+        return None
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "IntentModel":
+        """读取模型文件；文件缺失或损坏时返回空模型（仍绑定 path）"""
+        model = cls(path, **kwargs)
+        try:
+            with open(model.path, "rb") as f:
+                data = f.read()
+            if data[:4] != MAGIC:
+                return model
+            blocks, pos = [], 4
+            for _ in range(3):
+                (size,) = _U32.unpack_from(data, pos)
+                blocks.append(data[pos + 4:pos + 4 + size])
+                pos += 4 + size
+            header = json.loads(blocks[0].decode("utf-8"))
+            labels = header["labels"]
+            W = np.frombuffer(zlib.decompress(blocks[1]), dtype=np.float32)
+            b = np.frombuffer(zlib.decompress(blocks[2]), dtype=np.float32)
+            W = W.reshape(len(labels), header["n_features"]).copy()
+        except (OSError, struct.error, zlib.error, ValueError, KeyError):
+            return model
+        model.n_features = header["n_features"]
+        model.ngram = header["ngram"]
+        model.labels = list(labels)
+        model._rows = {label: i for i, label in enumerate(labels)}
+        model.W = W
+        # 冻结偏置时丢弃旧文件里（正反馈累积出的）偏置
+        model.b = b.copy() if model.fit_bias else np.zeros_like(b)
+        model.updates = header.get("updates", 0)
+        return model
+
+    def stats(self) -> Dict:
+        n = len(self.labels)
+        return {
+            "labels": n,
+            "updates": self.updates,
+            "nonzero": int(np.count_nonzero(self.W[:n])),
+            "pending": self._dirty,
+        }
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("🦞 在线意图学习模型演示")
+    print("=" * 50)
+
+    samples = [
+        ("测试一下", "TEST_SYSTEM"), ("检查系统可用性", "TEST_SYSTEM"), ("帮我诊断一下", "TEST_SYSTEM"),
+        ("创建新功能", "EXECUTE_TASK"), ("写一个脚本", "EXECUTE_TASK"), ("部署到服务器", "EXECUTE_TASK"),
+        ("了解机器学习", "LEARNING"), ("什么是强化学习", "LEARNING"), ("how does it work", "LEARNING"),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "intent_model.bin")
+        model = IntentModel(path, checkpoint_every=50)
+        for _ in range(10):
+            for text, label in samples:
+                model.update(text, label)
+        model.flush()
+
+        for text in ["测试下框架", "创建一个新脚本", "了解一下深度学习"]:
+            label, p = model.predict(text)
+            print(f"  {text:12s} → {label} ({p:.2f})")
+
+        loaded = IntentModel.load(path)
+        assert loaded.scores("测试下框架") == model.scores("测试下框架")
+        print(f"\n模型文件: {os.path.getsize(path)} 字节  {loaded.stats()}")
+
+        skewed = IntentModel()
+        for _ in range(35):
+            skewed.update("帮我执行这个任务", "EXECUTE_TASK")
+        print(f"只学过 EXECUTE_TASK 35 次后，无关文本: p={skewed.probability('今天天气不错', 'EXECUTE_TASK'):.2f}")
+
+        n = 20000
+        hashed_features.cache_clear()
+        start = time.perf_counter()
+        for i in range(n):
+            model.probability(samples[i % len(samples)][0], "TEST_SYSTEM")
+        print(f"打分: {(time.perf_counter() - start) / n * 1e6:6.1f} μs/次（特征已缓存）")
+        model.checkpoint_every = 0
+        start = time.perf_counter()
+        for i in range(n):
+            model.update(samples[i % len(samples)][0], "TEST_SYSTEM")
+        print(f"更新: {(time.perf_counter() - start) / n * 1e6:6.1f} μs/次")
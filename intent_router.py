@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 编译式多模式意图路由
+
+各代推理引擎的 _detect_type 都是一长串 `kw in problem` / `problem.lower()`，
+路由代价 O(模式数 × 文本长度)，且每个分支都重复分配小写副本。
+
+这里把声明式路由表一次编译成两个多模式匹配器（区分大小写 / 忽略大小写），
+单次扫描文本即可得到所有命中的关键词，再按优先级给出全部命中类别。
+模式少时用组合正则（C 实现，常数小），超过 TRIE_MIN_PATTERNS 个改用前缀树
+（耗时与模式数无关）。
+
+路由表格式（列表顺序即优先级，越靠前越优先）:
+    {"category": "nim", "keywords": ["尼姆"], "keywords_ci": ["nim"]}
+    {"category": "fermat_3", "all": [["费马"], ["a³", "立方"]]}
+
+- keywords:    任一命中（区分大小写，等价于 `kw in text`）
+- keywords_ci: 任一命中（忽略大小写，等价于 `kw in text.lower()`）
+- all:         每组至少命中一个（区分大小写）
+- 同时给出 keywords/keywords_ci 与 all 时，两者都要满足
+- priority:    可选，显式优先级（数值越小越优先，默认取列表位置）
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Set
+
+
+class RouteMatch(NamedTuple):
+    category: str
+    priority: int
+    keywords: tuple
+
+
+# 模式数超过此值改用前缀树。实测（2,250 字文本 / 短问题）: 25 个模式时正则
+# 190μs / 1.9μs、前缀树 360μs / 4.3μs；64 个时约持平；100 个时正则 850μs / 8.6μs、
+# 前缀树 560μs / 4.5μs，之后正则随模式数线性变慢
+TRIE_MIN_PATTERNS = 64
+
+
+class _PatternSet:
+    """
+    一组字面量模式的多模式匹配器，可找出所有（含重叠）命中
+
+    - 模式少: 零宽前瞻组合正则，同一位置优先最长模式，更短的前缀模式通过 implies 补回
+    - 模式多: 字符前缀树，从文本每个位置沿树向下走，耗时只与文本长度和最长模式
+      有关，与模式数量无关（知识库/路由表加条目不会拖慢匹配）
+    """
+
+    _END = ""  # 终止标记（模式非空，不会与字符边冲突）
+
+    def __init__(self, patterns: Set[str], trie_min: int = None):
+        self.patterns = patterns
+        self.regex = None
+        self.root: Dict = {}
+        if not patterns:
+            return
+        if len(patterns) > (TRIE_MIN_PATTERNS if trie_min is None else trie_min):
+            for p in patterns:
+                node = self.root
+                for ch in p:
+                    node = node.setdefault(ch, {})
+                node[self._END] = p
+            return
+        ordered = sorted(patterns, key=len, reverse=True)
+        self.regex = re.compile("(?=(" + "|".join(re.escape(p) for p in ordered) + "))")
+        self.implies = {
+            p: frozenset(q for q in patterns if p.startswith(q))
+            for p in patterns
+        }
+
+    def find(self, text: str) -> Set[str]:
+        found = set()
+        if self.regex is not None:
+            implies = self.implies
+            for m in self.regex.finditer(text):
+                found |= implies[m.group(1)]
+            return found
+        root, end, n = self.root, self._END, len(text)
+        if not root:
+            return found
+        for i in range(n):
+            node = root.get(text[i])
+            j = i + 1
+            while node is not None:
+                p = node.get(end)
+                if p is not None:
+                    found.add(p)
+                if j >= n:
+                    break
+                node = node.get(text[j])
+                j += 1
+        return found
+
+
+class IntentRouter:
+    """
+    编译式意图路由器
+
+    用法:
+        router = IntentRouter(ROUTES, default="general")
+        router.route("尼姆游戏(3,4,5)")      # → "nim"
+        router.match("...")                   # → [RouteMatch, ...] 按优先级排序
+    """
+
+    def __init__(self, routes: List[Dict], default: str = "general", cache_size: int = 1024):
+        self.default = default
+        self.routes = []
+        raw, ci = set(), set()
+        # 关键词 → 可能命中的路由下标
+        self._by_raw: Dict[str, List[int]] = {}
+        self._by_ci: Dict[str, List[int]] = {}
+
+        for i, spec in enumerate(routes):
+            keywords = tuple(spec.get("keywords", ()))
+            keywords_ci = tuple(k.lower() for k in spec.get("keywords_ci", ()))
+            groups = tuple(tuple(g) for g in spec.get("all", ()))
+            if not (keywords or keywords_ci or groups):
+                raise ValueError(f"路由 {spec.get('category')} 没有任何关键词")
+
+            route = {
+                "category": spec["category"],
+                "priority": spec.get("priority", i),
+                "keywords": keywords,
+                "keywords_ci": keywords_ci,
+                "all": groups,
+            }
+            idx = len(self.routes)
+            self.routes.append(route)
+
+            raw.update(keywords)
+            ci.update(keywords_ci)
+            for k in keywords:
+                self._by_raw.setdefault(k, []).append(idx)
+            for k in keywords_ci:
+                self._by_ci.setdefault(k, []).append(idx)
+            for group in groups:
+                raw.update(group)
+                for k in group:
+                    self._by_raw.setdefault(k, []).append(idx)
+
+        self._raw = _PatternSet(raw)
+        self._ci = _PatternSet(ci)
+        self.route = lru_cache(maxsize=cache_size)(self._route)
+
+    def _found(self, text: str):
+        found_raw = self._raw.find(text)
+        found_ci = self._ci.find(text.lower()) if self._ci.patterns else set()
+        return found_raw, found_ci
+
+    def match(self, text: str) -> List[RouteMatch]:
+        """单次扫描，返回所有命中的类别（按优先级排序）"""
+        found_raw, found_ci = self._found(text)
+
+        candidates = set()
+        for k in found_raw:
+            candidates.update(self._by_raw.get(k, ()))
+        for k in found_ci:
+            candidates.update(self._by_ci.get(k, ()))
+
+        matches = []
+        for idx in candidates:
+            route = self.routes[idx]
+            hits = [k for k in route["keywords"] if k in found_raw]
+            hits += [k for k in route["keywords_ci"] if k in found_ci]
+            if (route["keywords"] or route["keywords_ci"]) and not hits:
+                continue
+            ok = True
+            for group in route["all"]:
+                group_hits = [k for k in group if k in found_raw]
+                if not group_hits:
+                    ok = False
+                    break
+                hits.extend(group_hits)
+            if ok:
+                matches.append(RouteMatch(route["category"], route["priority"], tuple(hits)))
+
+        matches.sort(key=lambda m: m.priority)
+        return matches
+
+    def _route(self, text: str) -> str:
+        """最高优先级的类别（带 LRU 缓存）"""
+        matches = self.match(text)
+        return matches[0].category if matches else self.default
+
+    def categories(self) -> List[str]:
+        seen = []
+        for r in self.routes:
+            if r["category"] not in seen:
+                seen.append(r["category"])
+        return seen
+
+
+# ==================== 共享注册表 ====================
+
+_ROUTERS: Dict[str, IntentRouter] = {}
+
+
+def get_router(name: str, routes: List[Dict] = None, default: str = "general") -> IntentRouter:
+    """
+    按名字获取（并首次编译）路由器，各代引擎共用同一实例
+
+    Args:
+        name: 路由表名，如 "v14_2"
+        routes: 首次注册时提供的路由表
+    """
+    router = _ROUTERS.get(name)
+    if router is None:
+        if routes is None:
+            raise KeyError(f"未注册的路由表: {name}")
+        router = IntentRouter(routes, default=default)
+        _ROUTERS[name] = router
+    return router
+
+
+def benchmark(router: IntentRouter, texts: List[str], rounds: int = 2000,
+              use_cache: bool = False) -> Dict:
+    """
+    路由吞吐量微基准
+
+    Returns:
+        {"routes": 次数, "seconds": 耗时, "routes_per_sec": 吞吐}
+    """
+    fn = router.route if use_cache else router._route
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for t in texts:
+            fn(t)
+    elapsed = time.perf_counter() - start
+    n = rounds * len(texts)
+    return {"routes": n, "seconds": elapsed, "routes_per_sec": n / elapsed if elapsed else 0.0}
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 推理引擎路由表（声明式）
+
+各代引擎的 _detect_type 关键词链整理成数据，由 intent_router 编译。
+列表顺序即优先级（越靠前越高），迁移时照搬原 if 链的顺序；此后有意调整过的
+地方在表内注释说明（如 v14.2 游戏版 minimax 提前于 nim、新增四子棋与 hold'em），
+因此不再与最初的逐文件实现逐条一致。
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+from intent_router import IntentRouter, get_router as _get_router
+
+# ==================== v14.2 游戏增强版 ====================
+
+V14_2_GAMES = [
+    # 🎮 游戏
+    {"category": "chess", "keywords": ["象棋", "将死"], "keywords_ci": ["chess"]},
+    # minimax 须排在 nim 之前（"minimax" 含子串 "nim"）
+    {"category": "minimax", "keywords_ci": ["minimax", "alpha-beta"]},
+    {"category": "nim", "keywords": ["尼姆"], "keywords_ci": ["nim"]},
+    {"category": "tic_tac_toe", "keywords": ["井字"], "keywords_ci": ["tic-tac-toe"]},
+    {"category": "connect_four", "keywords": ["四子棋"], "keywords_ci": ["connect four", "connect-four"]},
+    {"category": "monty_hall", "keywords": ["三门"], "keywords_ci": ["monty hall"]},
+    {"category": "craps", "keywords": ["掷骰"], "keywords_ci": ["craps"]},
+    {"category": "prisoners_dilemma", "keywords": ["囚徒"], "keywords_ci": ["prisoner", "tit-for-tat"]},
+    {"category": "texas_holdem", "keywords": ["德州扑克"], "keywords_ci": ["texas holdem", "hold'em"]},
+    {"category": "blackjack", "keywords": ["21点"], "keywords_ci": ["blackjack"]},
+    {"category": "maze", "keywords": ["迷宫", "BFS", "A*"], "keywords_ci": ["maze"]},
+    {"category": "alphago", "keywords": ["MCTS"], "keywords_ci": ["alphago"]},
+    {"category": "dqn", "keywords": ["深度Q"], "keywords_ci": ["dqn"]},
+    {"category": "tsp", "keywords": ["旅行商"], "keywords_ci": ["tsp"]},
+    {"category": "knapsack", "keywords": ["背包"], "keywords_ci": ["knapsack"]},
+    {"category": "nash_equilibrium", "keywords": ["纳什", "均衡"], "keywords_ci": ["nash"]},
+    # 原有关键词
+    {"category": "math", "keywords": ["欧拉", "e^(iπ)"]},
+    {"category": "fermat_3", "all": [["费马"], ["a³", "立方"]]},
+    {"category": "riemann", "all": [["黎曼"], ["非平凡"]]},
+    {"category": "shor", "keywords": ["Shor", "RSA"]},
+    {"category": "transformer", "keywords": ["Transformer"]},
+    {"category": "gpt", "keywords": ["GPT"]},
+    {"category": "brain_vat", "keywords": ["缸中之脑"]},
+    {"category": "trolley", "keywords": ["电车"]},
+    {"category": "cap", "keywords": ["CAP"]},
+]
+
+# ==================== v14.2 最终游戏版 ====================
+
+# 类别即 self.knowledge 的键；全部忽略大小写。保留原链顺序: "minimax" 含子串 "nim"，
+# 在这一版里先命中 nim
+V14_2_FINAL = [
+    {"category": "chess", "keywords_ci": ["chess", "象棋"]},
+    {"category": "nim", "keywords_ci": ["nim"]},
+    {"category": "tic_tac_toe", "keywords_ci": ["tic-tac-toe", "井字"]},
+    {"category": "monty_hall", "keywords_ci": ["monty hall", "三门"]},
+    {"category": "craps", "keywords_ci": ["craps", "掷骰"]},
+    {"category": "prisoners_dilemma", "keywords_ci": ["prisoner", "tit-for-tat"]},
+    {"category": "minimax", "keywords_ci": ["minimax", "alpha-beta"]},
+    {"category": "texas_holdem", "keywords_ci": ["texas holdem", "德州扑克"]},
+    {"category": "blackjack", "keywords_ci": ["blackjack", "21点"]},
+    {"category": "maze", "keywords_ci": ["maze", "bfs", "dfs", "a*"]},
+    {"category": "alphago", "keywords_ci": ["alphago", "mcts"]},
+    {"category": "dqn", "keywords_ci": ["dqn", "deep q"]},
+    {"category": "tsp", "keywords_ci": ["tsp", "traveling salesman"]},
+    {"category": "knapsack", "keywords_ci": ["knapsack", "背包"]},
+    {"category": "nash_equilibrium", "keywords_ci": ["nash", "均衡"]},
+    # 原有关键词
+    {"category": "math", "keywords_ci": ["euler", "欧拉"]},
+    {"category": "transformer", "keywords_ci": ["transformer", "attention"]},
+]
+
+# ==================== v12.0 知识增强版 ====================
+
+V12 = [
+    # v12.0 新增领域
+    {"category": "math_ultimate", "keywords": ["黎曼", "ζ函数", "费马", "P vs NP", "康托尔", "素数", "证明"]},
+    {"category": "quantum", "keywords": ["量子", "纠缠", "叠加", "Shor", "贝尔"]},
+    {"category": "ml_ultimate", "keywords": ["Transformer", "注意力", "GPT", "Scaling"]},
+    {"category": "philosophy", "keywords": ["缸中之脑", "电车难题", "模拟", "功利主义", "义务论"]},
+    {"category": "system_design", "keywords": ["高可用", "分布式", "CAP", "微服务", "事件驱动"]},
+    {"category": "economics", "keywords": ["有效市场", "行为金融", "IS-LM", "AS-AD", "宏观"]},
+    # 回退到 v11.0
+    {"category": "math_advanced", "keywords": ["欧拉", "微分方程", "∫"]},
+    {"category": "coding_advanced", "keywords": ["二分查找", "LRU", "动态规划", "背包"]},
+    {"category": "logic_advanced", "keywords": ["约瑟夫环", "围成一圈"]},
+    {"category": "poem_advanced", "keywords": ["七言", "离别"]},
+    {"category": "physics", "keywords": ["相对论", "测不准"]},
+    {"category": "coding", "keywords": ["斐波那契", "排序", "链表"]},
+    {"category": "creative", "keywords": ["春天", "诗句"]},
+    {"category": "math", "keywords": ["因式分解"]},
+    {"category": "reasoning", "keywords": ["游泳"]},
+]
+
+# ==================== 统一推理引擎 v4.0 ====================
+
+# 类别取 TaskType 的值，按从最具体到最一般排列
+UNIFIED = [
+    {"category": "real", "keywords": ["洗车", "开车", "走路", "去还是"]},
+    {"category": "logical", "keywords": ["真话", "假话", "如果", "真假", "谁会"]},
+    {"category": "math", "keywords": ["计算", "等于", "直角三角形"]},
+    {"category": "geometry", "keywords": ["厘米", "体积", "水位", "放入", "棱长", "容器"]},
+    {"category": "iq", "keywords": ["为什么", "测试"]},
+    {"category": "ethical", "keywords": ["应该", "能否", "道德"]},
+]
+
+# ==================== 推理引擎集成器 v8.0 ====================
+
+INTEGRATOR = [
+    {"category": "factorization", "keywords": ["因式分解"]},
+    {"category": "trigonometric", "keywords": ["tan", "cos", "sin", "θ"]},
+    {"category": "combinatorics", "keywords": ["座位", "安排", "排列"]},
+    {"category": "physics", "keywords": ["雨滴", "LED"]},
+    {"category": "extremal", "keywords": ["极值", "最大", "最小"]},
+    {"category": "geometry", "keywords": ["抛物线", "椭圆", "三角形", "翻折", "二面角"]},
+    {"category": "function", "keywords": ["函数", "斜率", "直线", "共线", "交点"]},
+    {"category": "logic", "keywords": ["星期", "昨天", "今天"]},
+    {"category": "algebra", "keywords": ["相关系数"]},
+    {"category": "ml", "keywords": ["准确率", "泛化", "测试集"]},
+]
+
+ROUTE_TABLES = {
+    "v14_2_games": V14_2_GAMES,
+    "v14_2_final": V14_2_FINAL,
+    "v12": V12,
+    "unified": UNIFIED,
+    "integrator": INTEGRATOR,
+}
+
+
+def get_router(name: str) -> IntentRouter:
+    """按表名获取已编译的路由器（首次调用时编译）"""
+    return _get_router(name, ROUTE_TABLES[name])
+
+
+if __name__ == "__main__":
+    from intent_router import benchmark
+
+    samples = {
+        "v14_2_games": ["尼姆游戏(3,4,5)的获胜策略", "Monty Hall三门问题", "德州扑克AA的胜率",
+                        "用BFS解迷宫", "背包容量50的最优解", "费马大定理a³+b³=c³",
+                        "解释CAP定理", "今天天气怎么样"],
+        "v12": ["黎曼猜想是什么", "量子纠缠", "LRU缓存实现", "写一首七言离别诗", "你好"],
+        "unified": ["甲乙丙三人谁会游泳？", "直角三角形面积等于周长", "洗车应该开车还是走路？"],
+        "integrator": ["因式分解a^2(b - c)", "今天周三明天星期几", "求函数交点"],
+    }
+
+    print("🦞 意图路由微基准 (routes/sec, 不含缓存)")
+    print("=" * 50)
+    for name, texts in samples.items():
+        r = benchmark(get_router(name), texts, rounds=5000)
+        print(f"  {name:12s} {r['routes_per_sec']:>12,.0f} routes/s  ({r['routes']} 次)")
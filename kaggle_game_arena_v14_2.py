@@ -6,6 +6,7 @@
 import sys
 sys.path.insert(0, '/home/admin/.openclaw/workspace')
 
+from game_search import ConnectFour, KingRookKing, Nim, TicTacToe, describe_score, search
 from reasoning_engine_v14_2_games import ReasoningEngineV14_2
 
 
@@ -126,6 +127,26 @@ def test_games():
     if score > 50:
         print(f"\n提升: +{score:.1f}% 🎉")
     
+    # 搜索引擎基准
+    print("\n" + "="*80)
+    print("🔍 博弈树搜索基准 (negamax + alpha-beta + 置换表)")
+    print("="*80)
+    
+    positions = [
+        ("井字棋 空盘", TicTacToe(), 1.0),
+        ("尼姆 (3,4,5)", Nim([3, 4, 5]), 1.0),
+        ("王车对王 Kf6 Ra1 / kh8", KingRookKing("f6", "a1", "h8"), 1.0),
+        ("四子棋 空盘", ConnectFour(), 2.0),
+    ]
+    total_nodes, total_time = 0, 0.0
+    for title, game, budget in positions:
+        r = search(game, time_limit=budget)
+        total_nodes += r["nodes"]
+        total_time += r["elapsed_ms"] / 1000
+        print(f"\n  {title}: {r['move_text']} ({describe_score(r['score'], r['complete'])}, 深度{r['depth']})")
+        print(f"    节点: {r['nodes']:,} | 耗时: {r['elapsed_ms']:.1f} ms | 速度: {r['nps']:,.0f} nodes/s")
+    print(f"\n  平均速度: {total_nodes / total_time:,.0f} nodes/s")
+    
     print("\n" + "="*80)
 
 
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 知识库触发词索引（声明式）
+
+v14.x 各版本的 _knowledge_answer 都是二十多个 `if "xx" in p` 分支，
+按顺序挑一个 self.knowledge 条目；每加一条知识就多一次线性扫描。
+
+这里把触发词整理成数据（所有版本共用一张表），由 intent_router 编译成
+倒排索引（触发词 → 条目），单次扫描文本得到全部命中，再按优先级选择:
+1. 列表顺序即优先级（越靠前越优先），也可用 priority 显式指定
+2. 同一知识在不同版本里键名不同时用 aliases（如 chess / chess_endgame）
+3. 只返回当前版本 self.knowledge 里存在的条目，否则继续看下一个命中
+4. 匹配统一忽略大小写（文本与触发词都转小写）
+5. 触发词与通用表差别较大的版本另有一张表（KNOWLEDGE_TABLES，按名称取）
+
+条目格式（与 intent_routes 相同的 keywords / all 语义，confidence 可选）:
+    {"key": "fermat_3", "type": "math", "all": [["费马"], ["a³", "立方"]]}
+
+用法:
+    store = get_knowledge_store()                # 或 get_knowledge_store("v14_5_fixed")
+    store.answer(problem, self.knowledge)    # → {"type", "answer", "confidence"} 或 None
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from intent_router import IntentRouter
+
+# ==================== 触发词表 ====================
+
+KNOWLEDGE_TRIGGERS = [
+    # 数学
+    {"key": "euler", "type": "math", "keywords": ["欧拉", "e^(iπ)"]},
+    {"key": "fermat_3", "type": "math", "all": [["费马"], ["a³", "立方"]]},
+    {"key": "fermat", "type": "math", "keywords": ["费马"]},
+    {"key": "riemann", "type": "math", "keywords": ["黎曼"]},
+    {"key": "primes_infinite", "type": "math", "all": [["质数"], ["无穷", "证明"]]},
+    # 量子
+    {"key": "shor", "type": "quantum", "keywords": ["shor", "rsa"]},
+    {"key": "bell", "type": "quantum", "keywords": ["贝尔"]},
+    {"key": "teleportation", "type": "quantum", "keywords": ["隐形传态"]},
+    # 深度学习（scaling 须排在 gpt 之前："GPT Scaling Law" 答 scaling）
+    {"key": "transformer", "type": "ml", "keywords": ["transformer", "注意力"]},
+    {"key": "scaling", "type": "ml", "keywords": ["scaling"]},
+    {"key": "gpt", "type": "ml", "keywords": ["gpt"]},
+    {"key": "resnet", "type": "ml", "keywords": ["resnet", "残差"]},
+    # 游戏AI（alphago 先于 minimax 的 "alpha"，minimax 先于 nim 的子串 "nim"）
+    {"key": "chess", "aliases": ["chess_endgame"], "type": "game", "keywords": ["象棋", "chess"]},
+    {"key": "alphago", "type": "game", "keywords": ["alphago", "mcts"]},
+    {"key": "minimax", "type": "game", "keywords": ["minimax", "alpha"]},
+    {"key": "nim", "type": "game", "keywords": ["尼姆", "nim"]},
+    {"key": "monty_hall", "type": "game", "keywords": ["三门", "monty"]},
+    {"key": "prisoners", "type": "game", "keywords": ["囚徒", "prisoner"]},
+    {"key": "dqn", "type": "game", "keywords": ["dqn"]},
+    # 代码
+    {"key": "lru", "type": "code", "keywords": ["lru", "缓存"]},
+    {"key": "quick_sort", "type": "code", "keywords": ["quick", "快速", "排序"]},
+    # 经济学
+    {"key": "emh", "type": "economics", "keywords": ["有效市场"]},
+    {"key": "is_lm", "type": "economics", "keywords": ["is-lm", "is_lm", "is lm", "as-ad"]},
+    # v14.5 经济领域增强
+    {"key": "phillips_curve", "type": "economics", "keywords": ["菲利普斯"]},
+    {"key": "monetary_policy", "type": "economics",
+     "keywords": ["货币政策", "再贴现", "公开市场", "存款准备金", "量化宽松"]},
+    {"key": "fiscal_policy", "type": "economics", "keywords": ["财政政策", "政府支出", "乘数效应", "挤出效应"]},
+    {"key": "inflation", "type": "economics", "keywords": ["通货膨胀", "通胀", "cpi"]},
+    {"key": "exchange_rate", "type": "economics", "keywords": ["汇率", "购买力平价", "利率平价"]},
+    {"key": "international_trade", "type": "economics", "keywords": ["国际贸易", "比较优势", "h-o理论", "关税"]},
+    {"key": "economic_cycles", "type": "economics", "keywords": ["经济周期", "基钦", "朱格拉", "康德拉季耶夫"]},
+]
+
+# v14.5 修复版: 经济学触发词更宽（利率、税收、贸易、周期…）且优先于其他领域，
+# 都不命中时含"经济"即按 IS-LM 作答；其余领域沿用通用表
+V14_5_FIXED_TRIGGERS = [
+    {"key": "monetary_policy", "type": "economics",
+     "keywords": ["货币政策", "利率", "存款准备金", "量化宽松", "公开市场", "央行"]},
+    {"key": "fiscal_policy", "type": "economics", "keywords": ["财政政策", "政府支出", "税收", "乘数", "挤出", "财政"]},
+    {"key": "phillips_curve", "type": "economics", "keywords": ["菲利普斯", "phillips", "通胀率", "失业率", " tradeoff"]},
+    {"key": "inflation", "type": "economics", "keywords": ["通胀", "通货膨胀", "cpi", "物价"]},
+    {"key": "exchange_rate", "type": "economics", "keywords": ["汇率", "购买力平价", "利率平价", "ppp", "irp"]},
+    {"key": "international_trade", "type": "economics", "keywords": ["比较优势", "贸易", "关税", "要素禀赋", "trade"]},
+    {"key": "economic_cycles", "type": "economics", "keywords": ["经济周期", "基钦", "朱格拉", "库存", "周期"]},
+    {"key": "emh", "type": "economics", "keywords": ["有效市场", "emh", "弱式", "半强式", "强式"]},
+    {"key": "is_lm", "type": "economics", "keywords": ["is-lm", "is_lm", "as-ad", "as_ad", "宏观经济"]},
+    {"key": "is_lm", "type": "economics", "keywords": ["经济"], "confidence": 0.80},
+] + [
+    # 该版本只有 fermat_3 一条，不带 a³ 的"费马"也用它: 作为 fermat 条目的别名，保持"费马"原有的优先级
+    # （只在这张表里加别名: v14_3/v14_4 只有 fermat_3，单独的"费马"不该答 n=3）
+    dict(entry, aliases=["fermat_3"]) if entry["key"] == "fermat" else entry
+    for entry in KNOWLEDGE_TRIGGERS
+]
+
+KNOWLEDGE_TABLES = {
+    "default": KNOWLEDGE_TRIGGERS,
+    "v14_5_fixed": V14_5_FIXED_TRIGGERS,
+}
+
+
+# ==================== 编译 ====================
+
+class KnowledgeHit(NamedTuple):
+    key: str            # self.knowledge 中的键
+    type: str           # 领域
+    keywords: tuple     # 命中的触发词
+    confidence: Optional[float] = None   # 条目自带的置信度（None 用调用方默认值）
+
+
+class KnowledgeStore:
+    """
+    知识条目的倒排索引
+
+    Args:
+        entries: 触发词表（列表顺序即优先级）
+        cache_size: 按文本缓存命中列表的 LRU 容量
+    """
+
+    def __init__(self, entries: List[Dict] = None, cache_size: int = 1024):
+        self.entries = list(KNOWLEDGE_TRIGGERS if entries is None else entries)
+        routes = []
+        for i, entry in enumerate(self.entries):
+            route = {"category": str(i), "priority": entry.get("priority", i)}
+            if entry.get("keywords"):
+                route["keywords"] = [k.lower() for k in entry["keywords"]]
+            if entry.get("all"):
+                route["all"] = [[k.lower() for k in group] for group in entry["all"]]
+            routes.append(route)
+        self.router = IntentRouter(routes, default="")
+        self._match = lru_cache(maxsize=cache_size)(self._match_uncached)
+
+    def _match_uncached(self, text: str) -> tuple:
+        return tuple(self.router.match(text.lower()))
+
+    def lookup(self, text: str, available: Iterable[str] = None) -> Optional[KnowledgeHit]:
+        """最高优先级且在 available 中存在的条目；available 为 None 时不过滤"""
+        for m in self._match(text):
+            entry = self.entries[int(m.category)]
+            for key in (entry["key"], *entry.get("aliases", ())):
+                if available is None or key in available:
+                    return KnowledgeHit(key, entry["type"], m.keywords, entry.get("confidence"))
+        return None
+
+    def answer(self, text: str, knowledge: Dict[str, str], confidence: float = 0.85) -> Optional[Dict]:
+        """按当前版本的知识库作答，未命中返回 None"""
+        hit = self.lookup(text, knowledge)
+        if hit is None:
+            return None
+        return {"type": hit.type, "answer": knowledge[hit.key],
+                "confidence": confidence if hit.confidence is None else hit.confidence}
+
+    def keys(self) -> List[str]:
+        seen = []
+        for entry in self.entries:
+            for key in (entry["key"], *entry.get("aliases", ())):
+                if key not in seen:
+                    seen.append(key)
+        return seen
+
+
+_stores: Dict[str, KnowledgeStore] = {}
+
+
+def get_knowledge_store(name: str = "default") -> KnowledgeStore:
+    """按表名获取已编译的索引（首次调用时编译，各版本共用）"""
+    store = _stores.get(name)
+    if store is None:
+        store = _stores[name] = KnowledgeStore(KNOWLEDGE_TABLES[name])
+    return store
+
+
+if __name__ == "__main__":
+    import time
+
+    store = get_knowledge_store()
+    samples = ["欧拉公式", "费马大定理a³+b³=c³", "GPT的Scaling Law", "Minimax与Alpha-Beta剪枝",
+               "AlphaGo如何用MCTS", "IS-LM模型", "菲利普斯曲线与通胀", "今天天气怎么样"]
+
+    print("🦞 知识库触发词索引")
+    print("=" * 50)
+    for s in samples:
+        hit = store.lookup(s)
+        print(f"  {s:24s} → {hit.key if hit else '-':16s} {hit.keywords if hit else ''}")
+
+    # 条目数增加时的查找耗时（索引 vs 逐条子串扫描）
+    print("\n条目数  索引(μs)  线性扫描(μs)")
+    for n in (len(KNOWLEDGE_TRIGGERS), 200, 1000):
+        entries = KNOWLEDGE_TRIGGERS + [
+            {"key": f"topic_{i}", "type": "general", "keywords": [f"术语{i}号"]}
+            for i in range(n - len(KNOWLEDGE_TRIGGERS))
+        ]
+        indexed = KnowledgeStore(entries)
+        terms = [[k.lower() for k in e.get("keywords", ())] for e in entries]
+        rounds = 2000
+        start = time.perf_counter()
+        for i in range(rounds):
+            indexed._match_uncached(samples[i % len(samples)])
+        t_index = (time.perf_counter() - start) / rounds * 1e6
+        start = time.perf_counter()
+        for i in range(rounds):
+            p = samples[i % len(samples)].lower()
+            next((j for j, ks in enumerate(terms) if any(k in p for k in ks)), None)
+        t_scan = (time.perf_counter() - start) / rounds * 1e6
+        print(f"  {n:5d}  {t_index:8.2f}  {t_scan:10.2f}")
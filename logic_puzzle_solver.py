@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 真话/假话逻辑题位集求解器
+
+把题目中的陈述解析成 N 个人上的布尔约束，然后枚举全部 2^N 种世界：
+- N ≤ 8:  所有约束编译成一个位运算谓词，逐个掩码检查
+- N ≤ 20: NumPy 向量化，一次算完所有掩码
+- N > 20: 三值逻辑剪枝的回溯搜索（小型 DPLL）
+
+支持两类题:
+1. 属性题: "甲乙丙只有一人会游泳…只有一句是真的" —— 变量 = 谁具有该属性，
+   约束 = 属性人数 + 真话句数
+2. 诚实者/说谎者: "A说B在说谎…" —— 变量 = 谁说真话，
+   约束 = 每个人的陈述真值与其身份一致
+
+返回所有自洽世界及证明过程（每句话的真假、被排除的假设及原因）。
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+np = None  # 延迟导入: 只有 n > BITMASK_MAX_N 时才需要 numpy（见 _load_numpy）
+
+BITMASK_MAX_N = 8
+NUMPY_MAX_N = 20
+MAX_REJECTED_TRACES = 16
+
+NAME_CHARS = "甲乙丙丁戊己庚辛壬癸"
+_NAME = rf'[{NAME_CHARS}]|(?<![A-Za-z])[A-Z](?![A-Za-z])'
+_CN_NUM = {"零": 0, "一": 1, "两": 2, "二": 2, "三": 3, "四": 4, "五": 5,
+           "六": 6, "七": 7, "八": 8, "九": 9, "十": 10}
+
+_STATEMENT_RE = re.compile(
+    rf'(?P<who>{_NAME})\s*(?:说|称|声称|回答)\s*[:：]?\s*'
+    r'(?:["“\'‘「](?P<quoted>[^"”\'’」]*)["”\'’」]|(?P<plain>[^，,。；;！!？?\n"“]+))')
+_STMT_COUNT_RE = re.compile(
+    r'(?:只有|仅有|恰好有?|有且只有|其中)\s*([一两二三四五六七八九十\d]+)\s*(?:句|个人说的|人说的)[^，,。；;？?]*?(真|假|对|错)')
+_PROP_COUNT_RE = re.compile(
+    r'(?:只有|仅有|恰好有?|有且只有)\s*([一两二三四五六七八九十\d]+)\s*(?:个)?人\s*([^，,。；;？?\n]{1,8})')
+_LIAR_WORDS = ("说谎者", "在说谎", "说谎", "撒谎", "说假话", "假话", "骗子", "骗人")
+_HONEST_WORDS = ("说真话", "真话", "诚实", "老实", "骑士", "讲真话")
+
+
+def _load_numpy():
+    """首次需要时导入 numpy；未安装返回 None"""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+def _num(token: str) -> int:
+    return int(token) if token.isdigit() else _CN_NUM.get(token, 1)
+
+
+# ==================== 约束表达式 ====================
+# ("var", i) ("stmt", j) ("const", b) ("not", e) ("and", [e..]) ("or", [e..])
+# ("eq", a, b) ("xor", a, b) ("count", [e..], k)  —— count: 恰好 k 个为真
+# ("atleast", [e..], k)
+
+def _describe(expr, people: List[str]) -> str:
+    op = expr[0]
+    if op == "var":
+        return people[expr[1]]
+    if op == "stmt":
+        return f"第{expr[1] + 1}句"
+    if op == "const":
+        return "真" if expr[1] else "假"
+    if op == "not":
+        return f"非({_describe(expr[1], people)})"
+    if op in ("and", "or"):
+        joiner = " 且 " if op == "and" else " 或 "
+        return "(" + joiner.join(_describe(e, people) for e in expr[1]) + ")"
+    if op in ("eq", "xor"):
+        sym = "⇔" if op == "eq" else "⊕"
+        return f"({_describe(expr[1], people)} {sym} {_describe(expr[2], people)})"
+    if op in ("count", "atleast"):
+        word = "恰好" if op == "count" else "至少"
+        return f"{word}{expr[2]}个为真[{', '.join(_describe(e, people) for e in expr[1])}]"
+    return str(expr)
+
+
+def _eval_int(expr, mask: int, stmts) -> bool:
+    """单个世界（整数位掩码）上求值"""
+    op = expr[0]
+    if op == "var":
+        return (mask >> expr[1]) & 1 == 1
+    if op == "stmt":
+        return stmts[expr[1]]
+    if op == "const":
+        return expr[1]
+    if op == "not":
+        return not _eval_int(expr[1], mask, stmts)
+    if op == "and":
+        return all(_eval_int(e, mask, stmts) for e in expr[1])
+    if op == "or":
+        return any(_eval_int(e, mask, stmts) for e in expr[1])
+    if op == "eq":
+        return _eval_int(expr[1], mask, stmts) == _eval_int(expr[2], mask, stmts)
+    if op == "xor":
+        return _eval_int(expr[1], mask, stmts) != _eval_int(expr[2], mask, stmts)
+    n_true = sum(_eval_int(e, mask, stmts) for e in expr[1])
+    return n_true == expr[2] if op == "count" else n_true >= expr[2]
+
+
+def _source(expr, stmt_src: List[str]) -> str:
+    """把表达式编译成位运算源码（结果为 0/1），供整数掩码路径一次性 eval"""
+    op = expr[0]
+    if op == "var":
+        return f"(m>>{expr[1]}&1)"
+    if op == "stmt":
+        return stmt_src[expr[1]]
+    if op == "const":
+        return "1" if expr[1] else "0"
+    if op == "not":
+        return f"(1^{_source(expr[1], stmt_src)})"
+    if op in ("and", "or"):
+        joiner = "&" if op == "and" else "|"
+        return "(" + joiner.join(_source(e, stmt_src) for e in expr[1]) + ")"
+    if op in ("eq", "xor"):
+        tail = "^1" if op == "eq" else ""
+        return f"({_source(expr[1], stmt_src)}^{_source(expr[2], stmt_src)}{tail})"
+    total = "+".join(_source(e, stmt_src) for e in expr[1])
+    cmp = "==" if op == "count" else ">="
+    return f"(({total}){cmp}{expr[2]})"
+
+
+def _eval_np(expr, bits, stmts):
+    """所有世界上同时求值（bits[i] 为第 i 个变量的布尔数组）"""
+    op = expr[0]
+    if op == "var":
+        return bits[expr[1]]
+    if op == "stmt":
+        return stmts[expr[1]]
+    if op == "const":
+        return np.full(bits[0].shape, expr[1], dtype=bool)
+    if op == "not":
+        return ~_eval_np(expr[1], bits, stmts)
+    if op == "and":
+        return np.logical_and.reduce([_eval_np(e, bits, stmts) for e in expr[1]])
+    if op == "or":
+        return np.logical_or.reduce([_eval_np(e, bits, stmts) for e in expr[1]])
+    if op == "eq":
+        return _eval_np(expr[1], bits, stmts) == _eval_np(expr[2], bits, stmts)
+    if op == "xor":
+        return _eval_np(expr[1], bits, stmts) != _eval_np(expr[2], bits, stmts)
+    n_true = np.sum([_eval_np(e, bits, stmts) for e in expr[1]], axis=0)
+    return n_true == expr[2] if op == "count" else n_true >= expr[2]
+
+
+def _eval_partial(expr, assign: List[Optional[bool]], stmts):
+    """三值求值（None = 未定），用于回溯剪枝"""
+    op = expr[0]
+    if op == "var":
+        return assign[expr[1]]
+    if op == "stmt":
+        return _eval_partial(stmts[expr[1]], assign, stmts)
+    if op == "const":
+        return expr[1]
+    if op == "not":
+        v = _eval_partial(expr[1], assign, stmts)
+        return None if v is None else not v
+    if op in ("and", "or"):
+        values = [_eval_partial(e, assign, stmts) for e in expr[1]]
+        decisive = op == "or"
+        if decisive in values:
+            return decisive
+        return None if None in values else not decisive
+    if op in ("eq", "xor"):
+        a = _eval_partial(expr[1], assign, stmts)
+        b = _eval_partial(expr[2], assign, stmts)
+        if a is None or b is None:
+            return None
+        return (a == b) if op == "eq" else (a != b)
+    values = [_eval_partial(e, assign, stmts) for e in expr[1]]
+    lo = sum(v is True for v in values)
+    hi = lo + sum(v is None for v in values)
+    k = expr[2]
+    if op == "count":
+        if lo > k or hi < k:
+            return False
+        return True if lo == hi == k else None
+    if lo >= k:
+        return True
+    return False if hi < k else None
+
+
+# ==================== 题目模型 ====================
+
+class LogicPuzzle:
+    """
+    布尔约束模型
+
+    用法:
+        p = LogicPuzzle(["A", "B", "C"], mode="knights")
+        p.add_statement("A", ("not", ("var", 1)), "B在说谎")
+        result = p.solve()
+    """
+
+    def __init__(self, people: List[str], mode: str = "knights", prop: str = None):
+        self.people = list(people)
+        self.index = {p: i for i, p in enumerate(self.people)}
+        self.mode = mode
+        self.prop = prop
+        self.statements: List[Dict] = []      # {"speaker", "expr", "text"}
+        self.constraints: List[Tuple] = []    # (expr, 说明)
+
+    def var(self, name: str) -> Tuple:
+        return ("var", self.index[name])
+
+    def add_statement(self, speaker: str, expr, text: str = ""):
+        j = len(self.statements)
+        self.statements.append({"speaker": speaker, "expr": expr, "text": text})
+        if self.mode == "knights":
+            self.constraints.append((("eq", self.var(speaker), ("stmt", j)),
+                                     f"{speaker}的身份与其陈述一致"))
+        return j
+
+    def add_constraint(self, expr, text: str):
+        self.constraints.append((expr, text))
+
+    # ---------- 求解 ----------
+
+    def solve(self, method: str = None) -> Dict:
+        """
+        枚举所有世界，返回自洽解
+
+        Returns:
+            {"worlds": [...], "rejected": [...], "checked", "method", "elapsed_ms"}
+        """
+        start = time.perf_counter()
+        n = len(self.people)
+        if method is None:
+            if n <= BITMASK_MAX_N or _load_numpy() is None and n <= NUMPY_MAX_N:
+                method = "bitmask"
+            elif n <= NUMPY_MAX_N:
+                method = "numpy"
+            else:
+                method = "dpll"
+
+        if method == "bitmask":
+            masks, checked = self._solve_bitmask()
+        elif method == "numpy":
+            masks, checked = self._solve_numpy()
+        else:
+            masks, checked = self._solve_dpll()
+
+        worlds = [self._world(m) for m in masks]
+        rejected = []
+        if self._hypothesis_space() <= MAX_REJECTED_TRACES:
+            valid = set(masks)
+            for m in self._hypotheses():
+                if m not in valid:
+                    rejected.append(self._world(m))
+
+        return {
+            "people": self.people,
+            "mode": self.mode,
+            "property": self.prop,
+            "worlds": worlds,
+            "rejected": rejected,
+            "checked": checked,
+            "method": method,
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+        }
+
+    def _stmt_values_int(self, mask: int) -> List[bool]:
+        return [_eval_int(s["expr"], mask, None) for s in self.statements]
+
+    def _solve_bitmask(self):
+        # 所有约束编译成一个位运算谓词，逐个掩码检查
+        stmt_src = []
+        for st in self.statements:
+            stmt_src.append(_source(st["expr"], stmt_src))
+        body = "&".join(_source(c, stmt_src) for c, _ in self.constraints) or "1"
+        predicate = eval(f"lambda m: {body}", {"__builtins__": {}})
+        total = 1 << len(self.people)
+        return [m for m in range(total) if predicate(m)], total
+
+    def _solve_numpy(self):
+        _load_numpy()
+        n = len(self.people)
+        masks = np.arange(1 << n, dtype=np.uint32)
+        bits = [((masks >> i) & 1).astype(bool) for i in range(n)]
+        stmts = [_eval_np(s["expr"], bits, None) for s in self.statements]
+        ok = np.ones(masks.shape, dtype=bool)
+        for c, _ in self.constraints:
+            ok &= _eval_np(c, bits, stmts)
+        return [int(m) for m in masks[ok]], int(masks.size)
+
+    def _solve_dpll(self):
+        n = len(self.people)
+        stmts = [s["expr"] for s in self.statements]
+        constraints = [c for c, _ in self.constraints]
+        assign: List[Optional[bool]] = [None] * n
+        found, visited = [], 0
+
+        def search(i: int):
+            nonlocal visited
+            visited += 1
+            results = [_eval_partial(c, assign, stmts) for c in constraints]
+            if False in results:
+                return
+            if i == n:
+                found.append(sum(1 << k for k, v in enumerate(assign) if v))
+                return
+            for value in (True, False):
+                assign[i] = value
+                search(i + 1)
+            assign[i] = None
+
+        search(0)
+        return sorted(found), visited
+
+    # ---------- 证明过程 ----------
+
+    def _hypothesis_space(self) -> int:
+        if self.mode == "property":
+            return len(self.people)
+        return 1 << len(self.people)
+
+    def _hypotheses(self):
+        if self.mode == "property":
+            # 属性题按"谁具有该属性"逐个假设
+            return [1 << i for i in range(len(self.people))]
+        return range(1 << len(self.people))
+
+    def _world(self, mask: int) -> Dict:
+        stmts = self._stmt_values_int(mask)
+        assignment = {p: bool(mask >> i & 1) for i, p in enumerate(self.people)}
+        trace = [f"假设: {self._describe_mask(mask)}"]
+        for s, value in zip(self.statements, stmts):
+            trace.append(f"{s['speaker']}说「{s['text']}」→ {'真' if value else '假'}")
+        valid = True
+        for c, text in self.constraints:
+            ok = _eval_int(c, mask, stmts)
+            if not ok:
+                valid = False
+                trace.append(f"✗ 违反: {text}")
+        if valid:
+            trace.append("✓ 所有约束满足")
+        return {
+            "assignment": assignment,
+            "selected": [p for p, v in assignment.items() if v],
+            "statements": stmts,
+            "valid": valid,
+            "trace": trace,
+        }
+
+    def _describe_mask(self, mask: int) -> str:
+        if self.mode == "property":
+            who = [p for i, p in enumerate(self.people) if mask >> i & 1]
+            return f"{'、'.join(who) or '没有人'}{self.prop or ''}"
+        honest = [p for i, p in enumerate(self.people) if mask >> i & 1]
+        liars = [p for i, p in enumerate(self.people) if not mask >> i & 1]
+        return f"说真话: {'、'.join(honest) or '无'}；说谎: {'、'.join(liars) or '无'}"
+
+    def contradictions(self) -> List[Tuple[int, int]]:
+        """在所有世界中真值始终相反的陈述对（矛盾关系，必有一真一假）"""
+        hypotheses = list(self._hypotheses()) if self._hypothesis_space() <= 4096 else []
+        if not hypotheses:
+            return []
+        table = [self._stmt_values_int(m) for m in hypotheses]
+        pairs = []
+        for i in range(len(self.statements)):
+            for j in range(i + 1, len(self.statements)):
+                if all(row[i] != row[j] for row in table):
+                    pairs.append((i, j))
+        return pairs
+
+
+# ==================== 中文题目解析 ====================
+
+def _find_people(text: str) -> List[str]:
+    seen = []
+    for m in re.finditer(_NAME, text):
+        name = m.group(0)
+        if name not in seen:
+            seen.append(name)
+    # 保持天干/字母的自然顺序
+    order = {c: i for i, c in enumerate(NAME_CHARS)}
+    return sorted(seen, key=lambda c: (order.get(c, 100), c))
+
+
+def _subjects(content: str, speaker: str, people: List[str]) -> List[str]:
+    """陈述中提到的人（按出现顺序），"我" 指说话人"""
+    found = [(m.start(), m.group(0)) for m in re.finditer(_NAME, content) if m.group(0) in people]
+    found += [(m.start(), speaker) for m in re.finditer(r'我(?!们)', content)]
+    result = []
+    for _, name in sorted(found):
+        if name not in result:
+            result.append(name)
+    return result
+
+
+def _negated(content: str, predicate_at: int) -> bool:
+    """谓词前出现奇数个否定词"""
+    head = content[:predicate_at] if predicate_at >= 0 else content
+    return len(re.findall(r'不|没|并非|非', head)) % 2 == 1
+
+
+def _parse_knights(content: str, speaker: str, puzzle: LogicPuzzle):
+    people = puzzle.people
+    liar_pos = min((content.find(w) for w in _LIAR_WORDS if w in content), default=-1)
+    honest_pos = min((content.find(w) for w in _HONEST_WORDS if w in content), default=-1)
+    if liar_pos < 0 and honest_pos < 0:
+        if re.search(r'同一类|一样|同类', content):
+            names = _subjects(content, speaker, people)
+            if len(names) == 2:
+                expr = ("eq", puzzle.var(names[0]), puzzle.var(names[1]))
+                return ("not", expr) if re.search(r'不是同一|不一样|不同', content) else expr
+        return None
+    is_liar = liar_pos >= 0 and (honest_pos < 0 or liar_pos < honest_pos)
+    pos = liar_pos if is_liar else honest_pos
+    negate = _negated(content, pos)
+    # "说谎" → 该人不诚实
+    want_honest = (not is_liar) != negate
+
+    def lit(name):
+        v = puzzle.var(name)
+        return v if want_honest else ("not", v)
+
+    if re.search(r'我们|咱们|所有人|大家', content):
+        group = list(people)
+        m = re.search(r'(?:至少|起码)\s*有?\s*([一两二三四五六七八九十\d]+)\s*个', content)
+        if m:
+            return ("atleast", [lit(p) for p in group], _num(m.group(1)))
+        m = re.search(r'(?:恰好|只有|正好)\s*有?\s*([一两二三四五六七八九十\d]+)\s*个', content)
+        if m:
+            return ("count", [lit(p) for p in group], _num(m.group(1)))
+        return ("and", [lit(p) for p in group])
+
+    names = _subjects(content[:pos] if pos > 0 else content, speaker, people) or \
+        _subjects(content, speaker, people)
+    if not names:
+        return None
+    if len(names) == 1:
+        return lit(names[0])
+    if re.search(r'至少|或|其中一个', content):
+        return ("or", [lit(n) for n in names])
+    if re.search(r'只有一个|恰好一个', content):
+        return ("count", [lit(n) for n in names], 1)
+    return ("and", [lit(n) for n in names])
+
+
+def _parse_property(content: str, speaker: str, puzzle: LogicPuzzle):
+    names = _subjects(content, speaker, puzzle.people)
+    if not names:
+        return None
+    negate = bool(re.search(r'不|没|并非|非', content))
+    if len(names) == 1:
+        expr = puzzle.var(names[0])
+    elif re.search(r'或|之一', content):
+        expr = ("or", [puzzle.var(n) for n in names])
+    else:
+        expr = ("and", [puzzle.var(n) for n in names])
+    return ("not", expr) if negate else expr
+
+
+def parse_puzzle(text: str) -> Optional[LogicPuzzle]:
+    """
+    把中文逻辑题解析为 LogicPuzzle，无法识别时返回 None
+    """
+    raw = [(m.group("who"), (m.group("quoted") if m.group("quoted") is not None
+                             else m.group("plain")).strip())
+           for m in _STATEMENT_RE.finditer(text)]
+    raw = [(w, c) for w, c in raw if c]
+    if not raw:
+        return None
+
+    people = _find_people(text)
+    stmt_count = _STMT_COUNT_RE.search(text)
+    knights_words = any(w in text for w in _LIAR_WORDS + _HONEST_WORDS)
+
+    if stmt_count or not knights_words:
+        prop_match = _PROP_COUNT_RE.search(text)
+        prop = None
+        if prop_match:
+            prop = re.split(r'[的，,。？?]', prop_match.group(2))[0]
+        else:
+            q = re.search(r'([^，,。；;\s]{1,6})的(?:是|人是)', text)
+            prop = q.group(1) if q else None
+        puzzle = LogicPuzzle(people, mode="property", prop=prop)
+        for who, content in raw:
+            expr = _parse_property(content, who, puzzle)
+            if expr is None:
+                return None
+            puzzle.add_statement(who, expr, content)
+        k = _num(prop_match.group(1)) if prop_match else 1
+        puzzle.add_constraint(("count", [puzzle.var(p) for p in people], k),
+                              f"恰好{k}人{prop or ''}")
+        if stmt_count:
+            k_s = _num(stmt_count.group(1))
+            if stmt_count.group(2) in ("假", "错"):
+                k_s = len(puzzle.statements) - k_s
+            puzzle.add_constraint(("count", [("stmt", j) for j in range(len(puzzle.statements))], k_s),
+                                  f"恰好{k_s}句为真")
+        return puzzle
+
+    puzzle = LogicPuzzle(people, mode="knights")
+    for who, content in raw:
+        expr = _parse_knights(content, who, puzzle)
+        if expr is None:
+            return None
+        puzzle.add_statement(who, expr, content)
+    return puzzle
+
+
+@lru_cache(maxsize=256)
+def solve_puzzle(text: str) -> Optional[Dict]:
+    """
+    解析并求解；返回 solve() 结果并附 "answer"、"contradictions"，无法解析时为 None
+
+    结果按题目文本缓存，调用方不应修改返回值。
+    """
+    puzzle = parse_puzzle(text)
+    if puzzle is None:
+        return None
+    result = puzzle.solve()
+    result["contradictions"] = [
+        (puzzle.statements[i], puzzle.statements[j]) for i, j in puzzle.contradictions()
+    ]
+    result["answer"] = format_answer(puzzle, result["worlds"])
+    return result
+
+
+def format_answer(puzzle: LogicPuzzle, worlds: List[Dict]) -> str:
+    if not worlds:
+        return "无解（陈述自相矛盾）"
+    if len(worlds) > 1:
+        return f"有{len(worlds)}种可能: " + " | ".join(puzzle._describe_mask(
+            sum(1 << i for i, p in enumerate(puzzle.people) if w["assignment"][p])) for w in worlds[:4])
+    w = worlds[0]
+    if puzzle.mode == "property":
+        return "、".join(w["selected"]) or "没有人"
+    liars = [p for p, v in w["assignment"].items() if not v]
+    return f"说真话: {'、'.join(w['selected']) or '无'}；说谎: {'、'.join(liars) or '无'}"
+
+
+# ==================== 基准题 ====================
+
+def make_benchmark(n: int = 10, seed: int = 0) -> str:
+    """生成 n 人诚实者/说谎者题（有预设解），用于计时"""
+    import random
+    rng = random.Random(seed)
+    names = list(NAME_CHARS[:n]) if n <= len(NAME_CHARS) else [chr(65 + i) for i in range(n)]
+    honest = {p: rng.random() < 0.5 for p in names}
+    lines = []
+    for i, p in enumerate(names):
+        a, b = names[(i + 1) % n], names[(i + 3) % n]
+        form = rng.randrange(3)
+        if form == 0:
+            claim, value = f"{a}在说谎", not honest[a]
+        elif form == 1:
+            claim, value = f"{a}和{b}都说真话", honest[a] and honest[b]
+        else:
+            claim, value = f"{a}或{b}至少有一个在说谎", not (honest[a] and honest[b])
+        if value != honest[p]:
+            # 让陈述与身份一致: 取反
+            claim = {0: f"{a}说真话", 1: f"{a}和{b}至少有一个在说谎",
+                     2: f"{a}和{b}都说真话"}[form]
+        lines.append(f"{p}说：“{claim}”")
+    return "，".join(lines) + "。谁说真话？"
+
+
+if __name__ == "__main__":
+    classic = """甲、乙、丙三人中，只有一人会游泳。
+    甲说："我会"  乙说："我不会"  丙说："甲不会"
+    如果这三句话只有一句是真的，那么会游泳的是？"""
+    chain = "A说B在说谎，B说C在说谎，C说A和B都在说谎，谁说真话？"
+
+    print("🦞 真话/假话位集求解器")
+    print("=" * 50)
+    for q in (classic, chain):
+        r = solve_puzzle(q)
+        print(f"\n题目: {' '.join(q.split())}")
+        print(f"答案: {r['answer']}  ({r['method']}, {r['elapsed_ms']:.2f} ms)")
+        for line in r["worlds"][0]["trace"] if r["worlds"] else []:
+            print(f"  {line}")
+        for w in r["rejected"][:3]:
+            print(f"  ✗ {w['trace'][0]} → {w['trace'][-1]}")
+
+    print("\n10 人基准:")
+    for seed in range(5):
+        text = make_benchmark(10, seed)
+        p = parse_puzzle(text)
+        for method in ("bitmask", "numpy", "dpll"):
+            if method == "numpy" and _load_numpy() is None:
+                continue
+            r = p.solve(method)
+            print(f"  seed={seed} {method:7s} 解数={len(r['worlds'])} 检查={r['checked']:5d} "
+                  f"{r['elapsed_ms']:7.2f} ms")
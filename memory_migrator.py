@@ -2,13 +2,99 @@
 """
 MD → JSON 记忆迁移脚本
 将纯文本MD文件迁移到结构化JSON记忆
+
+并行模式: 进程池解析文件 → 单写入者批量提交 → 清单检查点，可中断续跑
+
+提交（写存储 → 推进游标 → 写清单）不是一次原子操作，靠来源键保证重放幂等:
+每个条目带 source_key（增量为 文件@起止偏移，全量并行为 run_id:文件），
+save_batch 跳过索引中已有的键，中断后续跑不会重复写入。
 """
 
 import json
+import os
 import re
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from structured_memory import StructuredMemory
+from daily_note_index import DailyNoteIndex
+
+# 迁移器在 daily note 索引中的游标名
+MIGRATION_CURSOR = "migrator"
+
+# 并行迁移的检查点清单文件名（位于 .memory/ 下）
+MANIFEST_NAME = "migration_manifest.json"
+
+
+def list_md_files(md_dir: str = 'memory') -> list:
+    """待迁移的MD文件（排除备份与 MEMORY.md）"""
+    return [
+        md_file for md_file in sorted(Path(md_dir).glob('*.md'))
+        if 'backup' not in str(md_file) and md_file.name != 'MEMORY.md'
+    ]
+
+
+def parse_file(filepath: str, incremental: bool = True) -> dict:
+    """
+    解析单个MD文件为待保存条目（不写存储，可在子进程中运行）
+    
+    Returns:
+        file/path/end_offset/source_key/lines/skipped + decisions/learnings 参数列表
+    """
+    filename = Path(filepath).name
+    end_offset = source_key = None
+    
+    if incremental:
+        index = DailyNoteIndex(filepath)
+        if index.refresh():
+            index.save()
+        start_offset = index.get_cursor(MIGRATION_CURSOR)
+        content = index.read_range(start_offset)
+        end_offset = index.size
+        source_key = f"{filename}@{start_offset}-{end_offset}"
+    else:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+    
+    parsed = {
+        'file': filename,
+        'path': str(filepath),
+        'end_offset': end_offset,
+        'source_key': source_key,
+        'lines': len(content.split('\n')) if content else 0,
+        'skipped': not content.strip(),
+        'decisions': [],
+        'learnings': []
+    }
+    if parsed['skipped']:
+        return parsed
+    
+    for d in MemoryMigrator.parse_decision_from_md(content, filename):
+        parsed['decisions'].append({
+            'intent': d.get('intent', 'MIGRATED'),
+            'action': d.get('action', 'MIGRATED'),
+            'confidence': d.get('confidence', 0.8),
+            'message': d.get('message', filename),
+            'context': {'source': 'md_migration', 'file': filename}
+        })
+    
+    for l in MemoryMigrator.parse_learning_from_md(content, filename):
+        parsed['learnings'].append({
+            'topic': l.get('topic', 'MIGRATED'),
+            'insight': l.get('insight', filename),
+            'source': 'MD_MIGRATION'
+        })
+    
+    return parsed
+
+
+def _keyed(entries: list, source_key: str) -> list:
+    """给条目参数附上来源键（无键时原样返回）"""
+    if source_key is None:
+        return entries
+    return [dict(e, source_key=source_key) for e in entries]
 
 
 class MemoryMigrator:
@@ -18,7 +104,8 @@ class MemoryMigrator:
         self.memory = StructuredMemory()
         self.migrated_count = 0
     
-    def parse_decision_from_md(self, content: str, filename: str) -> list:
+    @staticmethod
+    def parse_decision_from_md(content: str, filename: str) -> list:
         """从MD文件中提取决策"""
         decisions = []
         
@@ -63,7 +150,8 @@ class MemoryMigrator:
         
         return decisions
     
-    def parse_learning_from_md(self, content: str, filename: str) -> list:
+    @staticmethod
+    def parse_learning_from_md(content: str, filename: str) -> list:
         """从MD文件中提取学习"""
         learnings = []
         
@@ -91,70 +179,197 @@ class MemoryMigrator:
         
         return learnings
     
-    def migrate_file(self, filepath: str) -> dict:
-        """迁移单个MD文件"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def migrate_file(self, filepath: str, incremental: bool = False) -> dict:
+        """
+        迁移单个MD文件
         
-        filename = Path(filepath).name
-        result = {
-            'file': filename,
-            'decisions': 0,
-            'learnings': 0,
-            'lines': len(content.split('\n'))
+        Args:
+            incremental: 只迁移上次迁移之后追加的内容（基于偏移索引游标）
+        """
+        parsed = parse_file(filepath, incremental=incremental)
+        if not parsed['skipped']:
+            key = parsed['source_key']
+            self.memory.save_batch(_keyed(parsed['decisions'], key), _keyed(parsed['learnings'], key))
+            self.migrated_count += 1
+        self._advance_cursor(parsed)
+        return self._summarize(parsed)
+    
+    @staticmethod
+    def _summarize(parsed: dict) -> dict:
+        return {
+            'file': parsed['file'],
+            'decisions': len(parsed['decisions']),
+            'learnings': len(parsed['learnings']),
+            'lines': parsed['lines'],
+            'skipped': parsed['skipped']
         }
+    
+    @staticmethod
+    def _advance_cursor(parsed: dict):
+        """提交后推进文件游标（仅增量模式）"""
+        if parsed['end_offset'] is None:
+            return
+        index = DailyNoteIndex(parsed['path'])
+        index.set_cursor(MIGRATION_CURSOR, parsed['end_offset'])
+    
+    def migrate_all(self, md_dir: str = 'memory', incremental: bool = True) -> dict:
+        """
+        迁移所有MD文件
         
-        # 提取决策
-        decisions = self.parse_decision_from_md(content, filename)
-        for d in decisions:
-            self.memory.save_decision(
-                intent=d.get('intent', 'MIGRATED'),
-                action=d.get('action', 'MIGRATED'),
-                confidence=d.get('confidence', 0.8),
-                message=d.get('message', filename),
-                context={'source': 'md_migration', 'file': filename}
-            )
-            result['decisions'] += 1
-        
-        # 提取学习
-        learnings = self.parse_learning_from_md(content, filename)
-        for l in learnings:
-            self.memory.save_learning(
-                topic=l.get('topic', 'MIGRATED'),
-                insight=l.get('insight', filename),
-                source='MD_MIGRATION'
-            )
-            result['learnings'] += 1
-        
-        self.migrated_count += 1
-        
-        return result
-    
-    def migrate_all(self, md_dir: str = 'memory') -> dict:
-        """迁移所有MD文件"""
+        Args:
+            incremental: 已迁移过的文件只处理新增章节，未变化的文件直接跳过
+        """
         results = {
             'files': 0,
+            'skipped': 0,
             'decisions': 0,
             'learnings': 0,
             'details': []
         }
         
-        md_path = Path(md_dir)
-        
-        for md_file in sorted(md_path.glob('*.md')):
-            if 'backup' in str(md_file) or md_file.name == 'MEMORY.md':
+        for md_file in list_md_files(md_dir):
+            result = self.migrate_file(str(md_file), incremental=incremental)
+            if result['skipped']:
+                results['skipped'] += 1
                 continue
             
-            result = self.migrate_file(str(md_file))
             results['files'] += 1
             results['decisions'] += result['decisions']
             results['learnings'] += result['learnings']
             results['details'].append(result)
         
         return results
+    
+    # ==================== 并行迁移 ====================
+    
+    @property
+    def manifest_path(self) -> Path:
+        return self.memory.md / MANIFEST_NAME
+    
+    def _load_manifest(self, md_dir: str, files: list, resume: bool) -> dict:
+        """加载未完成的检查点清单，或新建一份"""
+        manifest = self.memory._load_json(self.manifest_path) if resume else None
+        if (manifest and manifest.get('status') == 'running'
+                and manifest.get('md_dir') == str(Path(md_dir).resolve())):
+            manifest['resumed'] = manifest.get('resumed', 0) + 1
+            return manifest
+        
+        return {
+            'run_id': uuid.uuid4().hex[:12],
+            'md_dir': str(Path(md_dir).resolve()),
+            'status': 'running',
+            'started_at': datetime.now().isoformat(),
+            'resumed': 0,
+            'pending': [str(f) for f in files],
+            'completed': {}
+        }
+    
+    def _commit(self, buffer: list, manifest: dict):
+        """
+        单写入者: 提交一批解析结果，再推进游标与检查点
+        
+        三步分别落盘；任一步后中断，续跑时未完成的文件会重新解析提交，
+        已写入的条目按 source_key 去重（全量模式用 run_id:文件 作键）。
+        """
+        decisions, learnings = [], []
+        for p in buffer:
+            key = p['source_key'] or f"{manifest['run_id']}:{p['file']}"
+            decisions.extend(_keyed(p['decisions'], key))
+            learnings.extend(_keyed(p['learnings'], key))
+        self.memory.save_batch(decisions, learnings)
+        
+        for parsed in buffer:
+            self._advance_cursor(parsed)
+            manifest['pending'].remove(parsed['path'])
+            manifest['completed'][parsed['file']] = self._summarize(parsed)
+        
+        manifest['updated_at'] = datetime.now().isoformat()
+        self.memory._save_json_atomic(self.manifest_path, manifest)
+        buffer.clear()
+    
+    def migrate_parallel(self, md_dir: str = 'memory', workers: int = None,
+                         batch_size: int = 16, resume: bool = True,
+                         incremental: bool = True) -> dict:
+        """
+        并行迁移所有MD文件
+        
+        进程池并行解析，主进程作为唯一写入者按批提交；每批提交后写检查点，
+        中断后再次运行会从清单中未完成的文件继续。
+        
+        Args:
+            workers: 解析进程数（默认 CPU 核数）
+            batch_size: 每批提交的文件数
+            resume: 存在未完成清单时续跑
+            incremental: 同 migrate_all；False 时忽略游标全量迁移
+        
+        Returns:
+            迁移结果 + throughput（文件/秒、条目/秒）
+        """
+        files = list_md_files(md_dir)
+        manifest = self._load_manifest(md_dir, files, resume)
+        pending = list(manifest['pending'])
+        workers = workers or os.cpu_count() or 1
+        
+        started = time.perf_counter()
+        buffer = []
+        results = {
+            'run_id': manifest['run_id'],
+            'resumed': manifest['resumed'] > 0,
+            'files': 0,
+            'skipped': 0,
+            'decisions': 0,
+            'learnings': 0,
+            'details': []
+        }
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(parse_file, path, incremental) for path in pending]
+            for future in as_completed(futures):
+                parsed = future.result()
+                if parsed['skipped']:
+                    results['skipped'] += 1
+                else:
+                    results['files'] += 1
+                    results['decisions'] += len(parsed['decisions'])
+                    results['learnings'] += len(parsed['learnings'])
+                    results['details'].append(self._summarize(parsed))
+                
+                buffer.append(parsed)
+                if len(buffer) >= batch_size:
+                    self._commit(buffer, manifest)
+            
+            if buffer:
+                self._commit(buffer, manifest)
+        
+        elapsed = time.perf_counter() - started
+        entries = results['decisions'] + results['learnings']
+        scanned = results['files'] + results['skipped']
+        results['throughput'] = {
+            'workers': workers,
+            'elapsed_sec': round(elapsed, 4),
+            'files_per_sec': round(scanned / elapsed, 2) if elapsed else 0.0,
+            'entries_per_sec': round(entries / elapsed, 2) if elapsed else 0.0
+        }
+        
+        manifest['status'] = 'completed'
+        manifest['finished_at'] = datetime.now().isoformat()
+        manifest['throughput'] = results['throughput']
+        self.memory._save_json_atomic(self.manifest_path, manifest)
+        self.migrated_count += results['files']
+        
+        return results
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='MD → JSON 记忆迁移')
+    parser.add_argument('--dir', '-d', default='memory', help='MD目录')
+    parser.add_argument('--parallel', '-p', action='store_true', help='进程池并行迁移')
+    parser.add_argument('--workers', '-w', type=int, default=None, help='并行进程数')
+    parser.add_argument('--full', action='store_true', help='忽略游标，全量迁移')
+    args = parser.parse_args()
+    
     print("=" * 70)
     print("MD → JSON 记忆迁移")
     print("=" * 70)
@@ -165,13 +380,22 @@ if __name__ == "__main__":
     print("开始迁移...")
     print("")
     
-    results = migrator.migrate_all()
+    if args.parallel:
+        results = migrator.migrate_parallel(args.dir, workers=args.workers,
+                                           incremental=not args.full)
+    else:
+        results = migrator.migrate_all(args.dir, incremental=not args.full)
     
     print("📊 迁移结果:")
     print("-" * 50)
     print(f"  文件数: {results['files']}")
+    print(f"  未变化跳过: {results['skipped']}")
     print(f"  决策: {results['decisions']}")
     print(f"  学习: {results['learnings']}")
+    if 'throughput' in results:
+        t = results['throughput']
+        print(f"  耗时: {t['elapsed_sec']}s ({t['workers']} 进程)")
+        print(f"  吞吐: {t['files_per_sec']} 文件/秒, {t['entries_per_sec']} 条目/秒")
     print("")
     
     # 显示详情
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 向量化蒙特卡洛概率引擎
+
+每批试验一次性用 NumPy 生成（洗牌、发牌、掷骰都是整批数组运算），
+按批累计均值与方差，置信区间足够窄时提前停止；可选进程池把批次分到多核。
+
+内置模型（均支持规则变体）:
+- 三门问题: 门数、主持人开门数
+- 掷骰 (craps): Pass Line 胜率、come-out 即胜/即负概率
+- 21点: 副数、庄家软17是否要牌、要牌/停牌基本策略的期望收益
+- 德州扑克: 任意手牌对指定手牌或随机对手的胜率（查表式 7 张牌型评估）
+
+用法:
+    r = simulate(partial(holdem_equity, hands=[parse_hand("AA")], opponents=1))
+    r["mean"], r["ci"], r["trials_per_sec"]
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import itertools
+import math
+import multiprocessing
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from engine_registry import cached_table
+
+Z_95 = 1.959964
+
+
+# ==================== 通用模拟器 ====================
+
+def _run_batches(batch_fn: Callable, seed, batches: int, batch_size: int) -> tuple:
+    """跑若干批，返回 (试验数, 和, 平方和)；进程池工作函数"""
+    rng = np.random.default_rng(seed)
+    n = total = total_sq = 0.0
+    for _ in range(batches):
+        x = np.asarray(batch_fn(rng, batch_size), dtype=np.float64)
+        n += x.size
+        total += float(x.sum())
+        total_sq += float(np.dot(x, x))
+    return n, total, total_sq
+
+
+def simulate(batch_fn: Callable, tol: float = 0.002, batch_size: int = 100_000,
+             min_trials: int = 200_000, max_trials: int = 20_000_000,
+             seed: int = None, workers: int = 0) -> Dict:
+    """
+    蒙特卡洛估计 E[batch_fn 输出]
+
+    Args:
+        batch_fn: f(rng, n) -> 长度 n 的每次试验结果数组（须可 pickle 才能用进程池）
+        tol: 95% 置信区间半宽小于 tol 时停止
+        workers: >1 时用进程池，每轮每个进程跑一批
+
+    Returns:
+        {"mean", "stderr", "ci", "trials", "converged", "elapsed_ms", "trials_per_sec", "workers"}
+    """
+    start = time.perf_counter()
+    seeds = np.random.SeedSequence(seed)
+    n = total = total_sq = 0.0
+    pool = None
+    if workers and workers > 1:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+
+    try:
+        while True:
+            if pool is None:
+                parts = [_run_batches(batch_fn, seeds.spawn(1)[0], 1, batch_size)]
+            else:
+                futures = [pool.submit(_run_batches, batch_fn, s, 1, batch_size)
+                           for s in seeds.spawn(workers)]
+                parts = [f.result() for f in futures]
+            for pn, ps, pss in parts:
+                n += pn
+                total += ps
+                total_sq += pss
+            mean = total / n
+            var = max(total_sq / n - mean * mean, 0.0)
+            stderr = math.sqrt(var / n)
+            converged = n >= min_trials and Z_95 * stderr <= tol
+            if converged or n >= max_trials:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "mean": mean,
+        "stderr": stderr,
+        "ci": (mean - Z_95 * stderr, mean + Z_95 * stderr),
+        "trials": int(n),
+        "converged": converged,
+        "elapsed_ms": elapsed * 1000,
+        "trials_per_sec": n / elapsed if elapsed > 0 else 0.0,
+        "workers": workers if pool is not None else 1,
+    }
+
+
+# ==================== 三门问题 ====================
+
+def monty_hall(rng: np.random.Generator, n: int, doors: int = 3, opened: int = 1,
+               switch: bool = True) -> np.ndarray:
+    """
+    主持人在 doors 扇门中打开 opened 扇空门（不开玩家的门、不开车门），
+    玩家换到剩下门中随机一扇。返回是否中奖 (0/1)。
+    """
+    car = rng.integers(0, doors, n)
+    pick = rng.integers(0, doors, n)
+    if not switch:
+        return (car == pick).astype(np.int8)
+    # 换门时: 选中车门则必输；否则车在剩下 doors-1-opened 扇门中，随机换中概率 1/剩余
+    remaining = doors - 1 - opened
+    hit = rng.integers(0, remaining, n) == 0
+    return ((car != pick) & hit).astype(np.int8)
+
+
+# ==================== 掷骰 ====================
+
+def craps_pass_line(rng: np.random.Generator, n: int, sides: int = 6) -> np.ndarray:
+    """Pass Line 一局结果: +1 赢 / -1 输（come-out 7/11 赢，2/3/12 输，否则追点）"""
+    roll = rng.integers(1, sides + 1, (n, 2)).sum(axis=1)
+    result = np.zeros(n, dtype=np.int8)
+    result[(roll == 7) | (roll == 11)] = 1
+    result[(roll == 2) | (roll == 3) | (roll == 12)] = -1
+    point = np.where(result == 0, roll, 0)
+    active = np.flatnonzero(point)
+    while active.size:
+        r = rng.integers(1, sides + 1, (active.size, 2)).sum(axis=1)
+        won = r == point[active]
+        lost = r == 7
+        result[active[won]] = 1
+        result[active[lost]] = -1
+        active = active[~(won | lost)]
+    return result
+
+
+def craps_come_out(rng: np.random.Generator, n: int, outcome: str = "win", sides: int = 6) -> np.ndarray:
+    """come-out 一掷即胜 (7/11) 或即负 (2/3/12) 的指示变量"""
+    roll = rng.integers(1, sides + 1, (n, 2)).sum(axis=1)
+    if outcome == "win":
+        return ((roll == 7) | (roll == 11)).astype(np.int8)
+    return ((roll == 2) | (roll == 3) | (roll == 12)).astype(np.int8)
+
+
+# ==================== 21点 ====================
+
+# 仅要牌/停牌的基本策略: 要牌返回 True；下标 [点数][庄家明牌 1-10]
+_HARD_HIT = np.zeros((32, 11), dtype=bool)
+_SOFT_HIT = np.zeros((32, 11), dtype=bool)
+for _up in range(1, 11):
+    _HARD_HIT[:12, _up] = True
+    _HARD_HIT[12, _up] = _up not in (4, 5, 6)
+    _HARD_HIT[13:17, _up] = not (2 <= _up <= 6)
+    _SOFT_HIT[:18, _up] = True
+    _SOFT_HIT[18, _up] = _up in (9, 10, 1)
+
+
+def _draw(counts: np.ndarray, rng: np.random.Generator, rows: np.ndarray) -> np.ndarray:
+    """从每行自己的牌靴（按点数计数）不放回抽一张，返回点数 1-10"""
+    c = counts[rows]
+    cum = np.cumsum(c, axis=1)
+    u = rng.random(rows.size) * cum[:, -1]
+    value = (cum <= u[:, None]).sum(axis=1)
+    counts[rows, value] -= 1
+    return value + 1
+
+
+def _add(total: np.ndarray, soft: np.ndarray, card: np.ndarray):
+    """把一张牌加到 (点数, 是否软牌) 上；A 先按 11 计，爆牌时降为 1"""
+    total += np.where(card == 1, 11, card)
+    soft |= card == 1
+    bust_soft = (total > 21) & soft
+    total[bust_soft] -= 10
+    soft[bust_soft] = False
+
+
+def blackjack_ev(rng: np.random.Generator, n: int, decks: int = 6, hit_soft_17: bool = False,
+                 blackjack_pays: float = 1.5) -> np.ndarray:
+    """一手 21 点（基本策略要牌/停牌，不加倍不分牌）的收益，单位为注码"""
+    counts = np.tile(np.array([4] * 9 + [16], dtype=np.int32) * decks, (n, 1))
+    rows = np.arange(n)
+    p_total = np.zeros(n, dtype=np.int32)
+    p_soft = np.zeros(n, dtype=bool)
+    d_total = np.zeros(n, dtype=np.int32)
+    d_soft = np.zeros(n, dtype=bool)
+
+    _add(p_total, p_soft, _draw(counts, rng, rows))
+    up = _draw(counts, rng, rows)
+    _add(d_total, d_soft, up)
+    _add(p_total, p_soft, _draw(counts, rng, rows))
+    _add(d_total, d_soft, _draw(counts, rng, rows))
+
+    payoff = np.zeros(n, dtype=np.float64)
+    p_bj, d_bj = p_total == 21, d_total == 21
+    payoff[p_bj & ~d_bj] = blackjack_pays
+    payoff[d_bj & ~p_bj] = -1.0
+    live = ~(p_bj | d_bj)
+
+    # 玩家按策略表要牌
+    while True:
+        hit = live & (p_total < 21) & np.where(p_soft, _SOFT_HIT[np.minimum(p_total, 31), up],
+                                               _HARD_HIT[np.minimum(p_total, 31), up])
+        idx = np.flatnonzero(hit)
+        if not idx.size:
+            break
+        card = _draw(counts, rng, idx)
+        t, s = p_total[idx], p_soft[idx]
+        _add(t, s, card)
+        p_total[idx], p_soft[idx] = t, s
+
+    bust = live & (p_total > 21)
+    payoff[bust] = -1.0
+    live &= ~bust
+
+    # 庄家补牌到 17（可选软17继续要）
+    while True:
+        need = live & ((d_total < 17) | (hit_soft_17 & (d_total == 17) & d_soft))
+        idx = np.flatnonzero(need)
+        if not idx.size:
+            break
+        card = _draw(counts, rng, idx)
+        t, s = d_total[idx], d_soft[idx]
+        _add(t, s, card)
+        d_total[idx], d_soft[idx] = t, s
+
+    payoff[live] = np.sign(p_total[live] - np.where(d_total[live] > 21, 0, d_total[live]))
+    return payoff
+
+
+# ==================== 德州扑克 ====================
+
+RANKS = "23456789TJQKA"
+SUITS = "shdc"
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+CATEGORY_NAMES = ["高牌", "一对", "两对", "三条", "顺子", "同花", "葫芦", "四条", "同花顺"]
+
+
+def _build_tables():
+    """按 13 位点数掩码预计算: 顺子最高点 (+1，0 表示无顺子)、最高 5 张的打包值"""
+    straight = np.zeros(1 << 13, dtype=np.int32)
+    top5 = np.zeros(1 << 13, dtype=np.int32)
+    windows = [(0b11111 << low, low + 4) for low in range(8, -1, -1)]
+    wheel = (1 << 12) | 0b1111
+    for mask in range(1 << 13):
+        for w, high in windows:
+            if mask & w == w:
+                straight[mask] = high + 1
+                break
+        else:
+            if mask & wheel == wheel:
+                straight[mask] = 4  # A-2-3-4-5，最高点为 5 (下标 3)
+        packed, taken = 0, 0
+        for r in range(12, -1, -1):
+            if mask >> r & 1 and taken < 5:
+                packed = packed << 4 | r
+                taken += 1
+        top5[mask] = packed << 4 * (5 - taken)
+    return straight, top5
+
+
+_STRAIGHT_HIGH, _TOP5 = cached_table("poker_rank_tables", _build_tables, __file__)
+
+
+def parse_cards(text: str) -> List[int]:
+    """'As Kd' / 'AsKd' / 'asKD' → 牌编号列表（编号 = 点数*4 + 花色），大小写不敏感"""
+    return [RANKS.index(r.upper()) * 4 + SUITS.index(s.lower())
+            for r, s in re.findall(r"([2-9TJQKA])([SHDC])", text.replace("10", "T"), flags=re.I)]
+
+
+def parse_hand(text: str) -> List[int]:
+    """
+    解析两张起手牌: 'AsKd'、'AA'、'AKs'（同花）、'AKo'（不同花）
+    未给花色时自动分配花色。
+    """
+    cards = parse_cards(text)
+    if len(cards) == 2:
+        return cards
+    m = re.fullmatch(r"\s*([2-9TJQKA])([2-9TJQKA])([SO]?)\s*", text.upper().replace("10", "T"))
+    if not m:
+        raise ValueError(f"无法解析手牌: {text}")
+    r1, r2 = RANKS.index(m.group(1)), RANKS.index(m.group(2))
+    suited = m.group(3) == "S" and r1 != r2
+    return [r1 * 4, r2 * 4 + (0 if suited else 1)]
+
+
+def hand_rank(cards: np.ndarray) -> np.ndarray:
+    """
+    7 张（或 5/6 张）牌的牌力分数，越大越强；cards 形状 (n, k)，元素为牌编号
+
+    分数 = 牌型 << 20 | 最多 5 个关键点数（各 4 位）
+    """
+    n = cards.shape[0]
+    ranks = cards >> 2
+    suits = cards & 3
+    bits = np.left_shift(1, ranks)
+
+    rank_counts = (ranks[:, :, None] == np.arange(13)).sum(axis=1)
+    rank_mask = np.bitwise_or.reduce(bits, axis=1)
+
+    # 同花 / 同花顺
+    flush_mask = np.zeros(n, dtype=np.int64)
+    for s in range(4):
+        m = np.bitwise_or.reduce(np.where(suits == s, bits, 0), axis=1)
+        has = (suits == s).sum(axis=1) >= 5
+        flush_mask = np.where(has, m, flush_mask)
+    is_flush = flush_mask > 0
+    sf_high = _STRAIGHT_HIGH[flush_mask]
+    st_high = _STRAIGHT_HIGH[rank_mask]
+
+    # 按 (张数, 点数) 降序排列出现过的点数
+    key = rank_counts * 16 + np.arange(13)
+    order = np.argsort(-key, axis=1)[:, :4]
+    cnt = np.take_along_axis(rank_counts, order, axis=1)
+    grp = np.where(cnt > 0, order, 0)
+    c1, c2 = cnt[:, 0], cnt[:, 1]
+
+    def pack(*cols):
+        value = np.zeros(n, dtype=np.int64)
+        for col in cols:
+            value = value << 4 | col
+        return value << 4 * (5 - len(cols))
+
+    score = (HIGH_CARD << 20) | _TOP5[rank_mask]
+    score = np.where(c1 == 2, (PAIR << 20) | pack(grp[:, 0], grp[:, 1], grp[:, 2], grp[:, 3]), score)
+    score = np.where((c1 == 2) & (c2 == 2),
+                     (TWO_PAIR << 20) | pack(grp[:, 0], grp[:, 1], np.maximum(grp[:, 2], grp[:, 3])), score)
+    score = np.where(c1 == 3, (TRIPS << 20) | pack(grp[:, 0], grp[:, 1], grp[:, 2]), score)
+    score = np.where(st_high > 0, (STRAIGHT << 20) | pack(st_high - 1), score)
+    score = np.where(is_flush, (FLUSH << 20) | _TOP5[flush_mask], score)
+    score = np.where((c1 == 3) & (c2 >= 2), (FULL_HOUSE << 20) | pack(grp[:, 0], grp[:, 1]), score)
+    score = np.where(c1 == 4, (QUADS << 20) | pack(grp[:, 0], grp[:, 1:].max(axis=1)), score)
+    score = np.where(sf_high > 0, (STRAIGHT_FLUSH << 20) | pack(sf_high - 1), score)
+    return score
+
+
+def holdem_equity(rng: np.random.Generator, n: int, hands: Sequence[Sequence[int]] = (),
+                  opponents: int = 1, board: Sequence[int] = ()) -> np.ndarray:
+    """
+    第一手牌的胜率份额: 赢 1，k 人平分 1/k，输 0
+
+    Args:
+        hands: 已知手牌，第一手为待求者，其余为指定对手
+        opponents: 额外的随机手牌对手数
+        board: 已知公共牌（0-5 张）
+    """
+    known = [c for h in hands for c in h] + list(board)
+    deck = np.setdiff1d(np.arange(52), known)
+    need = 5 - len(board) + 2 * opponents
+    # 每行随机键取最小的 need 个 = 无放回随机抽牌
+    dealt = deck[np.argpartition(rng.random((n, deck.size)), need, axis=1)[:, :need]]
+    community = np.concatenate([np.tile(np.asarray(board, dtype=np.int64), (n, 1)),
+                                dealt[:, :5 - len(board)]], axis=1)
+    holes = [np.tile(np.asarray(h, dtype=np.int64), (n, 1)) for h in hands]
+    holes += [dealt[:, 5 - len(board) + 2 * i: 7 - len(board) + 2 * i] for i in range(opponents)]
+
+    scores = np.stack([hand_rank(np.concatenate([h, community], axis=1)) for h in holes], axis=1)
+    best = scores.max(axis=1)
+    winners = scores == best[:, None]
+    return np.where(winners[:, 0], 1.0 / winners.sum(axis=1), 0.0)
+
+
+# ==================== 问题解析 ====================
+
+_POCKET_WORDS = {"aces": "AA", "kings": "KK", "queens": "QQ", "jacks": "JJ", "tens": "TT"}
+
+
+_HAND_TOKEN_RE = re.compile(r"(?<![A-Za-z0-9])((?:[2-9TJQKA][SHDC]?){2}[SO]?)(?![A-Za-z0-9])", re.I)
+# 形似手牌的常见英文单词
+_NOT_HANDS = {"at"}
+
+
+def _card_name(card: int) -> str:
+    return RANKS[card >> 2] + SUITS[card & 3]
+
+
+def _hands_from_question(question: str, board: Sequence[int] = ()) -> tuple:
+    """
+    题面中的起手牌（点数与花色大小写不敏感）；未写花色的手牌避开公共牌 board
+
+    Returns:
+        (手牌列表, 问题列表)；写明花色的牌重复或无法解析时记入问题，不改写成别的牌
+    """
+    q = question
+    for word, hand in _POCKET_WORDS.items():
+        q = re.sub(rf"pocket\s+{word}", hand, q, flags=re.I)
+    hands, errors, used = [], [], set(board)
+    auto = []
+    for token in _HAND_TOKEN_RE.findall(q.replace("10", "T")):
+        if token.isdigit() or token.lower() in _NOT_HANDS:
+            continue
+        try:
+            hand = parse_hand(token)
+        except ValueError as e:
+            errors.append(str(e))
+            continue
+        if len(parse_cards(token)) < 2:
+            auto.append((len(hands), hand))  # 未写花色: 等写明花色的牌占位后再分配
+            hands.append(None)
+            continue
+        if hand[0] == hand[1] or used & set(hand):
+            errors.append(f"重复的牌: {token}" + ("（与公共牌）" if set(board) & set(hand) else ""))
+            continue
+        used |= set(hand)
+        hands.append(hand)
+    for i, hand in auto:
+        # 未写花色的手牌与已有的牌撞牌时换花色（同花/不同花关系不变）
+        suited = hand[0] & 3 == hand[1] & 3
+        for s1, s2 in sorted(itertools.product(range(4), repeat=2),
+                             key=lambda p: (p != (hand[0] & 3, hand[1] & 3), p)):
+            alt = [hand[0] & ~3 | s1, hand[1] & ~3 | s2]
+            if (s1 == s2) == suited and len(set(alt)) == 2 and not used & set(alt):
+                used |= set(alt)
+                hands[i] = alt
+                break
+        else:
+            errors.append(f"没有剩余花色可分配: {''.join(RANKS[c >> 2] for c in hand)}")
+    return [h for h in hands if h is not None], errors
+
+
+def _fmt(r: Dict, pct: bool = True) -> str:
+    lo, hi = r["ci"]
+    if pct:
+        return f"{r['mean'] * 100:.2f}% (95%CI {lo * 100:.2f}–{hi * 100:.2f}%)"
+    return f"{r['mean']:+.4f} (95%CI {lo:+.4f}–{hi:+.4f})"
+
+
+def _speed(r: Dict) -> str:
+    return f"{r['trials']:,}次试验，{r['trials_per_sec']:,.0f}次/秒"
+
+
+def _invalid(category: str, reason: str) -> Dict:
+    """题面参数不合法: 说明原因，不换成别的题来算"""
+    return {"game": category, "summary": f"无法模拟: {reason}", "results": {}, "error": reason}
+
+
+def simulate_question(category: str, question: str, workers: int = 0, seed: int = None) -> Optional[Dict]:
+    """
+    按路由类别跑对应模型
+
+    Returns:
+        {"game", "summary", "results": {名称: simulate() 结果}}；类别不支持时返回 None；
+        题面参数不合法（门数 < 3、副数 < 1、重复的牌…）时 results 为空并带 "error"
+    """
+    q = question.lower()
+    results = {}
+    lines = []
+    run = partial(simulate, workers=workers, seed=seed)
+
+    if category == "monty_hall":
+        m = re.search(r"(\d+)\s*(?:doors?|扇门|个门)", q)
+        doors = int(m.group(1)) if m else 3
+        m = re.search(r"(?:opens?|打开|开)\s*(\d+)", q)
+        opened = int(m.group(1)) if m else 1
+        if doors < 3:
+            return _invalid(category, f"门数至少为 3（题面为 {doors}）")
+        if opened > doors - 2:
+            return _invalid(category, f"{doors} 扇门时主持人最多开 {doors - 2} 扇（题面为 {opened}）")
+        for name, switch in (("switch", True), ("stay", False)):
+            results[name] = run(partial(monty_hall, doors=doors, opened=opened, switch=switch))
+        lines.append(f"{doors}门、主持人开{opened}扇: 换门 {_fmt(results['switch'])}，"
+                     f"坚持 {_fmt(results['stay'])}")
+        speed = results["switch"]
+    elif category == "craps":
+        results["pass_line"] = run(partial(craps_pass_line))
+        results["come_out_win"] = run(partial(craps_come_out, outcome="win"))
+        results["come_out_lose"] = run(partial(craps_come_out, outcome="lose"))
+        lines.append(f"come-out即胜(7/11): {_fmt(results['come_out_win'])}，"
+                     f"即负(2/3/12): {_fmt(results['come_out_lose'])}")
+        pl = results["pass_line"]
+        lines.append(f"Pass Line 期望: {_fmt(pl, pct=False)}（胜率≈{(pl['mean'] + 1) / 2 * 100:.2f}%）")
+        speed = pl
+    elif category == "blackjack":
+        m = re.search(r"(\d+)\s*(?:-?\s*decks?|副)", q)
+        decks = int(m.group(1)) if m else 6
+        if decks < 1:
+            return _invalid(category, f"副数至少为 1（题面为 {decks}）")
+        h17 = bool(re.search(r"h17|hits? soft 17|软17要牌", q))
+        results["ev"] = run(partial(blackjack_ev, decks=decks, hit_soft_17=h17),
+                            batch_size=50_000, tol=0.004)
+        lines.append(f"{decks}副牌、庄家{'软17要牌' if h17 else '软17停牌'}，"
+                     f"要牌/停牌基本策略（不加倍/分牌）每注期望: {_fmt(results['ev'], pct=False)}")
+        speed = results["ev"]
+    elif category == "texas_holdem":
+        board_text = " ".join(re.findall(r"(?:board|flop|公共牌)[:：]?\s*((?:[2-9TJQKA][shdc]\s*){3,5})",
+                                         question, flags=re.I))
+        board = parse_cards(board_text)
+        hands, errors = _hands_from_question(question.replace(board_text, " ") if board_text else question,
+                                             board)
+        hands = hands or ([] if errors else [parse_hand("AA")])
+        m = re.search(r"(\d+)\s*(?:opponents?|players?|人|名对手|个?(?:随机)?对手)", q)
+        opponents = int(m.group(1)) if m else (0 if len(hands) > 1 else 1)
+        if m and "player" in m.group(0):
+            opponents = max(int(m.group(1)) - len(hands), 0)
+        if len(set(board)) < len(board):
+            errors.append("公共牌重复: " + board_text.strip())
+        if not errors and 2 * (len(hands) + opponents) + 5 > 52:
+            errors.append(f"一副牌不够 {len(hands) + opponents} 人")
+        if errors:
+            return _invalid(category, "；".join(errors))
+        results["equity"] = run(partial(holdem_equity, hands=hands, opponents=opponents, board=board),
+                                batch_size=50_000)
+        names = [" ".join(_card_name(c) for c in h) for h in hands]
+        versus = " vs ".join(names[1:] + [f"{opponents}个随机对手"] * bool(opponents))
+        lines.append(f"{names[0]} 对 {versus} 的胜率: {_fmt(results['equity'])}")
+        speed = results["equity"]
+    else:
+        return None
+
+    lines.append(f"模拟: {_speed(speed)}")
+    return {"game": category, "summary": "\n".join(lines), "results": results}
+
+
+if __name__ == "__main__":
+    import os
+
+    print("🦞 蒙特卡洛概率引擎")
+    print("=" * 60)
+    checks = [
+        ("三门 换门 (理论 66.67%)", partial(monty_hall, switch=True), 100_000, True),
+        ("Craps Pass Line (理论 -0.0141)", partial(craps_pass_line), 100_000, False),
+        ("AA vs 随机 (约 85.2%)", partial(holdem_equity, hands=[parse_hand("AA")]), 50_000, True),
+        ("AA vs KK (约 81.9%)", partial(holdem_equity, hands=[parse_hand("AsAh"), parse_hand("KsKh")],
+                                       opponents=0), 50_000, True),
+        ("21点 6副 S17 基本策略", partial(blackjack_ev), 50_000, False),
+    ]
+    for title, fn, batch, pct in checks:
+        r = simulate(fn, batch_size=batch, seed=1)
+        print(f"\n{title}")
+        print(f"  {_fmt(r, pct)}  {_speed(r)}  {'收敛' if r['converged'] else '达到上限'}")
+
+    workers = min(4, os.cpu_count() or 1)
+    if workers > 1:
+        fn = partial(holdem_equity, hands=[parse_hand("AA")])
+        single = simulate(fn, batch_size=50_000, tol=0.0005, seed=2)
+        multi = simulate(fn, batch_size=50_000, tol=0.0005, seed=2, workers=workers)
+        print(f"\n进程池 ({workers} 核): 单进程 {single['trials_per_sec']:,.0f}/s → "
+              f"多进程 {multi['trials_per_sec']:,.0f}/s")
+
+    q = "Monty Hall with 10 doors, host opens 8 doors. Should you switch?"
+    print(f"\n{q}\n{simulate_question('monty_hall', q)['summary']}")
@@ -86,8 +86,8 @@ class OptimizedConversationManager:
             self.stats["cache_hits"] += 1
             return json.dumps({"events": events}, ensure_ascii=False)
         
-        # 返回AI上下文摘要
-        return self.memory.get_context_for_ai(self.max_context_size)
+        # 返回AI上下文摘要（按当前消息相关度装入token预算）
+        return self.memory.get_context_for_ai(self.max_context_size, query=message)
     
     def _extract_entities(self, message: str) -> List[Dict]:
         """提取实体"""
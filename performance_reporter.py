@@ -7,11 +7,14 @@
 import json
 from datetime import datetime
 
+from timeseries_store import TimeSeriesStore
+
 class PerformanceReporter:
     """性能报告生成器"""
     
-    def __init__(self):
+    def __init__(self, store: TimeSeriesStore = None):
         self.metrics = []
+        self.store = store or TimeSeriesStore()
         
     def add_metric(self, name: str, value: float, unit: str):
         """添加指标"""
@@ -59,6 +62,11 @@ class PerformanceReporter:
         report = self.generate_report()
         with open(filename, 'w') as f:
             json.dump(report, f, indent=2)
+        
+        # 指标同时写入 performance 时序（每次报告一行，每个指标一列）
+        values = {m['name']: m['value'] for m in self.metrics}
+        if values:
+            self.store.append('performance', report['timestamp'], flush=True, **values)
         return filename
 
 if __name__ == "__main__":
@@ -6,6 +6,10 @@
 import re
 from typing import Dict
 
+from intent_routes import get_router
+
+_ROUTER = get_router("integrator")
+
 
 class ReasoningIntegrator:
     """推理引擎集成器 v8.0"""
@@ -22,17 +26,7 @@ class ReasoningIntegrator:
         return {"type": p_type, "answer": answer, "confidence": conf}
     
     def _detect_type(self, problem: str) -> str:
-        if "因式分解" in problem: return "factorization"
-        if any(kw in problem for kw in ["tan", "cos", "sin", "θ"]): return "trigonometric"
-        if any(kw in problem for kw in ["座位", "安排", "排列"]): return "combinatorics"
-        if any(kw in problem for kw in ["雨滴", "LED"]): return "physics"
-        if any(kw in problem for kw in ["极值", "最大", "最小"]): return "extremal"
-        if any(kw in problem for kw in ["抛物线", "椭圆", "三角形", "翻折", "二面角"]): return "geometry"
-        if any(kw in problem for kw in ["函数", "斜率", "直线", "共线", "交点"]): return "function"
-        if any(kw in problem for kw in ["星期", "昨天", "今天"]): return "logic"
-        if "相关系数" in problem: return "algebra"
-        if any(kw in problem for kw in ["准确率", "泛化", "测试集"]): return "ml"
-        return "general"
+        return _ROUTER.route(problem)
     
     def _solve(self, problem: str, p_type: str) -> tuple:
         if p_type == "logic":
@@ -7,6 +7,10 @@
 import re
 from typing import Dict
 
+from intent_routes import get_router
+
+_ROUTER = get_router("v12")
+
 
 class ReasoningEngineV12:
     def __init__(self):
@@ -223,16 +227,6 @@ AS-AD(总供给-总需求):
                 "keywords": ["离别", "七言"]
             }
         }
-        
-        # 关键词映射
-        self.keyword_map = {
-            "math_ultimate": ["黎曼", "ζ函数", "费马", "P vs NP", "康托尔", "素数", "证明"],
-            "quantum": ["量子", "纠缠", "叠加", "Shor", "贝尔"],
-            "ml_ultimate": ["Transformer", "注意力", "GPT", "Scaling"],
-            "philosophy": ["缸中之脑", "电车难题", "模拟", "功利主义", "义务论"],
-            "system_design": ["高可用", "分布式", "CAP", "微服务", "事件驱动"],
-            "economics": ["有效市场", "行为金融", "IS-LM", "AS-AD", "宏观"]
-        }
     
     def analyze(self, problem: str) -> Dict:
         result = {"type": None, "answer": None, "confidence": 0.0}
@@ -247,40 +241,8 @@ AS-AD(总供给-总需求):
         return result
     
     def _detect_type(self, problem: str) -> str:
-        # 检测v12.0新增领域
-        if any(kw in problem for kw in self.keyword_map["math_ultimate"]):
-            return "math_ultimate"
-        if any(kw in problem for kw in self.keyword_map["quantum"]):
-            return "quantum"
-        if any(kw in problem for kw in self.keyword_map["ml_ultimate"]):
-            return "ml_ultimate"
-        if any(kw in problem for kw in self.keyword_map["philosophy"]):
-            return "philosophy"
-        if any(kw in problem for kw in self.keyword_map["system_design"]):
-            return "system_design"
-        if any(kw in problem for kw in self.keyword_map["economics"]):
-            return "economics"
-        
-        # 回退到v11.0
-        if "欧拉" in problem: return "math_advanced"
-        if "微分方程" in problem: return "math_advanced"
-        if "∫" in problem: return "math_advanced"
-        if any(kw in problem for kw in ["二分查找", "LRU", "动态规划", "背包"]):
-            return "coding_advanced"
-        if "约瑟夫环" in problem or "围成一圈" in problem:
-            return "logic_advanced"
-        if "七言" in problem or "离别" in problem:
-            return "poem_advanced"
-        if "相对论" in problem or "测不准" in problem:
-            return "physics"
-        if any(kw in problem for kw in ["斐波那契", "排序", "链表"]):
-            return "coding"
-        if any(kw in problem for kw in ["春天", "诗句"]):
-            return "creative"
-        if "因式分解" in problem: return "math"
-        if "游泳" in problem: return "reasoning"
-        
-        return "general"
+        # v12.0 新增领域优先，其后回退到 v11.0（关键词表见 intent_routes.V12）
+        return _ROUTER.route(problem)
     
     # v12.0求解器
     def _solve_math_ultimate(self, problem: str) -> Dict:
@@ -15,11 +15,13 @@ import json
 from typing import Dict, List, Any
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+
 
 class ReasoningEngineV14:
     def __init__(self):
         self.version = "14.0"
-        self.memory = []  # 长期记忆
+        self.memory = memory_ring()  # 长期记忆
         self.tools = {
             "code_executor": True,
             "web_search": True,
@@ -49,6 +51,7 @@ class ReasoningEngineV14:
         # 工具执行
         self.tool_outputs = []
     
+    @memoize_answer
     def analyze(self, problem: str, context: List[str] = None) -> Dict:
         """分析问题（支持多模态和上下文）"""
         
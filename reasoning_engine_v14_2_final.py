@@ -7,11 +7,16 @@
 
 from typing import Dict
 
+from answer_cache import memoize_answer, memory_ring
+from intent_routes import get_router
+
+_ROUTER = get_router("v14_2_final")
+
 
 class ReasoningEngineV14_2_Final:
     def __init__(self):
         self.version = "14.2"
-        self.memory = []
+        self.memory = memory_ring()
         
         self.knowledge = {
             # 🎯 游戏知识库
@@ -183,53 +188,15 @@ dp[i][w] = max(dp[i-1][w], value[i] + dp[i-1][w-weight[i]])
             "transformer": "Attention(Q,K,V)=softmax(QK^T/√d)×V",
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         p_type = self._detect_type(problem)
         result = self._solve(problem, p_type)
         return result
     
     def _detect_type(self, problem: str) -> str:
-        p = problem.lower()
-        
-        # 游戏关键词
-        if "chess" in p or "象棋" in p:
-            return "chess"
-        if "nim" in p:
-            return "nim"
-        if "tic-tac-toe" in p or "井字" in p:
-            return "tic_tac_toe"
-        if "monty hall" in p or "三门" in p:
-            return "monty_hall"
-        if "craps" in p or "掷骰" in p:
-            return "craps"
-        if "prisoner" in p or "tit-for-tat" in p:
-            return "prisoners_dilemma"
-        if "minimax" in p or "alpha-beta" in p:
-            return "minimax"
-        if "texas holdem" in p or "德州扑克" in p:
-            return "texas_holdem"
-        if "blackjack" in p or "21点" in p:
-            return "blackjack"
-        if "maze" in p or "bfs" in p or "dfs" in p or "a*" in p:
-            return "maze"
-        if "alphago" in p or "mcts" in p:
-            return "alphago"
-        if "dqn" in p or "deep q" in p:
-            return "dqn"
-        if "tsp" in p or "traveling salesman" in p:
-            return "tsp"
-        if "knapsack" in p or "背包" in p:
-            return "knapsack"
-        if "nash" in p or "均衡" in p:
-            return "nash_equilibrium"
-        
-        # 原有关键词
-        if "euler" in p or "欧拉" in p:
-            return "math"
-        if "transformer" in p or "attention" in p:
-            return "transformer"
-        
-        return "general"
+        # 关键词表见 intent_routes.V14_2_FINAL（编译成单次扫描）
+        return _ROUTER.route(problem)
     
     def _solve(self, problem: str, p_type: str) -> Dict:
         if p_type in self.knowledge:
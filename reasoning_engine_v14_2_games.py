@@ -9,11 +9,37 @@ import re
 from typing import Dict
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+from engine_registry import resolve
+from intent_routes import get_router
+
+_ROUTER = get_router("v14_2_games")
+
+# 路由类别 → 知识库键（两者命名不一致的游戏）
+_KNOWLEDGE_KEYS = {"chess": "chess_endgame", "nim": "nim_game", "maze": "maze_solving"}
+
+# 每次 analyze 的博弈树搜索预算（秒）；井字棋/尼姆/王车对王远低于此即搜完
+SEARCH_BUDGET = 0.25
+
+# 数值求解器: (答案标签, "模块:函数", 结果字段)；函数签名 f(类别, 题面) -> {"summary", ...} 或 None
+# 求解器依赖 numpy，首次用到时才导入
+_SOLVERS = [
+    ("模拟", "monte_carlo:simulate_question", "simulation"),
+    ("求解", "combinatorial_solvers:solve_question", "solution"),
+    ("博弈", "game_theory:solve_game_theory", "equilibrium"),
+]
+
+# 知识条目中的示例段落；求解器算出了题面实例时，用计算结果替换示例
+_EXAMPLE_MARKER = "\n\n例子:"
+
 
 class ReasoningEngineV14_2:
+    # 棋局 (FEN 大写为白方)、牌面等解析区分大小写，答案缓存键不做大小写折叠
+    answer_cache_casefold = False
+
     def __init__(self):
         self.version = "14.2"
-        self.memory = []
+        self.memory = memory_ring()
         
         # v14.2游戏增强知识库
         self.knowledge = {
@@ -50,6 +76,14 @@ nim-sum = 3 XOR 4 XOR 5 = 2 (非零)
 
 完美策略下: 先手不败""",
             
+            "connect_four": """四子棋(Connect Four)策略:
+7列×6行，先连成四子者胜
+1. 中间列参与的四连最多，开局优先走中间
+2. 制造双重威胁: 两个空位都能连四，对手只能堵一个
+3. 注意奇偶行: 先手的威胁最好落在奇数行
+
+理论结论: 先手走中间列必胜 (1988年已被完全求解)""",
+            
             # 🎲 概率游戏
             "monty_hall": """三门问题:
 选择: 3门，1辆跑车，2只山羊
@@ -219,10 +253,9 @@ dp[i][w] = max(dp[i-1][w], value[i] + dp[i-1][w-weight[i]])
 
 解:
 - 选择(20,100) + (30,120) = 220, 重量50
-- 最优: 物品4+物品1 = 60+100=160
-- 实际上需要动态规划计算
+- 对比: (10,60) + (40,150) = 210, 重量50
 
-最优解: 60+100+150=310 (物品1+2+4)""",
+最优解: 100+120=220 (物品2+3)""",
             
             "nash_equilibrium": """纳什均衡:
 匹配硬币游戏:
@@ -256,6 +289,7 @@ P1
             "cap": "CAP定理: 一致性/可用性/分区容错性只能同时满足两个",
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         p_type = self._detect_type(problem)
         result = self._solve(problem, p_type)
@@ -263,68 +297,46 @@ P1
         return result
     
     def _detect_type(self, problem: str) -> str:
-        # 🎮 游戏相关关键词
-        if "chess" in problem.lower() or "象棋" in problem or "将死" in problem:
-            return "chess"
-        if "nim" in problem.lower() or "尼姆" in problem:
-            return "nim"
-        if "tic-tac-toe" in problem.lower() or "井字" in problem:
-            return "tic_tac_toe"
-        if "monty hall" in problem.lower() or "三门" in problem:
-            return "monty_hall"
-        if "craps" in problem.lower() or "掷骰" in problem:
-            return "craps"
-        if "prisoner" in problem.lower() or "囚徒" in problem or "tit-for-tat" in problem.lower():
-            return "prisoners_dilemma"
-        if "minimax" in problem.lower() or "alpha-beta" in problem.lower():
-            return "minimax"
-        if "texas holdem" in problem.lower() or "德州扑克" in problem:
-            return "texas_holdem"
-        if "blackjack" in problem.lower() or "21点" in problem:
-            return "blackjack"
-        if "maze" in problem.lower() or "迷宫" in problem or "BFS" in problem or "A*" in problem:
-            return "maze"
-        if "alphago" in problem.lower() or "AlphaGo" in problem or "MCTS" in problem:
-            return "alphago"
-        if "dqn" in problem.lower() or "DQN" in problem or "深度Q" in problem:
-            return "dqn"
-        if "tsp" in problem.lower() or "旅行商" in problem:
-            return "tsp"
-        if "knapsack" in problem.lower() or "背包" in problem:
-            return "knapsack"
-        if "nash" in problem.lower() or "纳什" in problem or "均衡" in problem:
-            return "nash_equilibrium"
-        
-        # 原有关键词
-        if "欧拉" in problem or "e^(iπ)" in problem:
-            return "math"
-        if "费马" in problem and ("a³" in problem or "立方" in problem):
-            return "fermat_3"
-        if "黎曼" in problem and "非平凡" in problem:
-            return "riemann"
-        if "Shor" in problem or "RSA" in problem:
-            return "shor"
-        if "Transformer" in problem:
-            return "transformer"
-        if "GPT" in problem:
-            return "gpt"
-        if "缸中之脑" in problem:
-            return "brain_vat"
-        if "电车" in problem:
-            return "trolley"
-        if "CAP" in problem:
-            return "cap"
-        
-        return "general"
+        # 关键词表见 intent_routes.V14_2_GAMES（编译成单次扫描）
+        return _ROUTER.route(problem)
     
     def _solve(self, problem: str, p_type: str) -> Dict:
-        if p_type in self.knowledge:
-            return {
+        key = _KNOWLEDGE_KEYS.get(p_type, p_type)
+        if key in self.knowledge:
+            result = {
                 "type": p_type,
-                "answer": self.knowledge[p_type],
+                "answer": self.knowledge[key],
                 "confidence": 0.85
             }
+            # 常规分析用短预算；小棋类远低于此即可搜完全树，同一局面再问时走缓存
+            searched = resolve("game_search:solve_game")(p_type, problem, time_limit=SEARCH_BUDGET)
+            if searched is not None:
+                result["answer"] += "\n\n" + self._format_search(searched)
+                result["search"] = searched
+                mate = abs(searched["score"]) >= resolve("game_search:MATE_BOUND")
+                result["confidence"] = 0.95 if searched["complete"] or mate else 0.9
+            for tag, solver, field in _SOLVERS:
+                computed = resolve(solver)(p_type, problem)
+                if computed is not None and computed.get("error"):
+                    # 题面参数不合法: 保留知识条目，附上原因，不提高置信度
+                    result["answer"] += f"\n\n【{tag}】" + computed["summary"]
+                    result[field] = computed
+                elif computed is not None:
+                    result["answer"] = result["answer"].split(_EXAMPLE_MARKER)[0]
+                    result["answer"] += f"\n\n【{tag}】" + computed["summary"]
+                    result[field] = computed
+                    result["confidence"] = 0.95
+            return result
         return {"type": "general", "answer": "需要分析", "confidence": 0.5}
+    
+    @staticmethod
+    def _format_search(r: Dict) -> str:
+        """把博弈树搜索结果整理成答案片段"""
+        describe_score = resolve("game_search:describe_score")
+        depth = f"{r['depth']}层" + ("（已搜完全树）" if r["complete"] else "")
+        return (f"【搜索】{r['game']} 最佳着: {r['move_text']}，评估: {describe_score(r['score'], r['complete'])}\n"
+                f"主变: {' '.join(r['pv'][:8])}\n"
+                f"深度: {depth}，节点: {r['nodes']:,}，速度: {r['nps']:,.0f} nodes/s")
 
 
 if __name__ == "__main__":
@@ -15,11 +15,14 @@ import json
 from typing import Dict, List, Any
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+from knowledge_store import get_knowledge_store
+
 
 class ReasoningEngineV14_3:
     def __init__(self):
         self.version = "14.3"
-        self.memory = []
+        self.memory = memory_ring()
         self.learned = set()
         self.tools = {
             "python_exec": True,
@@ -116,6 +119,7 @@ class LRUCache:
     return memo[n]''',
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         """分析问题（支持代码执行）"""
         
@@ -236,49 +240,10 @@ class LRUCache:
                 "confidence": 0.85
             }
         
-        # 数学检测
-        if "欧拉" in problem or "e^(iπ)" in problem:
-            return {"type": "math", "answer": self.knowledge["euler"], "confidence": 0.85}
-        if "费马" in problem and "a³" in problem:
-            return {"type": "math", "answer": self.knowledge["fermat_3"], "confidence": 0.85}
-        if "黎曼" in problem:
-            return {"type": "math", "answer": self.knowledge["riemann"], "confidence": 0.85}
-        
-        # 量子检测
-        if "Shor" in problem or "RSA" in problem:
-            return {"type": "quantum", "answer": self.knowledge["shor"], "confidence": 0.85}
-        if "贝尔" in problem:
-            return {"type": "quantum", "answer": self.knowledge["bell"], "confidence": 0.85}
-        
-        # 深度学习检测
-        if "Transformer" in problem or "注意力" in problem:
-            return {"type": "ml", "answer": self.knowledge["transformer"], "confidence": 0.85}
-        if "GPT" in problem:
-            return {"type": "ml", "answer": self.knowledge["gpt"], "confidence": 0.85}
-        if "Scaling" in problem:
-            return {"type": "ml", "answer": self.knowledge["scaling"], "confidence": 0.85}
-        
-        # 游戏AI检测
-        if "象棋" in problem or "chess" in problem.lower():
-            return {"type": "game", "answer": self.knowledge["chess_endgame"], "confidence": 0.85}
-        if "尼姆" in problem or "nim" in problem.lower():
-            return {"type": "game", "answer": self.knowledge["nim"], "confidence": 0.85}
-        if "三门" in problem or "monty" in problem.lower():
-            return {"type": "game", "answer": self.knowledge["monty_hall"], "confidence": 0.85}
-        if "囚徒" in problem or "prisoner" in problem.lower():
-            return {"type": "game", "answer": self.knowledge["prisoners"], "confidence": 0.85}
-        if "Minimax" in problem or "alpha" in problem.lower():
-            return {"type": "game", "answer": self.knowledge["minimax"], "confidence": 0.85}
-        if "AlphaGo" in problem or "MCTS" in problem:
-            return {"type": "game", "answer": self.knowledge["alphago"], "confidence": 0.85}
-        if "DQN" in problem:
-            return {"type": "game", "answer": self.knowledge["dqn"], "confidence": 0.85}
-        
-        # 经济学检测
-        if "有效市场" in problem:
-            return {"type": "economics", "answer": self.knowledge["emh"], "confidence": 0.85}
-        if "IS-LM" in problem:
-            return {"type": "economics", "answer": self.knowledge["is_lm"], "confidence": 0.85}
+        # 关键词匹配（触发词见 knowledge_store.KNOWLEDGE_TRIGGERS）
+        result = get_knowledge_store().answer(problem, self.knowledge)
+        if result is not None:
+            return result
         
         return {"type": "general", "answer": "需要分析", "confidence": 0.5}
     
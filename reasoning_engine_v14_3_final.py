@@ -10,11 +10,14 @@ import sys
 from typing import Dict
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+from knowledge_store import get_knowledge_store
+
 
 class ReasoningEngineV14_3_Final:
     def __init__(self):
         self.version = "14.3"
-        self.memory = []
+        self.memory = memory_ring()
         self.tools = {"python_exec": True, "calculator": True}
         
         # 完整知识库（修复版）
@@ -105,6 +108,7 @@ class LRUCache:
     return quick_sort(left) + mid + quick_sort(right)''',
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         # 代码执行
         if any(kw in problem for kw in ["实现", "run", "执行", "计算", "sort", "search", "fibonacci"]):
@@ -149,45 +153,10 @@ class LRUCache:
             if key in problem.lower() or key in value:
                 return {"type": key, "answer": value, "confidence": 0.85}
         
-        # 关键词匹配
-        if "欧拉" in problem or "e^(iπ)" in problem:
-            return {"type": "euler", "answer": self.knowledge["euler"], "confidence": 0.85}
-        if "费马" in problem and ("a³" in problem or "立方" in problem):
-            return {"type": "fermat_3", "answer": self.knowledge["fermat_3"], "confidence": 0.85}
-        if "黎曼" in problem:
-            return {"type": "riemann", "answer": self.knowledge["riemann"], "confidence": 0.85}
-        if "质数" in problem and ("无穷" in problem or "证明" in problem):
-            return {"type": "primes_infinite", "answer": self.knowledge["primes_infinite"], "confidence": 0.85}
-        if "Shor" in problem or "RSA" in problem:
-            return {"type": "shor", "answer": self.knowledge["shor"], "confidence": 0.85}
-        if "贝尔" in problem:
-            return {"type": "bell", "answer": self.knowledge["bell"], "confidence": 0.85}
-        if "隐形传态" in problem:
-            return {"type": "teleportation", "answer": self.knowledge["teleportation"], "confidence": 0.85}
-        if "Transformer" in problem or "注意力" in problem:
-            return {"type": "transformer", "answer": self.knowledge["transformer"], "confidence": 0.85}
-        if "GPT" in problem:
-            return {"type": "gpt", "answer": self.knowledge["gpt"], "confidence": 0.85}
-        if "Scaling" in problem or "定律" in problem:
-            return {"type": "scaling", "answer": self.knowledge["scaling"], "confidence": 0.85}
-        if "ResNet" in problem or "残差" in problem:
-            return {"type": "resnet", "answer": self.knowledge["resnet"], "confidence": 0.85}
-        if "象棋" in problem or "chess" in problem.lower():
-            return {"type": "chess_endgame", "answer": self.knowledge["chess_endgame"], "confidence": 0.85}
-        if "尼姆" in problem or "nim" in problem.lower():
-            return {"type": "nim", "answer": self.knowledge["nim"], "confidence": 0.85}
-        if "三门" in problem or "monty" in problem.lower():
-            return {"type": "monty_hall", "answer": self.knowledge["monty_hall"], "confidence": 0.85}
-        if "囚徒" in problem or "prisoner" in problem.lower():
-            return {"type": "prisoners", "answer": self.knowledge["prisoners"], "confidence": 0.85}
-        if "AlphaGo" in problem or "MCTS" in problem:
-            return {"type": "alphago", "answer": self.knowledge["alphago"], "confidence": 0.85}
-        if "DQN" in problem:
-            return {"type": "dqn", "answer": self.knowledge["dqn"], "confidence": 0.85}
-        if "有效市场" in problem:
-            return {"type": "emh", "answer": self.knowledge["emh"], "confidence": 0.85}
-        if "IS-LM" in problem or "AS-AD" in problem:
-            return {"type": "is_lm", "answer": self.knowledge["is_lm"], "confidence": 0.85}
+        # 关键词匹配（触发词见 knowledge_store.KNOWLEDGE_TRIGGERS）
+        hit = get_knowledge_store().lookup(problem, self.knowledge)
+        if hit is not None:
+            return {"type": hit.key, "answer": self.knowledge[hit.key], "confidence": 0.85}
         
         return {"type": "general", "answer": "需要分析", "confidence": 0.5}
 
@@ -15,11 +15,14 @@ import json
 from typing import Dict, List, Any
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+from knowledge_store import get_knowledge_store
+
 
 class ReasoningEngineV14_4:
     def __init__(self):
         self.version = "14.4"
-        self.memory = []
+        self.memory = memory_ring()
         self.tools = {
             "python_exec": True,
             "web_search": True,
@@ -107,6 +110,7 @@ class LRUCache:
     return quick_sort(left) + mid + quick_sort(right)''',
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         """分析问题（智能工具选择）"""
         
@@ -234,55 +238,10 @@ class LRUCache:
         }
     
     def _knowledge_answer(self, problem: str) -> Dict:
-        """知识库回答"""
-        p = problem.lower()
-        
-        # 数学
-        if "欧拉" in p or "e^(iπ)" in p:
-            return {"type": "math", "answer": self.knowledge["euler"], "confidence": 0.85}
-        if "费马" in p and "a³" in p:
-            return {"type": "math", "answer": self.knowledge["fermat_3"], "confidence": 0.85}
-        if "黎曼" in p:
-            return {"type": "math", "answer": self.knowledge["riemann"], "confidence": 0.85}
-        if "质数" in p and ("无穷" in p or "证明" in p):
-            return {"type": "math", "answer": self.knowledge["primes_infinite"], "confidence": 0.85}
-        
-        # 量子
-        if "Shor" in p or "RSA" in p:
-            return {"type": "quantum", "answer": self.knowledge["shor"], "confidence": 0.85}
-        if "贝尔" in p:
-            return {"type": "quantum", "answer": self.knowledge["bell"], "confidence": 0.85}
-        if "隐形传态" in p:
-            return {"type": "quantum", "answer": self.knowledge["teleportation"], "confidence": 0.85}
-        
-        # 深度学习
-        if "Transformer" in p or "注意力" in p:
-            return {"type": "ml", "answer": self.knowledge["transformer"], "confidence": 0.85}
-        if "GPT" in p:
-            return {"type": "ml", "answer": self.knowledge["gpt"], "confidence": 0.85}
-        if "ResNet" in p or "残差" in p:
-            return {"type": "ml", "answer": self.knowledge["resnet"], "confidence": 0.85}
-        
-        # 游戏AI
-        if "象棋" in p or "chess" in p:
-            return {"type": "game", "answer": self.knowledge["chess_endgame"], "confidence": 0.85}
-        if "尼姆" in p or "nim" in p:
-            return {"type": "game", "answer": self.knowledge["nim"], "confidence": 0.85}
-        if "三门" in p or "monty" in p:
-            return {"type": "game", "answer": self.knowledge["monty_hall"], "confidence": 0.85}
-        if "囚徒" in p or "prisoner" in p:
-            return {"type": "game", "answer": self.knowledge["prisoners"], "confidence": 0.85}
-        if "AlphaGo" in p or "MCTS" in p:
-            return {"type": "game", "answer": self.knowledge["alphago"], "confidence": 0.85}
-        if "DQN" in p:
-            return {"type": "game", "answer": self.knowledge["dqn"], "confidence": 0.85}
-        
-        # 经济学
-        if "有效市场" in p:
-            return {"type": "economics", "answer": self.knowledge["emh"], "confidence": 0.85}
-        if "IS-LM" in p or "AS-AD" in p:
-            return {"type": "economics", "answer": self.knowledge["is_lm"], "confidence": 0.85}
-        
+        """知识库回答（触发词见 knowledge_store.KNOWLEDGE_TRIGGERS）"""
+        result = get_knowledge_store().answer(problem, self.knowledge)
+        if result is not None:
+            return result
         return {"type": "general", "answer": "需要分析", "confidence": 0.50}
     
     def _learn(self, problem: str, result: Dict):
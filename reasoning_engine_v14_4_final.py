@@ -4,20 +4,23 @@
 推理引擎 v14.4 最终修复版
 """
 
-import subprocess
 import sys
 from typing import Dict, Optional
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+from knowledge_store import get_knowledge_store
+
 
 class ReasoningEngineV14_4_Final:
     def __init__(self):
         self.version = "14.4"
-        self.memory = []
+        self.memory = memory_ring()
         self.tools = {"python_exec": True, "web_search": True, "image": True}
         
         self.knowledge = {
             "euler": "欧拉公式: e^(iπ) + 1 = 0",
+            "fermat": "费马大定理: n>2时aⁿ+bⁿ=cⁿ无正整数解，1995年怀尔斯证明",
             "fermat_3": "费马大定理n=3: 假设a³+b³=c³，欧拉用无穷级数证明",
             "riemann": "黎曼猜想: ζ(s)的非平凡零点都在Re(s)=1/2",
             "primes_infinite": "质数无穷: 欧几里得证明，N=p1×...×pn+1含新质因数",
@@ -51,6 +54,7 @@ class ReasoningEngineV14_4_Final:
             "quick_sort": 'def quick_sort(a):\n if len(a)<=1:return a\n p=a[len(a)//2]\n return quick_sort([x for x in a if x<p])+[x for x in a if x==p]+quick_sort([x for x in a if x>p])',
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         p = problem.lower()
         
@@ -98,67 +102,30 @@ class ReasoningEngineV14_4_Final:
         return None
     
     def _run(self, code: str, name: str) -> Dict:
+        """在预热沙箱池中执行（池不可用时回退到子进程）"""
+        import subprocess
+        from sandbox_pool import get_pool  # 沙箱池只在代码题时需要，延迟导入
+        
         try:
-            r = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=10)
-            out = r.stdout + r.stderr
+            try:
+                r = get_pool().run(code, timeout=10)
+                out, error = r["stdout"] + r["stderr"], r["error"]
+            except RuntimeError:
+                r = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=10)
+                out = r.stdout + r.stderr
+                error = None if r.returncode == 0 else f"exitcode={r.returncode}"
+            if error:
+                return {"type": f"code_{name}", "answer": f"【{name}】执行失败: {error}\n{out}".rstrip(),
+                        "confidence": 0.50, "output": out, "error": error}
             return {"type": f"code_{name}", "answer": f"【{name}】\n{out}", "confidence": 0.90, "output": out}
         except Exception as e:
             return {"type": f"code_{name}", "answer": str(e), "confidence": 0.50}
     
     def _knowledge_answer(self, p: str) -> Dict:
-        """知识库回答"""
-        # 数学
-        if "欧拉" in p:
-            return {"type": "math", "answer": self.knowledge["euler"], "confidence": 0.85}
-        if "费马" in p:
-            key = "fermat_3" if "a³" in p else "fermat"
-            return {"type": "math", "answer": self.knowledge[key], "confidence": 0.85}
-        if "黎曼" in p:
-            return {"type": "math", "answer": self.knowledge["riemann"], "confidence": 0.85}
-        if "质数" in p and ("无穷" in p or "证明" in p):
-            return {"type": "math", "answer": self.knowledge["primes_infinite"], "confidence": 0.85}
-        
-        # 量子
-        if "shor" in p or "rsa" in p:
-            return {"type": "quantum", "answer": self.knowledge["shor"], "confidence": 0.85}
-        if "贝尔" in p:
-            return {"type": "quantum", "answer": self.knowledge["bell"], "confidence": 0.85}
-        if "隐形传态" in p:
-            return {"type": "quantum", "answer": self.knowledge["teleportation"], "confidence": 0.85}
-        
-        # 深度学习
-        if "transformer" in p or "注意力" in p:
-            return {"type": "ml", "answer": self.knowledge["transformer"], "confidence": 0.85}
-        if "gpt" in p:
-            key = "scaling" if "scaling" in p else "gpt"
-            return {"type": "ml", "answer": self.knowledge[key], "confidence": 0.85}
-        if "resnet" in p or "残差" in p:
-            return {"type": "ml", "answer": self.knowledge["resnet"], "confidence": 0.85}
-        
-        # 游戏AI
-        if "象棋" in p or "chess" in p:
-            return {"type": "game", "answer": self.knowledge["chess"], "confidence": 0.85}
-        if "尼姆" in p or "nim" in p:
-            return {"type": "game", "answer": self.knowledge["nim"], "confidence": 0.85}
-        if "三门" in p or "monty" in p:
-            return {"type": "game", "answer": self.knowledge["monty_hall"], "confidence": 0.85}
-        if "囚徒" in p or "prisoner" in p:
-            return {"type": "game", "answer": self.knowledge["prisoners"], "confidence": 0.85}
-        if "alphago" in p or "mcts" in p:
-            return {"type": "game", "answer": self.knowledge["alphago"], "confidence": 0.85}
-        if "dqn" in p:
-            return {"type": "game", "answer": self.knowledge["dqn"], "confidence": 0.85}
-        if "lru" in p or "缓存" in p:
-            return {"type": "code", "answer": self.knowledge["lru"], "confidence": 0.85}
-        if "quick" in p or "快速" in p or "排序" in p:
-            return {"type": "code", "answer": self.knowledge["quick_sort"], "confidence": 0.85}
-        
-        # 经济学
-        if "有效市场" in p:
-            return {"type": "economics", "answer": self.knowledge["emh"], "confidence": 0.85}
-        if "is-lm" in p or "is_lm" in p or ("lm" in p and "is" in p):
-            return {"type": "economics", "answer": self.knowledge["is_lm"], "confidence": 0.85}
-        
+        """知识库回答（触发词见 knowledge_store.KNOWLEDGE_TRIGGERS）"""
+        result = get_knowledge_store().answer(p, self.knowledge)
+        if result is not None:
+            return result
         return {"type": "general", "answer": "需要分析", "confidence": 0.50}
 
 
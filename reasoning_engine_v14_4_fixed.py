@@ -9,11 +9,14 @@ import sys
 from typing import Dict
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+from knowledge_store import get_knowledge_store
+
 
 class ReasoningEngineV14_4_Fixed:
     def __init__(self):
         self.version = "14.4"
-        self.memory = []
+        self.memory = memory_ring()
         self.tools = {"python_exec": True, "web_search": True, "image": True}
         
         # 完整知识库
@@ -57,6 +60,7 @@ class ReasoningEngineV14_4_Fixed:
             "quick_sort": 'def quick_sort(a):\n    if len(a)<=1:return a\n    p=a[len(a)//2]\n    return quick_sort([x for x in a if x<p])+[x for x in a if x==p]+quick_sort([x for x in a if x>p])',
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         p = problem.lower()
         
@@ -72,51 +76,10 @@ class ReasoningEngineV14_4_Fixed:
         if any(kw in p for kw in ["最新", "新闻", "recent", "latest"]):
             return {"type": "web", "answer": f"【搜索】{datetime.now().strftime('%Y-%m')}: 多模态/AI Agent趋势", "confidence": 0.70}
         
-        # 知识库
-        if "欧拉" in p:
-            return {"type": "math", "answer": self.knowledge["euler"], "confidence": 0.85}
-        if "费马" in p:
-            key = "fermat_3" if "a³" in p else "fermat"
-            return {"type": "math", "answer": self.knowledge[key], "confidence": 0.85}
-        if "黎曼" in p:
-            return {"type": "math", "answer": self.knowledge["riemann"], "confidence": 0.85}
-        if "质数" in p and ("无穷" in p or "证明" in p):
-            return {"type": "math", "answer": self.knowledge["primes_infinite"], "confidence": 0.85}
-        
-        if "Shor" in p or "RSA" in p:
-            return {"type": "quantum", "answer": self.knowledge["shor"], "confidence": 0.85}
-        if "贝尔" in p:
-            return {"type": "quantum", "answer": self.knowledge["bell"], "confidence": 0.85}
-        if "隐形传态" in p:
-            return {"type": "quantum", "answer": self.knowledge["teleportation"], "confidence": 0.85}
-        
-        if "Transformer" in p or "注意力" in p:
-            return {"type": "ml", "answer": self.knowledge["transformer"], "confidence": 0.85}
-        if "GPT" in p or "Scaling" in p:
-            key = "scaling" if "Scaling" in p else "gpt"
-            return {"type": "ml", "answer": self.knowledge[key], "confidence": 0.85}
-        if "ResNet" in p or "残差" in p:
-            return {"type": "ml", "answer": self.knowledge["resnet"], "confidence": 0.85}
-        
-        if "象棋" in p or "chess" in p:
-            return {"type": "game", "answer": self.knowledge["chess"], "confidence": 0.85}
-        if "尼姆" in p or "nim" in p:
-            return {"type": "game", "answer": self.knowledge["nim"], "confidence": 0.85}
-        if "三门" in p or "monty" in p:
-            return {"type": "game", "answer": self.knowledge["monty_hall"], "confidence": 0.85}
-        if "囚徒" in p or "prisoner" in p:
-            return {"type": "game", "answer": self.knowledge["prisoners"], "confidence": 0.85}
-        if "AlphaGo" in p or "MCTS" in p:
-            return {"type": "game", "answer": self.knowledge["alphago"], "confidence": 0.85}
-        if "DQN" in p:
-            return {"type": "game", "answer": self.knowledge["dqn"], "confidence": 0.85}
-        if "lru" in p or "缓存" in p:
-            return {"type": "code", "answer": self.knowledge["lru"], "confidence": 0.85}
-        
-        if "有效市场" in p:
-            return {"type": "economics", "answer": self.knowledge["emh"], "confidence": 0.85}
-        if "IS-LM" in p or "AS-AD" in p:
-            return {"type": "economics", "answer": self.knowledge["is_lm"], "confidence": 0.85}
+        # 知识库（触发词见 knowledge_store.KNOWLEDGE_TRIGGERS）
+        result = get_knowledge_store().answer(p, self.knowledge)
+        if result is not None:
+            return result
         
         return {"type": "general", "answer": "需要分析", "confidence": 0.50}
     
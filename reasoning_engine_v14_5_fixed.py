@@ -7,11 +7,14 @@
 from typing import Dict
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+from knowledge_store import get_knowledge_store
+
 
 class ReasoningEngineV14_5_Fixed:
     def __init__(self):
         self.version = "14.5"
-        self.memory = []
+        self.memory = memory_ring()
         
         self.knowledge = {
             # 原有知识
@@ -142,6 +145,7 @@ class ReasoningEngineV14_5_Fixed:
    - 技术革命驱动""",
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         p = problem.lower()
         
@@ -161,88 +165,10 @@ class ReasoningEngineV14_5_Fixed:
         if any(kw in p for kw in ["最新", "新闻", "recent"]):
             return {"type": "web", "answer": f"AI趋势: {datetime.now().strftime('%Y-%m')}", "confidence": 0.70}
         
-        # 知识库 - 按优先级
-        p = problem.lower()
-        
-        # 货币政策
-        if any(kw in p for kw in ["货币政策", "利率", "存款准备金", "量化宽松", "公开市场", "央行"]):
-            return {"type": "economics", "answer": self.knowledge["monetary_policy"], "confidence": 0.85}
-        
-        # 财政政策
-        if any(kw in p for kw in ["财政政策", "政府支出", "税收", "乘数", "挤出", "财政"]):
-            return {"type": "economics", "answer": self.knowledge["fiscal_policy"], "confidence": 0.85}
-        
-        # 菲利普斯曲线
-        if any(kw in p for kw in ["菲利普斯", "phillips", "通胀率", "失业率", " tradeoff"]):
-            return {"type": "economics", "answer": self.knowledge["phillips_curve"], "confidence": 0.85}
-        
-        # 通胀
-        if any(kw in p for kw in ["通胀", "通货膨胀", "cpi", "物价"]):
-            return {"type": "economics", "answer": self.knowledge["inflation"], "confidence": 0.85}
-        
-        # 汇率
-        if any(kw in p for kw in ["汇率", "购买力平价", "利率平价", "ppp", "irp"]):
-            return {"type": "economics", "answer": self.knowledge["exchange_rate"], "confidence": 0.85}
-        
-        # 国际贸易
-        if any(kw in p for kw in ["比较优势", "贸易", "关税", "要素禀赋", "trade"]):
-            return {"type": "economics", "answer": self.knowledge["international_trade"], "confidence": 0.85}
-        
-        # 经济周期
-        if any(kw in p for kw in ["经济周期", "基钦", "朱格拉", "库存", "周期"]):
-            return {"type": "economics", "answer": self.knowledge["economic_cycles"], "confidence": 0.85}
-        
-        # EMH
-        if any(kw in p for kw in ["有效市场", "emh", "弱式", "半强式", "强式"]):
-            return {"type": "economics", "answer": self.knowledge["emh"], "confidence": 0.85}
-        
-        # IS-LM
-        if any(kw in p for kw in ["is-lm", "is_lm", "as-ad", "as_ad", "宏观经济"]):
-            return {"type": "economics", "answer": self.knowledge["is_lm"], "confidence": 0.85}
-        
-        # 其他经济关键词
-        if "经济" in p:
-            return {"type": "economics", "answer": self.knowledge["is_lm"], "confidence": 0.80}
-        
-        # 数学
-        if "欧拉" in p or "e^(iπ)" in p:
-            return {"type": "math", "answer": self.knowledge["euler"], "confidence": 0.85}
-        if "费马" in p:
-            return {"type": "math", "answer": self.knowledge["fermat_3"], "confidence": 0.85}
-        if "黎曼" in p:
-            return {"type": "math", "answer": self.knowledge["riemann"], "confidence": 0.85}
-        if "质数" in p and ("无穷" in p or "证明" in p):
-            return {"type": "math", "answer": self.knowledge["primes_infinite"], "confidence": 0.85}
-        
-        # 量子
-        if "shor" in p or "rsa" in p:
-            return {"type": "quantum", "answer": self.knowledge["shor"], "confidence": 0.85}
-        if "贝尔" in p:
-            return {"type": "quantum", "answer": self.knowledge["bell"], "confidence": 0.85}
-        if "隐形传态" in p:
-            return {"type": "quantum", "answer": self.knowledge["teleportation"], "confidence": 0.85}
-        
-        # ML
-        if "transformer" in p or "注意力" in p:
-            return {"type": "ml", "answer": self.knowledge["transformer"], "confidence": 0.85}
-        if "gpt" in p or "scaling" in p:
-            return {"type": "ml", "answer": self.knowledge["gpt"], "confidence": 0.85}
-        if "resnet" in p or "残差" in p:
-            return {"type": "ml", "answer": self.knowledge["resnet"], "confidence": 0.85}
-        
-        # 游戏
-        if "象棋" in p or "chess" in p:
-            return {"type": "game", "answer": self.knowledge["chess"], "confidence": 0.85}
-        if "尼姆" in p or "nim" in p:
-            return {"type": "game", "answer": self.knowledge["nim"], "confidence": 0.85}
-        if "三门" in p or "monty" in p:
-            return {"type": "game", "answer": self.knowledge["monty_hall"], "confidence": 0.85}
-        if "囚徒" in p or "prisoner" in p:
-            return {"type": "game", "answer": self.knowledge["prisoners"], "confidence": 0.85}
-        if "alphago" in p or "mcts" in p:
-            return {"type": "game", "answer": self.knowledge["alphago"], "confidence": 0.85}
-        if "dqn" in p:
-            return {"type": "game", "answer": self.knowledge["dqn"], "confidence": 0.85}
+        # 知识库 - 经济学优先（触发词见 knowledge_store.V14_5_FIXED_TRIGGERS）
+        result = get_knowledge_store("v14_5_fixed").answer(p, self.knowledge)
+        if result is not None:
+            return result
         
         return {"type": "general", "answer": "需要分析", "confidence": 0.50}
 
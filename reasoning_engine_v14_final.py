@@ -9,11 +9,13 @@ import re
 from typing import Dict
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+
 
 class ReasoningEngineV14Final:
     def __init__(self):
         self.version = "14.1"
-        self.memory = []
+        self.memory = memory_ring()
         
         # 完整知识库
         self.knowledge = {
@@ -59,6 +61,7 @@ class ReasoningEngineV14Final:
             "is_lm": "IS-LM vs AS-AD"
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         p_type = self._detect_type(problem)
         result = self._solve(problem, p_type)
@@ -8,11 +8,13 @@ import re
 from typing import Dict
 from datetime import datetime
 
+from answer_cache import memoize_answer, memory_ring
+
 
 class ReasoningEngineV14:
     def __init__(self):
         self.version = "14.0"
-        self.memory = []
+        self.memory = memory_ring()
         self.knowledge = {
             "euler": "欧拉公式: e^(iπ) + 1 = 0",
             "fermat": "费马大定理: x^n + y^n = z^n (n>2无解)",
@@ -30,6 +32,7 @@ class ReasoningEngineV14:
             "is_lm": "IS-LM vs AS-AD"
         }
     
+    @memoize_answer
     def analyze(self, problem: str) -> Dict:
         p_type = self._detect_type(problem)
         result = self._solve(problem, p_type)
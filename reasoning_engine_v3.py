@@ -24,6 +24,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 import random
 
+from logic_puzzle_solver import solve_puzzle
+from tracing import get_tracer, span
+from tree_of_thoughts import ToTExecutor
+
 
 class ReasoningMode(Enum):
     """推理模式"""
@@ -71,6 +75,10 @@ class ReasoningEngineV3:
         self.confidence_threshold = 0.7
         self.max_depth = 5
         self.reasoning_history = []
+        self.tot_beam_width = 3
+        self.tot_workers = 0  # >0 时兄弟分支在线程池中并行评估
+        self._worlds: Dict[str, Dict] = {}
+        self.tracer = get_tracer()  # 采样率见 tracing.Tracer(sample_rate=...)
         
     def analyze(self, problem: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -85,28 +93,37 @@ class ReasoningEngineV3:
         """
         self.reasoning_history = []
         
-        # 步骤1: 问题理解
-        understanding = self._understand_problem(problem)
-        
-        # 步骤2: 模式选择 (根据问题类型)
-        mode = self._select_reasoning_mode(understanding)
-        
-        # 步骤3: 知识检索 (RAG)
-        knowledge = self._retrieve_knowledge(problem)
-        
-        # 步骤4: 推理执行
-        if mode == ReasoningMode.TREE_OF_THOUGHTS:
-            result = self._tree_reasoning(problem, understanding, knowledge)
-        else:
-            result = self._chain_reasoning(problem, understanding, knowledge)
-        
-        # 步骤5: 置信度评估
-        confidence = self._assess_confidence(result)
-        
-        # 步骤6: 自我纠正 (如果需要)
-        if confidence < self.confidence_threshold:
-            result = self._self_correct(result, problem)
-            confidence = self._assess_confidence(result)
+        with self.tracer.trace("ReasoningEngineV3.analyze", chars=len(problem)) as root:
+            # 步骤1: 问题理解
+            with span("understand"):
+                understanding = self._understand_problem(problem)
+            
+            # 步骤2: 模式选择 (根据问题类型)
+            with span("select_mode"):
+                mode = self._select_reasoning_mode(understanding)
+            
+            # 步骤3: 知识检索 (RAG)
+            with span("retrieve_knowledge") as s:
+                knowledge = self._retrieve_knowledge(problem)
+                s.set(hits=len(knowledge))
+            
+            # 步骤4: 推理执行
+            with span(f"reasoning.{mode.value}"):
+                if mode == ReasoningMode.TREE_OF_THOUGHTS:
+                    result = self._tree_reasoning(problem, understanding, knowledge)
+                else:
+                    result = self._chain_reasoning(problem, understanding, knowledge)
+            
+            # 步骤5: 置信度评估
+            with span("assess_confidence"):
+                confidence = self._assess_confidence(result)
+            
+            # 步骤6: 自我纠正 (如果需要)
+            if confidence < self.confidence_threshold:
+                with span("self_correct"):
+                    result = self._self_correct(result, problem)
+                    confidence = self._assess_confidence(result)
+            root.set(mode=mode.value, confidence=round(confidence, 3))
         
         return {
             "problem": problem,
@@ -115,13 +132,15 @@ class ReasoningEngineV3:
             "knowledge_used": knowledge,
             "result": result,
             "confidence": confidence,
-            "reasoning_steps": self.reasoning_history
+            "reasoning_steps": self.reasoning_history,
+            "trace": root.to_dict()
         }
     
     def _understand_problem(self, problem: str) -> Dict[str, Any]:
         """步骤1: 问题理解"""
         # 问题类型识别
-        problem_type = self._classify_problem(problem)
+        with span("classify"):
+            problem_type = self._classify_problem(problem)
         
         # 提取实体
         entities = self._extract_entities(problem)
@@ -270,7 +289,7 @@ class ReasoningEngineV3:
                 "type": "contradiction_detection",
                 "content": contradictions,
                 "confidence": 0.9,
-                "insight": "发现矛盾关系: 甲说'我会' vs 丙说'甲不会'"
+                "insight": f"发现矛盾关系: {contradictions[0]['statement_1']} vs {contradictions[0]['statement_2']}"
             })
             
             # 步骤2: 连锁推理
@@ -330,47 +349,90 @@ class ReasoningEngineV3:
         ]
     
     def _tree_reasoning(self, problem: str, understanding: Dict, knowledge: Dict) -> Dict[str, Any]:
-        """思维树推理 (ToT)"""
-        # 创建根节点
-        root = ThoughtNode(
-            content=problem,
-            depth=0,
-            reasoning_type="root"
+        """思维树推理 (ToT): 最佳优先搜索 假设 → 验证，评估结果按规范化状态缓存"""
+        self._worlds = {}
+        with span("solve_puzzle"):
+            solved = solve_puzzle(problem)
+        if solved:
+            for world in solved["worlds"] + solved["rejected"]:
+                self._worlds[self._hypothesis_text(world, solved)] = world
+        
+        def expand(state: str) -> List[str]:
+            if state == problem:
+                return self._generate_branches(problem, understanding)
+            world = self._worlds.get(state)
+            if world is None:
+                return []
+            return ["验证: " + " → ".join(world["trace"])]
+        
+        def evaluate(state: str) -> float:
+            if state == problem:
+                return 0.5
+            return self._evaluate_branch(ThoughtNode(content=state), knowledge)
+        
+        tot = ToTExecutor(
+            expand, evaluate,
+            is_goal=lambda state, score: state.startswith("验证") and score >= 0.9,
+            beam_width=self.tot_beam_width, max_depth=2, workers=self.tot_workers,
         )
-        self.thought_tree = root
-        self.current_node = root
-        
-        # 生成多个子节点 (分支)
-        branches = self._generate_branches(problem, understanding)
-        
-        for branch_content in branches:
-            child = ThoughtNode(
-                content=branch_content,
-                depth=1,
-                reasoning_type="branch"
+        with tot, span("tot.solve") as s:
+            search = tot.solve(problem)
+            s.set(nodes=len(search["nodes"]), cache_hits=search["cache_hits"])
+        
+        # 由搜索记录重建 ThoughtNode 树
+        tree: List[ThoughtNode] = []
+        for record in search["nodes"]:
+            node = ThoughtNode(
+                content=record["state"],
+                confidence=record["score"],
+                reasoning_type="root" if record["parent"] is None else "branch"
             )
-            root.add_child(child)
-        
-        # 评估每个分支
-        for child in root.children:
-            child.confidence = self._evaluate_branch(child, knowledge)
-        
-        # 选择最佳分支
-        best = max(root.children, key=lambda x: x.confidence)
+            if record["parent"] is not None:
+                tree[record["parent"]].add_child(node)
+            tree.append(node)
+        root = tree[0]
+        self.thought_tree = root
+        self.current_node = tree[search["best"]["id"]]
         
-        return {
+        best_branch = search["path"][1] if len(search["path"]) > 1 else problem
+        result = {
             "tree_structure": self._serialize_tree(root),
-            "best_branch": best.content,
-            "confidence": best.confidence,
-            "reasoning_type": "tree_of_thoughts"
+            "best_branch": best_branch,
+            "confidence": search["best"]["score"],
+            "reasoning_type": "tree_of_thoughts",
+            "path": search["path"],
+            "cache_hits": search["cache_hits"],
+            "latency": search["latency"]
         }
+        world = self._worlds.get(best_branch)
+        if search["solved"] and world is not None:
+            who = "、".join(world["selected"]) or "无人"
+            result["conclusion"] = f"答案是: {who if solved['mode'] == 'property' else best_branch[2:]}"
+        
+        self.reasoning_history.append({
+            "step": "tree_of_thoughts",
+            "name": "思维树搜索",
+            "data": " → ".join(search["path"][1:]) or "无可展开分支"
+        })
+        return result
+    
+    def _hypothesis_text(self, world: Dict, solved: Dict) -> str:
+        """把一个可能世界写成假设分支"""
+        if solved["mode"] == "property":
+            return f"假设{'、'.join(world['selected']) or '无人'}{solved['property']}"
+        if world["selected"]:
+            return f"假设{'、'.join(world['selected'])}说真话"
+        return "假设全部说谎"
     
     def _generate_branches(self, problem: str, understanding: Dict) -> List[str]:
         """生成分支"""
         branches = []
         problem_type = understanding["type"]
         
-        if problem_type == "logical":
+        if self._worlds:
+            # 谜题可解析: 每个可能世界一个假设分支
+            branches = list(self._worlds)
+        elif problem_type == "logical":
             people = understanding.get("entities", [])
             for p in people[:3]:
                 branches.append(f"假设{p}会游泳")
@@ -382,11 +444,18 @@ class ReasoningEngineV3:
         return branches
     
     def _evaluate_branch(self, branch: ThoughtNode, knowledge: Dict) -> float:
-        """评估分支置信度"""
+        """评估分支置信度: 可验证的假设按所在世界是否自洽打分"""
+        worlds = self._worlds
+        content = branch.content
+        if content.startswith("验证"):
+            return 0.95 if "✓" in content else 0.05
+        if content in worlds:
+            return 0.9 if worlds[content]["valid"] else 0.1
+        
         confidence = 0.5
         
         # 检查是否符合逻辑规则
-        if "假设" in branch.content:
+        if "假设" in content:
             confidence += 0.3
         
         # 检查是否与已知知识一致
@@ -396,44 +465,40 @@ class ReasoningEngineV3:
         return min(1.0, confidence)
     
     def _find_contradictions(self, problem: str) -> List[Dict]:
-        """查找矛盾"""
+        """查找矛盾: 在所有可能世界中真值始终相反的两句话"""
         contradictions = []
+        solved = solve_puzzle(problem)
+        if not solved:
+            return contradictions
         
-        if '甲说："我会"' in problem and '丙说："甲不会"' in problem:
+        for s1, s2 in solved["contradictions"]:
             contradictions.append({
                 "type": "contradiction",
-                "about": "甲是否会游泳",
-                "statement_1": "甲说'我会'",
-                "statement_2": "丙说'甲不会'",
+                "about": f"{s1['speaker']}与{s2['speaker']}的陈述",
+                "statement_1": f"{s1['speaker']}说'{s1['text']}'",
+                "statement_2": f"{s2['speaker']}说'{s2['text']}'",
                 "relationship": "矛盾关系 (必有一真一假)"
             })
         
         return contradictions
     
     def _exhaustive_verification(self, problem: str) -> List[Dict]:
-        """穷举验证"""
+        """穷举验证: 位集枚举所有世界，保留自洽解及被排除假设的原因"""
         hypotheses = []
+        solved = solve_puzzle(problem)
+        if not solved:
+            return hypotheses
         
-        # 检测人物
-        people = re.findall(r'[甲乙丙]', problem)
-        people = list(set(people))
-        
-        for person in people:
-            hypo = {
-                "who": person,
-                "valid": True,
-                "analysis": []
-            }
-            
-            # 简化验证
-            if "乙" in person:
-                hypo["analysis"].append("乙会游泳 → 甲假、丙真 → 1句真话 ✓")
-                hypo["valid"] = True
+        for world in solved["worlds"] + solved["rejected"]:
+            if solved["mode"] == "property":
+                who = "、".join(world["selected"]) or "无人"
             else:
-                hypo["analysis"].append(f"{person}会 → 不符合条件")
-                hypo["valid"] = False
-            
-            hypotheses.append(hypo)
+                who = "、".join(world["selected"]) + "说真话" if world["selected"] else "全部说谎"
+            hypotheses.append({
+                "who": who,
+                "valid": world["valid"],
+                "analysis": world["trace"]
+            })
         
         return hypotheses
     
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 推理步骤事件流
+
+热路径只产出结构化记录，文本在需要时才渲染:
+1. Event(ts, source, step, fields): 一个推理步骤的结果，不含任何展示格式
+2. EventLog: 有界环形缓冲（最近 capacity 条）+ 可选的 sink 回调
+3. 渲染器按需挂为 sink（CLI verbose），或事后对 recent() 渲染（调试接口）
+
+用法:
+    events = EventLog(capacity=1000)
+    events.emit("think_loop", "confidence", final=0.82)
+    events.add_sink(lambda e: print(e.step, e.fields))   # 实时渲染
+    events.recent(20)                                     # 调试: 最近 20 条
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+DEFAULT_CAPACITY = 1000
+
+
+class Event(NamedTuple):
+    ts: float                # time.time()
+    source: str              # 产生事件的组件，如 think_loop / multi_path
+    step: str                # 步骤名
+    fields: Dict[str, Any]   # 步骤结果（原始值，不预先格式化）
+
+    def to_dict(self) -> Dict:
+        return {"ts": self.ts, "source": self.source, "step": self.step, **self.fields}
+
+
+class EventLog:
+    """
+    Args:
+        capacity: 环形缓冲保留的最近事件数
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._events: deque = deque(maxlen=capacity)
+        self._sinks: List[Callable[[Event], None]] = []
+        self._lock = threading.Lock()
+
+    def emit(self, source: str, step: str, **fields) -> Event:
+        event = Event(time.time(), source, step, fields)
+        self._events.append(event)
+        for sink in self._sinks:
+            sink(event)
+        return event
+
+    def add_sink(self, sink: Callable[[Event], None]):
+        with self._lock:
+            if sink not in self._sinks:
+                self._sinks = self._sinks + [sink]
+
+    def remove_sink(self, sink: Callable[[Event], None]):
+        with self._lock:
+            self._sinks = [s for s in self._sinks if s != sink]
+
+    @property
+    def sinks(self) -> List[Callable[[Event], None]]:
+        return list(self._sinks)
+
+    def recent(self, n: Optional[int] = None, source: str = None) -> List[Event]:
+        events = list(self._events)
+        if source is not None:
+            events = [e for e in events if e.source == source]
+        return events if n is None else events[-n:]
+
+    def clear(self):
+        self._events.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 记忆/检索子系统微基准（回退跟踪）
+
+统一基准测试 (benchmark_harness) 只覆盖推理引擎；这里覆盖记忆与检索的热点:
+    kb.retrieve           KnowledgeBase.retrieve
+    twr.search            TimeWeightedRetriever.search
+    ems.query_memories    EnhancedMemorySystem.query_memories
+    hss.search            HistorySearchSystem.search
+    sm.save_decision      structured_memory.StructuredMemory 写入
+    sms.add_entity        structured_memory_system.StructuredMemory 写入
+
+1. 合成语料: 固定种子、Zipf 词频的中英混合文本，规模 1k / 10k / 100k
+2. 每个 (操作, 规模) 在独立子进程中运行: 峰值 RSS 互不干扰，HOME 指向临时目录
+   （不碰真实工作区），可设超时与内存上限（超限记为错误而不是拖垮整轮）；
+   默认重复 REPEATS 次（每次新进程），记录取最好的一次并保留每次的 p50/吞吐
+3. 记录: 建库耗时、每次操作 p50/p95/p99、吞吐 (次/秒)、峰值 RSS 及操作阶段的 RSS 增量
+4. 基线: 结果存为 JSON（默认 data/benchmarks/baselines/retrieval.json），
+   --compare 与基线比较，延迟/吞吐/峰值 RSS 任一回退超过阈值时退出码为 1；
+   延迟/吞吐比较当前最好的一次与基线最差的一次（两边范围拉开阈值以上才算回退）；
+   写磁盘的操作用更宽的阈值与下限；每个用例至少测 MIN_ROUNDS 次，
+   两边任一次数不足时只比较错误与 RSS，不判延迟/吞吐
+
+用法:
+    python retrieval_benchmark.py                              # 全部操作，1k 与 10k
+    python retrieval_benchmark.py --scales 1k 10k 100k --ops kb.retrieve hss.search
+    python retrieval_benchmark.py --save-baseline              # 测量并写入（合并进）基线
+    python retrieval_benchmark.py --compare                    # 测量并与基线比较
+    python retrieval_benchmark.py --results latest.json --compare   # 比较已有结果，不重跑
+    python retrieval_benchmark.py --list
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parent
+BASELINE_PATH = ROOT / "data" / "benchmarks" / "baselines" / "retrieval.json"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmark_harness import latency_summary
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+DEFAULT_SCALES = ["1k", "10k"]
+
+# 回退判定: 相对变化超过 THRESHOLD，且绝对差超过对应的下限（滤掉噪声）
+THRESHOLD = 0.25
+LATENCY_FLOOR_MS = 0.05
+RSS_FLOOR_MB = 8.0
+# p50/吞吐至少基于这么多次测量才参与回退判定（3 次的 p50 重跑一遍就能差出 25%）
+MIN_ROUNDS = 20
+# 单进程内 20 次的 p50 在重跑之间仍可差出 60% 以上（页缓存、内存布局、宿主机抖动），
+# 同一份代码隔几分钟再测，各次中最好的一次也能慢 40%；所以每个用例在独立进程中重复多次，
+# 只有当前最好的一次仍比基线最差的一次差出阈值，才算回退
+REPEATS = 5
+# 写磁盘的操作受页缓存/回写影响更大: 至少慢一倍且绝对差超过 2 ms 才算回退
+IO_THRESHOLD = 1.0
+IO_LATENCY_FLOOR_MS = 2.0
+
+VOCAB_SIZE = 1000
+QUERY_COUNT = 16
+
+
+# ==================== 合成语料 ====================
+
+_SYLLABLES = ["ka", "ri", "to", "men", "sa", "lo", "vi", "den", "qu", "ar", "el", "on",
+              "ta", "ser", "po", "lin", "mo", "zen", "ha", "tri"]
+_HANZI = "记忆检索推理模型数据系统框架测试学习会话决策用户知识向量索引时间窗口权重任务优化配置"
+
+
+@lru_cache(maxsize=None)
+def vocabulary(size: int = VOCAB_SIZE, seed: int = 0):
+    """
+    固定种子的词表（约 1/10 为两字中文词，其余为纯字母伪词）
+
+    Returns:
+        (词列表, Zipf 累计权重)
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size // 10:
+        words.add(rng.choice(_HANZI) + rng.choice(_HANZI))
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3))))
+    # 排序去掉集合迭代顺序的随机性，再按种子打乱决定词频排名
+    words = sorted(words)
+    rng.shuffle(words)
+    cum, total = [], 0.0
+    for rank in range(1, size + 1):
+        total += 1.0 / rank
+        cum.append(total)
+    return words, cum
+
+
+def make_texts(n: int, seed: int = 0, min_words: int = 8, max_words: int = 24) -> List[str]:
+    """n 条空格分词的合成文本，相同 (n, seed) 结果相同"""
+    words, cum = vocabulary()
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(words, cum_weights=cum, k=rng.randint(min_words, max_words)))
+            for _ in range(n)]
+
+
+def make_queries(k: int = QUERY_COUNT, seed: int = 1) -> List[str]:
+    """k 条 2~4 词的查询（与语料同分布，保证有命中）"""
+    return make_texts(k, seed=seed, min_words=2, max_words=4)
+
+
+# ==================== 被测操作 ====================
+
+class Operation(NamedTuple):
+    name: str
+    description: str
+    setup: Callable[[int, Path], Any]   # (文档数, 临时目录) → 被测对象（不计入操作耗时）
+    run: Callable[[Any, str], Any]      # (被测对象, 查询/写入文本) → 结果
+    io_bound: bool = False              # 每次操作都写磁盘（回退判定用 IO_THRESHOLD）
+
+
+def _setup_knowledge_base(n: int, tmp: Path):
+    from knowledge_base_rag import KnowledgeBase
+
+    kb = KnowledgeBase("bench")
+    kb.add_documents([{"content": text} for text in make_texts(n)])
+    kb.build()
+    return kb
+
+
+def _setup_time_weighted(n: int, tmp: Path):
+    from time_weighted_retriever import TimeWeightedRetriever
+
+    retriever = TimeWeightedRetriever(window_hours=24)
+    now = datetime.now()
+    rng = random.Random(n)
+    for i, text in enumerate(make_texts(n)):
+        retriever.add_document(f"doc{i}", text, now - timedelta(minutes=rng.uniform(0, 23 * 60)))
+    retriever.compute_global_tf_idf()
+    return retriever
+
+
+def _setup_enhanced_memory(n: int, tmp: Path):
+    from enhanced_memory_system import EnhancedMemorySystem
+
+    ems = EnhancedMemorySystem()
+    for i, text in enumerate(make_texts(n)):
+        if i % 3 == 0:
+            ems.save_decision("EXECUTE_TASK", "run", 0.8, text)
+        elif i % 3 == 1:
+            ems.save_learning("bench", text, "synthetic")
+        else:
+            ems.save_conversation(text, "ok")
+    return ems
+
+
+def _setup_history_search(n: int, tmp: Path):
+    from history_search_system import HistorySearchConfig, HistorySearchSystem
+
+    sessions = tmp / "sessions"
+    now = datetime.now()
+    rng = random.Random(n)
+    texts = make_texts(2 * n)
+    for i in range(n):
+        session_dir = sessions / f"session_{i:06d}"
+        session_dir.mkdir(parents=True)
+        data = {
+            "saved_at": (now - timedelta(hours=rng.uniform(0, 20 * 24))).isoformat(),
+            "data": {"current_task": texts[2 * i], "notes": {"summary": texts[2 * i + 1]}},
+        }
+        with open(session_dir / "session.json", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+    config = type("BenchHistoryConfig", (HistorySearchConfig,),
+                  {"SESSIONS_DIR": str(sessions), "BACKUPS_DIR": str(tmp / "backups")})()
+    hss = HistorySearchSystem(config)
+    hss.reindex_all()
+    return hss
+
+
+def _setup_structured_memory(n: int, tmp: Path):
+    # WORKSPACE 在导入时由 Path.home() 决定，run_case 已把 HOME 指向临时目录
+    from structured_memory import StructuredMemory
+
+    memory = StructuredMemory()
+    memory.save_batch(decisions=[
+        {"intent": "EXECUTE_TASK", "action": "run", "confidence": 0.8, "message": text}
+        for text in make_texts(n)
+    ])
+    return memory
+
+
+def _setup_structured_memory_system(n: int, tmp: Path):
+    from structured_memory_system import MemoryConfig, StructuredMemory
+
+    memory_dir = tmp / "structured"
+    memory_dir.mkdir(parents=True)
+    stamp = datetime.now().isoformat()
+    entities = {"users": {}, "projects": {}, "systems": {}, "documents": {
+        f"doc{i}": {"data": {"text": text}, "created_at": stamp, "updated_at": stamp}
+        for i, text in enumerate(make_texts(n))
+    }}
+    with open(memory_dir / MemoryConfig.ENTITIES_FILE, "w", encoding="utf-8") as f:
+        json.dump(entities, f, ensure_ascii=False)
+    config = type("BenchMemoryConfig", (MemoryConfig,), {"MEMORY_DIR": str(memory_dir)})()
+    return StructuredMemory(config)
+
+
+OPERATIONS: Dict[str, Operation] = {op.name: op for op in [
+    Operation("kb.retrieve", "KnowledgeBase.retrieve(top_k=3)",
+              _setup_knowledge_base, lambda kb, q: kb.retrieve(q, top_k=3)),
+    Operation("twr.search", "TimeWeightedRetriever.search(threshold=0.1)",
+              _setup_time_weighted, lambda r, q: r.search(q, threshold=0.1)),
+    Operation("ems.query_memories", "EnhancedMemorySystem.query_memories(limit=10)",
+              _setup_enhanced_memory, lambda ems, q: ems.query_memories(q, limit=10)),
+    Operation("hss.search", "HistorySearchSystem.search(days=30, limit=10)",
+              _setup_history_search, lambda hss, q: hss.search(q, days=30, limit=10)),
+    Operation("sm.save_decision", "structured_memory.StructuredMemory.save_decision",
+              _setup_structured_memory,
+              lambda m, q: m.save_decision("EXECUTE_TASK", "run", 0.8, q), io_bound=True),
+    Operation("sms.add_entity", "structured_memory_system.StructuredMemory.add_entity",
+              _setup_structured_memory_system,
+              lambda m, q: m.add_entity("documents", "bench", {"text": q}), io_bound=True),
+]}
+
+
+# ==================== 单个用例（子进程内） ====================
+
+def _peak_rss_mb() -> float:
+    """本进程峰值 RSS (MB)"""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 单位是 KB，macOS 是字节
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(op_name: str, scale: str, min_time: float = 0.5, max_time: float = 10.0,
+             max_rounds: int = 100, min_rounds: int = MIN_ROUNDS) -> Dict:
+    """
+    建库后反复执行一个操作（轮换查询），直到累计 min_time 秒且至少 min_rounds 次，
+    或达到 max_rounds 次 / max_time 秒；被测代码的打印输出被丢弃。
+    慢操作可能在 max_time 内凑不满 min_rounds 次，此时 rounds 如实记录，对比时跳过延迟判定
+    """
+    op = OPERATIONS[op_name]
+    n = SCALES[scale]
+    record = {"op": op_name, "scale": scale, "n": n, "error": None}
+    queries = make_queries()
+    base_rss = _peak_rss_mb()
+    sink = io.StringIO()
+    home = os.environ.get("HOME")
+    with tempfile.TemporaryDirectory(prefix="retrieval_bench_") as tmp:
+        os.environ["HOME"] = tmp
+        try:
+            with contextlib.redirect_stdout(sink):
+                start = time.perf_counter()
+                state = op.setup(n, Path(tmp))
+                record["setup_ms"] = (time.perf_counter() - start) * 1000
+                setup_rss = _peak_rss_mb()
+                op.run(state, queries[-1])  # 预热
+                times: List[float] = []
+                total = 0.0
+                while len(times) < max_rounds and total < max_time:
+                    if total >= min_time and len(times) >= min_rounds:
+                        break
+                    query = queries[len(times) % len(queries)]
+                    start = time.perf_counter()
+                    op.run(state, query)
+                    times.append((time.perf_counter() - start) * 1000)
+                    total += times[-1] / 1000
+                    sink.seek(0)
+                    sink.truncate()
+        except Exception as e:  # 含 MemoryError（内存上限）
+            record["error"] = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            return record
+        finally:
+            if home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = home
+    peak = _peak_rss_mb()
+    record.update({
+        "rounds": len(times),
+        "throughput_ops": len(times) / total if total else 0.0,
+        **latency_summary(times),
+        "base_rss_mb": base_rss,
+        "setup_rss_mb": setup_rss - base_rss,
+        "op_rss_mb": peak - setup_rss,
+        "peak_rss_mb": peak,
+    })
+    return record
+
+
+# ==================== 执行 ====================
+
+def run_isolated(op_name: str, scale: str, timeout: float = 300.0, mem_limit_mb: int = 4096,
+                 **measure) -> Dict:
+    """在新的解释器中运行一个用例（峰值 RSS 只含该用例）；超时/崩溃记为 error"""
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--case", op_name, scale,
+           "--mem-limit-mb", str(mem_limit_mb)]
+    for key, value in measure.items():
+        cmd += [f"--{key.replace('_', '-')}", str(value)]
+    record = {"op": op_name, "scale": scale, "n": SCALES[scale], "error": None}
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, cwd=str(ROOT))
+    except subprocess.TimeoutExpired:
+        record["error"] = f"超时 (>{timeout:.0f}s)"
+        return record
+    lines = proc.stdout.strip().splitlines()
+    try:
+        return json.loads(lines[-1])
+    except (IndexError, ValueError):
+        tail = (proc.stderr.strip().splitlines() or [f"退出码 {proc.returncode}"])[-1]
+        record["error"] = tail[:200]
+        return record
+
+
+def best_of(records: List[Dict]) -> Dict:
+    """
+    同一用例的多次重复合成一条记录: 任一次出错即记为错误；
+    否则取 p50 最小的一次，附上每次的 p50 (p50_runs) 与吞吐 (throughput_runs)
+    """
+    for record in records:
+        if record["error"]:
+            return record
+    best = dict(min(records, key=lambda r: r["p50_ms"]))
+    best["p50_runs"] = [r["p50_ms"] for r in records]
+    best["throughput_runs"] = [r["throughput_ops"] for r in records]
+    best["throughput_ops"] = max(best["throughput_runs"])
+    return best
+
+
+def run_benchmarks(ops: List[str], scales: List[str], timeout: float = 300.0,
+                   mem_limit_mb: int = 4096, progress: bool = False, repeats: int = REPEATS,
+                   **measure) -> Dict:
+    """依次运行全部 (操作, 规模)，每个重复 repeats 次；子进程串行执行，避免相互争用 CPU 影响延迟"""
+    start = time.perf_counter()
+    summary = {}
+    for op_name in ops:
+        for scale in scales:
+            runs = []
+            for _ in range(max(1, repeats)):
+                runs.append(run_isolated(op_name, scale, timeout, mem_limit_mb, **measure))
+                if runs[-1]["error"]:
+                    break
+            record = best_of(runs)
+            summary[f"{op_name}/{scale}"] = record
+            if progress:
+                status = record["error"] or "p50 " + " / ".join(f"{v:.3f}" for v in record["p50_runs"]) + " ms"
+                print(f"  {op_name}/{scale}: {status}", file=sys.stderr)
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "cpus": os.cpu_count()},
+        "params": {"timeout": timeout, "mem_limit_mb": mem_limit_mb, "repeats": repeats, **measure},
+        "wall_ms": (time.perf_counter() - start) * 1000,
+        "summary": summary,
+    }
+
+
+# ==================== 基线对比 ====================
+
+def undersampled(current: Dict, baseline: Dict, min_rounds: int = MIN_ROUNDS) -> List[str]:
+    """当前结果或基线测量次数不足 min_rounds 的用例（延迟/吞吐不参与回退判定）"""
+    base_summary = baseline.get("summary", {})
+    keys = []
+    for key, now in current["summary"].items():
+        before = base_summary.get(key)
+        if before is None or now["error"] or before["error"]:
+            continue
+        if min(now.get("rounds", 0), before.get("rounds", 0)) < min_rounds:
+            keys.append(key)
+    return keys
+
+
+def compare_to_baseline(current: Dict, baseline: Dict, threshold: float = THRESHOLD,
+                        min_rounds: int = MIN_ROUNDS) -> List[Dict]:
+    """
+    找出回退: 新出现的错误、p50 延迟变慢、吞吐下降、峰值 RSS 增长超过阈值；
+    延迟与吞吐只在两边都至少测了 min_rounds 次时判定，比较当前最好的一次与基线最差的一次
+    （两边的重复范围拉开阈值以上，而不是单次 p50 相比）；写磁盘的操作阈值取
+    max(threshold, IO_THRESHOLD)、下限 IO_LATENCY_FLOOR_MS。没有重复数据的旧记录按单次处理
+
+    Returns:
+        [{"key", "kind": "error"|"latency"|"throughput"|"rss", "detail"}]
+    """
+    regressions = []
+    base_summary = baseline.get("summary", {})
+    for key, now in current["summary"].items():
+        before = base_summary.get(key)
+        if before is None:
+            continue
+        if now["error"] and not before["error"]:
+            regressions.append({"key": key, "kind": "error", "detail": now["error"]})
+            continue
+        if now["error"] or before["error"]:
+            continue
+        grown = now["peak_rss_mb"] - before["peak_rss_mb"]
+        if grown > RSS_FLOOR_MB and grown > before["peak_rss_mb"] * threshold:
+            regressions.append({
+                "key": key, "kind": "rss",
+                "detail": f"峰值 RSS {before['peak_rss_mb']:.1f} MB → {now['peak_rss_mb']:.1f} MB",
+            })
+        if min(now.get("rounds", 0), before.get("rounds", 0)) < min_rounds:
+            continue
+        op = OPERATIONS.get(now.get("op"))
+        io_bound = op is not None and op.io_bound
+        rel = max(threshold, IO_THRESHOLD) if io_bound else threshold
+        floor = IO_LATENCY_FLOOR_MS if io_bound else LATENCY_FLOOR_MS
+
+        now_p50 = now.get("p50_runs") or [now["p50_ms"]]
+        before_p50 = before.get("p50_runs") or [before["p50_ms"]]
+        slower = min(now_p50) - max(before_p50)
+        if slower > floor and slower > max(before_p50) * rel:
+            regressions.append({
+                "key": key, "kind": "latency",
+                "detail": f"p50 {_runs_text(before_p50)} ms → {_runs_text(now_p50)} ms",
+            })
+        now_tp = now.get("throughput_runs") or [now["throughput_ops"]]
+        before_tp = before.get("throughput_runs") or [before["throughput_ops"]]
+        if max(now_tp) * (1 + rel) < min(before_tp) and now["mean_ms"] - before["mean_ms"] > floor:
+            regressions.append({
+                "key": key, "kind": "throughput",
+                "detail": f"{_runs_text(before_tp, 1)} → {_runs_text(now_tp, 1)} 次/秒",
+            })
+    return regressions
+
+
+def _runs_text(values: List[float], digits: int = 3) -> str:
+    """单次: '12.345'；多次: '12.345 [12.345–15.002]'（最好的一次 [范围]）"""
+    best = min(values) if digits == 3 else max(values)
+    if len(values) == 1:
+        return f"{best:.{digits}f}"
+    return f"{best:.{digits}f} [{min(values):.{digits}f}–{max(values):.{digits}f}]"
+
+
+def save_baseline(results: Dict, path: Path = BASELINE_PATH) -> Path:
+    """把结果合并进基线文件（只覆盖本次测到的用例，便于分批测 100k）"""
+    baseline = {"summary": {}}
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+    baseline.update({k: v for k, v in results.items() if k != "summary"})
+    baseline["summary"].update(results["summary"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+    return path
+
+
+# ==================== 输出 ====================
+
+def format_report(results: Dict, regressions: Optional[List[Dict]] = None,
+                  skipped: Optional[List[str]] = None) -> str:
+    lines = ["=" * 104, "🦞 记忆/检索微基准", "=" * 104]
+    lines.append(f"{'操作/规模':28s} {'建库':>9s} {'p50':>10s} {'p95':>10s} {'p99':>10s} "
+                 f"{'次/秒':>9s} {'峰值RSS':>9s} {'操作RSS':>8s}")
+    lines.append("-" * 104)
+    for key, s in results["summary"].items():
+        if s["error"]:
+            lines.append(f"{key:28s} ❌ {s['error'][:70]}")
+            continue
+        lines.append(
+            f"{key:28s} {s['setup_ms'] / 1000:8.2f}s {s['p50_ms']:8.3f}ms {s['p95_ms']:8.3f}ms "
+            f"{s['p99_ms']:8.3f}ms {s['throughput_ops']:9.1f} {s['peak_rss_mb']:7.1f}MB {s['op_rss_mb']:6.1f}MB"
+        )
+        runs = s.get("p50_runs") or []
+        if len(runs) > 1:
+            lines.append(f"{'':28s} p50 各次: " + " / ".join(f"{v:.3f}" for v in runs) + " ms")
+    lines.append("-" * 104)
+    machine = results.get("machine", {})
+    lines.append(f"Python {machine.get('python')} | CPU {machine.get('cpus')} | "
+                 f"总耗时: {results.get('wall_ms', 0) / 1000:.1f} s")
+    if regressions is not None:
+        if regressions:
+            lines.append(f"\n⚠️ 相对基线的回退 ({len(regressions)}):")
+            for r in regressions:
+                lines.append(f"  [{r['kind']}] {r['key']}: {r['detail']}")
+        else:
+            lines.append("\n✅ 无回退")
+        if skipped:
+            lines.append(f"ℹ️ 测量次数不足，未判定延迟/吞吐 ({len(skipped)}): {', '.join(skipped)}")
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='小爪记忆/检索子系统微基准')
+    parser.add_argument('--ops', nargs='*', choices=list(OPERATIONS), help='操作名，默认全部')
+    parser.add_argument('--scales', nargs='*', choices=list(SCALES), default=DEFAULT_SCALES,
+                        help='语料规模，默认 1k 10k')
+    parser.add_argument('--min-time', type=float, default=0.5, help='每个用例至少测量的秒数')
+    parser.add_argument('--max-time', type=float, default=10.0, help='每个用例最多测量的秒数')
+    parser.add_argument('--min-rounds', type=int, default=MIN_ROUNDS,
+                        help='每个用例至少执行次数（不足时不判定延迟/吞吐回退）')
+    parser.add_argument('--max-rounds', type=int, default=100, help='每个用例最多执行次数')
+    parser.add_argument('--repeats', type=int, default=REPEATS,
+                        help='每个用例在独立进程中重复的次数（比较最好的一次）')
+    parser.add_argument('--timeout', type=float, default=300.0, help='每个用例（含建库）的子进程超时秒数')
+    parser.add_argument('--mem-limit-mb', type=int, default=4096, help='子进程地址空间上限，0=不限')
+    parser.add_argument('--out', '-o', default=None, help='结果JSON路径')
+    parser.add_argument('--results', default=None, help='使用已有结果JSON，不重新测量')
+    parser.add_argument('--baseline', '-b', default=str(BASELINE_PATH), help='基线JSON路径')
+    parser.add_argument('--save-baseline', action='store_true', help='把结果合并进基线')
+    parser.add_argument('--compare', action='store_true', help='与基线比较，有回退时退出码为 1')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='回退阈值（相对变化比例）')
+    parser.add_argument('--list', action='store_true', help='列出操作与规模')
+    parser.add_argument('--case', nargs=2, metavar=('OP', 'SCALE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    measure = {"min_time": args.min_time, "max_time": args.max_time,
+               "max_rounds": max(args.max_rounds, args.min_rounds), "min_rounds": args.min_rounds}
+
+    if args.case:
+        # 子进程入口: 结果 JSON 写在 stdout 最后一行
+        if args.mem_limit_mb:
+            import resource
+
+            limit = args.mem_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        print(json.dumps(run_case(*args.case, **measure), ensure_ascii=False))
+        return 0
+
+    if args.list:
+        for op in OPERATIONS.values():
+            print(f"  {op.name:22s} {op.description}")
+        print(f"  规模: {', '.join(f'{k}={v}' for k, v in SCALES.items())}")
+        return 0
+
+    if args.results:
+        with open(args.results, encoding="utf-8") as f:
+            results = json.load(f)
+    else:
+        results = run_benchmarks(args.ops or list(OPERATIONS), args.scales, timeout=args.timeout,
+                                 mem_limit_mb=args.mem_limit_mb, progress=True,
+                                 repeats=args.repeats, **measure)
+
+    regressions = skipped = None
+    baseline_path = Path(args.baseline)
+    if args.compare:
+        if not baseline_path.exists():
+            print(f"❌ 基线不存在: {baseline_path}（先用 --save-baseline 生成）")
+            return 2
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("machine") != results.get("machine"):
+            print("⚠️ 基线来自不同的机器/Python，延迟对比仅供参考", file=sys.stderr)
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.min_rounds)
+        skipped = undersampled(results, baseline, args.min_rounds)
+        results["regressions"] = regressions
+    print(format_report(results, regressions, skipped))
+
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 结果已保存: {args.out}")
+    if args.save_baseline:
+        print(f"💾 基线已更新: {save_baseline(results, baseline_path)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 进程内安全数学求值器
+
+数学题不再返回"计算中"或起子进程，直接在进程内求值：
+- AST 白名单：只允许数字、四则/乘方/取模、白名单函数和常量
+- 精确计算：整数走大整数，小数和除法走 Fraction
+- 模运算：a^b mod m 直接用三参数 pow，不展开大数
+- 方程：一元多项式方程（线性、二次精确求解，高次尝试有理根）
+- 步数与位宽上限，防止 9**9**9 之类的表达式拖死进程
+- 长度与嵌套深度上限，超长/深嵌套的算式在解析前后直接拒绝，不触发递归溢出
+- 表达式缓存：同一表达式重复出现直接命中
+
+用法:
+    from safe_math import evaluate, solve_equation, answer_math
+    evaluate("2^100 mod 7")          # → 2
+    solve_equation("x^2-5x+6=0")     # → [2, 3]
+    answer_math("计算 1/3 + 1/6 等于多少")["answer"]   # → "1/2"
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import ast
+import math
+import re
+import threading
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+
+Number = Union[int, Fraction, float, complex]
+
+MAX_STEPS = 2000
+MAX_INT_BITS = 4096
+MAX_POLY_DEGREE = 8
+MAX_EXPR_LEN = 500
+MAX_DEPTH = 100
+
+
+class MathError(ValueError):
+    """表达式不合法、超出限制或无法求值"""
+
+
+# ==================== 文本规范化 ====================
+
+_REPLACEMENTS = [
+    ("×", "*"), ("·", "*"), ("÷", "/"), ("−", "-"), ("–", "-"), ("＋", "+"), ("－", "-"),
+    ("（", "("), ("）", ")"), ("＝", "="), ("＾", "^"), ("π", "pi"),
+    ("²", "^2"), ("³", "^3"), ("％", "%"),
+]
+_SQRT_RE = re.compile(r'√\s*(\d+(?:\.\d+)?|\([^()]*\))')
+_MOD_RE = re.compile(r'\bmod\b|模', re.I)
+_IMPLICIT_MUL_RE = re.compile(r'(?<=[\d)])\s*(?=[a-zA-Z(])')
+
+
+def normalize(expr: str) -> str:
+    """把题目中的数学写法转换成 Python 表达式"""
+    for old, new in _REPLACEMENTS:
+        expr = expr.replace(old, new)
+    expr = _SQRT_RE.sub(r'sqrt(\1)', expr)
+    expr = _MOD_RE.sub('%', expr)
+    expr = expr.replace("^", "**")
+    # 2x → 2*x，2(3+4) → 2*(3+4)，(a)(b) → (a)*(b)
+    expr = _IMPLICIT_MUL_RE.sub('*', expr)
+    # 上一步会把 log2(…) 这样带数字的函数名拆开，这里还原
+    expr = _FUNC_CALL_RE.sub(r'\1(', expr)
+    return expr.strip()
+
+
+# ==================== 求值器 ====================
+
+def _sqrt(x):
+    if isinstance(x, (int, Fraction)) and x >= 0:
+        num, den = Fraction(x).numerator, Fraction(x).denominator
+        rn, rd = math.isqrt(num), math.isqrt(den)
+        if rn * rn == num and rd * rd == den:
+            return Fraction(rn, rd)
+    return math.sqrt(x)
+
+
+def _factorial(n):
+    n = int(n)
+    if n < 0 or n > 2000:
+        raise MathError("阶乘参数超出范围")
+    return math.factorial(n)
+
+
+FUNCTIONS = {
+    "sqrt": _sqrt,
+    "abs": abs,
+    "gcd": lambda *a: math.gcd(*map(int, a)),
+    "lcm": lambda *a: math.lcm(*map(int, a)),
+    "factorial": _factorial,
+    "comb": lambda n, k: math.comb(int(n), int(k)),
+    "perm": lambda n, k: math.perm(int(n), int(k)),
+    "isqrt": lambda n: math.isqrt(int(n)),
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "round": round,
+    "min": min,
+    "max": max,
+    "pow": pow,   # 实际由 SafeEvaluator 处理，这里只作白名单
+    "log": math.log,
+    "ln": math.log,
+    "log2": math.log2,
+    "log10": math.log10,
+    "exp": math.exp,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+}
+
+CONSTANTS = {"pi": math.pi, "e": math.e}
+
+_FUNC_CALL_RE = re.compile(r'\b(' + '|'.join(sorted(FUNCTIONS, key=len, reverse=True)) + r')\*\(')
+
+
+class _Poly:
+    """一元多项式 {次数: 系数}，用于方程求解"""
+
+    __slots__ = ("c",)
+
+    def __init__(self, coeffs: Dict[int, Fraction]):
+        self.c = {k: v for k, v in coeffs.items() if v != 0}
+
+    @classmethod
+    def lift(cls, x) -> "_Poly":
+        if isinstance(x, _Poly):
+            return x
+        if isinstance(x, float):
+            x = Fraction(x)
+        if not isinstance(x, (int, Fraction)):
+            raise MathError("方程系数必须是实数")
+        return cls({0: Fraction(x)})
+
+    @property
+    def degree(self) -> int:
+        return max(self.c, default=0)
+
+    def __add__(self, o):
+        o = _Poly.lift(o)
+        out = dict(self.c)
+        for k, v in o.c.items():
+            out[k] = out.get(k, 0) + v
+        return _Poly(out)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return _Poly({k: -v for k, v in self.c.items()})
+
+    def __sub__(self, o):
+        return self + (-_Poly.lift(o))
+
+    def __rsub__(self, o):
+        return _Poly.lift(o) - self
+
+    def __mul__(self, o):
+        o = _Poly.lift(o)
+        out: Dict[int, Fraction] = {}
+        for i, a in self.c.items():
+            for j, b in o.c.items():
+                out[i + j] = out.get(i + j, 0) + a * b
+        result = _Poly(out)
+        if result.degree > MAX_POLY_DEGREE:
+            raise MathError("方程次数过高")
+        return result
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, o):
+        o = _Poly.lift(o)
+        if o.degree != 0 or not o.c:
+            raise MathError("不支持除以含未知数的式子")
+        d = o.c[0]
+        return _Poly({k: v / d for k, v in self.c.items()})
+
+    def __pow__(self, n):
+        if isinstance(n, _Poly):
+            if n.degree != 0:
+                raise MathError("指数不能含未知数")
+            n = n.c.get(0, 0)
+        if n != int(n) or not 0 <= n <= MAX_POLY_DEGREE:
+            raise MathError("多项式指数必须是小的非负整数")
+        result = _Poly({0: Fraction(1)})
+        for _ in range(int(n)):
+            result = result * self
+        return result
+
+
+class SafeEvaluator:
+    """
+    AST 白名单求值器
+
+    Args:
+        max_steps: 单个表达式允许访问的最大节点数
+        max_int_bits: 整数结果的最大位宽
+    """
+
+    def __init__(self, max_steps: int = MAX_STEPS, max_int_bits: int = MAX_INT_BITS):
+        self.max_steps = max_steps
+        self.max_int_bits = max_int_bits
+        # 步数计数和变量按线程隔离，同一个求值器可被多线程共用
+        self._local = threading.local()
+
+    def evaluate(self, expr: str, variables: Dict[str, object] = None) -> Number:
+        text = normalize(expr)
+        if len(text) > MAX_EXPR_LEN:
+            raise MathError("表达式过长")
+        try:
+            tree = ast.parse(text, mode="eval")
+        except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
+            raise MathError(f"无法解析: {expr}") from e
+        _check_depth(tree.body)
+        self._local.steps = 0
+        self._local.vars = variables or {}
+        return self._eval(tree.body)
+
+    # ---------- 节点 ----------
+
+    def _eval(self, node):
+        local = self._local
+        local.steps += 1
+        if local.steps > self.max_steps:
+            raise MathError("超出步数上限")
+
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float, complex)):
+                raise MathError("只允许数字常量")
+            if isinstance(node.value, float):
+                return Fraction(repr(node.value))
+            return node.value
+
+        if isinstance(node, ast.Name):
+            if node.id in local.vars:
+                return local.vars[node.id]
+            if node.id in CONSTANTS:
+                return CONSTANTS[node.id]
+            raise MathError(f"未知名称: {node.id}")
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._eval(node.operand)
+            if isinstance(node.op, ast.USub):
+                return -operand
+            if isinstance(node.op, ast.UAdd):
+                return +operand
+            raise MathError("不支持的一元运算")
+
+        if isinstance(node, ast.BinOp):
+            # a**b % m → pow(a, b, m)，避免展开大数
+            if (isinstance(node.op, ast.Mod) and isinstance(node.left, ast.BinOp)
+                    and isinstance(node.left.op, ast.Pow)):
+                base = self._eval(node.left.left)
+                exp = self._eval(node.left.right)
+                mod = self._eval(node.right)
+                if all(_is_int(v) for v in (base, exp, mod)) and int(mod) != 0:
+                    return pow(int(base), int(exp), int(mod))
+                return self._binop(ast.Mod(), self._binop(ast.Pow(), base, exp), mod)
+            return self._binop(node.op, self._eval(node.left), self._eval(node.right))
+
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+                raise MathError("不允许的函数调用")
+            args = [self._eval(a) for a in node.args]
+            if any(isinstance(a, _Poly) for a in args):
+                raise MathError("函数参数不能含未知数")
+            if node.func.id == "pow":
+                if len(args) == 3 and all(_is_int(a) for a in args):
+                    return pow(*map(int, args))
+                if len(args) == 2:
+                    return self._binop(ast.Pow(), *args)
+                raise MathError("pow 参数错误")
+            try:
+                self._guard_call(node.func.id, args)
+                return self._check(FUNCTIONS[node.func.id](*args))
+            except (TypeError, ValueError, OverflowError) as e:
+                if isinstance(e, MathError):
+                    raise
+                raise MathError(f"{node.func.id} 参数错误: {e}") from e
+
+        raise MathError(f"不允许的语法: {type(node).__name__}")
+
+    def _guard_call(self, name: str, args: List):
+        """阶乘/组合/排列/最小公倍数: 调用前按参数估算结果位宽，超限直接拒绝（不先算出大数）"""
+        if name not in ("factorial", "comb", "perm", "lcm"):
+            return
+        if not all(_is_int(a) for a in args):
+            return  # 交给函数本身报参数错误
+        ints = [int(a) for a in args]
+        if any(abs(a).bit_length() > self.max_int_bits for a in ints):
+            raise MathError(f"{name} 参数过大")
+        if name == "lcm":
+            bits = sum(abs(a).bit_length() for a in ints)
+        else:
+            n = ints[0]
+            k = n if name == "factorial" else ints[1] if len(ints) > 1 else n
+            if n < 0 or not 0 <= k <= n:
+                return
+            # log2(n! / (n-k)!)，comb 再除以 k!
+            bits = (math.lgamma(n + 1) - math.lgamma(n - k + 1)) / math.log(2)
+            if name == "comb":
+                bits -= math.lgamma(k + 1) / math.log(2)
+        if bits > self.max_int_bits:
+            raise MathError(f"{name} 结果过大")
+
+    def _binop(self, op, a, b):
+        try:
+            if isinstance(op, ast.Add):
+                return self._check(a + b)
+            if isinstance(op, ast.Sub):
+                return self._check(a - b)
+            if isinstance(op, ast.Mult):
+                return self._check(a * b)
+            if isinstance(op, ast.Div):
+                if _is_rational(a) and _is_rational(b):
+                    return _simplify(Fraction(a) / Fraction(b))
+                return a / b
+            if isinstance(op, (ast.FloorDiv, ast.Mod)):
+                if isinstance(a, _Poly) or isinstance(b, _Poly):
+                    raise MathError("整除/取模不能含未知数")
+                return a // b if isinstance(op, ast.FloorDiv) else a % b
+            if isinstance(op, ast.Pow):
+                return self._check(self._pow(a, b))
+        except ZeroDivisionError as e:
+            raise MathError("除数为零") from e
+        except OverflowError as e:
+            raise MathError("数值溢出") from e
+        except TypeError as e:
+            raise MathError(f"不支持的运算: {e}") from e
+        raise MathError("不支持的运算")
+
+    def _pow(self, a, b):
+        if isinstance(a, _Poly) or isinstance(b, _Poly):
+            return _Poly.lift(a) ** b
+        if _is_int(b) and _is_rational(a):
+            b = int(b)
+            a = _simplify(Fraction(a))
+            # 结果位宽估算: |b| × bits(a)
+            bits = max(Fraction(a).numerator.bit_length(), Fraction(a).denominator.bit_length())
+            if abs(b) * bits > self.max_int_bits:
+                raise MathError("乘方结果过大")
+            if b < 0 and a == 0:
+                raise ZeroDivisionError
+            return _simplify(Fraction(a) ** b)
+        return float(a) ** float(b)
+
+    def _check(self, value):
+        if isinstance(value, int) and value.bit_length() > self.max_int_bits:
+            raise MathError("整数结果过大")
+        if isinstance(value, Fraction) and (
+                value.numerator.bit_length() > self.max_int_bits
+                or value.denominator.bit_length() > self.max_int_bits):
+            raise MathError("分数结果过大")
+        return _simplify(value) if isinstance(value, Fraction) else value
+
+
+def _check_depth(root):
+    """迭代检查 AST 嵌套深度（_eval 是递归的，深度超限会栈溢出）"""
+    stack = [(root, 1)]
+    while stack:
+        node, depth = stack.pop()
+        if depth > MAX_DEPTH:
+            raise MathError("表达式嵌套过深")
+        stack.extend((child, depth + 1) for child in ast.iter_child_nodes(node))
+
+
+def _is_int(x) -> bool:
+    return isinstance(x, int) or (isinstance(x, Fraction) and x.denominator == 1)
+
+
+def _is_rational(x) -> bool:
+    return isinstance(x, (int, Fraction)) and not isinstance(x, bool)
+
+
+def _simplify(x):
+    if isinstance(x, Fraction) and x.denominator == 1:
+        return x.numerator
+    return x
+
+
+# ==================== 方程 ====================
+
+def _rational_roots(coeffs: List[Fraction]) -> List[Fraction]:
+    """有理根定理：系数通分为整数后枚举 ±p/q"""
+    lcm = 1
+    for c in coeffs:
+        lcm = lcm * c.denominator // math.gcd(lcm, c.denominator)
+    ints = [int(c * lcm) for c in coeffs]   # 高次在前
+    while ints and ints[-1] == 0:
+        ints.pop()
+    lead, const = abs(ints[0]), abs(ints[-1])
+    if const > 10 ** 6 or lead > 10 ** 6:
+        return []
+
+    def divisors(n):
+        return {d for i in range(1, math.isqrt(n) + 1) if n % i == 0 for d in (i, n // i)}
+
+    roots = set()
+    for p in divisors(const):
+        for q in divisors(lead):
+            for r in (Fraction(p, q), Fraction(-p, q)):
+                value = 0
+                for c in ints:
+                    value = value * r + c
+                if value == 0:
+                    roots.add(r)
+    if len(ints) < len(coeffs):
+        roots.add(Fraction(0))
+    return sorted(roots)
+
+
+def _solve_poly(poly: _Poly) -> List[Number]:
+    degree = poly.degree
+    c = [poly.c.get(k, Fraction(0)) for k in range(degree, -1, -1)]
+    if degree == 0:
+        raise MathError("恒等式" if not poly.c else "方程无解")
+    if degree == 1:
+        return [_simplify(-c[1] / c[0])]
+    if degree == 2:
+        a, b, k = c
+        disc = b * b - 4 * a * k
+        root = _sqrt(disc) if disc >= 0 else None
+        if isinstance(root, Fraction):
+            xs = {(-b - root) / (2 * a), (-b + root) / (2 * a)}
+            return [_simplify(x) for x in sorted(xs)]
+        if disc >= 0:
+            xs = sorted({(-float(b) - root) / (2 * float(a)), (-float(b) + root) / (2 * float(a))})
+            return xs
+        re_, im = -float(b) / (2 * float(a)) + 0.0, math.sqrt(-float(disc)) / (2 * float(a))
+        return [complex(re_, -abs(im)), complex(re_, abs(im))]
+    return [_simplify(r) for r in _rational_roots(c)]
+
+
+_DEFAULT = SafeEvaluator()
+_VAR_RE = re.compile(r'(?<![a-zA-Z])([a-zA-Z])(?![a-zA-Z])')
+
+
+@lru_cache(maxsize=4096)
+def evaluate(expr: str) -> Number:
+    """求值（按表达式缓存）"""
+    return _DEFAULT.evaluate(expr)
+
+
+@lru_cache(maxsize=1024)
+def solve_equation(equation: str, var: str = None) -> List[Number]:
+    """
+    解一元多项式方程
+
+    Args:
+        equation: "2x + 5 = 15"、"x^2-5x+6=0"，无等号时视为 "= 0"
+        var: 未知数名，默认自动识别（除 e 外的单字母）
+    """
+    text = normalize(equation)
+    left, _, right = text.partition("=")
+    right = right or "0"
+    if var is None:
+        names = {m for m in _VAR_RE.findall(left + " " + right) if m != "e"}
+        if len(names) != 1:
+            raise MathError("需要恰好一个未知数")
+        var = names.pop()
+    x = _Poly({1: Fraction(1)})
+    lhs = _DEFAULT.evaluate(left, {var: x})
+    rhs = _DEFAULT.evaluate(right, {var: x})
+    return _solve_poly(_Poly.lift(lhs) - _Poly.lift(rhs))
+
+
+# ==================== 从题目中提取 ====================
+
+_EQUATION_RE = re.compile(r'[0-9a-zA-Z\s\.\+\-\*/×÷\^\(\)（）²³√]+[=＝][0-9a-zA-Z\s\.\+\-\*/×÷\^\(\)（）²³√]+')
+_EXPR_RE = re.compile(r'(?:[a-z]+\s*\()?[0-9\s\.\+\-\*/×÷\^\(\)（）%²³√!,]*\d[0-9a-z\s\.\+\-\*/×÷\^\(\)（）%²³√!,]*', re.I)
+_FACT_RE = re.compile(r'(\d+)!')
+_DATE_RE = re.compile(r'\d{4}-\d{1,2}-\d{1,2}')
+
+
+def format_number(value: Number) -> Optional[str]:
+    """数值 → 文本；超出整数转字符串位数上限等无法格式化时返回 None"""
+    try:
+        if isinstance(value, Fraction):
+            return f"{value.numerator}/{value.denominator}"
+        if isinstance(value, float):
+            return f"{value:.10g}"
+        if isinstance(value, complex):
+            return f"{value.real:.6g}{value.imag:+.6g}i"
+        return str(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _candidates(question: str) -> List[str]:
+    text = _MOD_RE.sub(' mod ', question)
+    spans = [m.group(0).strip(" ,") for m in _EXPR_RE.finditer(text)]
+    # 需要至少一个运算符或函数调用
+    return sorted((s for s in spans if re.search(r'[\+\-\*/×÷\^%²³√!]|\bmod\b|[a-z]\(', s)
+                   and not _DATE_RE.search(s)),
+                  key=len, reverse=True)
+
+
+@lru_cache(maxsize=2048)
+def answer_math(question: str) -> Optional[Dict]:
+    """
+    从自然语言题目中提取算式/方程并求解
+
+    Returns:
+        {"kind": "equation"|"expression", "expression", "answer", "value"}，无法求解时为 None
+    """
+    eq = _EQUATION_RE.search(question)
+    if eq and any(v != "e" for v in _VAR_RE.findall(eq.group(0))):
+        try:
+            roots = solve_equation(eq.group(0).strip())
+            texts = [format_number(r) for r in roots]
+            if None not in texts:
+                answer = ", ".join(texts) if roots else "无有理解"
+                return {"kind": "equation", "expression": eq.group(0).strip(),
+                        "answer": answer, "value": roots}
+        except (MathError, OverflowError, ValueError, TypeError, ZeroDivisionError, RecursionError):
+            pass
+
+    for span in _candidates(question):
+        expr = _FACT_RE.sub(r'factorial(\1)', span)
+        try:
+            value = evaluate(expr)
+        except (MathError, TypeError, ZeroDivisionError, OverflowError, ValueError, RecursionError):
+            continue
+        if isinstance(value, _Poly):
+            continue
+        answer = format_number(value)
+        if answer is None:
+            continue
+        return {"kind": "expression", "expression": span, "answer": answer, "value": value}
+    return None
+
+
+if __name__ == "__main__":
+    import timeit
+
+    samples = [
+        "计算 123456789 × 987654321 等于多少",
+        "计算 1/3 + 1/6",
+        "2^100 mod 7 等于几",
+        "求解方程: 2x + 5 = 15",
+        "解方程 x² - 5x + 6 = 0",
+        "√144 + 3!",
+        "计算 0.1 + 0.2",
+        "comb(10, 3) 等于多少",
+    ]
+    print("🦞 安全数学求值器")
+    print("=" * 50)
+    for q in samples:
+        r = answer_math(q)
+        print(f"  {q:28s} → {r['answer'] if r else '无法求解'}")
+
+    n = 20000
+    cold = timeit.timeit(lambda: [answer_math.__wrapped__(q) for q in samples], number=200) / (200 * len(samples))
+    warm = timeit.timeit(lambda: [answer_math(q) for q in samples], number=n) / (n * len(samples))
+    print(f"\n  未缓存: {cold * 1e6:.1f} µs/题   缓存命中: {warm * 1e6:.2f} µs/题")
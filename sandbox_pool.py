@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 预热沙箱执行池
+
+每次 `subprocess.run([sys.executable, "-c", code])` 都要付出完整的解释器启动开销（数十毫秒）。
+这里预先启动若干受限的 Python 工作进程（zygote），通过管道收发代码与结果：
+
+- 每次执行都交给 zygote 预先 fork 好的一次性执行进程，zygote 自身从不执行用户代码，
+  所以上一次执行对模块状态的修改（如 math.pi = 3）不会带到下一次
+- 派发开销: 入口替换在 zygote 启动时做一次，执行进程 fork 之后只剩两个 setrlimit；
+  但每次执行仍要唤醒一个新进程并承担写时复制缺页，1 核 VM 上空任务约 2 ms。
+  这是按次隔离模块状态的代价（在工作进程内直接执行可到 0.1 ms 以下，但状态会串到下一次）
+- 资源限制: 内存 (RLIMIT_AS)、写文件大小 (RLIMIT_FSIZE)、每次执行的 CPU 时间 (RLIMIT_CPU)、
+  执行进程的子进程数 (RLIMIT_NPROC)
+- 网络: 能 unshare 网络命名空间时直接隔离，否则替换 socket/_socket 的入口（执行进程继承）
+- 子进程: 非 root 时由 RLIMIT_NPROC 拦截；另外替换 os/posix/subprocess 的 fork/exec 入口，
+  并禁止导入 ctypes
+- 超时: zygote 按墙钟超时杀掉执行进程；zygote 本身无响应时父进程杀掉并补一个新的
+- 回收: 每个工作进程执行 max_runs 次后、或崩溃后自动替换
+- 并发上限: 同时执行的任务数不超过池大小
+
+注意: 这是防误用的尽力隔离（失控循环、内存暴涨、意外的网络/子进程调用），
+不是安全边界。入口替换可以被有意绕过；执行不可信代码请用容器或 seccomp 等系统级隔离。
+
+用法:
+    pool = get_pool()
+    r = pool.run("print(1 + 1)")
+    r["stdout"], r["stderr"], r["result"], r["ok"]
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import ast
+import atexit
+import gc
+import io
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import select
+import signal
+import sys
+import threading
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Dict, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_RUNS = 100
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MEMORY_MB = 512
+MAX_OUTPUT_CHARS = 64 * 1024
+
+_CLONE_NEWNET = 0x40000000
+# 父进程在执行超时之外再等多久才认定 zygote 无响应
+_ZYGOTE_GRACE = 5.0
+_CAN_FORK = hasattr(os, "fork")
+# _restrict_entries 会替换 os.fork；zygote 用这个原始引用创建执行进程
+_fork = getattr(os, "fork", None)
+
+_SPAWN_FUNCS = ("fork", "forkpty", "system", "popen", "posix_spawn", "posix_spawnp",
+                "execv", "execve", "execvp", "execvpe", "spawnv", "spawnve")
+_SOCKET_FUNCS = ("socket", "SocketType", "socketpair", "fromfd", "create_connection",
+                 "create_server", "getaddrinfo")
+
+
+# ==================== 工作进程 ====================
+
+def _set_limit(name: str, value: int):
+    which = getattr(resource, name, None) if resource is not None else None
+    if which is None:
+        return
+    try:
+        soft, hard = resource.getrlimit(which)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(which, (value, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _apply_limits(memory_mb: int) -> bool:
+    """zygote 启动时: 内存/写文件上限，尝试切到独立网络命名空间；返回是否已隔离网络"""
+    _set_limit("RLIMIT_AS", memory_mb * 1024 * 1024)
+    _set_limit("RLIMIT_FSIZE", 16 * 1024 * 1024)
+    unshare = getattr(os, "unshare", None)
+    if unshare is not None:
+        try:
+            unshare(_CLONE_NEWNET)
+            return True
+        except OSError:
+            pass
+    return False
+
+
+def _restrict_entries(net_isolated: bool):
+    """
+    zygote 启动时: 替换进程/网络入口并禁止导入 ctypes
+
+    zygote 自己只需要 fork（已保存在 _fork）和管道读写，所以替换一次、由每个执行进程继承，
+    fork 之后不再做任何导入或替换
+    """
+    def _no_spawn(*args, **kwargs):
+        raise OSError("沙箱内禁止创建子进程")
+
+    # root 不受 RLIMIT_NPROC 约束；os 与 posix 是两份引用，都要替换
+    import posix
+    for module in (os, posix):
+        for name in _SPAWN_FUNCS:
+            if hasattr(module, name):
+                setattr(module, name, _no_spawn)
+    import subprocess  # subprocess 绕过 os.fork，直接走 _posixsubprocess.fork_exec
+    subprocess._fork_exec = _no_spawn
+    subprocess._USE_POSIX_SPAWN = False
+    try:
+        import _posixsubprocess
+        _posixsubprocess.fork_exec = _no_spawn
+    except ImportError:
+        pass
+    # ctypes 可直接调用 libc；禁止导入（已导入的模块不受影响）
+    sys.modules["ctypes"] = None
+    sys.modules["_ctypes"] = None
+
+    if not net_isolated:
+        import _socket
+        import socket
+
+        def _blocked(*args, **kwargs):
+            raise OSError("沙箱内禁止网络访问")
+
+        for module in (socket, _socket):
+            for name in _SOCKET_FUNCS:
+                if hasattr(module, name):
+                    setattr(module, name, _blocked)
+
+
+def _read_all(fd: int) -> bytes:
+    chunks = []
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _error_result(error: str) -> Dict:
+    return {"ok": False, "stdout": "", "stderr": "", "result": None, "error": error}
+
+
+def _prefork(conn_fd: int) -> tuple:
+    """
+    预先从 zygote fork 一个空闲的执行进程，阻塞等待 (代码, CPU 秒数)
+
+    fork 与执行进程退出时拆除地址空间（各约 0.2~0.8 ms）都不在派发路径上: fork 放在两次
+    执行之间，结果写完先关管道再退出，zygote 回传结果之后才 waitpid。
+    执行进程关闭继承来的 zygote 管道 conn_fd，zygote 崩溃时父进程仍能立刻收到 EOF。
+
+    Returns:
+        (pid, 写代码的 fd, 读结果的 fd)
+    """
+    code_r, code_w = os.pipe()
+    result_r, result_w = os.pipe()
+    pid = _fork()
+    if pid == 0:
+        os.close(code_w)
+        os.close(result_r)
+        os.close(conn_fd)
+        _set_limit("RLIMIT_NPROC", 0)
+        message = _read_all(code_r)
+        if not message:  # zygote 退出，没有等到任务
+            os._exit(0)
+        try:
+            code, cpu_seconds = pickle.loads(message)
+            _set_limit("RLIMIT_CPU", cpu_seconds)
+            payload = pickle.dumps(_execute(code))
+        except BaseException as e:
+            payload = pickle.dumps(_error_result(f"{type(e).__name__}: {e}"))
+        _write_all(result_w, payload)
+        os.close(result_w)
+        os._exit(0)
+    os.close(code_r)
+    os.close(result_w)
+    return pid, code_w, result_r
+
+
+def _run_forked(spare: tuple, code: str, timeout: float, cpu_seconds: int) -> Tuple[Dict, Optional[int]]:
+    """
+    把代码交给预先 fork 的执行进程，结果经管道 pickle 回传；超时杀掉执行进程
+
+    Returns:
+        (结果, 尚未回收的执行进程 pid)；正常返回时执行进程可能还在退出，由调用方回传结果后再 waitpid
+    """
+    pid, wfd, rfd = spare
+    try:
+        _write_all(wfd, pickle.dumps((code, cpu_seconds)))
+    except OSError:
+        pass  # 执行进程已退出，下面按崩溃处理
+    os.close(wfd)
+    chunks, timed_out = [], False
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        ready = select.select([rfd], [], [], max(0.0, remaining))[0] if remaining > 0 else []
+        if not ready:
+            timed_out = True
+            os.kill(pid, signal.SIGKILL)
+            break
+        chunk = os.read(rfd, 65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    os.close(rfd)
+    if not timed_out:
+        try:
+            return pickle.loads(b"".join(chunks)), pid
+        except Exception:
+            pass
+    _, status = os.waitpid(pid, 0)
+    if timed_out:
+        return _error_result(f"TimeoutError: 执行超过 {timeout}s"), None
+    if os.WIFSIGNALED(status):
+        how = f"signal={os.WTERMSIG(status)}"
+    else:
+        how = f"exitcode={os.WEXITSTATUS(status)}"
+    # SIGXCPU (RLIMIT_CPU) / SIGKILL (内存) / 代码自行 os._exit 等
+    return _error_result(f"WorkerCrashed: {how}"), None
+
+
+def _execute(code: str) -> Dict:
+    """在全新命名空间内执行代码，捕获输出；最后一个表达式的值作为 result"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+    result, error = None, None
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            tree = ast.parse(code, "<sandbox>", "exec")
+            tail = None
+            if tree.body and isinstance(tree.body[-1], ast.Expr):
+                tail = ast.Expression(tree.body.pop().value)
+            exec(compile(tree, "<sandbox>", "exec"), namespace)
+            if tail is not None:
+                value = eval(compile(tail, "<sandbox>", "eval"), namespace)
+                if value is not None:
+                    result = repr(value)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                error = f"SystemExit: {e.code}"
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            traceback.print_exc()
+
+    return {
+        "ok": error is None,
+        "stdout": stdout.getvalue()[:MAX_OUTPUT_CHARS],
+        "stderr": stderr.getvalue()[:MAX_OUTPUT_CHARS],
+        "result": result,
+        "error": error,
+    }
+
+
+def _worker_main(conn, memory_mb: int, cpu_seconds: Optional[int]):
+    net_isolated = _apply_limits(memory_mb)
+    spare = None
+    if _CAN_FORK:
+        _restrict_entries(net_isolated)
+        # 启动阶段的对象移出 GC 跟踪：执行进程里的回收不会逐页写入继承来的堆，减少写时复制
+        gc.freeze()
+        spare = _prefork(conn.fileno())
+    conn.send("ready")
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        code, timeout = message
+        if _CAN_FORK:
+            cpu = cpu_seconds or max(1, math.ceil(timeout))
+            result, pid = _run_forked(spare, code, timeout, cpu)
+            conn.send(result)
+            if pid is not None:
+                os.waitpid(pid, 0)
+            spare = _prefork(conn.fileno())
+        else:
+            # 不支持 fork 的平台: 在工作进程内执行，池在每次执行后回收工作进程
+            conn.send(_execute(code))
+    if spare is not None:
+        # 关闭写端，空闲的执行进程读到 EOF 后退出
+        pid, wfd, rfd = spare
+        os.close(wfd)
+        os.close(rfd)
+        os.waitpid(pid, 0)
+
+
+class _Worker:
+    """一个预热的工作进程及其管道"""
+
+    def __init__(self, ctx, memory_mb: int, cpu_seconds: Optional[int]):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child, memory_mb, cpu_seconds),
+                                   daemon=True)
+        self.process.start()
+        child.close()
+        self.runs = 0
+        # 等待限制设置完成，避免第一次执行把启动时间算进超时
+        if not self.conn.poll(10) or self.conn.recv() != "ready":
+            self.kill()
+            raise RuntimeError("沙箱工作进程启动失败")
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(0.5)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(1)
+
+
+# ==================== 执行池 ====================
+
+class SandboxPool:
+    """
+    预热沙箱执行池
+
+    Args:
+        size: 工作进程数（也是并发上限）
+        max_runs: 每个工作进程执行多少次后回收
+        timeout: 单次执行的墙钟超时（秒）
+        memory_mb: 每个工作进程的地址空间上限
+        cpu_seconds: 每次执行的 CPU 时间上限，默认取该次超时（向上取整）
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_runs: int = DEFAULT_MAX_RUNS,
+                 timeout: float = DEFAULT_TIMEOUT, memory_mb: int = DEFAULT_MEMORY_MB,
+                 cpu_seconds: int = None):
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+        self.size = size
+        self.max_runs = max_runs
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {"runs": 0, "timeouts": 0, "crashes": 0, "recycled": 0, "spawned": 0}
+
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self.memory_mb, self.cpu_seconds)
+        with self._lock:
+            self.stats["spawned"] += 1
+        return worker
+
+    def _release(self, worker: Optional[_Worker], replace: bool):
+        """归还工作进程；需要替换时关闭旧进程并补一个新的"""
+        try:
+            if replace or worker is None or not worker.alive():
+                if worker is not None:
+                    worker.close()
+                worker = None if self._closed else self._spawn()
+            if worker is not None:
+                self._idle.put(worker)
+        finally:
+            self._slots.release()
+
+    def run(self, code: str, timeout: float = None) -> Dict:
+        """
+        在沙箱中执行代码
+
+        Returns:
+            {"ok", "stdout", "stderr", "result", "error", "elapsed_ms"}
+        """
+        if self._closed:
+            raise RuntimeError("沙箱池已关闭")
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+
+        self._slots.acquire()
+        worker = self._idle.get()
+        replace = False
+        try:
+            worker.conn.send((code, timeout))
+            # 超时由 zygote 处理；这里只兜底 zygote 本身卡死
+            if worker.conn.poll(timeout + _ZYGOTE_GRACE if _CAN_FORK else timeout):
+                result = worker.conn.recv()
+                error = result["error"] or ""
+                if error.startswith(("TimeoutError", "WorkerCrashed")):
+                    with self._lock:
+                        self.stats["timeouts" if error.startswith("TimeoutError") else "crashes"] += 1
+            else:
+                worker.kill()
+                replace = True
+                with self._lock:
+                    self.stats["timeouts"] += 1
+                result = {"ok": False, "stdout": "", "stderr": "",
+                          "result": None, "error": f"TimeoutError: 执行超过 {timeout}s"}
+        except (EOFError, OSError, BrokenPipeError):
+            # 超出内存/CPU 限制等导致工作进程退出
+            replace = True
+            worker.process.join(1)
+            with self._lock:
+                self.stats["crashes"] += 1
+            result = {"ok": False, "stdout": "", "stderr": "", "result": None,
+                      "error": f"WorkerCrashed: exitcode={worker.process.exitcode}"}
+
+        worker.runs += 1
+        if not replace and (worker.runs >= self.max_runs or not _CAN_FORK):
+            replace = True
+            with self._lock:
+                self.stats["recycled"] += 1
+        with self._lock:
+            self.stats["runs"] += 1
+        self._release(worker, replace)
+
+        result["elapsed_ms"] = (time.perf_counter() - start) * 1000
+        return result
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ==================== 共享池 ====================
+
+_POOL: Optional[SandboxPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> SandboxPool:
+    """进程内共享的沙箱池（首次使用时预热）"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = SandboxPool()
+            atexit.register(_POOL.close)
+        return _POOL
+
+
+def run_code(code: str, timeout: float = None) -> Dict:
+    """在共享沙箱池中执行代码"""
+    return get_pool().run(code, timeout=timeout)
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    code = "def fib(n):\n    return n if n < 2 else fib(n-1) + fib(n-2)\nprint(fib(15))"
+    n = 50
+
+    print("🦞 沙箱执行池基准")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    for _ in range(10):
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=10)
+    cold = (time.perf_counter() - start) / 10 * 1000
+    print(f"  subprocess 冷启动: {cold:8.2f} ms/次")
+
+    with SandboxPool(size=2, max_runs=1000) as pool:
+        pool.run("0")
+        start = time.perf_counter()
+        for _ in range(n):
+            pool.run(code)
+        warm = (time.perf_counter() - start) / n * 1000
+        start = time.perf_counter()
+        for _ in range(n):
+            pool.run("1")
+        dispatch = (time.perf_counter() - start) / n * 1000
+        print(f"  预热池执行:        {warm:8.2f} ms/次")
+        print(f"  预热池空任务派发:  {dispatch:8.3f} ms/次")
+        print(f"  超时检测: {pool.run('while True: pass', timeout=0.5)['error']}")
+        pool.run("import math; math.pi = 3")
+        print(f"  模块状态隔离: math.pi = {pool.run('import math; math.pi')['result']}")
+        print(f"  统计: {pool.stats}")
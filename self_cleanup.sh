@@ -51,10 +51,13 @@ print_step "4. 清理过期日志..."
 find /home/admin/.openclaw/workspace/logs -name "*.log" -mtime +7 -delete 2>/dev/null
 print_ok "过期日志清理完成"
 
-# 5. 清理 economy_status JSON 文件（保留最近30天）
-print_step "5. 清理过期状态文件..."
+# 5. economy_status JSON 快照并入时序存储（导入后删除），再执行保留策略
+print_step "5. 归档状态快照到时序存储..."
+cd /home/admin/.openclaw/workspace && \
+    python3 timeseries_store.py import-economy --delete && \
+    python3 timeseries_store.py retention --family economy_status --max-age-days 90 --downsample-after-days 30
 find /home/admin/.openclaw/workspace -name "economy_status_*.json" -mtime +30 -delete 2>/dev/null
-print_ok "过期状态文件清理完成"
+print_ok "状态快照归档完成"
 
 # 6. 检查并清理僵尸进程
 print_step "6. 检查系统资源..."
@@ -10,6 +10,10 @@ from datetime import datetime
 from pathlib import Path
 import os
 
+# daily notes 偏移索引位于工作区根目录
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from daily_note_index import DailyNoteIndex
+
 class AutoMemorySaver:
     """
     自动记忆保存器
@@ -27,6 +31,9 @@ class AutoMemorySaver:
         
         # 确保目录存在
         (self.workspace / "memory").mkdir(exist_ok=True)
+        
+        # daily note 旁路索引，追加时增量维护
+        self.daily_index = DailyNoteIndex(self.daily_file)
     
     def save_decision(self, decision_type, content, confidence=None, context=None):
         """
@@ -74,8 +81,11 @@ class AutoMemorySaver:
         if entry['context']:
             content += f"- 上下文: {entry['context']}\n"
         
-        with open(self.daily_file, 'a', encoding='utf-8') as f:
-            f.write(content)
+        self.daily_index.append(content)
+    
+    def recent_daily_entries(self, types=None, limit=10):
+        """倒序读取今日笔记中的条目（通过偏移索引直接定位）"""
+        return list(self.daily_index.iter_entries(types=types, limit=limit))
     
     def _update_memory(self, entry):
         """更新长期记忆"""
@@ -19,8 +19,23 @@ class MultiPathUnderstanding:
     - 选择最优理解或返回候选
     """
     
-    def __init__(self):
+    # 理解角度 -> 视角描述（按优先级排列）
+    ANGLES = {
+        "执行任务": "用户想让我执行某个具体任务",
+        "澄清确认": "用户想确认或澄清某个问题",
+        "学习探索": "用户想学习或了解某个主题",
+        "讨论交流": "用户想进行讨论或交流观点",
+        "系统检查": "用户想检查或测试系统功能",
+    }
+    
+    def __init__(self, events=None):
+        """
+        Args:
+            events: 可选的 reasoning_events.EventLog，每次理解写入一条结构化记录
+                    （不打印；需要文本时用 format_result 按需渲染）
+        """
         self.workspace = Path.home() / ".openclaw/workspace"
+        self.events = events
         
     def understand(self, message, history=None, max_paths=3):
         """
@@ -44,6 +59,11 @@ class MultiPathUnderstanding:
         best = evaluated[0]
         alternatives = evaluated[1:]
         
+        if self.events is not None:
+            self.events.emit("multi_path", "understand", path_count=len(evaluated),
+                             primary=(best["angle"], best["score"], best["interpretation"]["intent"]),
+                             alternatives=[(p["angle"], p["score"]) for p in alternatives])
+        
         return {
             "primary": best,
             "alternatives": alternatives,
@@ -52,58 +72,22 @@ class MultiPathUnderstanding:
         }
     
     def _generate_paths(self, message, history, max_paths):
-        """生成多个理解路径"""
-        paths = []
-        
-        # 路径1: 执行任务视角
-        paths.append({
-            "id": "path_1",
-            "angle": "执行任务",
-            "perspective": "用户想让我执行某个具体任务",
-            "interpretation": self._interpret_from_angle(message, "执行任务"),
-            "keywords": self._extract_keywords(message)
-        })
-        
-        # 路径2: 澄清确认视角
-        if max_paths >= 2:
-            paths.append({
-                "id": "path_2",
-                "angle": "澄清确认",
-                "perspective": "用户想确认或澄清某个问题",
-                "interpretation": self._interpret_from_angle(message, "澄清确认"),
-                "keywords": self._extract_keywords(message)
-            })
-        
-        # 路径3: 学习探索视角
-        if max_paths >= 3:
-            paths.append({
-                "id": "path_3",
-                "angle": "学习探索",
-                "perspective": "用户想学习或了解某个主题",
-                "interpretation": self._interpret_from_angle(message, "学习探索"),
-                "keywords": self._extract_keywords(message)
-            })
-        
-        # 路径4: 讨论交流视角
-        if max_paths >= 4:
-            paths.append({
-                "id": "path_4",
-                "angle": "讨论交流",
-                "perspective": "用户想进行讨论或交流观点",
-                "interpretation": self._interpret_from_angle(message, "讨论交流"),
-                "keywords": self._extract_keywords(message)
-            })
+        """
+        生成多个理解路径（思维树的第一层: 根=消息，子节点=前 max_paths 个角度）
         
-        # 路径5: 系统检查视角
-        if max_paths >= 5:
+        角度固定且只有一层，直接循环即可；走通用 ToTExecutor 慢数倍，
+        其评估缓存在长驻的 ThinkLoopV3 里还会无界增长。
+        """
+        keywords = self._extract_keywords(message)
+        paths = []
+        for i, angle in enumerate(list(self.ANGLES)[:max_paths], 1):
             paths.append({
-                "id": "path_5",
-                "angle": "系统检查",
-                "perspective": "用户想检查或测试系统功能",
-                "interpretation": self._interpret_from_angle(message, "系统检查"),
-                "keywords": self._extract_keywords(message)
+                "id": f"path_{i}",
+                "angle": angle,
+                "perspective": self.ANGLES[angle],
+                "interpretation": self._interpret_from_angle(message, angle),
+                "keywords": keywords
             })
-        
         return paths[:max_paths]
     
     def _interpret_from_angle(self, message, angle):
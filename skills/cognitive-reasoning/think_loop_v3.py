@@ -19,6 +19,15 @@ from pathlib import Path
 # 导入多路径理解
 from multi_path import MultiPathUnderstanding
 
+# daily notes 偏移索引位于工作区根目录
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from buffered_log import get_logger
+from daily_note_index import append_daily
+from intent_model import IntentModel
+from reasoning_events import EventLog
+from stage_pipeline import Stage, StagePipeline
+from tracing import get_tracer, span
+
 
 class ThinkLoopV3:
     """
@@ -27,126 +36,246 @@ class ThinkLoopV3:
     使用模式：主动使用
     - 每次用户请求自动触发多路径理解
     - 无需手动调用，透明运行
+    
+    输出: 每一步写成结构化事件（self.events 环形缓冲），只有 verbose=True
+    时才实时渲染到控制台；事后可用 render_recent() 查看（调试接口）
     """
     
-    def __init__(self):
+    def __init__(self, verbose=False):
         self.threshold = 0.75  # 阈值
+        self.learned_weight = 0.1  # 学到的意图概率对置信度的最大加/减分
+        self.auto_save = True  # 可执行的决策写入当日 daily note
         self.memory_dir = Path.home() / ".openclaw/workspace/memory"
         self.memory_file = Path.home() / ".openclaw/workspace/MEMORY.md"
         self.user_file = Path.home() / ".openclaw/workspace/USER.md"
-        self.learning_file = Path.home() / ".openclaw/workspace/.intent_learning.json"
+        self.learning_file = Path.home() / ".openclaw/workspace/.intent_learning.json"  # 旧格式，仅用于迁移
+        self.model_file = Path.home() / ".openclaw/workspace/.intent_model.bin"
         
         # 多路径理解器 (主动集成)
         self.mpu = MultiPathUnderstanding()
-        
-        # 加载学习数据
-        self.learning_data = self._load_learning_data()
-        
-        print("\n🧠 认知框架v3 - 主动多路径理解模式已启动")
-        print(f"   阈值: {self.threshold*100:.0f}%")
-        print(f"   多路径理解: ✅ 主动集成")
+        self.tracer = get_tracer()
+        # 推理步骤事件；verbose 时渲染进缓冲日志，每条消息处理完一次写出
+        self.events = EventLog()
+        self.log = get_logger("think_loop_v3")
+        self.verbose = False
+        self.set_verbose(verbose)
+        
+        # 路径 -> (mtime_ns, size, 内容)：记忆文件未变化时不重复读取
+        self._file_cache = {}
+        
+        # 阶段依赖图：歧义检测与经验加成互不依赖，都只等多路径理解与历史分析
+        # （记忆文件读取已按 mtime 缓存，稳态下只剩一次 stat，内联执行比进线程池更快）
+        self.pipeline = StagePipeline([
+            Stage("read_memory", lambda ctx: self.read_memory()),
+            Stage("read_user_profile", lambda ctx: self.read_user_profile()),
+            Stage("analyze_history", lambda ctx: self.analyze_history(ctx["history"])),
+            Stage("multi_path", lambda ctx: self.mpu.understand(ctx["message"], ctx["history"], max_paths=3)),
+            Stage("detect_ambiguities",
+                  lambda ctx: self.detect_ambiguities(ctx["message"], ctx["multi_path"]["primary"],
+                                                      ctx["analyze_history"]),
+                  deps=("multi_path", "analyze_history")),
+            Stage("apply_experience",
+                  lambda ctx: self.apply_experience(ctx["message"], ctx["multi_path"]["primary"],
+                                                    ctx["analyze_history"]),
+                  deps=("multi_path", "analyze_history")),
+        ])
+        
+        # 在线意图模型：更新累计到一定次数自动落盘，退出时由 intent_model 统一写出剩余部分
+        self.intent_model = self._load_intent_model()
+        
+        self._emit("init", threshold=self.threshold)
+        self.log.flush()
     
-    def _load_learning_data(self):
-        """加载学习数据"""
-        if self.learning_file.exists():
-            try:
-                with open(self.learning_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {"user_patterns": {}, "preferred_actions": {}, "clarification_count": 0}
+    # ==================== 事件与渲染 ====================
+    
+    def set_verbose(self, verbose):
+        """开关控制台渲染（渲染器是 self.events 的一个 sink）"""
+        if verbose:
+            self.events.add_sink(self._render_sink)
+        else:
+            self.events.remove_sink(self._render_sink)
+        self.verbose = verbose
+    
+    def _emit(self, step, **fields):
+        self.events.emit("think_loop", step, **fields)
+    
+    def _render_sink(self, event):
+        for line in self.render_event(event):
+            self.log.info(line)
+    
+    def render_recent(self, n=None):
+        """把最近 n 条事件渲染成文本（调试接口，不影响热路径）"""
+        lines = []
+        for event in self.events.recent(n, source="think_loop"):
+            lines.extend(self.render_event(event))
+        return "\n".join(lines)
+    
+    @staticmethod
+    def render_event(event):
+        """单个事件 → 控制台文本行"""
+        f = event.fields
+        step = event.step
+        if step == "init":
+            return ["\n🧠 认知框架v3 - 主动多路径理解模式已启动",
+                    f"   阈值: {f['threshold']*100:.0f}%",
+                    f"   多路径理解: ✅ 主动集成"]
+        if step == "start":
+            return ["\n" + "🧠" * 35,
+                    "🧠🧠🧠 COGNITIVE REASONING FRAMEWORK v3 🧠🧠🧠",
+                    "🧠🧠🧠  主动多路径理解模式  🧠🧠🧠",
+                    "🧠" * 35,
+                    f"\n👤 用户: \"{f['message']}\"",
+                    f"⏰ 时间: {f['timestamp']}"]
+        
+        rule = "-" * 60
+        if step == "memory":
+            return ["\n" + rule, "Step 0 📚 加载记忆", rule,
+                    f"   长期记忆: {'✅ 已加载' if f['memory'] else '❌ 空'}",
+                    f"   用户档案: {'✅ 已加载' if f['profile'] else '❌ 空'}",
+                    f"   历史分析: {f['topics']} 个话题"]
+        if step == "multi_path":
+            lines = ["\n" + rule, "Step 1 🎯 主动多路径理解 (Tree of Thoughts)", rule,
+                     f"   ✅ 主动触发多路径理解",
+                     f"   📊 生成路径: {f['path_count']}个",
+                     f"   🎯 主路径: {f['primary'][0]} ({f['primary'][1]*100:.0f}%)"]
+            if f["alternatives"]:
+                lines.append(f"   📋 候选路径:")
+                for i, (angle, score) in enumerate(f["alternatives"], 1):
+                    lines.append(f"      {i}. {angle} ({score*100:.0f}%)")
+            return lines
+        if step == "ambiguities":
+            return ["\n" + rule, "Step 2 🔍 歧义检测（历史增强）", rule,
+                    f"   发现 {f['count']} 个模糊点"]
+        if step == "experience":
+            return ["\n" + rule, "Step 3 📈 经验学习", rule,
+                    f"   经验加成: {f['bonus']*100:+.0f}%"]
+        if step == "confidence":
+            return ["\n" + rule, "Step 4 📊 综合置信度", rule,
+                    f"   多路径基础分: {f['base']*100:.0f}%",
+                    f"   歧义惩罚: -{f['penalty']*100:.0f}%",
+                    f"   经验加成: {f['bonus']*100:+.0f}%",
+                    f"   📈 最终置信度: {f['final']*100:.0f}%"]
+        if step == "decision":
+            lines = ["\n" + rule, "Step 5 " + ("✅ 可以执行" if f["can_execute"] else "🔄 反复讨论"), rule]
+            if f["can_execute"]:
+                lines.append(f"   ✅ 置信度 {f['confidence']*100:.0f}% ≥ {f['threshold']*100:.0f}%")
+                lines.append(f"   🎯 执行意图: {f['intent']}")
+            else:
+                lines.append(f"   ⚠️ 置信度 {f['confidence']*100:.0f}% < {f['threshold']*100:.0f}%")
+                lines.append(f"   🔄 进入澄清模式")
+            return lines
+        if step == "auto_save":
+            return [f"   💾 决策已自动保存" if f["ok"] else f"   ⚠️ 自动保存失败: {f['error']}"]
+        if step == "learn":
+            mark = "✅" if f["accepted"] else "❌"
+            return [f"   📚 学习反馈: {f['intent']} {mark} (更新前概率 {f['before']*100:.0f}%)"]
+        if step == "respond":
+            text = f["text"] if f["action"] == "DISCUSS" else f"✅ 开始执行: {f['text']}"
+            return ["\n" + "=" * 60, text]
+        return [f"   [{event.source}.{step}] {f}"]
+    
+    # ==================== 经验学习 ====================
+    
+    def _load_intent_model(self):
+        """加载意图模型；只有旧的 .intent_learning.json 时用其中的澄清记录训练一次"""
+        model = IntentModel.load(self.model_file)
+        if model.updates or not self.learning_file.exists():
+            return model
+        try:
+            with open(self.learning_file, 'r') as f:
+                patterns = json.load(f).get("user_patterns", {})
+        except (OSError, ValueError, AttributeError):
+            return model
+        for original, record in patterns.items():
+            if isinstance(record, dict) and record.get("final_intent"):
+                model.update(original, record["final_intent"])
+                if record.get("clarified_to"):
+                    model.update(record["clarified_to"], record["final_intent"])
+        model.flush()
+        return model
     
-    def _save_learning_data(self):
-        """保存学习数据"""
-        with open(self.learning_file, 'w') as f:
-            json.dump(self.learning_data, f, ensure_ascii=False, indent=2)
+    def learn(self, message, intent, accepted=True):
+        """
+        记录一次反馈：用户确认（accepted）或否定了 message 的意图 intent
+        
+        Returns:
+            float: 更新前模型给出的概率
+        """
+        p = self.intent_model.update(message, intent, positive=accepted)
+        self._emit("learn", intent=intent, accepted=accepted, before=p)
+        return p
+    
+    def record_learning(self, original_msg, clarified_msg, final_intent):
+        """澄清后确定的意图：原话与澄清后的说法都记为正样本"""
+        self.learn(original_msg, final_intent)
+        if clarified_msg and clarified_msg != original_msg:
+            self.learn(clarified_msg, final_intent)
     
     def think(self, message, history=None):
         """
         主思考流程v3 - 主动多路径理解版
         
         Returns:
-            dict: 思考结果
+            dict: 思考结果（"trace" 为分阶段耗时树，未采样时为 None）
         """
-        print("\n" + "🧠" * 35)
-        print("🧠🧠🧠 COGNITIVE REASONING FRAMEWORK v3 🧠🧠🧠")
-        print("🧠🧠🧠  主动多路径理解模式  🧠🧠🧠")
-        print("🧠" * 35)
-        
+        with self.tracer.trace("ThinkLoopV3.think", chars=len(message)) as root:
+            try:
+                result = self._think(message, history)
+            finally:
+                self.log.flush()
+            root.set(confidence=round(result["confidence"], 3), can_execute=result["can_execute"])
+        result["trace"] = root.to_dict()
+        return result
+    
+    def _think(self, message, history=None):
+        emit = self._emit
         timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"\n👤 用户: \"{message}\"")
-        print(f"⏰ 时间: {timestamp}")
-        
-        # Step 0: 加载记忆
-        print("\n" + "-" * 60)
-        print("Step 0 📚 加载记忆")
-        print("-" * 60)
-        memory = self.read_memory()
-        profile = self.read_user_profile()
-        history_analysis = self.analyze_history(history or [])
-        
-        print(f"   长期记忆: {'✅ 已加载' if memory else '❌ 空'}")
-        print(f"   用户档案: {'✅ 已加载' if profile else '❌ 空'}")
-        print(f"   历史分析: {len(history_analysis.get('topics', []))} 个话题")
-        
-        # Step 1: 主动多路径理解 (核心升级)
-        print("\n" + "-" * 60)
-        print("Step 1 🎯 主动多路径理解 (Tree of Thoughts)")
-        print("-" * 60)
+        emit("start", message=message, timestamp=timestamp)
         
-        # 主动调用多路径理解
-        multi_path_result = self.mpu.understand(message, history or [], max_paths=3)
+        # Step 0-3 的计算: 依赖图见 __init__ 中的 self.pipeline
+        ctx = self.pipeline.run({"message": message, "history": history or []})
+        memory = ctx["read_memory"]
+        profile = ctx["read_user_profile"]
+        history_analysis = ctx["analyze_history"]
+        multi_path_result = ctx["multi_path"]
+        ambiguities = ctx["detect_ambiguities"]
+        experience_bonus = ctx["apply_experience"]
         
         primary = multi_path_result["primary"]
         alternatives = multi_path_result["alternatives"]
         
-        print(f"   ✅ 主动触发多路径理解")
-        print(f"   📊 生成路径: {multi_path_result['path_count']}个")
-        print(f"   🎯 主路径: {primary['angle']} ({primary['score']*100:.0f}%)")
+        # Step 0: 加载记忆
+        emit("memory", memory=bool(memory), profile=bool(profile),
+             topics=len(history_analysis.get("topics", [])))
         
-        if alternatives:
-            print(f"   📋 候选路径:")
-            for i, alt in enumerate(alternatives[:2], 1):
-                print(f"      {i}. {alt['angle']} ({alt['score']*100:.0f}%)")
+        # Step 1: 主动多路径理解 (核心升级)
+        emit("multi_path", path_count=multi_path_result["path_count"],
+             primary=(primary["angle"], primary["score"]),
+             alternatives=[(alt["angle"], alt["score"]) for alt in alternatives[:2]])
         
         # Step 2: 歧义检测（历史增强）
-        print("\n" + "-" * 60)
-        print("Step 2 🔍 歧义检测（历史增强）")
-        print("-" * 60)
-        ambiguities = self.detect_ambiguities(message, primary, history_analysis)
-        print(f"   发现 {len(ambiguities)} 个模糊点")
+        emit("ambiguities", count=len(ambiguities))
         
         # Step 3: 经验学习
-        print("\n" + "-" * 60)
-        print("Step 3 📈 经验学习")
-        print("-" * 60)
-        experience_bonus = self.apply_experience(message, primary, history_analysis)
-        print(f"   经验加成: +{experience_bonus*100:.0f}%")
+        emit("experience", bonus=experience_bonus)
         
         # Step 4: 综合置信度
-        print("\n" + "-" * 60)
-        print("Step 4 📊 综合置信度")
-        print("-" * 60)
-        
         # 综合评分 = 多路径评分 + 经验 - 歧义惩罚
         base_score = primary["score"]
         
         # 歧义惩罚
         for amb in ambiguities:
             base_score -= amb.get("weight", 0.3) * 0.1
+        penalty = sum([amb.get("weight", 0.3) * 0.1 for amb in ambiguities])
         
         # 最终置信度
         final_confidence = min(0.98, base_score + experience_bonus)
-        
-        print(f"   多路径基础分: {base_score*100:.0f}%")
-        print(f"   歧义惩罚: -{sum([amb.get('weight', 0.3)*0.1 for amb in ambiguities])*100:.0f}%")
-        print(f"   经验加成: +{experience_bonus*100:.0f}%")
-        print(f"   📈 最终置信度: {final_confidence*100:.0f}%")
+        emit("confidence", base=base_score, penalty=penalty, bonus=experience_bonus, final=final_confidence)
         
         # Step 5: 决策
-        print("\n" + "-" * 60)
-        print("Step 5 " + ("✅ 可以执行" if final_confidence >= self.threshold else "🔄 反复讨论"))
-        print("-" * 60)
+        can_execute = final_confidence >= self.threshold
+        emit("decision", can_execute=can_execute, confidence=final_confidence,
+             threshold=self.threshold, intent=primary["interpretation"]["intent"])
         
         result = {
             "message": message,
@@ -159,19 +288,14 @@ class ThinkLoopV3:
             "ambiguities": ambiguities,
             "confidence": final_confidence,
             "experience_bonus": experience_bonus,
-            "can_execute": final_confidence >= self.threshold,
+            "can_execute": can_execute,
             "rounds": 1
         }
         
-        if final_confidence >= self.threshold:
-            print(f"   ✅ 置信度 {final_confidence*100:.0f}% ≥ {self.threshold*100:.0f}%")
-            print(f"   🎯 执行意图: {primary['interpretation']['intent']}")
-            
+        if can_execute and self.auto_save:
             # 自动保存决策
-            self._auto_save_decision(result)
-        else:
-            print(f"   ⚠️ 置信度 {final_confidence*100:.0f}% < {self.threshold*100:.0f}%")
-            print(f"   🔄 进入澄清模式")
+            with span("auto_save"):
+                self._auto_save_decision(result)
         
         return result
     
@@ -179,7 +303,6 @@ class ThinkLoopV3:
         """自动保存决策到记忆"""
         try:
             daily_file = Path.home() / ".openclaw/workspace/memory" / f"{datetime.now().strftime('%Y-%m-%d')}.md"
-            daily_file.parent.mkdir(exist_ok=True)
             
             entry = f"""
 ### AUTO_SAVE - {result['timestamp']}
@@ -191,39 +314,50 @@ class ThinkLoopV3:
 - 理解路径: {result['primary_path']['angle']}
 
 """
-            with open(daily_file, 'a', encoding='utf-8') as f:
-                f.write(entry)
+            append_daily(daily_file, entry)
             
-            print(f"   💾 决策已自动保存")
+            self._emit("auto_save", ok=True, error=None)
         except Exception as e:
-            print(f"   ⚠️ 自动保存失败: {e}")
+            self._emit("auto_save", ok=False, error=str(e))
+    
+    def _read_text(self, path):
+        """读取文本文件；mtime 与大小都未变时直接返回上次的内容，文件不存在返回 None"""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._file_cache.pop(path, None)
+            return None
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._file_cache[path] = (st.st_mtime_ns, st.st_size, content)
+        return content
     
     def read_memory(self):
         """读取长期记忆"""
         memory = {}
-        if self.memory_file.exists():
-            try:
-                with open(self.memory_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if "用户:" in content:
-                        memory["user"] = True
-                    if "项目" in content or "技术" in content:
-                        memory["projects"] = True
-            except Exception as e:
-                memory["error"] = str(e)
+        try:
+            content = self._read_text(self.memory_file)
+            if content is not None:
+                if "用户:" in content:
+                    memory["user"] = True
+                if "项目" in content or "技术" in content:
+                    memory["projects"] = True
+        except Exception as e:
+            memory["error"] = str(e)
         return memory
     
     def read_user_profile(self):
         """读取用户档案"""
         profile = {}
-        if self.user_file.exists():
-            try:
-                with open(self.user_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if "timezone" in content:
-                        profile["timezone"] = content.split("timezone:")[1].strip().split("\n")[0]
-            except:
-                pass
+        try:
+            content = self._read_text(self.user_file)
+            if content is not None and "timezone" in content:
+                profile["timezone"] = content.split("timezone:")[1].strip().split("\n")[0]
+        except:
+            pass
         return profile
     
     def analyze_history(self, recent_messages):
@@ -273,7 +407,7 @@ class ThinkLoopV3:
         return amb
     
     def apply_experience(self, message, primary_path, history_analysis):
-        """应用经验学习"""
+        """应用经验学习：话题先验 + 意图模型对当前意图的概率（未学过的意图不加分）"""
         bonus = 0.0
         
         topics = primary_path.get("keywords", [])
@@ -283,6 +417,10 @@ class ThinkLoopV3:
             if any(w in topics for w in ["测试", "检查"]):
                 bonus += 0.05
         
+        p = self.intent_model.probability(message, primary_path["interpretation"]["intent"])
+        if p is not None:
+            bonus += self.learned_weight * (2 * p - 1)
+        
         return bonus
     
     def discuss(self, result):
@@ -315,22 +453,23 @@ class ThinkLoopV3:
         """
         result = self.think(message, history)
         
-        print("\n" + "=" * 60)
-        
         discussion = self.discuss(result)
+        intent = result['primary_path']['interpretation']['intent']
         
         if not result['can_execute']:
-            print(discussion)
+            self._emit("respond", action="DISCUSS", text=discussion)
+            self.log.flush()
             return {
                 "action": "DISCUSS",
                 "message": discussion,
                 "result": result
             }
         else:
-            print(f"✅ 开始执行: {result['primary_path']['interpretation']['intent']}")
+            self._emit("respond", action="EXECUTE", text=intent)
+            self.log.flush()
             return {
                 "action": "EXECUTE",
-                "message": f"执行: {result['primary_path']['interpretation']['intent']}",
+                "message": f"执行: {intent}",
                 "result": result
             }
 
@@ -342,7 +481,7 @@ def demo():
     print("🧠🧠🧠🧠  主动多路径理解  🧠🧠🧠🧠")
     print("🧠" * 35 + "\n")
     
-    thinker = ThinkLoopV3()
+    thinker = ThinkLoopV3(verbose=True)
     
     history = [
         {"content": "创建认知推理框架"},
@@ -368,12 +507,78 @@ def demo():
         print("-" * 70 + "\n")
 
 
-if __name__ == "__main__":
-    import sys
+def benchmark(n=400, stream=None):
+    """
+    每秒处理消息数: 控制台渲染关闭 vs 开启（渲染输出写入 stream，默认 os.devnull）
+    
+    Returns:
+        {"quiet": msg/s, "verbose": msg/s, "events": 每条消息的事件数}
+    """
+    import os
+    import time
+    
+    from buffered_log import BufferedLogger
     
-    if len(sys.argv) > 1:
-        message = " ".join(sys.argv[1:])
-        thinker = ThinkLoopV3()
-        response = thinker.think_and_respond(message, [])
+    messages = ["测试一下", "创建新功能", "了解机器学习", "检查系统可用性"]
+    history = [{"content": "创建认知推理框架"}, {"content": "升级到v2"}]
+    out = stream or open(os.devnull, "w", encoding="utf-8")
+    report = {}
+    try:
+        for label, verbose in (("quiet", False), ("verbose", True)):
+            thinker = ThinkLoopV3()
+            thinker.auto_save = False  # 基准不写 daily note
+            thinker.tracer = type(thinker.tracer)(sample_rate=0)
+            thinker.log = BufferedLogger("bench", level="INFO", stream=out)
+            thinker.set_verbose(verbose)
+            for m in messages:  # 预热
+                thinker.think_and_respond(m, history)
+            thinker.events.clear()
+            thinker.think_and_respond(messages[0], history)
+            report["events"] = len(thinker.events)
+            start = time.perf_counter()
+            for i in range(n):
+                thinker.think_and_respond(messages[i % len(messages)], history)
+            report[label] = n / (time.perf_counter() - start)
+    finally:
+        if stream is None:
+            out.close()
+    return report
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='小爪认知推理框架v3')
+    parser.add_argument('message', nargs='*', help='用户消息（省略时运行演示）')
+    parser.add_argument('--verbose', '-v', action='store_true', help='实时渲染每一步推理过程')
+    parser.add_argument('--bench', type=int, default=0, metavar='N',
+                        help='基准: 渲染关闭/开启时每秒处理的消息数（N 条消息）')
+    parser.add_argument('--learn', metavar='INTENT', help='把消息记为意图 INTENT 的正样本')
+    parser.add_argument('--reject', metavar='INTENT', help='把消息记为意图 INTENT 的负样本')
+    args = parser.parse_args()
+    
+    if args.bench:
+        r = benchmark(args.bench)
+        print(f"🧠 ThinkLoopV3 吞吐 ({args.bench} 条消息, 每条 {r['events']:.0f} 个事件)")
+        print(f"   渲染关闭: {r['quiet']:8.0f} msg/s")
+        print(f"   渲染开启: {r['verbose']:8.0f} msg/s  (输出到 os.devnull)")
+    elif args.message and (args.learn or args.reject):
+        thinker = ThinkLoopV3(verbose=True)
+        message = " ".join(args.message)
+        if args.learn:
+            thinker.learn(message, args.learn)
+        if args.reject:
+            thinker.learn(message, args.reject, accepted=False)
+        thinker.log.flush()
+        thinker.intent_model.flush()
+    elif args.message:
+        thinker = ThinkLoopV3(verbose=args.verbose)
+        response = thinker.think_and_respond(" ".join(args.message), [])
+        if not args.verbose:
+            print(response["message"])
     else:
         demo()
+
+
+if __name__ == "__main__":
+    main()
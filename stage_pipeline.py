@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 阶段流水线执行器
+
+把"读记忆 → 多路径理解 → 歧义检测 → 经验加成"这类串行步骤声明成依赖图:
+1. Stage(name, fn, deps, blocking): fn(ctx) 的返回值写入 ctx[name]
+2. 按依赖分层，同层阶段互不依赖
+3. blocking=True 的阶段（文件/网络 I/O，会释放 GIL）提交到共享线程池，
+   与同层的 CPU 阶段重叠执行；纯 CPU 的微秒级阶段留在调用线程内联执行
+   （GIL 下把它们丢进线程只会多付一次线程切换）
+4. 每个阶段一个 tracing span；池中阶段复制调用方的 contextvars，span 仍挂在同一棵树上
+
+用法:
+    pipeline = StagePipeline([
+        Stage("memory", lambda ctx: read_file(...), blocking=True),
+        Stage("paths", lambda ctx: understand(ctx["message"])),
+        Stage("bonus", lambda ctx: score(ctx["paths"], ctx["memory"]), deps=("paths", "memory")),
+    ])
+    ctx = pipeline.run({"message": text})
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import contextvars
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from tracing import span
+
+DEFAULT_WORKERS = 4
+
+
+class Stage(NamedTuple):
+    name: str
+    fn: Callable[[Dict[str, Any]], Any]
+    deps: Sequence[str] = ()
+    blocking: bool = False  # I/O 阶段：放进线程池与其他阶段重叠
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """流水线共享的 I/O 线程池（首次需要时创建）"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _pool = ThreadPoolExecutor(max_workers=DEFAULT_WORKERS, thread_name_prefix="stage")
+        return _pool
+
+
+class StagePipeline:
+    """
+    依赖分层的阶段执行器
+
+    Args:
+        stages: 阶段列表；deps 中的名字必须是前面声明过的阶段或 run() 的初始键
+        parallel: False 时全部内联串行执行（调试/对比用）
+    """
+
+    def __init__(self, stages: List[Stage], parallel: bool = True):
+        self.stages = list(stages)
+        self.parallel = parallel
+        self.levels = self._layer(self.stages)
+
+    @staticmethod
+    def _layer(stages: List[Stage]) -> List[List[Stage]]:
+        names = {s.name for s in stages}
+        if len(names) != len(stages):
+            raise ValueError("阶段名重复")
+        depth: Dict[str, int] = {}
+        for stage in stages:
+            level = 0
+            for dep in stage.deps:
+                if dep in names:
+                    if dep not in depth:
+                        raise ValueError(f"阶段 {stage.name} 依赖的 {dep} 须先声明")
+                    level = max(level, depth[dep] + 1)
+            depth[stage.name] = level
+        levels: List[List[Stage]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for stage in stages:
+            levels[depth[stage.name]].append(stage)
+        return levels
+
+    @staticmethod
+    def _call(stage: Stage, ctx: Dict[str, Any]) -> Any:
+        with span(stage.name):
+            return stage.fn(ctx)
+
+    def run(self, ctx: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """逐层执行，返回填好各阶段结果的 ctx；任一阶段异常时在该层结束后抛出"""
+        ctx = {} if ctx is None else ctx
+        for level in self.levels:
+            offload = [s for s in level if s.blocking] if self.parallel and len(level) > 1 else []
+            futures = []
+            if offload:
+                pool = _get_pool()
+                for stage in offload:
+                    # 每个任务一份上下文副本：span 挂到调用方当前的父节点下
+                    run_in = contextvars.copy_context().run
+                    futures.append((stage, pool.submit(run_in, self._call, stage, ctx)))
+            error = None
+            for stage in level:
+                if stage in offload:
+                    continue
+                try:
+                    ctx[stage.name] = self._call(stage, ctx)
+                except Exception as e:
+                    error = error or e
+            for stage, future in futures:
+                try:
+                    ctx[stage.name] = future.result()
+                except Exception as e:
+                    error = error or e
+            if error is not None:
+                raise error
+        return ctx
+
+
+if __name__ == "__main__":
+    import time
+
+    from tracing import Tracer, format_tree
+
+    def io_stage(seconds):
+        return lambda ctx: time.sleep(seconds) or seconds
+
+    print("🦞 阶段流水线演示")
+    print("=" * 50)
+
+    # 两个 20ms 的 I/O 阶段 + 一个 CPU 阶段：并行时总耗时约等于最慢的一个
+    stages = [
+        Stage("read_memory", io_stage(0.02), blocking=True),
+        Stage("read_profile", io_stage(0.02), blocking=True),
+        Stage("understand", lambda ctx: sum(range(20000))),
+        Stage("score", lambda ctx: ctx["understand"] % 7, deps=("understand", "read_memory")),
+    ]
+    for parallel in (False, True):
+        pipeline = StagePipeline(stages, parallel=parallel)
+        pipeline.run()  # 预热线程池
+        start = time.perf_counter()
+        pipeline.run()
+        print(f"  parallel={parallel!s:5s} {(time.perf_counter() - start) * 1000:6.1f} ms")
+
+    tracer = Tracer()
+    with tracer.trace("pipeline") as root:
+        StagePipeline(stages).run()
+    print("\n" + format_tree(root))
+
+    # 微秒级 CPU 阶段进线程池的代价（所以 blocking 只用于真正的 I/O）
+    tiny = [Stage("a", lambda ctx: 1, blocking=True), Stage("b", lambda ctx: 2, blocking=True)]
+    n = 2000
+    for parallel in (False, True):
+        pipeline = StagePipeline(tiny, parallel=parallel)
+        start = time.perf_counter()
+        for _ in range(n):
+            pipeline.run()
+        print(f"\n微型阶段 parallel={parallel!s:5s} {(time.perf_counter() - start) / n * 1e6:6.1f} μs/次")
@@ -2,6 +2,7 @@
 """Structured Memory System - JSON格式存储记忆"""
 
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -29,6 +30,14 @@ class StructuredMemory:
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2, default=str)
     
+    def _save_json_atomic(self, path: Path, data: Any):
+        """先写临时文件再替换，避免中断时留下半个JSON"""
+        path.parent.mkdir(exist_ok=True, parents=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp, path)
+    
     def _load_json(self, path: Path) -> Any:
         """加载JSON"""
         try:
@@ -39,10 +48,9 @@ class StructuredMemory:
     
     # ==================== 保存功能 ====================
     
-    def save_decision(self, intent: str, action: str, confidence: float, 
-                      message: str, context: Dict = None) -> Dict:
-        """保存决策"""
-        entry = {
+    def _decision_entry(self, intent: str, action: str, confidence: float,
+                        message: str, context: Dict = None) -> Dict:
+        return {
             "id": datetime.now().strftime("%Y%m%d_%H%M%S"),
             "timestamp": datetime.now().isoformat(),
             "type": "DECISION",
@@ -52,6 +60,21 @@ class StructuredMemory:
             "message": message,
             "context": context or {}
         }
+    
+    def _learning_entry(self, topic: str, insight: str, source: str) -> Dict:
+        return {
+            "id": datetime.now().strftime("%Y%m%d_%H%M%S"),
+            "timestamp": datetime.now().isoformat(),
+            "type": "LEARNING",
+            "topic": topic,
+            "insight": insight,
+            "source": source
+        }
+    
+    def save_decision(self, intent: str, action: str, confidence: float, 
+                      message: str, context: Dict = None) -> Dict:
+        """保存决策"""
+        entry = self._decision_entry(intent, action, confidence, message, context)
         
         f = self.md / "decisions" / "index.json"
         data = self._load_json(f) or {"entries": []}
@@ -63,14 +86,7 @@ class StructuredMemory:
     
     def save_learning(self, topic: str, insight: str, source: str) -> Dict:
         """保存学习"""
-        entry = {
-            "id": datetime.now().strftime("%Y%m%d_%H%M%S"),
-            "timestamp": datetime.now().isoformat(),
-            "type": "LEARNING",
-            "topic": topic,
-            "insight": insight,
-            "source": source
-        }
+        entry = self._learning_entry(topic, insight, source)
         
         f = self.md / "learnings" / "index.json"
         data = self._load_json(f) or {"entries": []}
@@ -80,6 +96,51 @@ class StructuredMemory:
         
         return entry
     
+    def save_batch(self, decisions: List[Dict] = None, learnings: List[Dict] = None) -> Dict:
+        """
+        批量保存决策和学习
+        
+        每个索引文件只读写一次（原子替换），替代逐条 save_* 的反复重写。
+        参数里可带 source_key: 索引中已有同键条目的跳过，中断后重放同一批不会重复。
+        
+        Args:
+            decisions: save_decision 的关键字参数列表（可选 source_key）
+            learnings: save_learning 的关键字参数列表（可选 source_key）
+        
+        Returns:
+            各类型写入条数
+        """
+        written = {"decisions": 0, "learnings": 0}
+        batches = [
+            ("decisions", self._decision_entry, decisions or []),
+            ("learnings", self._learning_entry, learnings or []),
+        ]
+        
+        for mem_type, make_entry, params in batches:
+            if not params:
+                continue
+            f = self.md / mem_type / "index.json"
+            data = self._load_json(f) or {"entries": []}
+            seen = {e.get("source_key") for e in data["entries"]} - {None}
+            entries = []
+            for p in params:
+                p = dict(p)
+                key = p.pop("source_key", None)
+                if key is not None and key in seen:
+                    continue
+                entry = make_entry(**p)
+                if key is not None:
+                    entry["source_key"] = key
+                entries.append(entry)
+            if not entries:
+                continue
+            data["entries"].extend(entries)
+            data["last_updated"] = datetime.now().isoformat()
+            self._save_json_atomic(f, data)
+            written[mem_type] = len(entries)
+        
+        return written
+    
     def save_config(self, name: str, old_value: str, new_value: str, reason: str) -> Dict:
         """保存配置"""
         entry = {
@@ -11,6 +11,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from context_assembler import ContextAssembler
+
 # ==================== 配置 ====================
 
 class MemoryConfig:
@@ -21,6 +23,7 @@ class MemoryConfig:
     RELATIONS_FILE = "relations.json"
     EVENTS_FILE = "events.json"
     MAX_CONTEXT_SIZE = 50000  # 最大上下文50KB
+    MAX_CONTEXT_TOKENS = 2000  # AI上下文token预算
     INDEX_FILE = "memory_index.json"
 
 
@@ -41,6 +44,10 @@ class StructuredMemory:
         self.events = self._load_json(self.config.EVENTS_FILE)
         self.index = self._load_json(self.config.INDEX_FILE)
         
+        # 上下文组装器；版本号在每次保存后递增，用于命中组装缓存
+        self.assembler = ContextAssembler(max_tokens=self.config.MAX_CONTEXT_TOKENS)
+        self._version = 0
+        
         # 初始化结构
         if not self.context:
             self.context = {
@@ -193,6 +200,7 @@ class StructuredMemory:
         self._save_json(self.config.RELATIONS_FILE, self.relations)
         self._save_json(self.config.EVENTS_FILE, self.events)
         self._update_index()
+        self._version += 1
     
     def get_summary(self) -> Dict:
         """获取摘要"""
@@ -211,31 +219,42 @@ class StructuredMemory:
             "index": self.index
         }
     
-    def get_context_for_ai(self, max_size: int = None) -> str:
-        """获取AI可读的上下文摘要"""
+    def get_context_for_ai(self, max_size: int = None, query: str = None,
+                           memories: List[Any] = None, max_tokens: int = None) -> str:
+        """
+        获取AI可读的上下文摘要
+        
+        事件、实体、待办和检索到的记忆按相关度与新鲜度打分，
+        在 token 预算内贪心装入，输出紧凑JSON。
+        
+        Args:
+            max_size: 字符上限
+            query: 当前用户消息（用于相关度打分）
+            memories: 检索系统返回的记忆条目
+            max_tokens: token预算（默认 MAX_CONTEXT_TOKENS）
+        """
         if max_size is None:
             max_size = self.config.MAX_CONTEXT_SIZE
         
-        summary = {
+        header = {
             "session_id": self.context.get("session_id"),
             "user": self.context.get("user_info", {}),
             "current_task": self.context.get("current_task"),
-            "recent_events": self.events.get("today", [])[-5:],
             "entities_count": {
                 "projects": len(self.entities.get("projects", {})),
                 "systems": len(self.entities.get("systems", {}))
-            },
-            "pending_actions": self.context.get("pending_actions", [])[-3:]
+            }
         }
+        candidates = ContextAssembler.collect(self.context, self.entities, self.events, memories)
         
-        context_str = json.dumps(summary, ensure_ascii=False, indent=2)
-        
-        if len(context_str) > max_size:
-            # 截取关键信息
-            summary["note"] = "上下文已截取，详细内容见文件"
-            context_str = json.dumps(summary, ensure_ascii=False, indent=2)
-        
-        return context_str
+        return self.assembler.assemble(
+            header, candidates,
+            query=query,
+            max_tokens=max_tokens,
+            max_chars=max_size,
+            # 带外部检索记忆时内容不由版本号决定，不走组装缓存
+            version=None if memories else self._version
+        )
     
     def clear_session(self):
         """清理会话"""
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 嵌入式时序存储
+
+替代每次运行写一个 JSON 的状态快照（economy_status_*.json、
+health_monitor 状态、performance_reporter 报告）：
+1. 每个指标族一个文件，只追加
+2. 按列分块 + zlib 压缩（时间戳做差分编码）
+3. 范围查询返回 NumPy 数组，按块的时间范围跳过无关块
+4. 降采样与保留策略（旧数据聚合成桶、过期数据删除）
+5. 导入已有的 economy_status_*.json 快照
+
+文件格式（重复的块）:
+    b"TSC1" | uint32 头长度 | 头JSON | 每列: uint32 长度 + 压缩数据
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import glob
+import json
+import os
+import re
+import struct
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"TSC1"
+_U32 = struct.Struct("<I")
+
+DEFAULT_ROOT = "data/timeseries"
+DEFAULT_CHUNK_ROWS = 256
+
+TIME_COLUMN = "timestamp"
+
+
+def to_epoch_ms(ts) -> int:
+    """datetime / ISO 字符串 / 秒或毫秒数值 → UTC 毫秒"""
+    if isinstance(ts, (int, np.integer)):
+        return int(ts) if ts > 10 ** 11 else int(ts) * 1000
+    if isinstance(ts, float):
+        return int(ts * 1000) if ts < 10 ** 11 else int(ts)
+    if isinstance(ts, str):
+        ts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    if ts.tzinfo is None:
+        ts = ts.astimezone()
+    return int(ts.timestamp() * 1000)
+
+
+# ==================== 列编码 ====================
+
+def _encode_column(values: List, kind: str) -> bytes:
+    if kind == "time":
+        arr = np.asarray(values, dtype=np.int64)
+        deltas = np.diff(arr, prepend=np.int64(0))
+        return zlib.compress(deltas.tobytes(), 6)
+    if kind == "f8":
+        arr = np.asarray([np.nan if v is None else v for v in values], dtype=np.float64)
+        return zlib.compress(arr.tobytes(), 6)
+    return zlib.compress(json.dumps(values, ensure_ascii=False).encode("utf-8"), 6)
+
+
+def _decode_column(raw: bytes, kind: str) -> np.ndarray:
+    data = zlib.decompress(raw)
+    if kind == "time":
+        return np.cumsum(np.frombuffer(data, dtype=np.int64))
+    if kind == "f8":
+        return np.frombuffer(data, dtype=np.float64).copy()
+    return np.asarray(json.loads(data.decode("utf-8")), dtype=object)
+
+
+def _column_kind(values: List) -> str:
+    for v in values:
+        if v is None:
+            continue
+        if isinstance(v, bool) or not isinstance(v, (int, float, np.number)):
+            return "str"
+    return "f8"
+
+
+class TimeSeriesStore:
+    """
+    嵌入式时序存储
+
+    用法:
+        store = TimeSeriesStore()
+        store.append("health", datetime.now(), healthy=5, warning=1)
+        store.flush()
+        data = store.query("health", start="2026-02-01")
+        data["timestamp"], data["healthy"]   # NumPy 数组
+    """
+
+    def __init__(self, root: str = DEFAULT_ROOT, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self.root = Path(root)
+        self.chunk_rows = chunk_rows
+        self._buffers: Dict[str, List[Tuple[int, Dict]]] = {}
+
+    def path(self, family: str) -> Path:
+        if not re.match(r'^[\w\-]+$', family):
+            raise ValueError(f"非法指标族名: {family}")
+        return self.root / f"{family}.tsdb"
+
+    # ==================== 写入 ====================
+
+    def append(self, family: str, timestamp, flush: bool = False, **fields):
+        """
+        追加一行（先进缓冲区，满 chunk_rows 行落盘一个块）
+
+        Args:
+            timestamp: datetime / ISO 字符串 / epoch
+            flush: 立即落盘（单次运行的脚本使用）
+            fields: 列名=值（数值或字符串）
+        """
+        buf = self._buffers.setdefault(family, [])
+        buf.append((to_epoch_ms(timestamp), fields))
+        if flush or len(buf) >= self.chunk_rows:
+            self.flush(family)
+
+    def flush(self, family: str = None):
+        """把缓冲区写成压缩块追加到文件"""
+        families = [family] if family else list(self._buffers)
+        for fam in families:
+            rows = self._buffers.pop(fam, [])
+            if rows:
+                self._write_chunk(self.path(fam), rows, mode="ab")
+
+    def _write_chunk(self, path: Path, rows: List[Tuple[int, Dict]], mode: str):
+        rows = sorted(rows, key=lambda r: r[0])
+        columns = []
+        for _, fields in rows:
+            for name in fields:
+                if name not in columns:
+                    columns.append(name)
+
+        times = [t for t, _ in rows]
+        encoded = [_encode_column(times, "time")]
+        kinds = {TIME_COLUMN: "time"}
+        for name in columns:
+            values = [fields.get(name) for _, fields in rows]
+            kind = _column_kind(values)
+            kinds[name] = kind
+            encoded.append(_encode_column(values, kind))
+
+        header = json.dumps({
+            "n": len(rows),
+            "t_min": times[0],
+            "t_max": times[-1],
+            "columns": [TIME_COLUMN] + columns,
+            "kinds": kinds
+        }, separators=(",", ":")).encode("utf-8")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, mode) as f:
+            f.write(MAGIC + _U32.pack(len(header)) + header)
+            for raw in encoded:
+                f.write(_U32.pack(len(raw)) + raw)
+
+    # ==================== 读取 ====================
+
+    def _iter_chunks(self, family: str, start_ms: int = None,
+                     end_ms: int = None) -> Iterator[Tuple[Dict, Dict[str, np.ndarray]]]:
+        """逐块读取；时间范围不相交的块只读头部后直接跳过"""
+        path = self.path(family)
+        if not path.exists():
+            return
+        with open(path, "rb") as f:
+            while True:
+                magic = f.read(4)
+                if len(magic) < 4:
+                    break
+                if magic != MAGIC:
+                    raise ValueError(f"{path} 已损坏（块标记错误）")
+                header = json.loads(f.read(_U32.unpack(f.read(4))[0]))
+                skip = ((start_ms is not None and header["t_max"] < start_ms) or
+                        (end_ms is not None and header["t_min"] > end_ms))
+                cols = {}
+                for name in header["columns"]:
+                    size = _U32.unpack(f.read(4))[0]
+                    if skip:
+                        f.seek(size, os.SEEK_CUR)
+                    else:
+                        cols[name] = _decode_column(f.read(size), header["kinds"][name])
+                if not skip:
+                    yield header, cols
+
+    def query(self, family: str, start=None, end=None,
+              columns: List[str] = None) -> Dict[str, np.ndarray]:
+        """
+        范围查询 [start, end]
+
+        Returns:
+            {"timestamp": int64 毫秒数组, 列名: 数组}；数值列为 float64（缺失为 NaN），
+            字符串列为 object 数组（缺失为 None）
+        """
+        start_ms = to_epoch_ms(start) if start is not None else None
+        end_ms = to_epoch_ms(end) if end is not None else None
+
+        parts: List[Dict[str, np.ndarray]] = []
+        kinds: Dict[str, str] = {}
+        for header, cols in self._iter_chunks(family, start_ms, end_ms):
+            ts = cols[TIME_COLUMN]
+            mask = np.ones(len(ts), dtype=bool)
+            if start_ms is not None:
+                mask &= ts >= start_ms
+            if end_ms is not None:
+                mask &= ts <= end_ms
+            parts.append({name: arr[mask] for name, arr in cols.items()})
+            for name, kind in header["kinds"].items():
+                if kinds.get(name) != "str":
+                    kinds[name] = kind
+
+        names = [TIME_COLUMN] + [n for n in kinds if n != TIME_COLUMN and (columns is None or n in columns)]
+        result = {}
+        for name in names:
+            kind = kinds.get(name, "f8")
+            pieces = []
+            for part in parts:
+                n = len(part[TIME_COLUMN])
+                if name in part:
+                    arr = part[name]
+                    pieces.append(arr.astype(object) if kind == "str" and arr.dtype != object else arr)
+                else:
+                    pieces.append(np.full(n, None, dtype=object) if kind == "str" else np.full(n, np.nan))
+            if kind == "time":
+                empty = np.empty(0, dtype=np.int64)
+            elif kind == "str":
+                empty = np.empty(0, dtype=object)
+            else:
+                empty = np.empty(0, dtype=np.float64)
+            result[name] = np.concatenate(pieces) if pieces else empty
+
+        # 块之间可能有时间重叠（乱序写入），统一排序
+        order = np.argsort(result[TIME_COLUMN], kind="stable")
+        return {name: arr[order] for name, arr in result.items()}
+
+    def downsample(self, family: str, bucket_seconds: int, start=None, end=None,
+                   agg: str = "mean", columns: List[str] = None) -> Dict[str, np.ndarray]:
+        """
+        按固定时间桶聚合数值列
+
+        Args:
+            agg: mean / min / max / last / count
+        """
+        data = self.query(family, start, end, columns)
+        ts = data[TIME_COLUMN]
+        bucket_ms = bucket_seconds * 1000
+        if len(ts) == 0:
+            return {TIME_COLUMN: ts}
+
+        buckets = ts // bucket_ms
+        keys, starts, counts = np.unique(buckets, return_index=True, return_counts=True)
+        result = {TIME_COLUMN: keys * bucket_ms, "count": counts.astype(np.float64)}
+
+        for name, arr in data.items():
+            if name == TIME_COLUMN or arr.dtype == object:
+                continue
+            if agg == "count":
+                continue
+            if agg == "last":
+                result[name] = arr[starts + counts - 1]
+                continue
+            valid = ~np.isnan(arr)
+            if agg == "mean":
+                sums = np.add.reduceat(np.where(valid, arr, 0.0), starts)
+                n = np.add.reduceat(valid.astype(np.float64), starts)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result[name] = sums / n
+            elif agg == "min":
+                result[name] = np.fmin.reduceat(np.where(valid, arr, np.inf), starts)
+                result[name][np.isinf(result[name])] = np.nan
+            elif agg == "max":
+                result[name] = np.fmax.reduceat(np.where(valid, arr, -np.inf), starts)
+                result[name][np.isinf(result[name])] = np.nan
+            else:
+                raise ValueError(f"不支持的聚合方式: {agg}")
+        return result
+
+    # ==================== 保留策略 ====================
+
+    def apply_retention(self, family: str, max_age_days: float = None,
+                        downsample_after_days: float = None, bucket_seconds: int = 3600,
+                        now=None) -> Dict:
+        """
+        重写指标族文件：删除过期数据，把较旧的原始数据降采样成桶均值，
+        同时把小块合并成 chunk_rows 大小的大块。
+
+        Returns:
+            {"before": 行数, "after": 行数}
+        """
+        self.flush(family)
+        path = self.path(family)
+        if not path.exists():
+            return {"before": 0, "after": 0}
+
+        now_ms = to_epoch_ms(now or datetime.now(timezone.utc))
+        data = self.query(family)
+        before = len(data[TIME_COLUMN])
+        ts = data[TIME_COLUMN]
+
+        keep = np.ones(before, dtype=bool)
+        if max_age_days is not None:
+            keep &= ts >= now_ms - int(max_age_days * 86400_000)
+
+        rows: List[Tuple[int, Dict]] = []
+        raw_mask = keep
+        if downsample_after_days is not None:
+            cutoff = now_ms - int(downsample_after_days * 86400_000)
+            old = keep & (ts < cutoff)
+            raw_mask = keep & (ts >= cutoff)
+            if old.any():
+                bucket_ms = bucket_seconds * 1000
+                buckets = ts[old] // bucket_ms
+                for b in np.unique(buckets):
+                    sel = buckets == b
+                    fields = {}
+                    for name, arr in data.items():
+                        if name == TIME_COLUMN:
+                            continue
+                        vals = arr[old][sel]
+                        if arr.dtype == object:
+                            fields[name] = vals[-1]
+                        else:
+                            finite = vals[~np.isnan(vals)]
+                            fields[name] = float(finite.mean()) if len(finite) else None
+                    rows.append((int(b * bucket_ms), fields))
+
+        names = [n for n in data if n != TIME_COLUMN]
+        for i in np.nonzero(raw_mask)[0]:
+            fields = {}
+            for name in names:
+                v = data[name][i]
+                if data[name].dtype == object:
+                    fields[name] = v
+                elif not np.isnan(v):
+                    fields[name] = float(v)
+            rows.append((int(ts[i]), fields))
+
+        rows.sort(key=lambda r: r[0])
+        tmp = path.with_suffix(".tmp")
+        if tmp.exists():
+            tmp.unlink()
+        for i in range(0, len(rows), self.chunk_rows):
+            self._write_chunk(tmp, rows[i:i + self.chunk_rows], mode="ab")
+        if rows:
+            os.replace(tmp, path)
+        else:
+            path.unlink()
+
+        return {"before": before, "after": len(rows)}
+
+    def families(self) -> List[str]:
+        return sorted(p.stem for p in self.root.glob("*.tsdb"))
+
+
+# ==================== 导入已有快照 ====================
+
+def _parse_money(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        cleaned = re.sub(r'[^\d.\-]', '', value)
+        try:
+            return float(cleaned)
+        except ValueError:
+            return None
+    return None
+
+
+def import_economy_status(store: TimeSeriesStore, pattern: str = "economy_status_*.json",
+                          delete: bool = False) -> Dict:
+    """
+    把 economy_status_<date>_<n>.json 快照导入 economy_status 指标族
+
+    Args:
+        pattern: 快照文件 glob
+        delete: 导入成功后删除原文件
+
+    Returns:
+        {"imported": n, "failed": [文件]}
+    """
+    imported, failed, done = 0, [], []
+    for path in sorted(glob.glob(pattern)):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snap = json.load(f)
+            store.append(
+                "economy_status", snap["timestamp"],
+                agent_count=snap.get("agentCount"),
+                transaction_volume=_parse_money(snap.get("transactionVolume")),
+                platform_status=snap.get("platformStatus"),
+                x402_status=snap.get("x402ProtocolStatus"),
+                status=snap.get("status")
+            )
+            imported += 1
+            done.append(path)
+        except (OSError, ValueError, KeyError):
+            failed.append(path)
+    store.flush("economy_status")
+
+    if delete:
+        for path in done:
+            os.remove(path)
+
+    return {"imported": imported, "failed": failed}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='小爪时序存储')
+    parser.add_argument('command', choices=['import-economy', 'query', 'retention', 'list'])
+    parser.add_argument('--family', '-f', default='economy_status', help='指标族')
+    parser.add_argument('--root', default=DEFAULT_ROOT, help='存储目录')
+    parser.add_argument('--pattern', default='economy_status_*.json', help='导入文件 glob')
+    parser.add_argument('--delete', action='store_true', help='导入后删除原JSON')
+    parser.add_argument('--start', default=None, help='起始时间 (ISO)')
+    parser.add_argument('--end', default=None, help='结束时间 (ISO)')
+    parser.add_argument('--bucket', type=int, default=0, help='降采样桶大小(秒)')
+    parser.add_argument('--max-age-days', type=float, default=None, help='保留天数')
+    parser.add_argument('--downsample-after-days', type=float, default=None, help='超过天数后降采样')
+    args = parser.parse_args()
+
+    store = TimeSeriesStore(args.root)
+
+    if args.command == 'import-economy':
+        result = import_economy_status(store, args.pattern, args.delete)
+        size = store.path('economy_status').stat().st_size if result['imported'] else 0
+        print(f"✅ 导入 {result['imported']} 个快照 → {store.path('economy_status')} ({size} 字节)")
+        if result['failed']:
+            print(f"⚠️ 失败 {len(result['failed'])} 个: {result['failed'][:5]}")
+    elif args.command == 'query':
+        if args.bucket:
+            data = store.downsample(args.family, args.bucket, args.start, args.end)
+        else:
+            data = store.query(args.family, args.start, args.end)
+        ts = data[TIME_COLUMN]
+        print(f"📈 {args.family}: {len(ts)} 行")
+        for name, arr in data.items():
+            if name == TIME_COLUMN or arr.dtype == object or len(arr) == 0:
+                continue
+            print(f"  {name}: min={np.nanmin(arr):.4g} max={np.nanmax(arr):.4g} last={arr[-1]:.4g}")
+    elif args.command == 'retention':
+        result = store.apply_retention(args.family, args.max_age_days,
+                                       args.downsample_after_days, args.bucket or 3600)
+        print(f"🧹 {args.family}: {result['before']} → {result['after']} 行")
+    else:
+        for fam in store.families():
+            print(f"  {fam}: {store.path(fam).stat().st_size} 字节")
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 轻量级分阶段追踪 (Tracing)
+
+给推理流程的每个阶段计时:
+1. with span("阶段名"): ... —— perf_counter_ns 计时，自动挂到当前父节点下形成嵌套树
+2. Tracer.trace() 开启一次根追踪；已在追踪中时退化为子 span（引擎互相调用时只有一棵树）
+3. 采样开关: sample_rate ∈ [0, 1]（环境变量 OPENCLAW_TRACE_SAMPLE 设默认值），
+   未采样时 span() 返回共享的空对象，几乎零开销
+4. 导出 Chrome trace-event JSON（chrome://tracing 或 Perfetto 打开）
+
+用法:
+    tracer = get_tracer()
+    with tracer.trace("analyze") as root:
+        with span("understand", chars=len(text)):
+            ...
+    result["trace"] = root.to_dict()
+    write_chrome_trace("trace.json", tracer.recent())
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import functools
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# 默认采样率（生产环境可设为 0.01 之类的值，0 表示关闭）
+DEFAULT_SAMPLE_RATE = float(os.environ.get("OPENCLAW_TRACE_SAMPLE", "1"))
+
+_current: ContextVar[Optional["Span"]] = ContextVar("openclaw_trace_span", default=None)
+
+
+# ==================== Span ====================
+
+class Span:
+    """一个计时区间；children 为嵌套的子区间"""
+
+    __slots__ = ("name", "attrs", "start_ns", "end_ns", "children", "tid", "_token")
+
+    def __init__(self, name: str, attrs: Dict[str, Any] = None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.start_ns = 0
+        self.end_ns = 0
+        self.children: List["Span"] = []
+        self.tid = 0
+        self._token = None
+
+    def __enter__(self) -> "Span":
+        parent = _current.get()
+        if parent is not None:
+            parent.children.append(self)
+        self.tid = threading.get_ident()
+        self._token = _current.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        _current.reset(self._token)
+        self._token = None
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+
+    def set(self, **attrs):
+        """追加属性（如节点数、缓存命中数）"""
+        self.attrs.update(attrs)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "duration_ms": round(self.duration_ms, 4),
+            "attrs": dict(self.attrs),
+            "children": [c.to_dict() for c in self.children],
+        }
+
+    def walk(self, depth: int = 0):
+        """深度优先遍历 (span, 深度)"""
+        yield self, depth
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+class _NullSpan:
+    """未采样/未追踪时的空 span：所有操作都是空操作"""
+
+    __slots__ = ()
+    name = ""
+    children = ()
+    duration_ms = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+    def to_dict(self):
+        return None
+
+    def walk(self, depth: int = 0):
+        return iter(())
+
+
+NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **attrs):
+    """当前追踪下的子 span；不在追踪中（或未采样）时返回空 span"""
+    if _current.get() is None:
+        return NULL_SPAN
+    return Span(name, attrs)
+
+
+def current_span():
+    return _current.get() or NULL_SPAN
+
+
+def traced(name: str = None):
+    """装饰器: 把函数调用包成一个 span"""
+    def decorator(fn: Callable) -> Callable:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return fn(*args, **kwargs)
+            with Span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ==================== Tracer ====================
+
+class Tracer:
+    """
+    根追踪的入口与采样器
+
+    Args:
+        sample_rate: 采样率，默认取 DEFAULT_SAMPLE_RATE
+        keep: 保留最近多少棵追踪树（供导出）
+    """
+
+    def __init__(self, sample_rate: float = None, keep: int = 100):
+        self.sample_rate = DEFAULT_SAMPLE_RATE if sample_rate is None else sample_rate
+        self._recent: deque = deque(maxlen=keep)
+        self._lock = threading.Lock()
+
+    def trace(self, name: str, **attrs):
+        """开启根追踪；已在追踪中时作为子 span，未采样时返回空 span"""
+        if _current.get() is not None:
+            return Span(name, attrs)
+        if self.sample_rate <= 0 or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return NULL_SPAN
+        return _RootSpan(self, name, attrs)
+
+    def _finish(self, root: "Span"):
+        with self._lock:
+            self._recent.append(root)
+
+    def recent(self) -> List[Span]:
+        with self._lock:
+            return list(self._recent)
+
+    def clear(self):
+        with self._lock:
+            self._recent.clear()
+
+
+class _RootSpan(Span):
+    """根 span：结束时登记到 tracer"""
+
+    __slots__ = ("tracer",)
+
+    def __init__(self, tracer: Tracer, name: str, attrs: Dict[str, Any]):
+        super().__init__(name, attrs)
+        self.tracer = tracer
+
+    def __exit__(self, exc_type, exc, tb):
+        super().__exit__(exc_type, exc, tb)
+        self.tracer._finish(self)
+
+
+_default_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """进程级默认 tracer"""
+    return _default_tracer
+
+
+# ==================== 导出 ====================
+
+def to_chrome_trace(roots: Iterable[Span]) -> Dict:
+    """转换为 Chrome trace-event 格式（完整事件 ph=X，时间单位 μs）"""
+    pid = os.getpid()
+    events = []
+    for root in roots:
+        for s, _ in root.walk():
+            events.append({
+                "name": s.name,
+                "cat": "reasoning",
+                "ph": "X",
+                "ts": s.start_ns / 1000,
+                "dur": (s.end_ns - s.start_ns) / 1000,
+                "pid": pid,
+                "tid": s.tid,
+                "args": {k: v if isinstance(v, (int, float, bool, str)) or v is None else str(v)
+                         for k, v in s.attrs.items()},
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(path: str, roots: Iterable[Span]) -> str:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(to_chrome_trace(roots), f, ensure_ascii=False)
+    return path
+
+
+def format_tree(root) -> str:
+    """缩进文本树，便于终端查看（root 可为 Span 或 to_dict() 的结果）"""
+    if root is None or root is NULL_SPAN:
+        return "(未采样)"
+    node = root.to_dict() if isinstance(root, Span) else root
+    total = node["duration_ms"] or 1e-9
+    lines = []
+
+    def emit(n: Dict, depth: int):
+        attrs = " ".join(f"{k}={v}" for k, v in n["attrs"].items())
+        lines.append(f"{'  ' * depth}{n['name']:<{32 - 2 * depth}s} {n['duration_ms']:9.3f} ms "
+                     f"{n['duration_ms'] / total:6.1%}  {attrs}".rstrip())
+        for c in n["children"]:
+            emit(c, depth + 1)
+
+    emit(node, 0)
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    from reasoning_engine_v3 import ReasoningEngineV3
+
+    print("=" * 70)
+    print("🦞 分阶段追踪演示 - ReasoningEngineV3")
+    print("=" * 70)
+
+    engine = ReasoningEngineV3()
+    problems = [
+        "甲、乙、丙三人中，只有一人会游泳。甲说：“我会”。乙说：“我不会”。丙说：“甲不会”。"
+        "如果这三句话只有一句是真的，那么会游泳的是？",
+        "计算 3 + 5 × 2 等于多少",
+    ]
+    for problem in problems:
+        result = engine.analyze(problem)
+        print(f"\n{problem[:30]}...")
+        print(format_tree(result["trace"]))
+
+    # 开销: 关闭采样 vs 全量追踪
+    n = 200
+    print("\n追踪开销:")
+    for rate in (0.0, 1.0):
+        engine.tracer = Tracer(sample_rate=rate)
+        start = time.perf_counter()
+        for _ in range(n):
+            engine.analyze(problems[0])
+        print(f"  sample_rate={rate}: {(time.perf_counter() - start) / n * 1000:.3f} ms/次")
+
+    path = write_chrome_trace(os.path.join(tempfile.gettempdir(), "reasoning_trace.json"),
+                              engine.tracer.recent()[-5:])
+    print(f"\n💾 Chrome trace 已导出: {path}")
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🦞 思维树 (Tree of Thoughts) 执行器
+
+把“生成想法 / 评估想法”两个函数接入通用的树搜索:
+- 最佳优先: 优先队列前沿，每次展开得分最高的节点
+- 束搜索: 逐层保留得分最高的 beam_width 个节点
+- 评估缓存: 以规范化状态的哈希为键，相同状态（换个顺序/空白/大小写）只评估一次
+- 并行展开: 同一节点的兄弟子节点在线程池/进程池中并行评估，束搜索时同层节点也并行展开
+- 延迟统计: 每个节点记录展开耗时、评估耗时、是否命中缓存
+
+用法:
+    tot = ToTExecutor(expand=gen, evaluate=score, beam_width=3, max_depth=3)
+    r = tot.solve(root_state)
+    r["best"]["state"], r["path"], r["nodes"], r["latency"]
+
+Version: 1.0
+Date: 2026-02-11
+"""
+
+import concurrent.futures
+import hashlib
+import heapq
+import itertools
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+def normalize_state(state: Any) -> str:
+    """默认规范化: 字符串折叠空白并转小写；容器按 JSON（键排序）序列化"""
+    if isinstance(state, str):
+        return re.sub(r"\s+", " ", state.strip().lower())
+    if isinstance(state, (list, tuple)):
+        return json.dumps([normalize_state(s) for s in state], ensure_ascii=False)
+    if isinstance(state, dict):
+        return json.dumps({k: normalize_state(v) for k, v in state.items()}, ensure_ascii=False, sort_keys=True)
+    return repr(state)
+
+
+def state_key(state: Any, normalize: Callable[[Any], str] = normalize_state) -> str:
+    return hashlib.blake2b(normalize(state).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _timed(fn: Callable, arg: Any) -> tuple:
+    """在工作线程/进程中调用并计时（模块级函数，进程池可 pickle）"""
+    start = time.perf_counter()
+    value = fn(arg)
+    return value, (time.perf_counter() - start) * 1000
+
+
+@dataclass
+class ToTNode:
+    """搜索树节点（含延迟统计）"""
+    id: int
+    state: Any
+    depth: int
+    parent: Optional[int] = None
+    score: float = 0.0
+    key: str = ""
+    eval_ms: float = 0.0
+    expand_ms: float = 0.0
+    cached: bool = False
+    children: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id, "state": self.state, "depth": self.depth, "parent": self.parent,
+            "score": self.score, "eval_ms": self.eval_ms, "expand_ms": self.expand_ms,
+            "cached": self.cached, "children": list(self.children),
+        }
+
+
+class ToTExecutor:
+    """
+    思维树执行器
+
+    Args:
+        expand: f(state) -> 子状态列表
+        evaluate: f(state) -> 分数（越大越好）
+        is_goal: f(state, score) -> 是否已解决（可选，命中即停止）
+        strategy: "best_first" 或 "beam"
+        beam_width: 束宽（最佳优先时为每个节点保留的子节点数）
+        max_depth: 最大深度（根为 0）
+        max_nodes: 最多创建的节点数
+        workers: >0 时启用并行池
+        pool: "thread" 或 "process"（进程池要求 expand/evaluate 可 pickle）
+        normalize: 状态规范化函数（决定缓存键）
+    """
+
+    def __init__(self, expand: Callable[[Any], List[Any]], evaluate: Callable[[Any], float],
+                 is_goal: Callable[[Any, float], bool] = None, strategy: str = "best_first",
+                 beam_width: int = 3, max_depth: int = 3, max_nodes: int = 500,
+                 workers: int = 0, pool: str = "thread",
+                 normalize: Callable[[Any], str] = normalize_state):
+        if strategy not in ("best_first", "beam"):
+            raise ValueError(f"未知搜索策略: {strategy}")
+        self.expand = expand
+        self.evaluate = evaluate
+        self.is_goal = is_goal
+        self.strategy = strategy
+        self.beam_width = beam_width
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.workers = workers
+        self.pool_kind = pool
+        self.normalize = normalize
+        self._cache: Dict[str, float] = {}
+        self._cache_lock = threading.Lock()
+        self._pool = None
+
+    # ---------- 并行池 ----------
+
+    def _executor(self):
+        if self.workers <= 0:
+            return None
+        if self._pool is None:
+            # 按需访问: concurrent.futures 首次取属性时才导入线程/进程池子模块
+            futures = concurrent.futures
+            cls = futures.ProcessPoolExecutor if self.pool_kind == "process" else futures.ThreadPoolExecutor
+            self._pool = cls(max_workers=self.workers)
+        return self._pool
+
+    def _map(self, fn: Callable, items: List[Any]) -> List[tuple]:
+        pool = self._executor()
+        if pool is None or len(items) <= 1:
+            return [_timed(fn, item) for item in items]
+        return list(pool.map(_timed, itertools.repeat(fn, len(items)), items))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- 评估（带缓存） ----------
+
+    def _score(self, nodes: List[ToTNode], stats: Dict):
+        """批量评估: 先查缓存，未命中的（同批内也去重）并行计算"""
+        pending: Dict[str, List[ToTNode]] = {}
+        with self._cache_lock:
+            for node in nodes:
+                node.key = state_key(node.state, self.normalize)
+                if node.key in self._cache:
+                    node.score = self._cache[node.key]
+                    node.cached = True
+                    stats["cache_hits"] += 1
+                else:
+                    pending.setdefault(node.key, []).append(node)
+
+        keys = list(pending)
+        results = self._map(self.evaluate, [pending[k][0].state for k in keys])
+        with self._cache_lock:
+            for key, (score, ms) in zip(keys, results):
+                self._cache[key] = score
+                stats["evaluated"] += 1
+                for i, node in enumerate(pending[key]):
+                    node.score = score
+                    node.eval_ms = ms if i == 0 else 0.0
+                    node.cached = i > 0
+                    stats["cache_hits"] += i > 0
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    # ---------- 搜索 ----------
+
+    def solve(self, root_state: Any) -> Dict:
+        """
+        Returns:
+            {"best", "path", "solved", "nodes", "expanded", "evaluated", "cache_hits",
+             "elapsed_ms", "latency": {"expand_ms", "eval_ms", "max_node_ms"}}
+        """
+        start = time.perf_counter()
+        stats = {"expanded": 0, "evaluated": 0, "cache_hits": 0}
+        nodes: List[ToTNode] = [ToTNode(0, root_state, 0)]
+        self._score(nodes, stats)
+        best = nodes[0]
+        solved = bool(self.is_goal and self.is_goal(best.state, best.score))
+        counter = itertools.count()
+
+        def grow(parents: List[ToTNode]) -> List[ToTNode]:
+            """并行展开一批父节点，再并行评估全部子节点"""
+            expansions = self._map(self.expand, [p.state for p in parents])
+            children = []
+            for parent, (states, ms) in zip(parents, expansions):
+                parent.expand_ms = ms
+                stats["expanded"] += 1
+                for state in states[:max(0, self.max_nodes - len(nodes))]:
+                    child = ToTNode(len(nodes), state, parent.depth + 1, parent=parent.id)
+                    nodes.append(child)
+                    parent.children.append(child.id)
+                    children.append(child)
+            self._score(children, stats)
+            return children
+
+        if not solved and self.strategy == "beam":
+            layer = [nodes[0]]
+            while layer and layer[0].depth < self.max_depth and len(nodes) < self.max_nodes:
+                children = grow(layer)
+                if not children:
+                    break
+                children.sort(key=lambda n: n.score, reverse=True)
+                for child in children:
+                    if child.score > best.score:
+                        best = child
+                    if self.is_goal and self.is_goal(child.state, child.score):
+                        best, solved = child, True
+                        break
+                if solved:
+                    break
+                layer = children[:self.beam_width]
+        elif not solved:
+            frontier = [(-nodes[0].score, next(counter), 0)]
+            while frontier and len(nodes) < self.max_nodes:
+                _, _, node_id = heapq.heappop(frontier)
+                node = nodes[node_id]
+                if node.depth >= self.max_depth:
+                    continue
+                children = sorted(grow([node]), key=lambda n: n.score, reverse=True)
+                for child in children[:self.beam_width]:
+                    if child.score > best.score:
+                        best = child
+                    if self.is_goal and self.is_goal(child.state, child.score):
+                        best, solved = child, True
+                        break
+                    heapq.heappush(frontier, (-child.score, next(counter), child.id))
+                if solved:
+                    break
+
+        path, cur = [], best
+        while cur is not None:
+            path.append(cur.state)
+            cur = nodes[cur.parent] if cur.parent is not None else None
+
+        expand_ms = sum(n.expand_ms for n in nodes)
+        eval_ms = sum(n.eval_ms for n in nodes)
+        return {
+            "best": best.to_dict(),
+            "path": path[::-1],
+            "solved": solved,
+            "nodes": [n.to_dict() for n in nodes],
+            "expanded": stats["expanded"],
+            "evaluated": stats["evaluated"],
+            "cache_hits": stats["cache_hits"],
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+            "latency": {
+                "expand_ms": expand_ms,
+                "eval_ms": eval_ms,
+                "max_node_ms": max((n.expand_ms + n.eval_ms for n in nodes), default=0.0),
+            },
+        }
+
+
+# ==================== 示例: 24 点 ====================
+
+def _combine(a: float, b: float) -> List[tuple]:
+    out = [(a + b, "+"), (a - b, "-"), (b - a, "-r"), (a * b, "*")]
+    if b:
+        out.append((a / b, "/"))
+    if a:
+        out.append((b / a, "/r"))
+    return out
+
+
+def game24_expand(state: tuple) -> List[tuple]:
+    """状态: ((数值, 表达式), ...)；任取两个数做一次四则运算"""
+    children = []
+    for i, j in itertools.combinations(range(len(state)), 2):
+        (a, ea), (b, eb) = state[i], state[j]
+        rest = tuple(s for k, s in enumerate(state) if k not in (i, j))
+        for value, op in _combine(a, b):
+            expr = {"+": f"({ea}+{eb})", "-": f"({ea}-{eb})", "-r": f"({eb}-{ea})",
+                    "*": f"({ea}*{eb})", "/": f"({ea}/{eb})", "/r": f"({eb}/{ea})"}[op]
+            children.append(rest + ((value, expr),))
+    return children
+
+
+def _reachable(values: tuple, target: float = 24.0) -> bool:
+    if len(values) == 1:
+        return abs(values[0] - target) < 1e-6
+    for i, j in itertools.combinations(range(len(values)), 2):
+        rest = tuple(v for k, v in enumerate(values) if k not in (i, j))
+        if any(_reachable(rest + (v,), target) for v, _ in _combine(values[i], values[j])):
+            return True
+    return False
+
+
+def game24_evaluate(state: tuple) -> float:
+    """价值函数: 剩余数字还能凑出 24 记 1，否则 0（剩一个数时直接判定）"""
+    return 1.0 if _reachable(tuple(v for v, _ in state)) else 0.0
+
+
+def game24_normalize(state: tuple) -> str:
+    """只看剩余数值的多重集，忽略表达式写法与顺序"""
+    return ",".join(f"{v:.6g}" for v in sorted(v for v, _ in state))
+
+
+def solve_24(numbers: List[int], **kwargs) -> Dict:
+    """24 点: 最佳优先 ToT，命中单个 24 即停止"""
+    tot = ToTExecutor(game24_expand, game24_evaluate,
+                      is_goal=lambda s, score: len(s) == 1 and score >= 1.0,
+                      max_depth=len(numbers) - 1, beam_width=kwargs.pop("beam_width", 5),
+                      normalize=game24_normalize, **kwargs)
+    with tot:
+        result = tot.solve(tuple((float(n), str(n)) for n in numbers))
+    state = result["best"]["state"]
+    result["expression"] = state[0][1][1:-1] if result["solved"] else None
+    return result
+
+
+if __name__ == "__main__":
+    print("🦞 思维树执行器")
+    print("=" * 60)
+
+    for nums in ([4, 9, 10, 13], [1, 1, 4, 6], [3, 3, 8, 8], [1, 1, 1, 1]):
+        r = solve_24(nums)
+        print(f"\n24点 {nums}: {r['expression'] or '无解'}")
+        print(f"  节点 {len(r['nodes'])}  展开 {r['expanded']}  评估 {r['evaluated']}  "
+              f"缓存命中 {r['cache_hits']}  耗时 {r['elapsed_ms']:.1f} ms")
+
+    # 模拟慢评估（如调用模型打分），比较串行与线程池并行
+    def slow_expand(state):
+        return [f"{state.strip().lower()}/{k}" for k in "abcd"] if state.count("/") < 3 else []
+
+    def slow_evaluate(state):
+        time.sleep(0.01)
+        return -abs(hash(state.lower())) % 100 / 100
+
+    print("\n慢评估 (每次 10ms)，束宽 2，深度 3:")
+    for workers in (0, 4):
+        with ToTExecutor(slow_expand, slow_evaluate, strategy="beam", beam_width=2,
+                         max_depth=3, workers=workers) as tot:
+            r = tot.solve("root")
+            again = tot.solve("ROOT ")  # 规范化后同一状态，评估全部命中缓存
+        print(f"  workers={workers}: {r['elapsed_ms']:7.1f} ms  节点 {len(r['nodes'])}  "
+              f"评估耗时合计 {r['latency']['eval_ms']:.1f} ms | 再次求解 {again['elapsed_ms']:.1f} ms "
+              f"(缓存命中 {again['cache_hits']})")
@@ -5,9 +5,18 @@
 """
 
 import re
-from typing import Dict, List, Any
+import threading
+import weakref
+from typing import Dict, List, Any, Optional
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+from intent_routes import get_router
+from logic_puzzle_solver import solve_puzzle
+from safe_math import answer_math
+from tracing import get_tracer, span
+
+_ROUTER = get_router("unified")
 
 
 class ReasoningMode(Enum):
@@ -36,6 +45,7 @@ class ReasoningResult:
     steps: List[str]
     key_insight: str
     learned: str = None
+    trace: Dict = None
 
 
 class UnifiedReasoningEngine:
@@ -44,41 +54,162 @@ class UnifiedReasoningEngine:
         self.learned_lessons = []
         self.success_count = 0
         self.total_count = 0
+        self.tracer = get_tracer()
+        
+        # asolve: 有界执行器 + 背压（最多 max_pending 个请求在执行或排队）
+        self.executor_kind = "thread"  # "thread" 或 "process"（CPU 密集且需多核时）
+        self.max_workers = 4
+        self.max_pending = 32
+        # asyncio / concurrent.futures 导入较重，首次 asolve 时才加载
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        # 事件循环 → 信号量；弱引用键，循环关闭回收后条目随之消失
+        self._slots: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
         
     def solve(self, question: str, mode: str = None) -> ReasoningResult:
+        result = self._solve_traced(question, mode)
+        self._record(result)
+        return result
+    
+    def _record(self, result: ReasoningResult):
         self.total_count += 1
-        task_type = self._detect_task_type(question)
-        if mode:
-            selected_mode = ReasoningMode(mode)
-        else:
-            selected_mode = self._select_mode(task_type)
-        result = self._execute(question, task_type, selected_mode)
         if result.confidence > 0.8:
             self.success_count += 1
+    
+    def _solve_traced(self, question: str, mode: str = None) -> ReasoningResult:
+        with self.tracer.trace("UnifiedReasoningEngine.solve", chars=len(question)) as root:
+            with span("detect_task_type"):
+                task_type = self._detect_task_type(question)
+            if mode:
+                selected_mode = ReasoningMode(mode)
+            else:
+                selected_mode = self._select_mode(task_type)
+            with span(f"execute.{task_type.value}"):
+                result = self._execute(question, task_type, selected_mode)
+            root.set(task=task_type.value, mode=selected_mode.value)
+        result.trace = root.to_dict()
+        return result
+    
+    # ==================== 批量 ====================
+    
+    def solve_many(self, questions: List[str], mode: str = None) -> List[ReasoningResult]:
+        """
+        批量求解: 去重 + 逐题求解，结果按输入顺序返回
+        
+        去掉空白后相同的问题只求解一次，重复项拿到结果副本；其余问题逐题调用
+        与 solve 相同的求解器，没有跨题共享的计算。按任务类型分组只为了在
+        trace 中按组统计耗时，以及每组只选一次推理模式。
+        """
+        results: List[Optional[ReasoningResult]] = [None] * len(questions)
+        with self.tracer.trace("UnifiedReasoningEngine.solve_many", size=len(questions)) as root:
+            groups: Dict[TaskType, Dict[str, List[int]]] = {}
+            with span("group"):
+                for i, question in enumerate(questions):
+                    task_type = self._detect_task_type(question)
+                    key = re.sub(r"\s+", "", question)
+                    groups.setdefault(task_type, {}).setdefault(key, []).append(i)
+            
+            for task_type, unique in groups.items():
+                selected_mode = ReasoningMode(mode) if mode else self._select_mode(task_type)
+                size = sum(len(idx) for idx in unique.values())
+                with span(f"execute.{task_type.value}", size=size, unique=len(unique)):
+                    for indices in unique.values():
+                        result = self._execute(questions[indices[0]], task_type, selected_mode)
+                        results[indices[0]] = result
+                        for i in indices[1:]:
+                            results[i] = replace(result, steps=list(result.steps))
+            root.set(groups=len(groups))
+        
+        trace = root.to_dict()
+        for result in results:
+            result.trace = trace
+            self._record(result)
+        return results
+    
+    # ==================== 异步 ====================
+    
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+                
+                cls = ProcessPoolExecutor if self.executor_kind == "process" else ThreadPoolExecutor
+                self._executor = cls(max_workers=self.max_workers)
+            return self._executor
+    
+    def _get_slots(self):
+        """每个事件循环一个信号量（asyncio 原语不能跨循环使用）"""
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_pending)
+        return slots
+    
+    async def asolve(self, question: str, mode: str = None, timeout: float = None) -> ReasoningResult:
+        """
+        异步求解: 在有界执行器中运行，不阻塞事件循环
+        
+        - 背压: 在途请求达到 max_pending 时，新请求在此等待
+        - 截止时间: timeout 秒（含排队时间）内未完成则返回超时结果，
+          执行器中的计算继续跑完后才释放名额
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        slots = self._get_slots()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            return self._timeout_result(question, timeout, "排队")
+        
+        try:
+            if self.executor_kind == "process":
+                future = loop.run_in_executor(self._get_executor(), _solve_in_process, question, mode)
+            else:
+                future = loop.run_in_executor(self._get_executor(), self._solve_traced, question, mode)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        
+        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), remaining)
+        except asyncio.TimeoutError:
+            return self._timeout_result(question, timeout, "执行")
+        self._record(result)
         return result
     
+    async def asolve_many(self, questions: List[str], mode: str = None,
+                          timeout: float = None) -> List[ReasoningResult]:
+        """并发 asolve，每个问题独立计时，慢题不拖住其他题"""
+        import asyncio
+        
+        return await asyncio.gather(*(self.asolve(q, mode, timeout) for q in questions))
+    
+    def _timeout_result(self, question: str, timeout: float, stage: str) -> ReasoningResult:
+        self.total_count += 1
+        return ReasoningResult(
+            answer="超时，请稍后重试",
+            confidence=0.0,
+            mode_used="timeout",
+            steps=[f"{stage}超过截止时间 {timeout}s"],
+            key_insight=question[:30]
+        )
+    
+    def close(self):
+        """关闭异步执行器"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+    
     def _detect_task_type(self, question: str) -> TaskType:
-        """按优先级检测，从最具体到最一般"""
-        # 1. 实际问题 (最具体)
-        if any(kw in question for kw in ["洗车", "开车", "走路", "去还是"]):
-            return TaskType.REAL_WORLD
-        # 2. 逻辑推理
-        if any(kw in question for kw in ["真话", "假话", "如果", "真假", "谁会"]):
-            return TaskType.LOGICAL
-        # 3. 数学计算
-        if any(kw in question for kw in ["计算", "等于", "直角三角形"]):
-            return TaskType.MATHEMATICAL
-        # 4. 几何问题
-        if any(kw in question for kw in ["厘米", "体积", "水位", "放入", "棱长", "容器"]):
-            return TaskType.GEOMETRY
-        # 5. 智商测试
-        if any(kw in question for kw in ["为什么", "测试"]):
-            return TaskType.IQ_TEST
-        # 6. 伦理分析
-        if any(kw in question for kw in ["应该", "能否", "道德"]):
-            return TaskType.ETHICAL
-        # 7. 一般问题
-        return TaskType.GENERAL
+        """按优先级检测，从最具体到最一般（关键词表见 intent_routes.UNIFIED）"""
+        return TaskType(_ROUTER.route(question))
     
     def _select_mode(self, task_type: TaskType) -> ReasoningMode:
         mode_map = {
@@ -107,28 +238,42 @@ class UnifiedReasoningEngine:
     
     def _solve_logical(self, question: str, mode: ReasoningMode) -> ReasoningResult:
         steps = ["矛盾识别", "穷举验证", "连锁推理", "得出结论"]
-        if "甲" in question and "乙" in question and "丙" in question:
+        solved = solve_puzzle(question)
+        if solved and solved["worlds"]:
+            if solved["contradictions"]:
+                s1, s2 = solved["contradictions"][0]
+                insight = f"{s1['speaker']}和{s2['speaker']}的话是矛盾关系，必有一真一假"
+            else:
+                insight = f"枚举{solved['checked']}种情况，{len(solved['worlds'])}种自洽"
+            unique = len(solved["worlds"]) == 1
             return ReasoningResult(
-                answer="乙",
-                confidence=0.95,
+                answer=solved["answer"],
+                confidence=0.95 if unique else 0.7,
                 mode_used=mode.value,
-                steps=steps,
-                key_insight="甲和丙的话是矛盾关系，必有一真一假",
-                learned="从甲乙丙题学会：矛盾关系→唯一真话在之间→第三方必为假"
+                steps=steps + solved["worlds"][0]["trace"],
+                key_insight=insight,
+                learned="矛盾关系→唯一真话在之间→第三方必为假" if solved["contradictions"] else None
             )
         return ReasoningResult("需分析", 0.7, mode.value, steps, "需要更多信息")
     
     def _solve_math(self, question: str, mode: ReasoningMode) -> ReasoningResult:
+        from integer_search import answer_diophantine, format_solutions  # 依赖 numpy，首次用到时才导入
+        
         steps = ["提取条件", "建立方程", "求解", "验证"]
-        if "直角三角形" in question:
+        searched = answer_diophantine(question)
+        if searched is not None:
             return ReasoningResult(
-                answer="(5,12,13), (6,8,10)",
+                answer=format_solutions(searched["solutions"]),
                 confidence=0.95,
                 mode_used=mode.value,
                 steps=steps,
-                key_insight="满足a²+b²=c²且ab/2=a+b+c的整数解",
+                key_insight=f"满足{' 且 '.join(searched['constraints'])}的整数解",
                 learned="从直角三角题学会：穷举验证所有可能性"
             )
+        solved = answer_math(question)
+        if solved:
+            insight = ("解方程 " if solved["kind"] == "equation" else "求值 ") + solved["expression"]
+            return ReasoningResult(solved["answer"], 0.95, mode.value, steps, insight)
         return ReasoningResult("计算中", 0.85, mode.value, steps, "数学计算")
     
     def _solve_geometry(self, question: str, mode: ReasoningMode) -> ReasoningResult:
@@ -210,6 +355,13 @@ class UnifiedReasoningEngine:
 ╚═══════════════════════════════════════════════════════╝"""
 
 
+def _solve_in_process(question: str, mode: str = None) -> ReasoningResult:
+    """进程池工作函数: 每个工作进程复用一个引擎单例"""
+    from engine_registry import get_engine
+    
+    return get_engine("unified")._solve_traced(question, mode)
+
+
 def demo():
     print("="*70)
     print("🦞 统一推理引擎 v4.0 - 一站式解决方案")
@@ -232,6 +384,28 @@ def demo():
         print("-"*50)
     
     print(f"\n统计: {engine.get_statistics()}")
+    
+    # 批量 / 异步
+    import asyncio
+    import time
+    
+    batch = tests * 20
+    start = time.perf_counter()
+    for q in batch:
+        engine.solve(q)
+    serial = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.solve_many(batch)
+    batched = time.perf_counter() - start
+    print(f"\n批量 {len(batch)} 题: 逐个 {serial * 1000:.1f} ms, solve_many {batched * 1000:.1f} ms")
+    
+    start = time.perf_counter()
+    results = asyncio.run(engine.asolve_many(batch, timeout=5.0))
+    elapsed = time.perf_counter() - start
+    timeouts = sum(r.mode_used == "timeout" for r in results)
+    print(f"异步 {len(batch)} 题 (workers={engine.max_workers}, pending≤{engine.max_pending}): "
+          f"{elapsed * 1000:.1f} ms, 超时 {timeouts}")
+    engine.close()
 
 
 if __name__ == "__main__":